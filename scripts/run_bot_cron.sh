@@ -1,6 +0,0 @@
-#!/bin/bash -l
-
-cd /app
-langboard run:bot:cron "$@"
-
-exit 0
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Micro-benchmark for the batch API.
+
+Compares the previous path (sub-requests run one by one, and each body decoded and encoded again) with ``parallel``
+batches, where consecutive GET requests run concurrently, and the bodies embedded as they are.
+
+Run from ``src/api`` with the same environment as the services (``.env``):
+``python -m benchmarks.BatchApiBenchmark [--number N]``
+"""
+
+from asyncio import run as run_async
+from asyncio import sleep
+from json import dumps as json_dumps
+from json import loads as json_loads
+from fastapi import FastAPI, Request
+from langboard.routes.batcher.BatchApi import _batch_response, batch_apis
+from langboard.routes.batcher.BatchForm import BatchForm, BatchFormRequestSchema
+from langboard_shared.core.routing import AppRouter
+from langboard_shared.core.utils.Converter import json_default
+from .BenchmarkUtils import parse_number, run
+
+
+_READ_COUNT = 10
+_READ_SECONDS = 0.02
+_BODY_COUNT = 20
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        await sleep(_READ_SECONDS)
+        return {"item_id": item_id}
+
+    @app.post("/items")
+    async def create_item():
+        return {"created": True}
+
+    return app
+
+
+def _create_form(parallel: bool) -> BatchForm:
+    reads = [
+        BatchFormRequestSchema(path_or_api_name="get_item", method="GET", query={"item_id": str(i)})
+        for i in range(_READ_COUNT)
+    ]
+    write = BatchFormRequestSchema(path_or_api_name="/items", method="POST")
+    return BatchForm(request_schemas=[*reads, write, reads[0]], parallel=parallel)
+
+
+def main() -> None:
+    number = parse_number(10)
+
+    AppRouter.set_app(_create_app())
+    request = Request({"type": "http", "headers": []})
+    sequential_form, parallel_form = _create_form(False), _create_form(True)
+
+    name = f"{_READ_COUNT} reads of {int(_READ_SECONDS * 1000)} ms, 1 write, 1 read"
+    run(f"{name}: sequential", lambda: run_async(batch_apis(request, sequential_form, None)), number)
+    run(f"{name}: parallel", lambda: run_async(batch_apis(request, parallel_form, None)), number)
+
+    body = json_dumps([{"uid": f"uid-{i}", "title": f"Card {i}", "order": i} for i in range(500)]).encode()
+    bodies = [body] * _BODY_COUNT
+    run(
+        f"embed {_BODY_COUNT} bodies of {len(body) // 1024} KB: decode and encode",
+        lambda: json_dumps([{"status": 200, "body": json_loads(b)} for b in bodies], default=json_default).encode(),
+        number * 10,
+    )
+    run(
+        f"embed {_BODY_COUNT} bodies of {len(body) // 1024} KB: raw",
+        lambda: b"[" + b",".join(_batch_response(200, b) for b in bodies) + b"]",
+        number * 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""Micro-benchmarks of the API.
+
+Run a benchmark from ``src/api`` with the same environment as the services (``.env``):
+``python -m benchmarks.<Name>Benchmark [--number N]``
+
+Modules create their directories on import, so the data directory and the database are moved to a temporary directory
+before any of them are imported and the benchmarks never touch the data of the services.
+"""
+
+from pathlib import Path
+from tempfile import mkdtemp
+from langboard_shared.Env import Env
+
+
+_BENCHMARK_DATA_DIR = Path(mkdtemp(prefix="langboard-api-benchmarks-"))
+setattr(type(Env), "DATA_DIR", property(lambda _: _BENCHMARK_DATA_DIR))
+setattr(type(Env), "MAIN_DATABASE_URL", property(lambda _: f"sqlite:///{_BENCHMARK_DATA_DIR / 'main.db'}"))
+setattr(type(Env), "READONLY_DATABASE_URL", property(lambda _: f"sqlite:///{_BENCHMARK_DATA_DIR / 'main.db'}"))
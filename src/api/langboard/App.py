@@ -4,8 +4,7 @@ from typing import Any, cast
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from langboard_shared.ai import BotScheduleHelper
-from langboard_shared.core.routing import AppExceptionHandlingRoute, AppRouter, BaseMiddleware
+from langboard_shared.core.routing import AppExceptionHandlingRoute, AppRouter, BaseMiddleware, RouteMatcher
 from langboard_shared.core.security import AuthSecurity, KeyVault
 from langboard_shared.Env import Env
 from langboard_shared.FastAPIAppConfig import FastAPIAppConfig
@@ -35,7 +34,6 @@ class App:
 
     def create(self):
         AppRouter.set_app(self.api)
-        BotScheduleHelper.utils.reload_cron()
         self.app_config.set_restarting(True)
         return self.api
 
@@ -85,6 +83,7 @@ class App:
         ModuleLoader.load("routes", "Api", log=not self.config.is_restarting)
         self.api.include_router(AppRouter.api)
         self.api.mount("/mcp", cast(Any, self.mcp_http_app))
+        RouteMatcher(self.api.routes).bind_router(self.api.router)
 
     def _init_mcp_server(self):
         ModuleLoader.load("mcp_tools", "Mcp", log=not self.config.is_restarting)
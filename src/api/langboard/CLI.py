@@ -33,6 +33,7 @@ def _run_app(options: RunCommandOptions):
         _init_internal_bots()
         _init_admin()
         _set_full_admin_access()
+        _init_order_keys()
 
     app_config = FastAPIAppConfig(APP_CONFIG_FILE)
     app_config.create(
@@ -167,3 +168,30 @@ def _set_full_admin_access():
             if not mcp_role.is_all_granted():
                 mcp_role.set_all_actions()
                 db.update(mcp_role)
+
+
+def _init_order_keys():
+    """Gives keys to the rows added or moved while `ORDER_MODE` was `index`, following their `order`."""
+    if Env.ORDER_MODE != "key":
+        return
+
+    from langboard_shared.core.db import DbSession, SqlBuilder
+    from langboard_shared.domain.models import Card, Checkitem, Checklist, ProjectColumn
+    from langboard_shared.helpers import InfraHelper
+
+    ordered_models = {
+        Card: "project_column_id",
+        ProjectColumn: "project_id",
+        Checklist: "card_id",
+        Checkitem: "checklist_id",
+    }
+    for model_class, parent_foreign_key_name in ordered_models.items():
+        with DbSession.use(readonly=True) as db:
+            parent_ids = db.exec(
+                SqlBuilder.select.column(model_class.column(parent_foreign_key_name))
+                .where(model_class.column("order_key") == None)  # noqa
+                .distinct()
+            ).all()
+
+        for parent_id in parent_ids:
+            InfraHelper.rebalance_order(model_class, parent_foreign_key_name, parent_id, by="order")
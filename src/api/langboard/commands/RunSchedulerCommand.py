@@ -0,0 +1,41 @@
+from langboard_shared.core.bootstrap import BaseCommand, BaseCommandOptions
+
+
+class RunSchedulerCommandOptions(BaseCommandOptions):
+    pass
+
+
+class RunSchedulerCommand(BaseCommand):
+    @staticmethod
+    def is_only_in_dev() -> bool:
+        return False
+
+    @property
+    def option_class(self) -> type[RunSchedulerCommandOptions]:
+        return RunSchedulerCommandOptions
+
+    @property
+    def command(self) -> str:
+        return "run:scheduler"
+
+    @property
+    def positional_name(self) -> str:
+        return ""
+
+    @property
+    def description(self) -> str:
+        return "Run the bot scheduler service (Run only one scheduler)"
+
+    @property
+    def choices(self) -> list[str] | None:
+        return None
+
+    @property
+    def store_type(self) -> type[bool] | type[str]:
+        return bool
+
+    def execute(self, _: RunSchedulerCommandOptions) -> None:
+        from langboard_shared.ai import BotScheduler
+        from langboard_shared.tasks.bots import BotScheduleTask
+
+        BotScheduler(BotScheduleTask.run_due_bot_schedules).run()
@@ -0,0 +1,46 @@
+from asyncio import run
+from langboard_shared.core.bootstrap import BaseCommand, BaseCommandOptions
+from .CommandUtils import logger
+
+
+class WebhookReplayCommandOptions(BaseCommandOptions):
+    pass
+
+
+class WebhookReplayCommand(BaseCommand):
+    @staticmethod
+    def is_only_in_dev() -> bool:
+        return False
+
+    @property
+    def option_class(self) -> type[WebhookReplayCommandOptions]:
+        return WebhookReplayCommandOptions
+
+    @property
+    def command(self) -> str:
+        return "webhook:replay"
+
+    @property
+    def positional_name(self) -> str:
+        return ""
+
+    @property
+    def description(self) -> str:
+        return "Resend the failed webhook events in the dead letter file and drain it"
+
+    @property
+    def choices(self) -> list[str] | None:
+        return None
+
+    @property
+    def store_type(self) -> type[bool] | type[str]:
+        return bool
+
+    def execute(self, _: WebhookReplayCommandOptions) -> None:
+        from langboard_shared.tasks.webhooks.utils import WebhookDispatcher
+
+        counts = run(WebhookDispatcher.replay_dead_letters())
+        logger.info(
+            f"Webhook dead letters replayed: {counts['sent']} sent, {counts['failed']} failed again, "
+            f"{counts['dropped']} dropped (webhook deleted)."
+        )
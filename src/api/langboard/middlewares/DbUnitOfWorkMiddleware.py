@@ -0,0 +1,29 @@
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.routing import BaseMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Message
+
+
+class DbUnitOfWorkMiddleware(BaseMiddleware):
+    """Runs each request in its own unit of work and commits it right before the response starts.
+
+    Sub-requests of a batch request get their own unit of work too, so each one commits (or rolls back) on its own.
+
+    If the commit fails, the error is raised before anything is sent, so the client gets an error response.
+    Database calls made after the response has started (e.g. while streaming or in background tasks) use their own
+    sessions.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with DbSession.unit_of_work(isolated=True) as unit:
+
+            async def wrapped_send(message: Message) -> None:
+                if message["type"] == "http.response.start" and not unit.is_closed:
+                    await run_in_threadpool(unit.commit)
+                await send(message)
+
+            await self.app(scope, receive, wrapped_send)
@@ -0,0 +1,26 @@
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.publisher import BaseSocketPublisher
+from langboard_shared.core.routing import BaseMiddleware
+from starlette.types import Message
+
+
+class SocketPublishBatchMiddleware(BaseMiddleware):
+    """Merges the socket publishes of a request and dispatches them once the response starts.
+
+    Publishes made after the response has started (e.g. while streaming or in background tasks) are dispatched
+    directly. If the request's unit of work has not committed yet, the batch waits for the commit.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with BaseSocketPublisher.batch() as buffer:
+
+            async def wrapped_send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    DbSession.on_commit(buffer.flush)
+                await send(message)
+
+            await self.app(scope, receive, wrapped_send)
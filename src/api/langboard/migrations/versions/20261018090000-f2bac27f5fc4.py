@@ -0,0 +1,78 @@
+"""empty message
+
+Revision ID: f2bac27f5fc4
+Revises: b7f2c8a1d9a4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+import sqlalchemy as sa
+import sqlmodel
+import sqlmodel.sql.sqltypes
+from alembic import op
+from langboard_shared.core.utils.OrderKey import OrderKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2bac27f5fc4"
+down_revision: Union[str, None] = "b7f2c8a1d9a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ORDERED_TABLES = {
+    "card": "project_column_id",
+    "project_column": "project_id",
+    "checklist": "card_id",
+    "checkitem": "checklist_id",
+}
+
+
+def upgrade() -> None:
+    for table_name, parent_column_name in _ORDERED_TABLES.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("order_key", sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+            batch_op.create_index(
+                f"ix_{table_name}_{parent_column_name}_order_key", [parent_column_name, "order_key"], unique=False
+            )
+
+        _fill_order_keys(table_name, parent_column_name)
+
+
+def downgrade() -> None:
+    for table_name, parent_column_name in _ORDERED_TABLES.items():
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            batch_op.drop_index(f"ix_{table_name}_{parent_column_name}_order_key")
+            batch_op.drop_column("order_key")
+
+
+def _fill_order_keys(table_name: str, parent_column_name: str) -> None:
+    table = sa.table(
+        table_name,
+        sa.column("id", sa.BigInteger()),
+        sa.column(parent_column_name, sa.BigInteger()),
+        sa.column("order", sa.Integer()),
+        sa.column("order_key", sa.String()),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(table.c.id, table.c[parent_column_name]).order_by(
+            table.c[parent_column_name], table.c.order, table.c.id
+        )
+    ).all()
+
+    rows_by_parent: dict[int, list[int]] = {}
+    for row_id, parent_id in rows:
+        rows_by_parent.setdefault(parent_id, []).append(row_id)
+
+    params = []
+    for row_ids in rows_by_parent.values():
+        for row_id, order_key in zip(row_ids, OrderKey.spread(len(row_ids))):
+            params.append({"row_id": row_id, "order_key": order_key})
+
+    if params:
+        connection.execute(
+            table.update().where(table.c.id == sa.bindparam("row_id")).values(order_key=sa.bindparam("order_key")),
+            params,
+        )
@@ -0,0 +1,56 @@
+"""empty message
+
+Revision ID: a4fbe8f4511e
+Revises: f2bac27f5fc4
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+import sqlalchemy as sa
+from alembic import op
+from langboard_shared.core.db.ColumnTypes import EnumLikeType, SnowflakeIDType
+from langboard_shared.domain.models.ProjectChange import ProjectChangeTarget
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4fbe8f4511e"
+down_revision: Union[str, None] = "f2bac27f5fc4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("project", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("change_seq", sa.Integer(), nullable=False, server_default="0"))
+
+    op.create_table(
+        "project_change",
+        sa.Column("id", SnowflakeIDType, nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column("project_id", SnowflakeIDType, nullable=False),
+        sa.Column("target", EnumLikeType(ProjectChangeTarget), nullable=False),
+        sa.Column("target_id", SnowflakeIDType, nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("project_id", "target", "target_id", name="uq_project_change_project_target"),
+    )
+    with op.batch_alter_table("project_change", schema=None) as batch_op:
+        batch_op.create_index("ix_project_change_project_id_seq", ["project_id", "seq"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("project_change", schema=None) as batch_op:
+        batch_op.drop_index("ix_project_change_project_id_seq")
+
+    op.drop_table("project_change")
+
+    with op.batch_alter_table("project", schema=None) as batch_op:
+        batch_op.drop_column("change_seq")
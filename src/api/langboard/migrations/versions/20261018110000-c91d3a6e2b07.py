@@ -0,0 +1,146 @@
+"""empty message
+
+Revision ID: c91d3a6e2b07
+Revises: a4fbe8f4511e
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+import sqlalchemy as sa
+from alembic import op
+from langboard_shared.core.db.ColumnTypes import EnumLikeType, ModelColumnListType, SnowflakeIDType
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models.BotLog import BotLogMessage, BotLogType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c91d3a6e2b07"
+down_revision: Union[str, None] = "a4fbe8f4511e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_BATCH_SIZE = 500
+
+_bot_log_table = sa.table(
+    "bot_log",
+    sa.column("id", SnowflakeIDType),
+    sa.column("message_stack", ModelColumnListType(BotLogMessage)),
+)
+_bot_log_stack_table = sa.table(
+    "bot_log_stack",
+    sa.column("id", SnowflakeIDType),
+    sa.column("created_at", sa.DateTime(timezone=True)),
+    sa.column("updated_at", sa.DateTime(timezone=True)),
+    sa.column("bot_log_id", SnowflakeIDType),
+    sa.column("message", sa.TEXT()),
+    sa.column("log_type", EnumLikeType(BotLogType)),
+    sa.column("log_date", sa.DateTime(timezone=True)),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bot_log_stack",
+        sa.Column("id", SnowflakeIDType, nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.Column("bot_log_id", SnowflakeIDType, nullable=False),
+        sa.Column("message", sa.TEXT(), nullable=False),
+        sa.Column("log_type", EnumLikeType(BotLogType), nullable=False),
+        sa.Column(
+            "log_date", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["bot_log_id"], ["bot_log.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("bot_log_stack", schema=None) as batch_op:
+        batch_op.create_index("ix_bot_log_stack_bot_log_id_log_date", ["bot_log_id", "log_date"], unique=False)
+
+    _move_message_stacks_to_rows()
+
+    with op.batch_alter_table("bot_log", schema=None) as batch_op:
+        batch_op.drop_column("message_stack")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("bot_log", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "message_stack", ModelColumnListType(BotLogMessage), nullable=False, server_default=sa.text("'[]'")
+            )
+        )
+
+    _move_rows_to_message_stacks()
+
+    with op.batch_alter_table("bot_log_stack", schema=None) as batch_op:
+        batch_op.drop_index("ix_bot_log_stack_bot_log_id_log_date")
+
+    op.drop_table("bot_log_stack")
+
+
+def _move_message_stacks_to_rows() -> None:
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(_bot_log_table.c.id, _bot_log_table.c.message_stack)
+            .where(_bot_log_table.c.id > last_id)
+            .order_by(_bot_log_table.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for bot_log_id, message_stack in rows:
+            for stack in message_stack or []:
+                params.append(
+                    {
+                        "id": SnowflakeID(),
+                        "created_at": stack.log_date,
+                        "updated_at": stack.log_date,
+                        "bot_log_id": bot_log_id,
+                        "message": stack.message,
+                        "log_type": stack.log_type,
+                        "log_date": stack.log_date,
+                    }
+                )
+
+        if params:
+            connection.execute(_bot_log_stack_table.insert(), params)
+        last_id = rows[-1][0]
+
+
+def _move_rows_to_message_stacks() -> None:
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            _bot_log_stack_table.c.bot_log_id,
+            _bot_log_stack_table.c.message,
+            _bot_log_stack_table.c.log_type,
+            _bot_log_stack_table.c.log_date,
+        ).order_by(_bot_log_stack_table.c.bot_log_id, _bot_log_stack_table.c.log_date, _bot_log_stack_table.c.id)
+    ).all()
+
+    stacks_by_log: dict[int, list[BotLogMessage]] = {}
+    for bot_log_id, message, log_type, log_date in rows:
+        stacks_by_log.setdefault(bot_log_id, []).append(
+            BotLogMessage(message=message, log_type=log_type, log_date=log_date)
+        )
+
+    params = [
+        {"row_id": bot_log_id, "message_stack": message_stack} for bot_log_id, message_stack in stacks_by_log.items()
+    ]
+    if params:
+        connection.execute(
+            _bot_log_table.update()
+            .where(_bot_log_table.c.id == sa.bindparam("row_id"))
+            .values(message_stack=sa.bindparam("message_stack")),
+            params,
+        )
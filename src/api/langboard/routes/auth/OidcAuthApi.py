@@ -9,6 +9,7 @@ from langboard_shared.core.utils.String import generate_random_string
 from langboard_shared.domain.models import IdentityProvider
 from langboard_shared.domain.services import DomainService
 from langboard_shared.Env import Env
+from langboard_shared.security import RoleSecurity
 
 
 @AppRouter.schema()
@@ -137,6 +138,7 @@ def oidc_callback(
             )
 
         access_token, refresh_token = AuthSecurity.authenticate(user.id)
+        RoleSecurity.preload(user.id)
 
         response = JsonResponse(content={"access_token": access_token, "redirect": redirect})
         response.set_cookie(
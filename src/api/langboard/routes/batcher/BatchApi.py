@@ -1,96 +1,114 @@
+from asyncio import Semaphore, gather
 from json import dumps as json_dumps
-from json import loads as json_loads
-from typing import cast
-from fastapi import Request, status
+from typing import Any
+from fastapi import Request, Response, status
 from langboard_shared.core.filter import AuthFilter
-from langboard_shared.core.routing import AppExceptionHandlingRoute, AppRouter, JsonResponse
+from langboard_shared.core.routing import AppRouter
 from langboard_shared.core.utils.Converter import json_default
 from langboard_shared.domain.models import Bot, User
 from langboard_shared.security import Auth
 from starlette.types import Message
-from .BatchForm import BatchForm
+from .BatchForm import BatchForm, BatchFormRequestSchema
 
 
-_cached_apis: dict[str, str] = {}
+_API_METHODS = {"GET", "POST", "PUT", "DELETE"}
+_MAX_PARALLEL_REQUESTS = 8
+_INVALID_JSON_BODY = b'{"error":"Invalid JSON response"}'
 
 
 @AppRouter.schema(form=BatchForm)
 @AppRouter.api.post(
     "/batch",
     tags=["Batcher"],
-    description="Batch API for processing multiple requests in a single call. The response will be a list of responses corresponding to each request schema provided in the form.",
+    description="Batch API for processing multiple requests in a single call. The response will be a list of responses corresponding to each request schema provided in the form. With `parallel`, consecutive GET requests are processed concurrently.",
 )
 @AuthFilter.add()
 async def batch_apis(request: Request, form: BatchForm, user_or_bot: User | Bot = Auth.scope("all")):
-    if not _cached_apis:
-        _set_cache_apis()
-
-    API_METHODS = {"GET", "POST", "PUT", "DELETE"}
-    responses = []
+    # The sub-responses are embedded as they are, so they must not be compressed.
+    headers = [(key, value) for key, value in request.headers.raw if key.lower() != b"accept-encoding"]
+    semaphore = Semaphore(_MAX_PARALLEL_REQUESTS)
+
+    async def run(request_schema: BatchFormRequestSchema) -> bytes:
+        if request_schema.method.upper() not in _API_METHODS:
+            return _batch_response(status.HTTP_400_BAD_REQUEST, b"{}")
+        async with semaphore:
+            return await _run_request(request_schema, headers, user_or_bot)
+
+    responses: list[bytes] = []
+    pending_reads: list[BatchFormRequestSchema] = []
     for request_schema in form.request_schemas:
-        if request_schema.method.upper() not in API_METHODS:
-            responses.append(_batch_response({}, status.HTTP_400_BAD_REQUEST))
+        if form.parallel and request_schema.method.upper() == "GET":
+            pending_reads.append(request_schema)
             continue
 
-        if request_schema.path_or_api_name in _cached_apis:
-            request_schema.path_or_api_name = _cached_apis[request_schema.path_or_api_name]
-            try:
-                request_schema.path_or_api_name = request_schema.path_or_api_name.format(
-                    **{**(request_schema.form or {}), **(request_schema.query or {})}
-                )
-            except Exception:
-                pass
-
-        query_string = _query_dict_to_bytes(request_schema.query or {})
-        scope = {
-            "type": "http",
-            "method": request_schema.method,
-            "path": request_schema.path_or_api_name,
-            "query_string": query_string,
-            "headers": request.headers.raw,
-            "auth": user_or_bot,
-            "is_batch": True,
-        }
-
-        response = {}
-        responses.append(response)
-
-        async def receive():
-            message = b""
-            if request_schema.form:
-                message = json_dumps(request_schema.form, default=json_default).encode()
-            return {"type": "http.request", "body": message, "more_body": False}
-
-        async def send(message: Message):
-            message_type = message.get("type")
-            if message_type == "http.response.start":
-                response["status"] = message.get("status", status.HTTP_200_OK)
-                return
-
-            if message_type != "http.response.body":
-                return
-
-            body = message.get("body", b"{}")
-            try:
-                response["body"] = json_loads(body) if body else {}
-            except Exception:
-                response["body"] = {"error": "Invalid JSON response"}
-
-        await AppRouter.get_app()(scope, receive, send)
-
-    return JsonResponse(content=responses)
+        # Writes run in order, after the reads before them.
+        if pending_reads:
+            responses.extend(await gather(*[run(pending_read) for pending_read in pending_reads]))
+            pending_reads = []
+        responses.append(await run(request_schema))
+
+    if pending_reads:
+        responses.extend(await gather(*[run(pending_read) for pending_read in pending_reads]))
+
+    return Response(content=b"[" + b",".join(responses) + b"]", media_type="application/json")
+
+
+async def _run_request(request_schema: BatchFormRequestSchema, headers: list[tuple[bytes, bytes]], user_or_bot: Any):
+    path = request_schema.path_or_api_name
+    route_path = AppRouter.get_path_by_name(path)
+    if route_path is not None:
+        path = route_path
+        try:
+            path = path.format(**{**(request_schema.form or {}), **(request_schema.query or {})})
+        except Exception:
+            pass
+
+    scope = {
+        "type": "http",
+        "method": request_schema.method,
+        "path": path,
+        "query_string": _query_dict_to_bytes(request_schema.query or {}),
+        "headers": headers,
+        "auth": user_or_bot,
+        "is_batch": True,
+    }
+
+    response_status = status.HTTP_200_OK
+    is_json = False
+    body_chunks: list[bytes] = []
+
+    async def receive():
+        message = b""
+        if request_schema.form:
+            message = json_dumps(request_schema.form, default=json_default).encode()
+        return {"type": "http.request", "body": message, "more_body": False}
+
+    async def send(message: Message):
+        nonlocal response_status, is_json
+        message_type = message.get("type")
+        if message_type == "http.response.start":
+            response_status = message.get("status", status.HTTP_200_OK)
+            for key, value in message.get("headers", []):
+                if key.lower() == b"content-type":
+                    is_json = value.split(b";")[0].strip().lower() == b"application/json"
+            return
+
+        if message_type == "http.response.body":
+            body_chunks.append(message.get("body", b""))
+
+    await AppRouter.get_app()(scope, receive, send)
+
+    body = b"".join(body_chunks)
+    if not body:
+        body = b"{}"
+    elif not is_json:
+        body = _INVALID_JSON_BODY
+    return _batch_response(response_status, body)
 
 
 def _query_dict_to_bytes(query: dict) -> bytes:
     return b"&".join(f"{key}={value}".encode() for key, value in query.items() if value is not None)
 
 
-def _batch_response(content: dict, status_code: int = status.HTTP_200_OK) -> dict:
-    return {"status": status_code, "body": content}
-
-
-def _set_cache_apis():
-    for route in AppRouter.get_app().routes:
-        route = cast(AppExceptionHandlingRoute, route)
-        route_name = route.name
-        _cached_apis[route_name] = route.path
+def _batch_response(status_code: int, body: bytes) -> bytes:
+    return b'{"status":%d,"body":%s}' % (status_code, body)
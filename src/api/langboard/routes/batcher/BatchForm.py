@@ -32,3 +32,8 @@ class BatchForm(BaseFormModel):
         }
     ]""",
     )
+    parallel: bool = Field(
+        default=False,
+        title="Parallel",
+        description="Whether to process consecutive GET requests concurrently. The other requests are still processed in order.",
+    )
@@ -1,3 +1,4 @@
+from fastapi import Depends
 from langboard_shared.core.filter import AuthFilter
 from langboard_shared.core.routing import ApiErrorCode, ApiException, AppRouter, JsonResponse
 from langboard_shared.core.schema import OpenApiSchema
@@ -22,7 +23,7 @@ from langboard_shared.domain.models.ProjectRole import ProjectRoleAction
 from langboard_shared.domain.services import DomainService
 from langboard_shared.filter import RoleFilter
 from langboard_shared.security import Auth, RoleFinder
-from .forms import InviteProjectMemberForm, ProjectInvitationForm
+from .forms import BoardChangesQuery, BoardSnapshotQuery, InviteProjectMemberForm, ProjectInvitationForm
 
 
 @AppRouter.schema()
@@ -219,6 +220,107 @@ def get_project_cards(project_uid: str, service: DomainService = DomainService.s
     )
 
 
+@AppRouter.schema()
+@AppRouter.api.get(
+    "/board/{project_uid}/snapshot",
+    tags=["Board"],
+    description=(
+        "Get the whole board in one request. With `compact`, each list is sent as keys and value rows. "
+        "`seq` is the change sequence to get the later changes with."
+    ),
+    responses=(
+        OpenApiSchema()
+        .suc(
+            {
+                "seq": "integer",
+                "columns": [(ProjectColumn, {"schema": {"count": "integer"}})],
+                "labels": [ProjectLabel],
+                "cards": [
+                    (
+                        Card,
+                        {
+                            "schema": {
+                                "project_column_name": "string",
+                                "count_comment": "integer",
+                                "member_uids": "string[]",
+                                "relationships": [CardRelationship],
+                                "labels": [ProjectLabel],
+                            }
+                        },
+                    )
+                ],
+            }
+        )
+        .auth()
+        .forbidden()
+        .err(404, ApiErrorCode.NF2001)
+        .get()
+    ),
+)
+@RoleFilter.add(ProjectRole, [ProjectRoleAction.Read], RoleFinder.project)
+@AuthFilter.add()
+def get_project_snapshot(
+    project_uid: str, query: BoardSnapshotQuery = Depends(), service: DomainService = DomainService.scope()
+) -> JsonResponse:
+    snapshot = service.card.get_board_snapshot(project_uid, compact=query.compact)
+    if snapshot is None:
+        raise ApiException.NotFound_404(ApiErrorCode.NF2001)
+    return JsonResponse(content=snapshot)
+
+
+@AppRouter.schema()
+@AppRouter.api.get(
+    "/board/{project_uid}/changes",
+    tags=["Board"],
+    description=(
+        "Get the board rows changed after the change sequence `since`. "
+        "If the changes can't be sent, the whole board is sent with `full` set to true."
+    ),
+    responses=(
+        OpenApiSchema()
+        .suc(
+            {
+                "seq": "integer",
+                "full": "bool",
+                "columns": [(ProjectColumn, {"schema": {"count": "integer"}})],
+                "labels": [ProjectLabel],
+                "cards": [
+                    (
+                        Card,
+                        {
+                            "schema": {
+                                "project_column_name": "string",
+                                "count_comment": "integer",
+                                "member_uids": "string[]",
+                                "relationships": [CardRelationship],
+                                "labels": [ProjectLabel],
+                            }
+                        },
+                    )
+                ],
+                "deleted?": {"columns": "string[]", "labels": "string[]", "cards": "string[]"},
+                "column_uids?": "string[]",
+                "label_uids?": "string[]",
+                "card_orders?": "object",
+            }
+        )
+        .auth()
+        .forbidden()
+        .err(404, ApiErrorCode.NF2001)
+        .get()
+    ),
+)
+@RoleFilter.add(ProjectRole, [ProjectRoleAction.Read], RoleFinder.project)
+@AuthFilter.add()
+def get_project_changes(
+    project_uid: str, query: BoardChangesQuery = Depends(), service: DomainService = DomainService.scope()
+) -> JsonResponse:
+    changes = service.card.get_board_changes(project_uid, query.since, compact=query.compact)
+    if changes is None:
+        raise ApiException.NotFound_404(ApiErrorCode.NF2001)
+    return JsonResponse(content=changes)
+
+
 @AppRouter.api.put(
     "/board/{project_uid}/assigned-users",
     tags=["Board"],
@@ -2,7 +2,7 @@ from langboard_shared.core.routing import BaseFormModel, form_model
 from langboard_shared.core.schema import TimeBasedPagination
 from langboard_shared.domain.models.InternalBot import InternalBotType
 from langboard_shared.domain.models.ProjectRole import ProjectRoleAction
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 
 @form_model
@@ -19,6 +19,15 @@ class ChatHistoryPagination(TimeBasedPagination):
     pass
 
 
+class BoardSnapshotQuery(BaseModel):
+    compact: bool = Field(False, description="Send each list as keys and value rows")
+
+
+class BoardChangesQuery(BaseModel):
+    since: int = Field(..., description="The last change sequence the client has")
+    compact: bool = Field(False, description="Send each list as keys and value rows")
+
+
 @form_model
 class UpdateProjectDetailsForm(BaseFormModel):
     title: str = Field(..., description="Project title")
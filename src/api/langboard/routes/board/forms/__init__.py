@@ -5,6 +5,8 @@ from .Check import CardChecklistNotifyForm, CardCheckRelatedForm, CardifyCheckit
 from .Column import ColumnForm
 from .Comment import ToggleCardCommentReactionForm
 from .Project import (
+    BoardChangesQuery,
+    BoardSnapshotQuery,
     ChangeInternalBotForm,
     ChangeInternalBotSettingsForm,
     ChatHistoryPagination,
@@ -38,6 +40,8 @@ __all__ = [
     "UpdateProjectLabelDetailsForm",
     "ProjectInvitationForm",
     "ChatHistoryPagination",
+    "BoardChangesQuery",
+    "BoardSnapshotQuery",
     "ChangeAttachmentNameForm",
     "ToggleCardCommentReactionForm",
     "CardCheckRelatedForm",
@@ -3,6 +3,7 @@ from langboard_shared.core.filter import AuthFilter
 from langboard_shared.core.routing import ApiErrorCode, ApiException, AppRouter, JsonResponse
 from langboard_shared.core.schema import OpenApiSchema
 from langboard_shared.domain.models import BotLog, Card, CardBotLog, ProjectRole
+from langboard_shared.domain.models.BotLog import BotLogMessage
 from langboard_shared.domain.models.ProjectRole import ProjectRoleAction
 from langboard_shared.domain.services import DomainService
 from langboard_shared.filter import RoleFilter
@@ -43,3 +44,34 @@ def get_bot_logs_by_card(
     logs = service.bot_log.get_api_list_by_scope(CardBotLog, bot, card, pagination)
 
     return JsonResponse(content={"logs": logs, "target": card.api_response()})
+
+
+@AppRouter.schema(query=BotLogPagination)
+@AppRouter.api.get(
+    "/bot/{bot_uid}/card/{card_uid}/log/{log_uid}/stacks",
+    tags=["Bot.Log"],
+    description="Get the messages of a bot log for a specific card, oldest first.",
+    responses=OpenApiSchema().suc({"stacks": [BotLogMessage]}).auth().forbidden().err(404, ApiErrorCode.NF2014).get(),
+)
+@RoleFilter.add(ProjectRole, [ProjectRoleAction.Update], RoleFinder.project)
+@AuthFilter.add()
+def get_bot_log_stacks_by_card(
+    bot_uid: str,
+    card_uid: str,
+    log_uid: str,
+    pagination: BotLogPagination = Depends(),
+    service: DomainService = DomainService.scope(),
+) -> JsonResponse:
+    bot = service.bot.get_by_id_like(bot_uid)
+    if not bot:
+        raise ApiException.NotFound_404(ApiErrorCode.NF2014)
+
+    card = service.card.get_by_id_like(card_uid)
+    if not card:
+        raise ApiException.NotFound_404(ApiErrorCode.NF2014)
+
+    stacks = service.bot_log.get_api_stack_list_by_scope(CardBotLog, bot, card, log_uid, pagination)
+    if stacks is None:
+        raise ApiException.NotFound_404(ApiErrorCode.NF2014)
+
+    return JsonResponse(content={"stacks": stacks})
@@ -1,3 +1,5 @@
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.db.DbEngine import DbEngine
 from langboard_shared.core.filter import AuthFilter
 from langboard_shared.core.routing import ApiErrorCode, ApiException, AppRouter, JsonResponse
 from langboard_shared.core.schema import OpenApiSchema
@@ -11,6 +13,49 @@ def health_check() -> JsonResponse:
     return JsonResponse(content={"status": "ok"})
 
 
+@AppRouter.api.get(
+    "/health/db",
+    tags=["Global"],
+    responses=(
+        OpenApiSchema()
+        .suc({"pools": {"<main | readonly>": {"pool": "string", "checked_out": "integer", "saturation": "float"}}})
+        .auth()
+        .forbidden()
+        .get()
+    ),
+)
+@AuthFilter.add("admin")
+def db_pool_health_check() -> JsonResponse:
+    return JsonResponse(content={"pools": DbEngine.get_pool_stats()})
+
+
+@AppRouter.api.get(
+    "/health/cache",
+    tags=["Global"],
+    responses=(
+        OpenApiSchema()
+        .suc(
+            {
+                "local": {
+                    "size": "integer",
+                    "max_size": "integer",
+                    "hits": "integer",
+                    "misses": "integer",
+                    "evictions": "integer",
+                    "hit_rate": "float",
+                }
+            }
+        )
+        .auth()
+        .forbidden()
+        .get()
+    ),
+)
+@AuthFilter.add("admin")
+def cache_health_check() -> JsonResponse:
+    return JsonResponse(content={"local": Cache.local_stats()})
+
+
 @AppRouter.api.get(
     "/global/internal-bot/{bot_uid}",
     tags=["Global"],
@@ -0,0 +1,102 @@
+from asyncio import sleep
+from json import loads as json_loads
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from langboard.routes.batcher.BatchApi import batch_apis
+from langboard.routes.batcher.BatchForm import BatchForm, BatchFormRequestSchema
+from langboard_shared.core.routing import AppRouter
+
+
+class SubApp:
+    """Records the order and the concurrency of the sub-requests."""
+
+    def __init__(self):
+        self.events: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+
+@pytest.fixture
+def sub_app() -> SubApp:
+    state = SubApp()
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str, request: Request):
+        state.running += 1
+        state.max_running = max(state.max_running, state.running)
+        await sleep(0.05)
+        state.running -= 1
+        state.events.append(f"get:{item_id}")
+        return {"item_id": item_id, "accept_encoding": request.headers.get("accept-encoding")}
+
+    @app.post("/items")
+    async def create_item():
+        state.events.append(f"post:{state.max_running}")
+        state.max_running = 0
+        return {"created": True}
+
+    @app.get("/text")
+    async def get_text():
+        return PlainTextResponse("text")
+
+    AppRouter.set_app(app)
+    return state
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": [(b"accept-encoding", b"gzip"), (b"x-test", b"1")]})
+
+
+def _get(item_id: str) -> BatchFormRequestSchema:
+    return BatchFormRequestSchema(path_or_api_name="get_item", method="GET", query={"item_id": item_id})
+
+
+async def _batch(request_schemas: list[BatchFormRequestSchema], parallel: bool) -> list[dict]:
+    response = await batch_apis(_request(), BatchForm(request_schemas=request_schemas, parallel=parallel), None)
+    return json_loads(response.body)
+
+
+async def test_parallel_reads_run_concurrently_and_keep_the_response_order(sub_app: SubApp):
+    responses = await _batch([_get(str(i)) for i in range(5)], parallel=True)
+
+    assert [response["body"]["item_id"] for response in responses] == ["0", "1", "2", "3", "4"]
+    assert all(response["status"] == 200 for response in responses)
+    assert sub_app.max_running == 5
+
+
+async def test_writes_wait_for_the_reads_before_them(sub_app: SubApp):
+    responses = await _batch(
+        [_get("a"), _get("b"), BatchFormRequestSchema(path_or_api_name="/items", method="POST"), _get("c")],
+        parallel=True,
+    )
+
+    assert [response["body"] for response in responses][2] == {"created": True}
+    # Both reads ran together and finished before the write.
+    assert sub_app.events[2] == "post:2"
+    assert sub_app.events[3] == "get:c"
+
+
+async def test_sequential_by_default(sub_app: SubApp):
+    await _batch([_get(str(i)) for i in range(3)], parallel=False)
+
+    assert sub_app.max_running == 1
+    assert sub_app.events == ["get:0", "get:1", "get:2"]
+
+
+async def test_embeds_json_bodies_and_rejects_the_others(sub_app: SubApp):
+    responses = await _batch(
+        [
+            _get("a"),
+            BatchFormRequestSchema(path_or_api_name="/text", method="GET"),
+            BatchFormRequestSchema(path_or_api_name="/missing", method="GET"),
+            BatchFormRequestSchema(path_or_api_name="/items", method="PATCH"),
+        ],
+        parallel=True,
+    )
+
+    assert responses[0]["body"] == {"item_id": "a", "accept_encoding": None}
+    assert responses[1] == {"status": 200, "body": {"error": "Invalid JSON response"}}
+    assert responses[2] == {"status": 404, "body": {"detail": "Not Found"}}
+    assert responses[3] == {"status": 400, "body": {}}
@@ -0,0 +1,20 @@
+from argparse import ArgumentParser
+from timeit import timeit
+from typing import Any, Callable
+
+
+def parse_number(default: int) -> int:
+    """Parses ``--number``, the times each case is run."""
+    parser = ArgumentParser()
+    parser.add_argument("--number", type=int, default=default)
+    return parser.parse_args().number
+
+
+def run(name: str, func: Callable[[], Any], number: int) -> float:
+    """Runs the function and prints the time per run.
+
+    :return: Seconds per run
+    """
+    elapsed = timeit(func, number=number) / number
+    print(f"{name:<56} {elapsed * 1_000_000:>10.2f} us/op")
+    return elapsed
@@ -0,0 +1,35 @@
+"""Micro-benchmark for getting the flow definition of a run.
+
+Compares the previous path (the flow JSON read and parsed on every run) with the copies made by :class:`FlowCache`.
+
+Run from ``src/flows`` with the same environment as the services (``.env``):
+``python -m benchmarks.FlowCacheBenchmark [--number N]``
+"""
+
+from json import loads as json_loads
+from langboard_shared.core.resources import get_resource_path
+from langboard_flows.core.flows import FlowCache
+from .BenchmarkUtils import parse_number, run
+
+
+def _read_default_flow() -> dict:
+    with open(get_resource_path("flows", "default_flow.json"), "r", encoding="utf-8") as f:
+        return json_loads(f.read())
+
+
+def main() -> None:
+    number = parse_number(1000)
+
+    FlowCache.preload()
+    with open(get_resource_path("flows", "default_flow.json"), "r", encoding="utf-8") as f:
+        bot_flow_json = f.read()
+    print(f"{'default flow JSON':<56} {len(bot_flow_json):>10} bytes")
+
+    run("default flow: read and parse", _read_default_flow, number)
+    run("default flow: FlowCache copy", FlowCache.get_default_flow, number)
+    run("bot flow: parse", lambda: json_loads(bot_flow_json), number)
+    run("bot flow: FlowCache copy", lambda: FlowCache.get_bot_flow("bot", bot_flow_json), number)
+
+
+if __name__ == "__main__":
+    main()
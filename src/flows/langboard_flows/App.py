@@ -3,6 +3,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from langboard_shared.core.routing import AppExceptionHandlingRoute, AppRouter, BaseMiddleware
 from langboard_shared.FastAPIAppConfig import FastAPIAppConfig
 from .Constants import APP_CONFIG_FILE
+from .core.flows import FlowCache
 from .Loader import ModuleLoader
 
 
@@ -15,6 +16,7 @@ class App:
         self.api = FastAPI(debug=True)
         self._init_api_middlewares()
         self._init_api_routes()
+        FlowCache.preload()
 
         AppRouter.set_app(self.api)
 
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from hashlib import sha256
+from json import loads as json_loads
+from pickle import HIGHEST_PROTOCOL
+from pickle import dumps as pickle_dumps
+from pickle import loads as pickle_loads
+from threading import Lock
+from typing import Any
+from langboard_shared.core.resources import get_resource_path
+from langboard_shared.core.utils.decorators import staticclass
+
+
+_DEFAULT_FLOW_NAMES = ("default", "ollama", "lm_studio")
+_MAX_BOT_FLOWS = 256
+
+_default_flows: dict[str, bytes] = {}
+_bot_flows: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+_lock = Lock()
+
+
+@staticclass
+class FlowCache:
+    """Keeps the flow definitions parsed, so a run copies a definition instead of reading and parsing its JSON.
+
+    The default flows are loaded once by :meth:`preload`. A bot's own flow is keyed by the bot UID and the hash of its
+    JSON, so a changed flow gets a new entry and replaces the old one.
+
+    Graphs are not cached: the tweaks of a run are applied to the definition before Langflow builds the graph, and a
+    graph keeps the state of its run.
+    """
+
+    @staticmethod
+    def preload() -> None:
+        for name in _DEFAULT_FLOW_NAMES:
+            FlowCache._get_default_flow_template(name)
+
+    @staticmethod
+    def get_default_flow(tweaks: dict | None = None) -> dict[str, Any]:
+        """Gets a copy of the default flow matching the LLM of the tweaks.
+
+        :param tweaks: Tweaks of the run
+        """
+        name = "default"
+        if tweaks:
+            if "Ollama" in tweaks:
+                name = "ollama"
+            elif "LM Studio" in tweaks:
+                name = "lm_studio"
+        return pickle_loads(FlowCache._get_default_flow_template(name))
+
+    @staticmethod
+    def get_bot_flow(bot_uid: str, flow_json: str) -> dict[str, Any]:
+        """Gets a copy of a bot's own flow.
+
+        :param bot_uid: UID of the bot
+        :param flow_json: Flow JSON of the bot
+        """
+        key = (bot_uid, sha256(flow_json.encode()).hexdigest())
+        with _lock:
+            template = _bot_flows.get(key)
+            if template is not None:
+                _bot_flows.move_to_end(key)
+
+        if template is None:
+            template = pickle_dumps(json_loads(flow_json), protocol=HIGHEST_PROTOCOL)
+            with _lock:
+                for old_key in [old_key for old_key in _bot_flows if old_key[0] == bot_uid]:
+                    del _bot_flows[old_key]
+                _bot_flows[key] = template
+                while len(_bot_flows) > _MAX_BOT_FLOWS:
+                    _bot_flows.popitem(last=False)
+
+        return pickle_loads(template)
+
+    @staticmethod
+    def _get_default_flow_template(name: str) -> bytes:
+        template = _default_flows.get(name)
+        if template is None:
+            with open(get_resource_path("flows", f"{name}_flow.json"), "r", encoding="utf-8") as f:
+                template = pickle_dumps(json_loads(f.read()), protocol=HIGHEST_PROTOCOL)
+            _default_flows[name] = template
+        return template
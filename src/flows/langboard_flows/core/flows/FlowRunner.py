@@ -4,8 +4,8 @@ from typing import AsyncGenerator, Literal
 from langboard_shared.core.caching import Cache
 from langboard_shared.core.db import DbSession
 from langboard_shared.core.logger import Logger
-from langboard_shared.domain.models import Bot, BotLog, InternalBot, Project
-from langboard_shared.domain.models.BotLog import BotLogMessage, BotLogType
+from langboard_shared.domain.models import Bot, BotLog, BotLogStack, InternalBot, Project
+from langboard_shared.domain.models.BotLog import BotLogType
 from langboard_shared.publishers import CardPublisher, ProjectBotPublisher, ProjectColumnPublisher
 from langflow.events.event_manager import EventManager, create_stream_tokens_event_manager
 from langflow.exceptions.serialization import SerializationError
@@ -18,8 +18,10 @@ from ..schema.Exception import InvalidChatInputError
 
 
 class FlowRunner:
-    BOT_STATUS_MAP_CACHE_PREFIX = "bot.status.map"
-    BOT_STATUS_MAP_INDEX_CACHE_KEY = "bot.status.map:index"
+    BOT_STATUS_MAP_CACHE_PREFIX = "bot.status.running"
+    BOT_STATUS_MAP_INDEX_CACHE_KEY = "bot.status.running:index"
+    LEGACY_BOT_STATUS_MAP_CACHE_KEYS = ("bot.status.map", "bot.status.map:index")
+    BOT_STATUS_TTL = 24 * 60 * 60
 
     def __init__(
         self,
@@ -55,12 +57,14 @@ class FlowRunner:
 
     @classmethod
     def clear_bot_status_cache(cls) -> None:
-        project_uids: list[str] = Cache.get(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY) or []
-        for project_uid in project_uids:
-            Cache.delete(cls._get_bot_status_cache_key(project_uid))
-
-        Cache.delete(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY)
-        Cache.delete(FlowRunner.BOT_STATUS_MAP_CACHE_PREFIX)
+        project_uids = Cache.hgetall(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY)
+        Cache.delete_many(
+            [
+                *[cls._get_bot_status_cache_key(project_uid) for project_uid in project_uids],
+                FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY,
+                *FlowRunner.LEGACY_BOT_STATUS_MAP_CACHE_KEYS,
+            ]
+        )
 
     async def __run_flow_generator(self, event_manager: EventManager, client_consumed_queue: asyncio.Queue) -> None:
         try:
@@ -160,11 +164,15 @@ class FlowRunner:
                 event_manager=event_manager,
             )
             await self._update_log(BotLogType.Success, "Flow successfully completed", "stopped")
+        except asyncio.CancelledError:
+            await self._update_log(BotLogType.Error, "Flow cancelled", "stopped")
+            raise
         except Exception as e:
             Logger.main.exception(e)
             await self._update_log(BotLogType.Error, str(e), "stopped")
-
-        await self._publish_status("stopped")
+        finally:
+            # The running count must be released even when the run is cancelled or the log update fails.
+            await self._publish_status("stopped")
 
         return run_outputs, self.graph.session_id
 
@@ -204,17 +212,15 @@ class FlowRunner:
 
         log = BotLog(**log)
         log.log_type = log_type
-        log_stack = BotLogMessage(message=stack, log_type=log_type)
-        message_stack = log.message_stack
-        message_stack.append(log_stack)
-        log.message_stack = message_stack
+        log_stack = BotLogStack(bot_log_id=log.id, message=stack, log_type=log_type)
 
         with DbSession.use(readonly=False) as db:
             db.update(log)
+            db.insert(log_stack)
 
         if self.raw_project and scope_log:
             project = Project(**self.raw_project)
-            ProjectBotPublisher.log_stack_added(project, log, log_stack, status)
+            ProjectBotPublisher.log_stack_added(project, log, log_stack.to_message(), status)
 
     async def _publish_status(self, status: Literal["running", "stopped"]) -> None:
         if not self.raw_project or not self.input_request.tweaks or not self.raw_bot:
@@ -246,42 +252,25 @@ class FlowRunner:
         else:
             return
 
-        cache_key = self._get_bot_status_cache_key(project_uid)
-        status_map: dict = Cache.get(cache_key) or {}
-        type_map = status_map.setdefault(target_type, {})
-        status_list = list(type_map.setdefault(target_uid, []))
-
-        if status == "running":
-            if bot_uid not in status_list:
-                status_list.append(bot_uid)
-            type_map[target_uid] = status_list
-        else:
-            type_map[target_uid] = [uid for uid in status_list if uid != bot_uid]
-            if not type_map[target_uid]:
-                del type_map[target_uid]
-            if not type_map:
-                del status_map[target_type]
-
-        Cache.set(cache_key, status_map, ttl=24 * 60 * 60)
-        self._sync_bot_status_cache_index(project_uid, has_status=bool(status_map))
+        amount = 1 if status == "running" else -1
+        field = f"{target_type}:{target_uid}:{bot_uid}"
+        await Cache.ahincr(self._get_bot_status_cache_key(project_uid), field, amount, ttl=FlowRunner.BOT_STATUS_TTL)
+        await Cache.ahincr(
+            FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY, project_uid, amount, ttl=FlowRunner.BOT_STATUS_TTL
+        )
         publisher.bot_status_changed(project_uid, bot_uid, target_uid, status)
 
     @classmethod
-    def _sync_bot_status_cache_index(cls, project_uid: str, has_status: bool) -> None:
-        project_uids: list[str] = Cache.get(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY) or []
-
-        if has_status:
-            if project_uid not in project_uids:
-                project_uids.append(project_uid)
-                Cache.set(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY, project_uids, ttl=24 * 60 * 60)
-            return
-
-        updated_project_uids = [uid for uid in project_uids if uid != project_uid]
-        Cache.delete(cls._get_bot_status_cache_key(project_uid))
-        if updated_project_uids:
-            Cache.set(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY, updated_project_uids, ttl=24 * 60 * 60)
-        else:
-            Cache.delete(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY)
+    def get_bot_status_map(cls, project_uid: str) -> dict[str, dict[str, list[str]]]:
+        """Gets the running bot UIDs of the project by target type and target UID.
+
+        :param project_uid: UID of the project
+        """
+        status_map: dict[str, dict[str, list[str]]] = {}
+        for field in Cache.hgetall(cls._get_bot_status_cache_key(project_uid)):
+            target_type, target_uid, bot_uid = field.split(":", 2)
+            status_map.setdefault(target_type, {}).setdefault(target_uid, []).append(bot_uid)
+        return status_map
 
     @classmethod
     def _get_bot_status_cache_key(cls, project_uid: str) -> str:
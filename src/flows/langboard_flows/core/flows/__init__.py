@@ -1,6 +1,8 @@
+from .FlowCache import FlowCache
 from .FlowRunner import FlowRunner
 
 
 __all__ = [
+    "FlowCache",
     "FlowRunner",
 ]
@@ -1,11 +1,9 @@
 from json import dumps as json_dumps
-from json import loads as json_loads
 from typing import Literal, cast
 from fastapi import BackgroundTasks, HTTPException, status
 from fastapi.responses import StreamingResponse
 from langboard_shared.core.db import DbSession, SqlBuilder
 from langboard_shared.core.logger import Logger
-from langboard_shared.core.resources import get_resource_path
 from langboard_shared.core.routing import ApiErrorCode, ApiException, AppRouter, JsonResponse
 from langboard_shared.core.types import SnowflakeID
 from langboard_shared.domain.models import BotLog
@@ -17,19 +15,19 @@ from langboard_shared.domain.services import DomainService
 from langboard_shared.helpers import ModelHelper
 from langflow.load import aload_flow_from_json
 from sqlalchemy import Row
-from ..core.flows import FlowRunner
+from ..core.flows import FlowCache, FlowRunner
 from ..core.schema import FlowRequestModel
 from ..core.schema.Exception import APIException, InvalidChatInputError
 
 
 @AppRouter.api.post("/api/v1/run/{anypath}")
 async def run_flow(api_request: FlowRequestModel, stream: bool = False, service: DomainService = DomainService.scope()):
-    result = _get_flow_json(api_request)
+    result = _get_flow(api_request)
     if isinstance(result, ApiErrorCode):
         raise ApiException.NotFound_404(result)
 
-    bot, bot_json = result
-    graph = await aload_flow_from_json(flow=json_loads(bot_json), tweaks=api_request.tweaks)
+    bot, flow = result
+    graph = await aload_flow_from_json(flow=flow, tweaks=api_request.tweaks)
 
     project = await _get_raw_project(service, api_request)
     bot_log = _get_raw_bot_log(api_request)
@@ -74,16 +72,16 @@ async def run_flow(api_request: FlowRequestModel, stream: bool = False, service:
 async def webhook_run_flow(
     api_request: FlowRequestModel, background_tasks: BackgroundTasks, service: DomainService = DomainService.scope()
 ):
-    result = _get_flow_json(api_request)
+    result = _get_flow(api_request)
     if isinstance(result, ApiErrorCode):
         return JsonResponse(content=result, status_code=status.HTTP_404_NOT_FOUND)
 
-    bot, bot_json = result
+    bot, flow = result
     if not api_request.tweaks:
         api_request.tweaks = {}
     api_request.tweaks["Webhook"] = {"data": {"tweaks": json_dumps(api_request.tweaks)}}
 
-    graph = await aload_flow_from_json(flow=json_loads(bot_json), tweaks=api_request.tweaks)
+    graph = await aload_flow_from_json(flow=flow, tweaks=api_request.tweaks)
 
     project = await _get_raw_project(service, api_request)
     bot_log = _get_raw_bot_log(api_request)
@@ -106,7 +104,7 @@ async def webhook_run_flow(
     return JsonResponse(content={"message": "Task started in the background", "status": "in progress"})
 
 
-def _get_flow_json(api_request: FlowRequestModel) -> ApiErrorCode | tuple[InternalBot | Bot, str]:
+def _get_flow(api_request: FlowRequestModel) -> ApiErrorCode | tuple[InternalBot | Bot, dict]:
     if api_request.run_type == "internal_bot":
         bot_class = InternalBot
         bot_code = ApiErrorCode.NF3001
@@ -128,10 +126,10 @@ def _get_flow_json(api_request: FlowRequestModel) -> ApiErrorCode | tuple[Intern
 
     if isinstance(bot, InternalBot):
         if bot.platform == BotPlatform.Default and bot.platform_running_type == BotPlatformRunningType.Default:
-            return bot, _get_default_flow(api_request.tweaks)
-        return bot, bot.value
+            return bot, FlowCache.get_default_flow(api_request.tweaks)
+        return bot, FlowCache.get_bot_flow(api_request.uid, bot.value)
     elif isinstance(bot, Bot):
-        return bot, _get_default_flow(api_request.tweaks)
+        return bot, FlowCache.get_default_flow(api_request.tweaks)
     else:
         return bot_code
 
@@ -173,17 +171,3 @@ async def _get_raw_project(service: DomainService, api_request: FlowRequestModel
 
     project = service.project.get_by_id_like(api_request.project_uid)
     return project.model_dump() if project else None
-
-
-def _get_default_flow(tweaks: dict | None = None) -> str:
-    json_filename = "default"
-    if tweaks:
-        if "Ollama" in tweaks:
-            json_filename = "ollama"
-        elif "LM Studio" in tweaks:
-            json_filename = "lm_studio"
-
-    flow_json_path = get_resource_path("flows", f"{json_filename}_flow.json")
-    with open(flow_json_path, "r", encoding="utf-8") as f:
-        default_flow_json = f.read()
-    return default_flow_json
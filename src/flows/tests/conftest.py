@@ -0,0 +1,16 @@
+from os import environ
+from pathlib import Path
+from tempfile import mkdtemp
+
+
+_TEST_DATA_DIR = Path(mkdtemp(prefix="langboard-flows-tests-"))
+
+environ.setdefault("PROJECT_NAME", "langboard")
+environ.setdefault("MAIN_DATABASE_URL", f"sqlite:///{_TEST_DATA_DIR / 'main.db'}")
+environ.setdefault("CACHE_TYPE", "in-memory")
+
+from langboard_shared.Env import Env  # noqa: E402
+
+
+# Modules create their directories on import, so the data directory is moved before any of them are imported.
+setattr(type(Env), "DATA_DIR", property(lambda _: _TEST_DATA_DIR))
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from importlib import import_module
+from json import dumps as json_dumps
+from json import loads as json_loads
+import pytest
+from langboard_shared.core.resources import get_resource_path
+from langboard_flows.core.flows import FlowCache
+
+
+@pytest.fixture
+def flow_cache_module(monkeypatch: pytest.MonkeyPatch):
+    flow_cache_module = import_module("langboard_flows.core.flows.FlowCache")
+    monkeypatch.setattr(flow_cache_module, "_default_flows", {})
+    monkeypatch.setattr(flow_cache_module, "_bot_flows", OrderedDict())
+    return flow_cache_module
+
+
+def _read_flow(name: str) -> dict:
+    with open(get_resource_path("flows", f"{name}_flow.json"), "r", encoding="utf-8") as f:
+        return json_loads(f.read())
+
+
+def _bot_flow_json(name: str) -> str:
+    return json_dumps({"data": {"nodes": [{"id": name, "data": {"value": name}}], "edges": []}})
+
+
+def test_default_flows_are_read_once_and_copied_for_each_run(flow_cache_module, monkeypatch):
+    FlowCache.preload()
+
+    def read_again(*_):
+        raise AssertionError("The flow was read again.")
+
+    monkeypatch.setattr(flow_cache_module, "get_resource_path", read_again)
+
+    first = FlowCache.get_default_flow()
+    second = FlowCache.get_default_flow()
+
+    assert first == second == _read_flow("default")
+    first["data"]["nodes"].clear()
+    assert second["data"]["nodes"] and FlowCache.get_default_flow()["data"]["nodes"]
+
+
+@pytest.mark.parametrize(
+    "tweaks, name", [(None, "default"), ({"Ollama": {}}, "ollama"), ({"LM Studio": {}}, "lm_studio")]
+)
+def test_picks_the_default_flow_of_the_llm(flow_cache_module, tweaks, name):
+    assert FlowCache.get_default_flow(tweaks) == _read_flow(name)
+
+
+def test_bot_flows_are_keyed_by_their_json(flow_cache_module):
+    first_json, second_json = _bot_flow_json("first"), _bot_flow_json("second")
+
+    flow = FlowCache.get_bot_flow("bot", first_json)
+    flow["data"]["nodes"].clear()
+
+    assert FlowCache.get_bot_flow("bot", first_json) == json_loads(first_json)
+    assert FlowCache.get_bot_flow("other-bot", first_json) == json_loads(first_json)
+    assert len(flow_cache_module._bot_flows) == 2
+
+    assert FlowCache.get_bot_flow("bot", second_json) == json_loads(second_json)
+    assert [bot_uid for bot_uid, _ in flow_cache_module._bot_flows] == ["other-bot", "bot"]
+
+
+def test_bot_flows_drop_the_least_recently_used(flow_cache_module, monkeypatch):
+    monkeypatch.setattr(flow_cache_module, "_MAX_BOT_FLOWS", 2)
+    flow_json = _bot_flow_json("flow")
+
+    FlowCache.get_bot_flow("first", flow_json)
+    FlowCache.get_bot_flow("second", flow_json)
+    FlowCache.get_bot_flow("first", flow_json)
+    FlowCache.get_bot_flow("third", flow_json)
+
+    assert [bot_uid for bot_uid, _ in flow_cache_module._bot_flows] == ["first", "third"]
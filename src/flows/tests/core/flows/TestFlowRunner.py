@@ -0,0 +1,104 @@
+import asyncio
+from importlib import import_module
+from types import SimpleNamespace
+import pytest
+from langboard_shared.core.caching import Cache
+from langboard_flows.core.flows import FlowRunner
+from langboard_flows.core.schema import FlowRequestModel
+
+
+CARD_UID = "card-uid"
+
+
+class FakeGraph:
+    def __init__(self, arun):
+        self.vertices = []
+        self.session_id = None
+        self.arun = arun
+
+
+@pytest.fixture
+def published_statuses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    statuses = []
+
+    class CardPublisher:
+        @staticmethod
+        def bot_status_changed(project_uid: str, bot_uid: str, card_uid: str, status: str):
+            statuses.append(status)
+
+    flow_runner_module = import_module("langboard_flows.core.flows.FlowRunner")
+    monkeypatch.setattr(flow_runner_module, "CardPublisher", CardPublisher)
+    monkeypatch.setattr(
+        flow_runner_module,
+        "get_settings_service",
+        lambda: SimpleNamespace(settings=SimpleNamespace(fallback_to_env_var=False)),
+    )
+    FlowRunner.clear_bot_status_cache()
+    return statuses
+
+
+def _create_runner(arun) -> FlowRunner:
+    return FlowRunner(
+        FakeGraph(arun),  # type: ignore
+        FlowRequestModel(
+            session_id="session",
+            run_type="bot",
+            uid="bot-uid",
+            output_component="output",
+            tweaks={"rest_data": {"card_uid": CARD_UID}},
+        ),
+        raw_project={"id": 1},
+        raw_bot=("bot", {"id": 2}),
+    )
+
+
+def _running_counts() -> tuple[dict[str, int], dict[str, int]]:
+    index = Cache.hgetall(FlowRunner.BOT_STATUS_MAP_INDEX_CACHE_KEY)
+    counts = {}
+    for project_uid in index:
+        counts.update(Cache.hgetall(FlowRunner._get_bot_status_cache_key(project_uid)))
+    return index, counts
+
+
+async def test_cancelled_run_releases_the_running_count(published_statuses):
+    started = asyncio.Event()
+
+    async def arun(**_):
+        started.set()
+        await asyncio.Event().wait()
+
+    task = asyncio.create_task(_create_runner(arun).run())
+    await started.wait()
+    assert list(_running_counts()[1].values()) == [1]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert _running_counts() == ({}, {})
+    assert published_statuses == ["running", "stopped"]
+
+
+async def test_failed_run_releases_only_its_own_running_count(published_statuses):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking_arun(**_):
+        started.set()
+        await release.wait()
+        return []
+
+    async def failing_arun(**_):
+        raise RuntimeError("failed")
+
+    task = asyncio.create_task(_create_runner(blocking_arun).run())
+    await started.wait()
+    await _create_runner(failing_arun).run()
+
+    assert list(_running_counts()[1].values()) == [1]
+
+    release.set()
+    await task
+
+    assert _running_counts() == ({}, {})
+    assert published_statuses == ["running", "running", "stopped", "stopped"]
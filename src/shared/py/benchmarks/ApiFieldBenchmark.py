@@ -0,0 +1,54 @@
+"""Micro-benchmark for converting models to API responses.
+
+Compares the previous path (each model's API fields found through the token registry and converted field by field) with
+the compiled :class:`ApiFieldPlan` used by :meth:`ApiField.convert` and :meth:`ApiField.convert_many`.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.ApiFieldBenchmark [--number N]``
+"""
+
+from typing import Any
+from langboard_shared.core.db import ApiField, BaseSqlModel, EditorContentModel
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import Card
+from .BenchmarkUtils import parse_number, run
+
+
+_CARD_COUNT = 2_000
+
+
+def _field_convert(model: BaseSqlModel) -> dict[str, Any]:
+    """The previous :meth:`ApiField.convert`."""
+    api_result: dict[str, Any] = {}
+    for field_name, api_field, _ in ApiField._ApiField__iter_api_fields(model):  # type: ignore
+        api_result.update(api_field.field_convert(model, field_name, getattr(model, field_name, None)))
+    return api_result
+
+
+def _create_cards() -> list[Card]:
+    return [
+        Card(
+            id=SnowflakeID(),
+            project_id=SnowflakeID(),
+            project_column_id=SnowflakeID(),
+            title=f"Card {i}",
+            description=EditorContentModel(content="Lorem ipsum " * 20),
+            deadline_at=SafeDateTime.now(),
+            order=i,
+        )
+        for i in range(_CARD_COUNT)
+    ]
+
+
+def main() -> None:
+    number = parse_number(20)
+
+    cards = _create_cards()
+
+    run(f"{_CARD_COUNT} cards: field by field", lambda: [_field_convert(card) for card in cards], number)
+    run(f"{_CARD_COUNT} cards: ApiField.convert", lambda: [ApiField.convert(card) for card in cards], number)
+    run(f"{_CARD_COUNT} cards: ApiField.convert_many", lambda: ApiField.convert_many(cards), number)
+
+
+if __name__ == "__main__":
+    main()
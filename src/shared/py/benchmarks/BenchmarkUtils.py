@@ -0,0 +1,61 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+from timeit import timeit
+from typing import Any, Callable, Iterator
+
+
+def parse_number(default: int) -> int:
+    """Parses ``--number``, the times each case is run."""
+    parser = ArgumentParser()
+    parser.add_argument("--number", type=int, default=default)
+    return parser.parse_args().number
+
+
+def run(name: str, func: Callable[[], Any], number: int) -> float:
+    """Runs the function and prints the time per run.
+
+    :return: Seconds per run
+    """
+    elapsed = timeit(func, number=number) / number
+    print(f"{name:<56} {elapsed * 1_000_000:>10.2f} us/op")
+    return elapsed
+
+
+class _DelayedServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 would make concurrent requests wait for each other to connect.
+    request_queue_size = 64
+
+
+@contextmanager
+def serve_http(delay: float) -> Iterator[str]:
+    """Serves a local HTTP server that answers every POST with an empty 200 after the delay.
+
+    :param delay: Seconds each response takes
+    :return: Base URL of the server
+    """
+
+    class DelayedHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = _DelayedServer(("127.0.0.1", 0), DelayedHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
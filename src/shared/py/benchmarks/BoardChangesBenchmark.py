@@ -0,0 +1,47 @@
+"""Micro-benchmark for catching up on the changes of a board.
+
+Compares the previous path (reloading the board with :meth:`CardService.get_board_snapshot`) with
+:meth:`CardService.get_board_changes` after a few card edits.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.BoardChangesBenchmark [--number N]``
+"""
+
+from json import dumps as json_dumps
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.core.utils.Converter import json_default
+from langboard_shared.domain.models import ProjectChange, ProjectChangeTarget
+from langboard_shared.domain.services import DomainService
+from langboard_shared.helpers import ProjectChangeHelper
+from .BenchmarkUtils import parse_number, run
+from .BoardSnapshotBenchmark import CARD_COUNT, create_board
+
+
+_EDIT_COUNT = 4
+
+
+def main() -> None:
+    number = parse_number(20)
+
+    ProjectChange.metadata.create_all(DbEngine.get_main_engine(), tables=[ProjectChange.__table__])  # type: ignore
+    project = create_board()
+    service = DomainService()
+
+    card_uids = [card["uid"] for card in service.card.get_board_list(project)]
+    for card_uid in card_uids[:: len(card_uids) // _EDIT_COUNT][:_EDIT_COUNT]:
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, SnowflakeID.from_short_code(card_uid))
+
+    name = f"{CARD_COUNT} cards, {_EDIT_COUNT} edited"
+    run(f"{name}: snapshot", lambda: service.card.get_board_snapshot(project.id), number)
+    run(f"{name}: changes", lambda: service.card.get_board_changes(project.id, since=0), number)
+
+    for name, board in (
+        ("snapshot", service.card.get_board_snapshot(project.id)),
+        ("changes", service.card.get_board_changes(project.id, since=0)),
+    ):
+        print(f"{f'{CARD_COUNT} cards JSON: {name}':<56} {len(json_dumps(board, default=json_default)):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
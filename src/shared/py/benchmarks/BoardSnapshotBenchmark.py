@@ -0,0 +1,124 @@
+"""Micro-benchmark for loading a whole board.
+
+Compares the previous path (:meth:`CardService.get_board_list`, with separate member, label, and comment reads) with
+:meth:`CardService.get_board_snapshot`, which aggregates the cards in one query, and its compact format.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.BoardSnapshotBenchmark [--number N]``
+"""
+
+from json import dumps as json_dumps
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.core.utils.Converter import json_default
+from langboard_shared.domain.models import (
+    Card,
+    CardAssignedProjectLabel,
+    CardAssignedUser,
+    CardComment,
+    CardRelationship,
+    GlobalCardRelationshipType,
+    Project,
+    ProjectColumn,
+    ProjectLabel,
+    User,
+)
+from langboard_shared.domain.services import DomainService
+from .BenchmarkUtils import parse_number, run
+
+
+CARD_COUNT = 300
+_TABLES = [
+    User,
+    Project,
+    ProjectColumn,
+    ProjectLabel,
+    Card,
+    CardAssignedUser,
+    CardComment,
+    CardAssignedProjectLabel,
+    GlobalCardRelationshipType,
+    CardRelationship,
+]
+
+
+def create_board() -> Project:
+    """Creates a project whose cards have members, comments, labels, and relationships."""
+    Card.metadata.create_all(DbEngine.get_main_engine(), tables=[table.__table__ for table in _TABLES])  # type: ignore
+    with DbSession.use(readonly=False) as db:
+        users = [
+            User(firstname=f"First{i}", lastname=f"Last{i}", email=f"user{i}@langboard.test", password="password")
+            for i in range(5)
+        ]
+        db.insert_all(users)
+        project = Project(owner_id=users[0].id, title="Project")
+        db.insert(project)
+        columns = [ProjectColumn(project_id=project.id, name=f"Column {i}", order=i) for i in range(5)]
+        labels = [
+            ProjectLabel(project_id=project.id, name=f"Label {i}", color="#000000", description="", order=i)
+            for i in range(8)
+        ]
+        db.insert_all([*columns, *labels])
+        cards = [
+            Card(
+                project_id=project.id,
+                project_column_id=columns[i % len(columns)].id,
+                title=f"Card {i}",
+                order=i // len(columns),
+            )
+            for i in range(CARD_COUNT)
+        ]
+        db.insert_all(cards)
+        relationship_type = GlobalCardRelationshipType(parent_name="Parent", child_name="Child")
+        db.insert(relationship_type)
+        for i, card in enumerate(cards):
+            db.insert_all(
+                [
+                    *(
+                        CardAssignedUser(project_assigned_id=SnowflakeID(1), card_id=card.id, user_id=user.id)
+                        for user in users[: i % 3]
+                    ),
+                    *(CardComment(card_id=card.id, user_id=users[0].id) for _ in range(i % 4)),
+                    *(
+                        CardAssignedProjectLabel(card_id=card.id, project_label_id=label.id)
+                        for label in labels[: i % 3]
+                    ),
+                ]
+            )
+            if i % 10 == 1:
+                db.insert(
+                    CardRelationship(
+                        relationship_type_id=relationship_type.id, card_id_parent=cards[i - 1].id, card_id_child=card.id
+                    )
+                )
+    return project
+
+
+def main() -> None:
+    number = parse_number(20)
+
+    project = create_board()
+    service = DomainService()
+
+    def get_previous_board():
+        return {
+            "columns": service.project_column.get_api_list_by_project(project),
+            "labels": service.project_label.get_api_list_by_project(project),
+            "cards": service.card.get_board_list(project),
+        }
+
+    run(f"{CARD_COUNT} cards: board list, columns and labels", get_previous_board, number)
+    run(f"{CARD_COUNT} cards: snapshot", lambda: service.card.get_board_snapshot(project), number)
+    run(f"{CARD_COUNT} cards: compact snapshot", lambda: service.card.get_board_snapshot(project, compact=True), number)
+
+    for name, board in (
+        ("board list, columns and labels", get_previous_board()),
+        ("snapshot", service.card.get_board_snapshot(project)),
+        ("compact snapshot", service.card.get_board_snapshot(project, compact=True)),
+    ):
+        print(f"{f'{CARD_COUNT} cards JSON: {name}':<56} {len(json_dumps(board, default=json_default)):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Micro-benchmark for requesting the bots of an event.
+
+Compares the previous path (each bot awaited in turn, with a blocking ``httpx.post``) with :meth:`BotTaskHelper.run`,
+which requests the bots concurrently on the pooled clients of :class:`BaseBotRequest`.
+
+The bots are served by a local HTTP server that answers after :data:`_RESPONSE_DELAY` seconds. The bot logs are not
+written, so only the requests are measured.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.BotRequestBenchmark [--number N]``
+"""
+
+from asyncio import run as run_async
+from importlib import import_module
+from logging import WARNING
+from typing import Any
+from httpx import post
+from langboard_shared.ai import BotDefaultTrigger
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import Bot
+from langboard_shared.domain.models.BaseBotModel import BotPlatform, BotPlatformRunningType
+from langboard_shared.tasks.bots.utils.BotTaskHelper import BotTaskHelper
+from langboard_shared.tasks.bots.utils.requests.BaseBotRequest import BaseBotRequest, RequestData, logger
+from .BenchmarkUtils import parse_number, run, serve_http
+
+
+_BOT_COUNT = 8
+_RESPONSE_DELAY = 0.05
+
+
+class _UnloggedRequest(BaseBotRequest):
+    def create_request_data(self, bot_log) -> RequestData:
+        return {"url": self._base_url, "data": self._data}
+
+    async def _create_log(self, log_type, message):
+        return None, None
+
+    async def _update_log(self, bot_log, log_type, stack) -> None:
+        pass
+
+
+def main() -> None:
+    number = parse_number(5)
+    logger.setLevel(WARNING)
+
+    with serve_http(_RESPONSE_DELAY) as url:
+        bots = [
+            Bot(
+                id=SnowflakeID(),
+                name=f"Bot {i}",
+                bot_uname=f"bot-{i}",
+                api_url=f"{url}/bots/{i}",
+                app_api_token="token",
+                platform=BotPlatform.N8N,
+                platform_running_type=BotPlatformRunningType.Default,
+            )
+            for i in range(_BOT_COUNT)
+        ]
+        data: dict[str, Any] = {"card_uid": "card", "title": "Card title"}
+
+        bot_task_helper_module = import_module(BotTaskHelper.__module__)
+        bot_task_helper_module.WebhookTask.webhook_task = lambda *_: None
+        bot_task_helper_module.create_request = lambda bot, event, data, project, scope_model: _UnloggedRequest(
+            bot, bot.api_url, event, data, project, scope_model
+        )
+
+        def request_in_turn():
+            for bot in bots:
+                post(bot.api_url, json={"event": "bot_mentioned", "data": data}).raise_for_status()
+
+        def request_concurrently():
+            run_async(BotTaskHelper.run(bots, BotDefaultTrigger.BotMentioned, data))
+
+        request_concurrently()
+
+        run(f"{_BOT_COUNT} bots: post in turn", request_in_turn, number)
+        run(f"{_BOT_COUNT} bots: BotTaskHelper.run", request_concurrently, number)
+
+
+if __name__ == "__main__":
+    main()
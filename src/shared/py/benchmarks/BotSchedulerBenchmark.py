@@ -0,0 +1,64 @@
+"""Micro-benchmark for a bot schedule tick.
+
+Compares the previous path (crontab starting a new process for each interval on every tick, which imports the bot
+schedule task before it can query the schedules) with :class:`BotScheduler`, which loads the schedules once and pops
+the due ones from its heap.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.BotSchedulerBenchmark [--number N]``
+"""
+
+from datetime import timedelta
+from logging import WARNING
+from subprocess import run as run_process
+from sys import executable
+from langboard_shared.ai import BotScheduler
+from langboard_shared.ai.BotScheduler import logger
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import BotSchedule
+from langboard_shared.domain.models.BotSchedule import BotScheduleRunningType, BotScheduleStatus
+from .BenchmarkUtils import parse_number, run
+
+
+_SCHEDULE_COUNT = 1000
+
+
+def _start_cron_process() -> None:
+    """The work the previous ``run:bot:cron`` command did before it could look for the schedules of an interval."""
+    run_process([executable, "-c", "from langboard_shared.tasks.bots import BotScheduleTask"], check=True)
+
+
+def main() -> None:
+    number = parse_number(3)
+
+    BotSchedule.metadata.create_all(DbEngine.get_main_engine(), tables=[BotSchedule.__table__])  # type: ignore
+    with DbSession.use(readonly=False) as db:
+        db.insert_all(
+            [
+                BotSchedule(
+                    bot_id=SnowflakeID(1),
+                    running_type=BotScheduleRunningType.Infinite,
+                    status=BotScheduleStatus.Started,
+                    interval_str=f"{i % 60} * * * *",
+                )
+                for i in range(_SCHEDULE_COUNT)
+            ]
+        )
+
+    logger.setLevel(WARNING)
+    scheduler = BotScheduler(lambda _: None)
+    ticks = iter(SafeDateTime.now() + timedelta(minutes=minute) for minute in range(1, 1_000_000))
+
+    def reload_all():
+        scheduler._should_reload_all = True
+        scheduler._reload()
+
+    run("tick: new process per interval", _start_cron_process, number)
+    run(f"{_SCHEDULE_COUNT} schedules: BotScheduler full reload", reload_all, number * 10)
+    run(f"{_SCHEDULE_COUNT} schedules: BotScheduler tick", lambda: scheduler._pop_due_ids(next(ticks)), number * 1000)
+
+
+if __name__ == "__main__":
+    main()
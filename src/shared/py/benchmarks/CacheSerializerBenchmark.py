@@ -0,0 +1,81 @@
+"""Micro-benchmark for cache serialization of broadcast and user payloads.
+
+Compares the previous path (stdlib json, broadcast models encoded and decoded before caching) with
+:class:`JsonCacheSerializer`.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.CacheSerializerBenchmark [--number N]``
+"""
+
+from json import dumps as json_dumps
+from json import loads as json_loads
+from langboard_shared.core.broadcast.DispatcherModel import DispatcherModel
+from langboard_shared.core.caching.CacheSerializer import JsonCacheSerializer
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.core.utils.Converter import json_default
+from langboard_shared.domain.models import User
+from .BenchmarkUtils import parse_number, run
+
+
+def _create_user(index: int) -> User:
+    user = User(
+        id=SnowflakeID(),
+        firstname=f"First{index}",
+        lastname=f"Last{index}",
+        email=f"user{index}@langboard.test",
+        username=f"user-{index}",
+        password="password",
+        preferred_lang="en-US",
+        activated_at=SafeDateTime.now(),
+    )
+    user.created_at = SafeDateTime.now()
+    user.updated_at = SafeDateTime.now()
+    return user
+
+
+def _create_dispatcher_model(users: list[User]) -> DispatcherModel:
+    return DispatcherModel(
+        event="socket",
+        data={
+            "topic": "board",
+            "topic_id": SnowflakeID().to_short_code(),
+            "event": "board:card:details:changed",
+            "data": {
+                "uid": SnowflakeID().to_short_code(),
+                "title": "Card title",
+                "description": {"content": "Lorem ipsum dolor sit amet " * 20},
+                "deadline_at": SafeDateTime.now(),
+                "assigned_members": [user.api_response() for user in users],
+                "labels": [{"uid": SnowflakeID().to_short_code(), "name": f"label-{i}"} for i in range(5)],
+            },
+        },
+    )
+
+
+def main() -> None:
+    number = parse_number(10_000)
+
+    serializer = JsonCacheSerializer()
+    users = [_create_user(i) for i in range(20)]
+    user_payload = [user.api_response() for user in users]
+    model = _create_dispatcher_model(users[:5])
+
+    model_raw = json_dumps(json_loads(model.model_dump_json())["data"], default=json_default)
+    user_raw = json_dumps(user_payload, default=json_default)
+
+    run(
+        "DispatcherModel: stdlib (double encode)",
+        lambda: json_dumps(json_loads(model.model_dump_json())["data"], default=json_default),
+        number,
+    )
+    run("DispatcherModel: JsonCacheSerializer", lambda: serializer.dumps(model.model_dump(mode="json")["data"]), number)
+    run("DispatcherModel loads: stdlib", lambda: json_loads(model_raw), number)
+    run("DispatcherModel loads: JsonCacheSerializer", lambda: serializer.loads(model_raw), number)
+    run("User x20 dumps: stdlib", lambda: json_dumps(user_payload, default=json_default), number)
+    run("User x20 dumps: JsonCacheSerializer", lambda: serializer.dumps(user_payload), number)
+    run("User x20 loads: stdlib", lambda: json_loads(user_raw), number)
+    run("User x20 loads: JsonCacheSerializer", lambda: serializer.loads(user_raw), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Micro-benchmark for detaching selected models from the session.
+
+Compares the previous path (``detach="copy"``, a validated copy of every model) with ``detach="expunge"``, which
+removes the loaded models from the session and returns them as they are.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.DbSessionDetachBenchmark [--number N]``
+"""
+
+from sqlmodel import select
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.domain.models import Card
+from .BenchmarkUtils import parse_number, run
+
+
+_ROW_COUNT = 1_000
+
+
+def _create_cards() -> None:
+    Card.metadata.create_all(DbEngine.get_main_engine(), tables=[Card.__table__])  # type: ignore
+    with DbSession.use(readonly=False) as db:
+        db.insert_all(
+            Card(project_id=1, project_column_id=1, title=f"Card {i}", description={"content": "Lorem ipsum " * 20})
+            for i in range(_ROW_COUNT)
+        )
+
+
+def _select_cards(detach) -> None:
+    with DbSession.use(readonly=True) as db:
+        db.exec(select(Card), detach=detach).all()
+
+
+def main() -> None:
+    number = parse_number(20)
+
+    _create_cards()
+
+    copy_elapsed = run(f"select {_ROW_COUNT} cards: copy", lambda: _select_cards("copy"), number)
+    expunge_elapsed = run(f"select {_ROW_COUNT} cards: expunge", lambda: _select_cards("expunge"), number)
+    print(f"{'per row: copy':<56} {copy_elapsed / _ROW_COUNT * 1_000_000:>10.2f} us/row")
+    print(f"{'per row: expunge':<56} {expunge_elapsed / _ROW_COUNT * 1_000_000:>10.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Micro-benchmark for the SQLite cache used when ``CACHE_TYPE=in-memory``.
+
+Compares the previous path (a new connection, a schema check and an expiry sweep on every call) with
+:class:`InMemoryCache`, which keeps one WAL connection per process and sweeps in batches.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.InMemoryCacheBenchmark [--number N]``
+"""
+
+from itertools import count
+from json import dumps as json_dumps
+from json import loads as json_loads
+from sqlite3 import Connection
+from langboard_shared.core.caching.InMemoryCache import InMemoryCache
+from langboard_shared.core.types import SafeDateTime
+from langboard_shared.Env import Env
+from .BenchmarkUtils import parse_number, run
+
+
+class PerCallConnectionCache:
+    """The previous cache, which opened a connection on every call."""
+
+    def get(self, key: str):
+        self._expire()
+        with self._get_cache_db() as conn:
+            cursor = conn.execute(
+                "SELECT value, expiry FROM cache WHERE key = ? AND expiry > ?",
+                (key, int(SafeDateTime.now().timestamp())),
+            )
+            raw_value, _ = cursor.fetchone() or (None, None)
+            return None if raw_value is None else json_loads(raw_value)
+
+    def set(self, key: str, value, ttl: int = 0) -> None:
+        self._expire()
+        with self._get_cache_db() as conn:
+            expiry = int(SafeDateTime.now().timestamp()) + ttl
+            conn.execute("REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)", (key, json_dumps(value), expiry))
+            conn.commit()
+
+    def _expire(self) -> None:
+        with self._get_cache_db() as conn:
+            conn.execute("DELETE FROM cache WHERE expiry <= ?", (int(SafeDateTime.now().timestamp()),))
+            conn.commit()
+
+    def _get_cache_db(self) -> Connection:
+        conn = Connection(Env.CACHE_DIR / "per-call-cache.db")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expiry INTEGER NOT NULL)"
+        )
+        return conn
+
+
+def main() -> None:
+    number = parse_number(5_000)
+    value = {"id": 1, "username": "user", "email": "user@langboard.test", "roles": ["read", "update"]}
+
+    for name, cache in (("per-call connection", PerCallConnectionCache()), ("InMemoryCache", InMemoryCache())):
+        keys = count()
+        run(f"set + get: {name}", lambda: _set_and_get(cache, f"benchmark:{next(keys) % 1000}", value), number)
+        run(f"get (hit): {name}", lambda: cache.get("benchmark:1"), number)
+        run(f"get (miss): {name}", lambda: cache.get("benchmark:missing"), number)
+
+
+def _set_and_get(cache: PerCallConnectionCache | InMemoryCache, key: str, value) -> None:
+    cache.set(key, value, 60)
+    cache.get(key)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Micro-benchmark for in-memory broadcasts (``BROADCAST_TYPE=in-memory``).
+
+Compares the previous path (one JSON file per event in the broadcast directory) with :class:`MemoryDispatcherQueue`
+streaming the events over the Unix domain socket to a reader draining it like the socket server.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.MemoryBroadcastBenchmark [--number N]``
+"""
+
+import socket
+from importlib import import_module
+from threading import Thread
+from langboard_shared.core.broadcast.DispatcherModel import DispatcherModel
+from langboard_shared.core.broadcast.memory.MemoryDispatcherQueue import MemoryDispatcherQueue
+from .BenchmarkUtils import parse_number, run
+
+
+def _drain(server: socket.socket) -> None:
+    connection, _ = server.accept()
+    while connection.recv(1 << 20):
+        pass
+
+
+def main() -> None:
+    number = parse_number(20_000)
+    model = DispatcherModel(
+        event="socket",
+        data={
+            "topic": "board",
+            "topic_id": "project-uid",
+            "event": "board:card:details:changed",
+            "data": {"uid": "card-uid", "title": "Card title", "description": {"content": "Lorem ipsum " * 20}},
+        },
+    )
+
+    broadcast_dir = import_module("langboard_shared.core.broadcast.BaseDispatcherQueue")._BROADCAST_DIR
+    broadcast_dir.mkdir(parents=True, exist_ok=True)
+    socket_path = import_module("langboard_shared.core.broadcast.memory.MemoryDispatcherQueue")._BROADCAST_SOCKET_PATH
+    socket_path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    Thread(target=_drain, args=(server,), daemon=True).start()
+
+    queue = MemoryDispatcherQueue()
+    run("file per event", lambda: queue._record_model(model, file_only=True), number)
+    run("MemoryDispatcherQueue (Unix domain socket)", lambda: queue.put(model), number)
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Micro-benchmark for the change tracking of :class:`BaseSqlModel`.
+
+Compares the previous path (changes kept in a class-level dict keyed by ``"{table}:{id}"`` and only dropped by
+``clear_changes``) with the changes kept on each instance.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.ModelChangeBenchmark [--number N]``
+"""
+
+from gc import collect
+from itertools import count
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+from sqlmodel import SQLModel
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import Card
+from .BenchmarkUtils import parse_number, run
+
+
+_MODEL_COUNT = 20_000
+_LEGACY_CHANGES: dict[str, dict[str, Any]] = {}
+
+
+def _legacy_setattr(model: Card, name: str, value: Any) -> None:
+    """The previous tracking in ``BaseSqlModel.__setattr__``."""
+    change_key = f"{model.__tablename__}:{model.id}"
+    if not model.is_new() and name in type(model).model_fields.keys():
+        old_value = getattr(model, name)
+        if change_key not in _LEGACY_CHANGES:
+            _LEGACY_CHANGES[change_key] = {}
+        changes = _LEGACY_CHANGES[change_key]
+        if old_value != value:
+            if name not in changes:
+                changes[name] = old_value
+            elif changes[name] == value:
+                del changes[name]
+    SQLModel.__setattr__(model, name, value)
+
+
+def _setattr(model: Card, name: str, value: Any) -> None:
+    setattr(model, name, value)
+
+
+def _create_card(card_id: int) -> Card:
+    card = Card(id=SnowflakeID(card_id), project_id=1, project_column_id=1, title="Card")
+    card.clear_changes()
+    return card
+
+
+def _retained_bytes(set_value: Callable[[Card, str, Any], None]) -> int:
+    """Changes a model that is never saved, :data:`_MODEL_COUNT` times, and returns the memory left afterwards."""
+    collect()
+    start()
+    for card_id in range(1, _MODEL_COUNT + 1):
+        set_value(_create_card(card_id), "title", "Changed")
+    collect()
+    retained, _ = get_traced_memory()
+    stop()
+    return retained
+
+
+def main() -> None:
+    number = parse_number(20_000)
+
+    legacy_card, card = _create_card(1), _create_card(2)
+    titles = count()
+
+    run("setattr: class-level changes", lambda: _legacy_setattr(legacy_card, "title", f"{next(titles)}"), number)
+    run("setattr: instance changes", lambda: _setattr(card, "title", f"{next(titles)}"), number)
+
+    _LEGACY_CHANGES.clear()
+    print(f"{f'{_MODEL_COUNT} unsaved models: class-level changes':<56} {_retained_bytes(_legacy_setattr):>10} bytes")
+    print(f"{f'{_MODEL_COUNT} unsaved models: instance changes':<56} {_retained_bytes(_setattr):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
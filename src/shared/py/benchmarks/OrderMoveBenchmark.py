@@ -0,0 +1,69 @@
+"""Micro-benchmark for moving a card within a column.
+
+Compares the previous path (``ORDER_MODE=index``, which shifts the `order` of every card between the old and new
+positions) with ``ORDER_MODE=key``, which only updates the moved card. Rebalances that `key` mode queues in background
+are run inline.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.OrderMoveBenchmark [--number N]``
+"""
+
+from importlib import import_module
+from random import Random
+from sqlmodel import delete
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.domain.models import Card
+from langboard_shared.Env import Env
+from langboard_shared.helpers import InfraHelper
+from langboard_shared.infrastructure.repositories.factory.CardRepository import CardRepository
+from .BenchmarkUtils import parse_number, run
+
+
+_CARD_COUNT = 3_000
+_COLUMN_ID = 1
+
+
+class _InlineOrderTask:
+    @staticmethod
+    def rebalance_order(table_name: str, column: str, parent_ids: list[int]):
+        for parent_id in parent_ids:
+            InfraHelper.rebalance_order(Card, column, parent_id)
+
+
+def _create_cards(repository: CardRepository) -> list[int]:
+    with DbSession.use(readonly=False) as db:
+        db.exec(delete(Card), purge=True)
+    cards = [Card(project_id=1, project_column_id=_COLUMN_ID, title=f"Card {i}", order=i) for i in range(_CARD_COUNT)]
+    repository.insert(cards)
+    InfraHelper.rebalance_order(Card, "project_column_id", _COLUMN_ID)
+    return [card.id for card in cards]
+
+
+def _benchmark_moves(order_mode: str, number: int) -> None:
+    setattr(type(Env), "ORDER_MODE", property(lambda _: order_mode))
+    repository = CardRepository(lambda _: None, lambda _: None)
+    card_ids = _create_cards(repository)
+    random = Random(0)
+
+    def move():
+        old_order, new_order = random.randrange(_CARD_COUNT), random.randrange(_CARD_COUNT)
+        card_id = card_ids.pop(old_order)
+        card_ids.insert(new_order, card_id)
+        repository.update_row_order(card_id, _COLUMN_ID, old_order, new_order)
+
+    run(f"move in {_CARD_COUNT} cards: {order_mode} mode", move, number)
+
+
+def main() -> None:
+    number = parse_number(100)
+
+    Card.metadata.create_all(DbEngine.get_main_engine(), tables=[Card.__table__])  # type: ignore
+    setattr(import_module("langboard_shared.core.domain.BaseOrderRepository"), "OrderTask", _InlineOrderTask)
+
+    _benchmark_moves("index", number)
+    _benchmark_moves("key", number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Micro-benchmark for the role check of each request.
+
+Compares the previous path (the role read from the database on every :meth:`RoleSecurity.is_authorized` call) with the
+actions cached by :class:`RoleCache`, for a granted and a denied user.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.RoleCacheBenchmark [--number N]``
+"""
+
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import Project, ProjectRole, User
+from langboard_shared.domain.models.ProjectRole import ProjectRoleAction
+from langboard_shared.infrastructure.repositories import Repository
+from langboard_shared.security import RoleFinder
+from langboard_shared.security.RoleSecurity import RoleSecurity
+from .BenchmarkUtils import parse_number, run
+
+
+def _uncached_project_finder(query, path_params, user_id):
+    """The project role finder without :meth:`RoleCache.scope`, so every check reads the database."""
+    return RoleFinder.project(query, path_params, user_id)
+
+
+def main() -> None:
+    number = parse_number(2000)
+
+    tables = [User, Project, ProjectRole]
+    User.metadata.create_all(DbEngine.get_main_engine(), tables=[table.__table__ for table in tables])  # type: ignore
+
+    user = User(firstname="First", lastname="Last", email="user@langboard.test", password="password")
+    with DbSession.use(readonly=False) as db:
+        db.insert(user)
+        project = Project(owner_id=user.id, title="Project")
+        db.insert(project)
+    Repository().role.project.grant_default(user_id=user.id, project_id=project.id)
+
+    security = RoleSecurity(ProjectRole)
+    path_params = {"project_uid": project.get_uid()}
+    actions = [ProjectRoleAction.Read.value]
+    other_user_id = SnowflakeID()
+
+    run(
+        "granted: database",
+        lambda: security.is_authorized(user.id, path_params, actions, _uncached_project_finder),
+        number,
+    )
+    run("granted: RoleCache", lambda: security.is_authorized(user.id, path_params, actions, RoleFinder.project), number)
+    run(
+        "denied: database",
+        lambda: security.is_authorized(other_user_id, path_params, actions, _uncached_project_finder),
+        number,
+    )
+    run(
+        "denied: RoleCache",
+        lambda: security.is_authorized(other_user_id, path_params, actions, RoleFinder.project),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    main()
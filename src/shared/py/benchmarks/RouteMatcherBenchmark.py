@@ -0,0 +1,81 @@
+"""Micro-benchmark for finding the route of a request.
+
+Compares the previous path (every route tried in order by each of the two filter middlewares and by the router) with
+:class:`RouteMatcher`, which narrows the routes down by path segment and keeps the match in the scope.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.RouteMatcherBenchmark [--number N]``
+"""
+
+from itertools import cycle
+from random import Random
+from starlette.responses import PlainTextResponse
+from starlette.routing import BaseRoute, Match, Route
+from langboard_shared.core.routing.RouteMatcher import RouteMatcher
+from .BenchmarkUtils import parse_number, run
+
+
+_RESOURCES = ["board", "card", "column", "label", "wiki", "checklist", "comment", "bot", "user", "setting", "project"]
+_ACTIONS = ["details", "title", "description", "order", "assign", "archive", "delete", "activity", "members", "logs"]
+_LOOKUPS_PER_REQUEST = 3
+
+
+async def _endpoint(request):
+    return PlainTextResponse("")
+
+
+def _create_routes() -> list[BaseRoute]:
+    routes: list[BaseRoute] = []
+    for resource in _RESOURCES:
+        routes.append(Route(f"/{resource}/{{project_uid}}", _endpoint, methods=["GET"]))
+        for action in _ACTIONS:
+            routes.append(Route(f"/{resource}/{{project_uid}}/{{uid}}/{action}", _endpoint, methods=["GET"]))
+            routes.append(Route(f"/{resource}/{{project_uid}}/{{uid}}/{action}", _endpoint, methods=["PUT"]))
+    return routes
+
+
+def _linear_match(routes: list[BaseRoute], scope: dict) -> BaseRoute | None:
+    for route in routes:
+        matches, _ = route.matches(scope)
+        if matches == Match.FULL:
+            return route
+    return None
+
+
+def main() -> None:
+    number = parse_number(5_000)
+
+    routes = _create_routes()
+    matcher = RouteMatcher(routes)
+    random = Random(0)
+    requests = cycle(
+        [
+            (
+                random.choice(["GET", "PUT"]),
+                f"/{random.choice(_RESOURCES)}/p1/u1/{random.choice(_ACTIONS)}",
+            )
+            for _ in range(1_000)
+        ]
+    )
+
+    def scope() -> dict:
+        method, path = next(requests)
+        return {"type": "http", "method": method, "path": path, "root_path": ""}
+
+    def linear_request():
+        request_scope = scope()
+        for _ in range(_LOOKUPS_PER_REQUEST):
+            _linear_match(routes, request_scope)
+
+    def matcher_request():
+        request_scope = scope()
+        for _ in range(_LOOKUPS_PER_REQUEST):
+            matcher.match(request_scope)
+
+    name = f"{len(routes)} routes, {_LOOKUPS_PER_REQUEST} lookups per request"
+    run(f"{name}: linear scan", linear_request, number)
+    run(f"{name}: RouteMatcher", matcher_request, number)
+
+
+if __name__ == "__main__":
+    main()
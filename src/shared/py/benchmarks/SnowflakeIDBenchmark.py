@@ -0,0 +1,60 @@
+"""Micro-benchmark for the conversion between :class:`SnowflakeID` and short codes.
+
+Compares the previous path (a Feistel shuffle and a base62 conversion on every call) with the memoized conversions and
+the batch :meth:`SnowflakeID.to_short_codes` and :meth:`SnowflakeID.from_short_codes`.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.SnowflakeIDBenchmark [--number N]``
+"""
+
+from random import Random
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.core.utils.String import BASE62_ALPHABET
+from .BenchmarkUtils import parse_number, run
+
+
+_CONVERSION_COUNT = 100_000
+_DISTINCT_ID_COUNT = 2_000
+
+
+def _previous_to_short_code(value: int) -> str:
+    left, right = value >> 32, value & 0xFFFFFFFF
+    for i in range(4):
+        left, right = right, left ^ ((right * SnowflakeID.EPOCH + i) & 0xFFFFFFFF)
+    n = (left << 32) | right
+    s = []
+    while n > 0:
+        n, r = divmod(n, 62)
+        s.append(BASE62_ALPHABET[r])
+    return "".join(reversed(s)).rjust(SnowflakeID.FIXED_SHORT_CODE_LENGTH, BASE62_ALPHABET[0])
+
+
+def _previous_from_short_code(short_code: str) -> int:
+    x = 0
+    for c in short_code:
+        x = x * 62 + BASE62_ALPHABET.index(c)
+    left, right = x >> 32, x & 0xFFFFFFFF
+    for i in reversed(range(4)):
+        left, right = right ^ ((left * SnowflakeID.EPOCH + i) & 0xFFFFFFFF), left
+    return (left << 32) | right
+
+
+def main() -> None:
+    number = parse_number(5)
+
+    random = Random(0)
+    distinct_ids = [SnowflakeID() for _ in range(_DISTINCT_ID_COUNT)]
+    ids = [random.choice(distinct_ids) for _ in range(_CONVERSION_COUNT)]
+    short_codes = [snowflake_id.to_short_code() for snowflake_id in ids]
+
+    name = f"{_CONVERSION_COUNT} over {_DISTINCT_ID_COUNT} IDs"
+    run(f"encode {name}: previous", lambda: [_previous_to_short_code(int(i)) for i in ids], number)
+    run(f"encode {name}: to_short_code", lambda: [i.to_short_code() for i in ids], number)
+    run(f"encode {name}: to_short_codes", lambda: SnowflakeID.to_short_codes(ids), number)
+    run(f"decode {name}: previous", lambda: [SnowflakeID(_previous_from_short_code(c)) for c in short_codes], number)
+    run(f"decode {name}: from_short_code", lambda: [SnowflakeID.from_short_code(c) for c in short_codes], number)
+    run(f"decode {name}: from_short_codes", lambda: SnowflakeID.from_short_codes(short_codes), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Micro-benchmark for sending a webhook event.
+
+Compares the previous path (a blocking ``httpx.post`` to each webhook in turn, with a new connection per request) with
+:meth:`WebhookDispatcher.dispatch`, which sends the event to every webhook concurrently on a pooled client.
+
+The webhooks are served by a local HTTP server that answers after :data:`_RESPONSE_DELAY` seconds.
+
+Run from ``src/shared/py`` with the same environment as the services (``.env``):
+``python -m benchmarks.WebhookDispatchBenchmark [--number N]``
+"""
+
+from asyncio import run as run_async
+from httpx import post
+from langboard_shared.tasks.webhooks.utils import WebhookDispatcher
+from .BenchmarkUtils import parse_number, run, serve_http
+
+
+_WEBHOOK_COUNT = 10
+_RESPONSE_DELAY = 0.02
+
+
+def main() -> None:
+    number = parse_number(10)
+
+    with serve_http(_RESPONSE_DELAY) as url:
+        settings = [{"id": i, "url": f"{url}/webhooks/{i}"} for i in range(_WEBHOOK_COUNT)]
+        data = {"uid": "card", "title": "Card title", "description": "Lorem ipsum dolor sit amet " * 20}
+
+        def send_in_turn():
+            for setting in settings:
+                post(setting["url"], json={"event": "card:created", "data": data}).raise_for_status()
+
+        def dispatch():
+            sent_ids = run_async(WebhookDispatcher.dispatch(settings, "card:created", data))
+            assert len(sent_ids) == _WEBHOOK_COUNT
+
+        dispatch()
+
+        run(f"{_WEBHOOK_COUNT} webhooks: post in turn", send_in_turn, number)
+        run(f"{_WEBHOOK_COUNT} webhooks: WebhookDispatcher", dispatch, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -108,6 +108,42 @@ class Env:
     def AI_REQUEST_TRIALS(self) -> int:
         return int(self.__get_from_cache("AI_REQUEST_TRIALS", "5"))
 
+    @property
+    def AI_REQUEST_MAX_CONNECTIONS(self) -> int:
+        return int(self.__get_from_cache("AI_REQUEST_MAX_CONNECTIONS", "10"))
+
+    @property
+    def AI_REQUEST_MAX_CONCURRENCY(self) -> int:
+        return int(self.__get_from_cache("AI_REQUEST_MAX_CONCURRENCY", "4"))
+
+    @property
+    def AI_REQUEST_CIRCUIT_FAILURES(self) -> int:
+        return int(self.__get_from_cache("AI_REQUEST_CIRCUIT_FAILURES", "5"))
+
+    @property
+    def AI_REQUEST_CIRCUIT_COOLDOWN(self) -> int:
+        return int(self.__get_from_cache("AI_REQUEST_CIRCUIT_COOLDOWN", "60"))
+
+    @property
+    def WEBHOOK_TIMEOUT(self) -> int:
+        return int(self.__get_from_cache("WEBHOOK_TIMEOUT", "10"))
+
+    @property
+    def WEBHOOK_TRIALS(self) -> int:
+        return int(self.__get_from_cache("WEBHOOK_TRIALS", "3"))
+
+    @property
+    def WEBHOOK_MAX_CONNECTIONS(self) -> int:
+        return int(self.__get_from_cache("WEBHOOK_MAX_CONNECTIONS", "20"))
+
+    @property
+    def WEBHOOK_DEAD_LETTER_MAX_BYTES(self) -> int:
+        return int(self.__get_from_cache("WEBHOOK_DEAD_LETTER_MAX_BYTES", str(10 * 1024 * 1024)))
+
+    @property
+    def WEBHOOK_DEAD_LETTER_BACKUP_COUNT(self) -> int:
+        return int(self.__get_from_cache("WEBHOOK_DEAD_LETTER_BACKUP_COUNT", "5"))
+
     @property
     def MAIN_DATABASE_URL(self) -> str:
         return self.__get_from_cache("MAIN_DATABASE_URL", f"sqlite:///{self.PROJECT_NAME}.db")
@@ -124,6 +160,42 @@ class Env:
     def DB_TCP_USER_TIMEOUT(self) -> int:
         return int(self.__get_from_cache("DB_TCP_USER_TIMEOUT", "1000"))
 
+    @property
+    def DB_POOL_MODE(self) -> Literal["null", "queue", "pgbouncer"]:
+        pool_mode = cast(Any, self.__get_from_cache("DB_POOL_MODE", "null"))
+        _available_pool_modes = {"null", "queue", "pgbouncer"}
+        if pool_mode not in _available_pool_modes:
+            raise ValueError(f"Invalid db pool mode: {pool_mode}. Must be one of {_available_pool_modes}")
+        return pool_mode
+
+    @property
+    def DB_POOL_SIZE(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_SIZE", "5"))
+
+    @property
+    def DB_POOL_MAX_OVERFLOW(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_MAX_OVERFLOW", "10"))
+
+    @property
+    def DB_POOL_RECYCLE(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_RECYCLE", "1800"))
+
+    @property
+    def DB_POOL_TIMEOUT(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_TIMEOUT", "30"))
+
+    @property
+    def ORDER_MODE(self) -> Literal["index", "key"]:
+        order_mode = cast(Any, self.__get_from_cache("ORDER_MODE", "index"))
+        _available_order_modes = {"index", "key"}
+        if order_mode not in _available_order_modes:
+            raise ValueError(f"Invalid order mode: {order_mode}. Must be one of {_available_order_modes}")
+        return order_mode
+
+    @property
+    def ORDER_KEY_MAX_LENGTH(self) -> int:
+        return int(self.__get_from_cache("ORDER_KEY_MAX_LENGTH", "24"))
+
     @property
     def TERMINAL_LOGGING_LEVEL(self) -> str:
         return self.__get_from_cache("TERMINAL_LOGGING_LEVEL", "AUTO").upper()
@@ -149,6 +221,18 @@ class Env:
         urls = self.__get_from_cache("BROADCAST_URLS", "")
         return urls.split(",") if urls else []
 
+    @property
+    def BROADCAST_INLINE_MAX_BYTES(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_INLINE_MAX_BYTES", "65536"))
+
+    @property
+    def BROADCAST_LINGER_MS(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_LINGER_MS", "5"))
+
+    @property
+    def BROADCAST_BATCH_SIZE(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_BATCH_SIZE", "16384"))
+
     @property
     def CACHE_TYPE(self) -> Literal["in-memory", "redis"]:
         cache_type = cast(Any, self.__get_from_cache("CACHE_TYPE", "in-memory"))
@@ -161,6 +245,14 @@ class Env:
     def CACHE_URL(self) -> str:
         return self.__get_from_cache("CACHE_URL", "")
 
+    @property
+    def CACHE_LOCAL_MAX_SIZE(self) -> int:
+        return int(self.__get_from_cache("CACHE_LOCAL_MAX_SIZE", "1024"))
+
+    @property
+    def CACHE_LOCAL_TTL(self) -> int:
+        return int(self.__get_from_cache("CACHE_LOCAL_TTL", "30"))
+
     @property
     def COMMON_SECRET_KEY(self) -> str:
         return self.__get_from_cache("COMMON_SECRET_KEY", f"{self.PROJECT_NAME}_common_key")
@@ -332,9 +424,8 @@ class Env:
         return local_storage_dir
 
     @property
-    def CRON_TAB_FILE(self) -> Path:
-        cron_tab_file = self.DATA_DIR / "cron.tab"
-        return cron_tab_file
+    def WEBHOOK_DEAD_LETTER_FILE(self) -> Path:
+        return self.DATA_DIR / "webhook-dead-letters.jsonl"
 
     @property
     def CACHE_DIR(self) -> Path:
@@ -1,15 +1,14 @@
-from typing import Any, Literal, TypeVar, cast, overload
-from crontab import CronTab
-from sqlalchemy import tuple_
+from typing import Any, Literal, TypeVar, overload
 from ..core.db import BaseSqlModel, DbSession, SqlBuilder
 from ..core.schema import TimeBasedPagination
-from ..core.types import SafeDateTime, SnowflakeID
+from ..core.types import SafeDateTime
 from ..core.utils.CronTabUtils import CronTabUtils
 from ..core.utils.decorators import staticclass
 from ..domain.models import Bot, BotSchedule
 from ..domain.models.bases import BaseBotScheduleModel
 from ..domain.models.BotSchedule import BotScheduleRunningType, BotScheduleStatus
 from ..helpers import InfraHelper
+from .BotScheduler import BotScheduler
 
 
 _TBotScheduleModel = TypeVar("_TBotScheduleModel", bound=BaseBotScheduleModel)
@@ -149,10 +148,6 @@ class BotScheduleHelper:
         if not running_type:
             running_type = BotScheduleRunningType.Infinite
 
-        cron = BotScheduleHelper.utils.get_cron()
-
-        has_changed = BotScheduleHelper.__create_job(cron, interval_str, running_type)
-
         result = BotScheduleHelper.get_default_status_with_dates(
             running_type=running_type, start_at=start_at, end_at=end_at
         )
@@ -182,8 +177,7 @@ class BotScheduleHelper:
         with DbSession.use(readonly=False) as db:
             db.insert(schedule_model)
 
-        if has_changed:
-            BotScheduleHelper.utils.save_cron(cron)
+        BotScheduler.notify([bot_schedule.id])
 
         return bot_schedule, schedule_model
 
@@ -206,11 +200,8 @@ class BotScheduleHelper:
             return None
 
         model = {}
-        has_changed = False
-        old_status = bot_schedule.status
         old_interval_str = bot_schedule.interval_str
 
-        cron = None
         if running_type:
             if bot_schedule.running_type != running_type:
                 result = BotScheduleHelper.get_default_status_with_dates(
@@ -227,14 +218,6 @@ class BotScheduleHelper:
                 model["status"] = status.value
                 model["start_at"] = start_at
                 model["end_at"] = end_at
-
-                cron, has_changed = BotScheduleHelper.change_status(
-                    schedule_model_class,
-                    schedule_model,
-                    status,
-                    no_update=True,
-                    bot_schedule=bot_schedule,
-                )
             else:
                 if bot_schedule.start_at != start_at or bot_schedule.end_at != end_at:
                     result = BotScheduleHelper.get_default_status_with_dates(
@@ -260,28 +243,10 @@ class BotScheduleHelper:
                 bot_schedule.interval_str = interval_str
                 model["interval_str"] = interval_str
 
-                if not cron:
-                    cron = BotScheduleHelper.utils.get_cron()
-
-                if (
-                    bot_schedule.running_type in BotSchedule.RUNNING_TYPES_WITH_START_AT
-                    and bot_schedule.status == BotScheduleStatus.Pending
-                ):
-                    has_changed = BotScheduleHelper.__create_job(cron, interval_str, running_type) or has_changed
-                else:
-                    has_changed = BotScheduleHelper.__create_job(cron, interval_str) or has_changed
-
         with DbSession.use(readonly=False) as db:
             db.update(bot_schedule)
 
-        has_old_intervals = BotScheduleHelper.__has_interval_schedule(old_interval_str, old_status)
-        if not has_old_intervals:
-            if not cron:
-                cron = BotScheduleHelper.utils.get_cron()
-            BotScheduleHelper.__remove_job(cron, old_status, old_interval_str)
-
-        if cron and (has_changed or not has_old_intervals):
-            BotScheduleHelper.utils.save_cron(cron)
+        BotScheduler.notify([bot_schedule.id])
 
         return bot_schedule, schedule_model, model
 
@@ -298,25 +263,17 @@ class BotScheduleHelper:
         if not bot_schedule:
             return None
 
-        cron = BotScheduleHelper.utils.get_cron()
-
-        status = bot_schedule.status
-        interval_str = bot_schedule.interval_str
         with DbSession.use(readonly=False) as db:
             db.delete(bot_schedule)
 
-        has_interval = BotScheduleHelper.__has_interval_schedule(interval_str, status)
-        if not has_interval:
-            BotScheduleHelper.__remove_job(cron, status, interval_str)
-            BotScheduleHelper.utils.save_cron(cron)
+        BotScheduler.notify([bot_schedule.id])
         return bot_schedule, schedule_model
 
     @staticmethod
     def unschedule_by_scope(schedule_model_class: type[_TBotScheduleModel], scope_model: BaseSqlModel) -> None:
-        old_schedules: list[tuple[SnowflakeID, str, BotScheduleStatus]] = []
         with DbSession.use(readonly=True) as db:
             query = (
-                SqlBuilder.select.columns(BotSchedule.id, BotSchedule.interval_str, BotSchedule.status)
+                SqlBuilder.select.column(BotSchedule.id)
                 .join(
                     schedule_model_class,
                     BotSchedule.column("id") == schedule_model_class.column("bot_schedule_id"),
@@ -324,154 +281,35 @@ class BotScheduleHelper:
                 .where(schedule_model_class.column(f"{scope_model.__tablename__}_id") == scope_model.id)
             )
             result = db.exec(query)
-            old_schedules = cast(Any, result.all())
+            old_schedule_ids = list(result.all())
 
-        with DbSession.use(readonly=False) as db:
-            db.exec(
-                SqlBuilder.delete.table(BotSchedule).where(
-                    BotSchedule.column("id").in_([old_schedule[0] for old_schedule in old_schedules])
-                )
-            )
+        if not old_schedule_ids:
+            return
 
-        cron = BotScheduleHelper.utils.get_cron()
-        schedule_id_has_schedules = BotScheduleHelper.__has_interval_schedule(
-            [(old_schedule[1], old_schedule[2]) for old_schedule in old_schedules]
-        )
-        schedule_id_has_schedules = set(schedule_id_has_schedules)
-
-        for old_schedule_id, old_interval_str, old_status in old_schedules:
-            if old_schedule_id not in schedule_id_has_schedules:
-                BotScheduleHelper.__remove_job(cron, old_status, old_interval_str)
+        with DbSession.use(readonly=False) as db:
+            db.exec(SqlBuilder.delete.table(BotSchedule).where(BotSchedule.column("id").in_(old_schedule_ids)))
 
-        BotScheduleHelper.utils.save_cron(cron)
+        BotScheduler.notify(old_schedule_ids)
 
-    @overload
-    @staticmethod
-    def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: None = None,
-        bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | None: ...
-    @overload
-    @staticmethod
-    def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: Literal[False],
-        bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | None: ...
-    @overload
     @staticmethod
     def change_status(
         schedule_model_class: type[_TBotScheduleModel],
         schedule_model: _TBotScheduleModel | _TBaseParam,
         status: BotScheduleStatus,
-        no_update: Literal[True],
         bot_schedule: BotSchedule | None = None,
-    ) -> tuple[CronTab, bool]: ...
-    @staticmethod
-    def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: bool | None = None,
-        bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | tuple[CronTab, bool] | None:
+    ) -> BotSchedule | None:
         schedule_model = InfraHelper.get_by_id_like(schedule_model_class, schedule_model)
-        cron = BotScheduleHelper.utils.get_cron()
         if not schedule_model:
-            return None if not no_update else (cron, False)
+            return None
 
         if not bot_schedule:
             bot_schedule = InfraHelper.get_by_id_like(BotSchedule, schedule_model.bot_schedule_id)
             if not bot_schedule:
-                return None if not no_update else (cron, False)
+                return None
 
-        old_status = bot_schedule.status
         bot_schedule.status = status
-        if not no_update:
-            with DbSession.use(readonly=False) as db:
-                db.update(bot_schedule)
-
-        has_changed = False
-        has_old_intervals = True
-        old_comment = bot_schedule.interval_str
-        if old_status == BotScheduleStatus.Pending and status == BotScheduleStatus.Started:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str)
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-            old_comment = f"scheduled {bot_schedule.interval_str}"
-        elif old_status == BotScheduleStatus.Started and status == BotScheduleStatus.Pending:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str, bot_schedule.running_type)
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-        elif old_status == BotScheduleStatus.Started and status == BotScheduleStatus.Stopped:
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-        elif old_status == BotScheduleStatus.Stopped and status == BotScheduleStatus.Started:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str)
-        elif old_status == BotScheduleStatus.Pending and status == BotScheduleStatus.Stopped:
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-            old_comment = f"scheduled {bot_schedule.interval_str}"
-        elif old_status == BotScheduleStatus.Stopped and status == BotScheduleStatus.Pending:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str, bot_schedule.running_type)
-
-        if not has_old_intervals:
-            BotScheduleHelper.utils.remove_job(cron, old_comment)
-
-        if has_changed or not has_old_intervals:
-            BotScheduleHelper.utils.save_cron(cron)
-        return bot_schedule if not no_update else (cron, has_changed)
-
-    @staticmethod
-    def __create_job(cron: CronTab, interval_str: str, running_type: BotScheduleRunningType | None = None) -> bool:
-        comment = None
-        if running_type:
-            if BotSchedule.RUNNING_TYPES_WITH_START_AT.count(running_type) > 0:
-                comment = f"scheduled {interval_str}"
-        if comment is None:
-            comment = interval_str
-
-        BotScheduleHelper.utils.create_job(cron, interval_str, f"/app/scripts/run_bot_cron.sh '{comment}'", comment)
-        return True
-
-    @staticmethod
-    def __remove_job(cron: CronTab, status: BotScheduleStatus, interval_str: str):
-        if status == BotScheduleStatus.Pending:
-            interval_str = f"scheduled {interval_str}"
-        BotScheduleHelper.utils.remove_job(cron, interval_str)
-
-    @overload
-    @staticmethod
-    def __has_interval_schedule(interval_str: str, status: BotScheduleStatus) -> bool: ...
-    @overload
-    @staticmethod
-    def __has_interval_schedule(
-        interval_str: list[tuple[str, BotScheduleStatus]],
-    ) -> list[SnowflakeID]: ...
-    @staticmethod
-    def __has_interval_schedule(
-        interval_str: str | list[tuple[str, BotScheduleStatus]],
-        status: BotScheduleStatus | None = None,
-    ) -> bool | list[SnowflakeID]:
-        if status is None:
-            interval_str = cast(list[tuple[str, BotScheduleStatus]], interval_str)
-            query = SqlBuilder.select.column(BotSchedule.id).where(
-                tuple_(BotSchedule.column("interval_str"), BotSchedule.column("status")).in_(interval_str)
-            )
-        else:
-            interval_str = cast(str, interval_str)
-            query = (
-                SqlBuilder.select.table(BotSchedule)
-                .where((BotSchedule.column("interval_str") == interval_str) & (BotSchedule.column("status") == status))
-                .limit(1)
-            )
+        with DbSession.use(readonly=False) as db:
+            db.update(bot_schedule)
 
-        result = False
-        with DbSession.use(readonly=True) as db:
-            result = db.exec(query)
-            if status is None:
-                result = cast(list[SnowflakeID], result.all())
-            else:
-                result = bool(result.first())
-        return result
+        BotScheduler.notify([bot_schedule.id])
+        return bot_schedule
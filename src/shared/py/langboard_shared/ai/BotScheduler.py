@@ -0,0 +1,187 @@
+from datetime import timedelta, timezone
+from heapq import heappop, heappush
+from threading import Event, Lock
+from typing import Any, Callable, Sequence
+from ..core.caching import Cache
+from ..core.db import DbSession, SqlBuilder
+from ..core.logger import Logger
+from ..core.types import SafeDateTime, SnowflakeID
+from ..core.utils.CronTabUtils import CronTabUtils
+from ..domain.models import BotSchedule
+from ..domain.models.BotSchedule import BotScheduleRunningType, BotScheduleStatus
+
+
+_CHANGED_KEY_PREFIX = "bot-schedule-changed-"
+_RELOAD_ALL_INTERVAL = 60 * 10
+logger = Logger.use("bot-scheduler")
+
+
+class BotScheduler:
+    """Runs the bot schedules from a min-heap of their next run times.
+
+    The heap is loaded from :class:`BotSchedule` on start. Changed schedules are announced by :meth:`notify` through
+    the cache invalidation channel, so only they are reloaded. Every schedule is reloaded every 10 minutes in case an
+    announcement is lost.
+
+    Only one scheduler must run, otherwise the due schedules are sent more than once.
+
+    E.g.::
+
+        BotScheduler(BotScheduleTask.run_due_bot_schedules).run()
+
+    :param on_due: Function sending the due schedule IDs to the broker
+    """
+
+    def __init__(self, on_due: Callable[[list[SnowflakeID]], Any]):
+        self._on_due = on_due
+        self._utils = CronTabUtils()
+        self._heap: list[tuple[SafeDateTime, SnowflakeID]] = []
+        self._schedules: dict[SnowflakeID, tuple[str, BotScheduleRunningType, SafeDateTime]] = {}
+        self._changed_ids: set[SnowflakeID] = set()
+        self._should_reload_all = True
+        self._reloaded_all_at = SafeDateTime.now()
+        self._lock = Lock()
+        self._wakeup = Event()
+
+    @staticmethod
+    def notify(bot_schedule_ids: Sequence[int]) -> None:
+        """Makes the running scheduler reload the schedules once the current unit of work commits.
+
+        :param bot_schedule_ids: IDs of the created, changed or deleted schedules
+        """
+        keys = [f"{_CHANGED_KEY_PREFIX}{int(bot_schedule_id)}" for bot_schedule_id in bot_schedule_ids]
+        if not keys:
+            return
+
+        def publish():
+            for key in keys:
+                Cache.publish_invalidation(key)
+
+        DbSession.on_commit(publish)
+
+    def run(self) -> None:
+        """Runs the due schedules until the process stops."""
+        Cache.listen_invalidation(self._on_invalidated)
+        logger.info("Bot scheduler started.")
+
+        while True:
+            self._reload()
+
+            due_ids = self._pop_due_ids(SafeDateTime.now())
+            if due_ids:
+                try:
+                    self._on_due(due_ids)
+                except Exception:
+                    logger.exception("Failed to run the due bot schedules: %s", due_ids)
+
+            self._wakeup.wait(self._get_wait_seconds())
+            self._wakeup.clear()
+
+    def _on_invalidated(self, key: str | None) -> None:
+        if key is None:
+            with self._lock:
+                self._should_reload_all = True
+        elif key.startswith(_CHANGED_KEY_PREFIX):
+            try:
+                bot_schedule_id = SnowflakeID(int(key.removeprefix(_CHANGED_KEY_PREFIX)))
+            except ValueError:
+                return
+            with self._lock:
+                self._changed_ids.add(bot_schedule_id)
+        else:
+            return
+        self._wakeup.set()
+
+    def _reload(self) -> None:
+        now = SafeDateTime.now()
+        with self._lock:
+            if (now - self._reloaded_all_at).total_seconds() >= _RELOAD_ALL_INTERVAL:
+                self._should_reload_all = True
+            should_reload_all = self._should_reload_all
+            changed_ids = self._changed_ids
+            self._should_reload_all = False
+            self._changed_ids = set()
+
+        if not should_reload_all and not changed_ids:
+            return
+
+        query = SqlBuilder.select.table(BotSchedule).where(
+            BotSchedule.column("status").in_([BotScheduleStatus.Pending, BotScheduleStatus.Started])
+        )
+        if not should_reload_all:
+            query = query.where(BotSchedule.column("id").in_(changed_ids))
+
+        try:
+            with DbSession.use(readonly=True) as db:
+                result = db.exec(query)
+                bot_schedules = result.all()
+        except Exception:
+            logger.exception("Failed to load the bot schedules.")
+            with self._lock:
+                self._should_reload_all = self._should_reload_all or should_reload_all
+                self._changed_ids.update(changed_ids)
+            return
+
+        if should_reload_all:
+            self._heap = []
+            self._schedules.clear()
+            self._reloaded_all_at = now
+        else:
+            for bot_schedule_id in changed_ids:
+                self._schedules.pop(bot_schedule_id, None)
+
+        for bot_schedule in bot_schedules:
+            interval_str = bot_schedule.interval_str
+            if bot_schedule.status == BotScheduleStatus.Started:
+                if bot_schedule.running_type == BotScheduleRunningType.Onetime:
+                    continue
+                next_run_at = self._utils.get_next_run_at(interval_str, now)
+            elif bot_schedule.start_at:
+                start_at = bot_schedule.start_at
+                # SQLite returns the stored UTC time without its time zone.
+                if start_at.tzinfo is None:
+                    start_at = start_at.replace(tzinfo=timezone.utc)
+                # A pending schedule starts on its first run at or after its start time.
+                after = max(now, start_at - timedelta(microseconds=1))
+                next_run_at = self._utils.get_next_run_at(interval_str, after)
+            else:
+                continue
+            self._push(bot_schedule.id, interval_str, bot_schedule.running_type, next_run_at)
+
+        if should_reload_all:
+            logger.info("Loaded %d bot schedules.", len(self._schedules))
+
+    def _pop_due_ids(self, now: SafeDateTime) -> list[SnowflakeID]:
+        due_ids: list[SnowflakeID] = []
+        while self._heap and self._heap[0][0] <= now:
+            run_at, bot_schedule_id = heappop(self._heap)
+            schedule = self._schedules.get(bot_schedule_id)
+            # Entries of rescheduled or removed schedules stay in the heap until they are popped.
+            if not schedule or schedule[2] != run_at:
+                continue
+
+            due_ids.append(bot_schedule_id)
+            interval_str, running_type, _ = schedule
+            self._schedules.pop(bot_schedule_id)
+            if running_type != BotScheduleRunningType.Onetime:
+                self._push(bot_schedule_id, interval_str, running_type, self._utils.get_next_run_at(interval_str, now))
+        return due_ids
+
+    def _push(
+        self,
+        bot_schedule_id: SnowflakeID,
+        interval_str: str,
+        running_type: BotScheduleRunningType,
+        next_run_at: SafeDateTime | None,
+    ) -> None:
+        if not next_run_at:
+            return
+        self._schedules[bot_schedule_id] = (interval_str, running_type, next_run_at)
+        heappush(self._heap, (next_run_at, bot_schedule_id))
+
+    def _get_wait_seconds(self) -> float:
+        now = SafeDateTime.now()
+        wait_seconds = _RELOAD_ALL_INTERVAL - (now - self._reloaded_all_at).total_seconds()
+        if self._heap:
+            wait_seconds = min(wait_seconds, (self._heap[0][0] - now).total_seconds())
+        return max(wait_seconds, 0)
@@ -1,5 +1,6 @@
 from .BotDefaultTrigger import BotDefaultTrigger
 from .BotScheduleHelper import BotScheduleHelper
+from .BotScheduler import BotScheduler
 from .BotScopeHelper import BotScopeHelper
 from .BotValidator import BaseSharedBotForm, validate_bot_form
 from .TweaksComponent import LangboardCalledVariablesComponent
@@ -7,6 +8,7 @@ from .TweaksComponent import LangboardCalledVariablesComponent
 
 __all__ = [
     "BotScheduleHelper",
+    "BotScheduler",
     "BotDefaultTrigger",
     "BotScopeHelper",
     "LangboardCalledVariablesComponent",
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any
 from pydantic import BaseModel
@@ -27,8 +26,8 @@ class BaseDispatcherQueue(ABC):
 
         if Env.CACHE_TYPE == "redis":
             cache_key = f"broadcast-{now_str}-{random_str}"
-            # Prevent enums from being Enum.Name
-            Cache.set(cache_key, json_loads(model.model_dump_json())["data"], 3 * 60)
+            # JSON mode prevents enums from being Enum.Name without encoding and decoding the model again
+            Cache.set(cache_key, model.model_dump(mode="json")["data"], 3 * 60)
             return cache_key
 
         name = f"{now_str}-{random_str}.json" if not file_only else f"{now_str}-{random_str}-fileonly.json"
@@ -1,20 +1,48 @@
-import json
 from typing import Any
 from kafka import KafkaProducer
 from ....Env import Env
+from ...caching import CacheSerializer
+from ...logger import Logger
 from ..BaseDispatcherQueue import BaseDispatcherQueue
 from ..DispatcherModel import DispatcherModel
 
 
+logger = Logger.use("broadcast")
+
+
 class KafkaDispatcherQueue(BaseDispatcherQueue):
     def __init__(self):
         self.producer: KafkaProducer | None = None
 
     def put(self, event: str | DispatcherModel, data: dict[str, Any] | None = None):
         if not self.producer:
+            # Messages are batched by linger_ms/batch_size and flushed by the producer's I/O thread.
+            # The producer is closed (and flushed) on interpreter exit.
             self.producer = KafkaProducer(
-                bootstrap_servers=Env.BROADCAST_URLS, value_serializer=lambda v: json.dumps(v).encode("utf-8")
+                bootstrap_servers=Env.BROADCAST_URLS,
+                compression_type="gzip",
+                linger_ms=Env.BROADCAST_LINGER_MS,
+                batch_size=Env.BROADCAST_BATCH_SIZE,
             )
-        cache_key = self._record_model(event, data)
-        self.producer.send(event if isinstance(event, str) else event.event, {"cache_key": cache_key})
-        self.producer.flush()
+
+        model = DispatcherModel(event=event, data=data or {}) if isinstance(event, str) else event
+        future = self.producer.send(model.event, self._create_message(model))
+        future.add_errback(self._on_send_error, model.event)
+
+    def _create_message(self, model: DispatcherModel) -> bytes:
+        """Creates the Kafka message value.
+
+        Payloads up to :attr:`Env.BROADCAST_INLINE_MAX_BYTES` are sent inline. Larger ones are stored in the cache and
+        only the cache key is sent.
+        """
+        serializer = CacheSerializer.DEFAULT
+        if Env.BROADCAST_INLINE_MAX_BYTES > 0:
+            message = serializer.dumps({"data": model.model_dump(mode="json")["data"]}).encode("utf-8")
+            if len(message) <= Env.BROADCAST_INLINE_MAX_BYTES:
+                return message
+
+        cache_key = self._record_model(model)
+        return serializer.dumps({"cache_key": cache_key}).encode("utf-8")
+
+    def _on_send_error(self, error: BaseException, topic: str) -> None:
+        logger.error("Failed to send broadcast message to %s: %s", topic, error)
@@ -1,8 +1,89 @@
+import socket
+from os import getpid
+from pathlib import Path
+from threading import Lock
+from time import monotonic
 from typing import Any
+from ....Env import Env
 from ..BaseDispatcherQueue import BaseDispatcherQueue
 from ..DispatcherModel import DispatcherModel
 
 
+_BROADCAST_SOCKET_PATH: Path = Env.DATA_DIR / "broadcast.sock"
+
+
 class MemoryDispatcherQueue(BaseDispatcherQueue):
+    """Streams events to the socket server through a Unix domain socket.
+
+    Each process keeps one connection shared by its threads and reconnects after a fork. If the socket server is not
+    reachable (or the platform has no Unix domain sockets), events fall back to one file per event in the broadcast
+    directory, which the socket server consumes on start.
+    """
+
+    CONNECT_RETRY_INTERVAL = 1
+    SEND_TIMEOUT = 1
+
+    def __init__(self):
+        self._lock = Lock()
+        self._socket: socket.socket | None = None
+        self._socket_pid: int | None = None
+        self._next_connect_at = 0.0
+
     def put(self, event: str | DispatcherModel, data: dict[str, Any] | None = None):
-        self._record_model(event, data, file_only=True)
+        model = DispatcherModel(event=event, data=data or {}) if isinstance(event, str) else event
+        if self._send(f"{model.model_dump_json()}\n".encode("utf-8")):
+            return
+
+        self._record_model(model, file_only=True)
+
+    def _send(self, message: bytes) -> bool:
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+
+        with self._lock:
+            sock = self._get_socket()
+            if sock is None:
+                return False
+
+            try:
+                sock.sendall(message)
+                return True
+            except OSError:
+                # A partially sent line is dropped by the socket server when the connection closes.
+                self._close_socket()
+                return False
+
+    def _get_socket(self) -> socket.socket | None:
+        pid = getpid()
+        if self._socket is not None and self._socket_pid == pid:
+            return self._socket
+
+        if self._socket is not None:
+            # Closes the descriptor inherited from the parent process without touching the parent's connection.
+            self._socket.close()
+            self._socket = None
+
+        if monotonic() < self._next_connect_at:
+            return None
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(MemoryDispatcherQueue.SEND_TIMEOUT)
+        try:
+            sock.connect(str(_BROADCAST_SOCKET_PATH))
+        except OSError:
+            sock.close()
+            self._next_connect_at = monotonic() + MemoryDispatcherQueue.CONNECT_RETRY_INTERVAL
+            return None
+
+        self._socket = sock
+        self._socket_pid = pid
+        return sock
+
+    def _close_socket(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._next_connect_at = monotonic() + MemoryDispatcherQueue.CONNECT_RETRY_INTERVAL
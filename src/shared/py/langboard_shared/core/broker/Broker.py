@@ -12,6 +12,7 @@ from celery.apps.worker import Worker
 from celery.signals import celeryd_after_setup, setup_logging, worker_process_init
 from ...Env import Env
 from ...ModuleLoader import ModuleLoader
+from ..db import DbSession
 from ..logger import Logger
 from ..utils.decorators import class_instance
 from .TaskParameters import TaskParameters
@@ -90,6 +91,7 @@ class Broker:
         """Wrap async celery task decorator.
 
         You don't need to use `@Broker.celery.task` decorator.
+        Inside a unit of work (see :meth:`DbSession.unit_of_work`), the task is sent after the unit commits.
 
         DO NOT use *args or **kwargs in async task.
         """
@@ -102,7 +104,7 @@ class Broker:
             if Env.CACHE_TYPE == "in-memory":
 
                 def local_task(*args: _TParams.args, **kwargs: _TParams.kwargs):
-                    return Thread(target=run_async, args=(func(*args, **kwargs),)).start()
+                    DbSession.on_commit(lambda: Thread(target=run_async, args=(func(*args, **kwargs),)).start())
 
                 return local_task
 
@@ -132,6 +134,7 @@ class Broker:
         """Wrap sync celery task decorator.
 
         You don't need to use `@Broker.celery.task` decorator.
+        The task runs in a unit of work (see :meth:`DbSession.unit_of_work`), joining the caller's one if it exists.
 
         DO NOT use *args or **kwargs in sync task.
         """
@@ -144,13 +147,15 @@ class Broker:
             if Env.CACHE_TYPE == "in-memory":
 
                 def local_task(*args: _TParams.args, **kwargs: _TParams.kwargs):
-                    return func(*args, **kwargs)
+                    with DbSession.unit_of_work():
+                        return func(*args, **kwargs)
 
                 return local_task
 
             def task(*args: _TParams.args, **kwargs: _TParams.kwargs) -> Any:
                 new_args, new_kwargs = self.__unpack_task_parameters(func, *args, **kwargs)
-                return func(*new_args, **new_kwargs)
+                with DbSession.unit_of_work():
+                    return func(*new_args, **new_kwargs)
 
             task.__module__ = func.__module__
             task.__name__ = func.__name__
@@ -211,7 +216,8 @@ class Broker:
     def __create_async_task(self, func: Callable[Concatenate[_TParams], Any]) -> _Task[_TParams, Any]:
         def inner(*args: _TParams.args, **kwargs: _TParams.kwargs) -> Any:
             new_args, new_kwargs = self.__pack_task_parameters(*args, **kwargs)
-            return cast(Task, func).apply_async(args=new_args, kwargs=new_kwargs)
+            # The worker must see the rows written by the current unit of work.
+            DbSession.on_commit(lambda: cast(Task, func).apply_async(args=new_args, kwargs=new_kwargs))
 
         return inner
 
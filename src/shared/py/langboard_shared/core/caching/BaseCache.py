@@ -1,9 +1,6 @@
 from abc import ABC, abstractmethod
-from json import dumps as json_dumps
-from json import loads as json_loads
 from typing import Any, Callable
-from pydantic import BaseModel
-from ..utils.Converter import json_default
+from .CacheSerializer import CacheSerializer
 
 
 class BaseCache(ABC):
@@ -32,7 +29,9 @@ class BaseCache(ABC):
     def set(self, key: str, value: Any, ttl: int = 0) -> None:
         """Sets value in cache by key
 
-        If value is a Pydantic model, it will call model_dump_json() to serialize the model.
+        The value is serialized by the serializer registered for the key prefix in :class:`CacheSerializer`.
+
+        By default, if value is a Pydantic model, it will call model_dump_json() to serialize the model.
 
         Otherwise, it will serialize the value to JSON.
 
@@ -54,9 +53,112 @@ class BaseCache(ABC):
     def clear(self) -> None:
         """Deletes all values from cache"""
 
-    def _cast_get(self, raw_value: Any, cast: Callable[[Any], Any] | None) -> Any | None:
-        value = json_loads(raw_value)
+    @abstractmethod
+    def hincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        """Atomically adds the amount to a counter field of the hash stored at key
+
+        The field is removed once its counter drops to zero or below, so the hash only keeps the positive counters.
+
+        Hashes are deleted by :meth:`delete` and :meth:`clear` like any other key.
+
+        :param key: Key of the hash
+        :param field: Field of the counter
+        :param amount: Amount to add, negative to subtract
+        :param ttl: Time to live of the whole hash in seconds, renewed on every change
+        :return: The new counter, never below zero
+        """
+
+    @abstractmethod
+    def hgetall(self, key: str) -> dict[str, int]:
+        """Gets the counters of the hash stored at key
+
+        :param key: Key of the hash
+        """
+
+    def get_many(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        """Gets values from cache by keys in one round trip if the backend supports it
+
+        :param keys: Keys to get values from cache
+        :param caster: Function to cast each value to
+        """
+        return [self.get(key, caster) for key in keys]
+
+    def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        """Sets values in cache in one round trip if the backend supports it
+
+        :param values: Key-value pairs to set in cache
+        :param ttl: Time to live in seconds
+        """
+        for key, value in values.items():
+            self.set(key, value, ttl)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Deletes values from cache by keys in one round trip if the backend supports it
+
+        :param keys: Keys to delete values from cache
+        """
+        for key in keys:
+            self.delete(key)
+
+    async def aget(self, key: str, caster: Callable[[Any], Any] | None = None) -> Any | None:
+        """Asynchronous version of :meth:`get`
+
+        The default implementation calls :meth:`get` directly, so override it if the backend blocks on the network.
+        """
+        return self.get(key, caster)
+
+    async def aset(self, key: str, value: Any, ttl: int = 0) -> None:
+        """Asynchronous version of :meth:`set`"""
+        self.set(key, value, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronous version of :meth:`delete`"""
+        self.delete(key)
+
+    async def amget(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        """Asynchronous version of :meth:`get_many`"""
+        return self.get_many(keys, caster)
+
+    async def amset(self, values: dict[str, Any], ttl: int = 0) -> None:
+        """Asynchronous version of :meth:`set_many`"""
+        self.set_many(values, ttl)
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        """Asynchronous version of :meth:`delete_many`"""
+        self.delete_many(keys)
+
+    async def ahincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        """Asynchronous version of :meth:`hincr`"""
+        return self.hincr(key, field, amount, ttl)
+
+    async def ahgetall(self, key: str) -> dict[str, int]:
+        """Asynchronous version of :meth:`hgetall`"""
+        return self.hgetall(key)
+
+    def publish_invalidation(self, key: str | None) -> None:
+        """Notifies every process listening with :meth:`listen_invalidation` that a key has changed
+
+        The default implementation does nothing.
+
+        :param key: Changed key. If None, every key is considered changed.
+        """
+
+    async def apublish_invalidation(self, key: str | None) -> None:
+        """Asynchronous version of :meth:`publish_invalidation`"""
+        self.publish_invalidation(key)
+
+    def listen_invalidation(self, callback: Callable[[str | None], None]) -> None:
+        """Starts listening to invalidations published by :meth:`publish_invalidation` in the background
+
+        The default implementation does nothing.
+
+        :param callback: Function called with the changed key, or None if every key has changed
+        """
+
+    def _cast_get(self, raw_value: Any, cast: Callable[[Any], Any] | None, key: str = "") -> Any | None:
+        return self._cast(CacheSerializer.get(key).loads(raw_value), cast)
 
+    def _cast(self, value: Any, cast: Callable[[Any], Any] | None) -> Any | None:
         if cast is None:
             return value
 
@@ -65,8 +167,5 @@ class BaseCache(ABC):
         except Exception:
             return None
 
-    def _cast_set(self, value: Any) -> str:
-        if isinstance(value, BaseModel):
-            return value.model_dump_json()
-        else:
-            return json_dumps(value, default=json_default)
+    def _cast_set(self, value: Any, key: str = "") -> str:
+        return CacheSerializer.get(key).dumps(value)
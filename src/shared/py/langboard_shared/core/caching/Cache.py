@@ -1,8 +1,11 @@
+from os import getpid
+from threading import Lock
 from typing import Any, Callable, TypeVar, overload
 from ...Env import Env
 from ..utils.decorators import class_instance, thread_safe_singleton
 from .BaseCache import BaseCache
 from .InMemoryCache import InMemoryCache
+from .LocalCache import LocalCache
 from .RedisCache import RedisCache
 
 
@@ -18,12 +21,33 @@ class Cache(BaseCache):
         else:
             self._cache: BaseCache = InMemoryCache()
 
+        self._local = (
+            LocalCache(Env.CACHE_LOCAL_MAX_SIZE, Env.CACHE_LOCAL_TTL) if Env.CACHE_LOCAL_MAX_SIZE > 0 else None
+        )
+        self._local_prefixes: tuple[str, ...] = ()
+        self._listening_pid: int | None = None
+        self._listening_lock = Lock()
+
     @overload
     def get(self, key: str) -> Any | None: ...
     @overload
     def get(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
     def get(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
-        return self._cache.get(key, caster)
+        if not self._is_local_key(key):
+            return self._cache.get(key, caster)
+
+        local = self._get_local()
+        is_hit, value = local.get(key)
+        if is_hit:
+            return self._cast(value, caster)
+
+        generation = local.generation
+        value = self._cache.get(key)
+        if value is None:
+            return None
+
+        local.put(key, value, generation)
+        return self._cast(value, caster)
 
     def has(self, key: str) -> bool:
         return self._cache.has(key)
@@ -34,9 +58,188 @@ class Cache(BaseCache):
     def set(self, key: str, value: Any, ttl: int) -> None: ...
     def set(self, key: str, value: Any, ttl: int = 0) -> None:
         self._cache.set(key, value, ttl)
+        self._invalidate_local(key)
 
     def delete(self, key: str) -> None:
         self._cache.delete(key)
+        self._invalidate_local(key)
 
     def clear(self) -> None:
         self._cache.clear()
+        if self._local:
+            self._local.invalidate()
+            self._cache.publish_invalidation(None)
+
+    def get_many(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        values, missing_keys, generation = self._get_many_from_local(keys, caster)
+        if missing_keys:
+            fetched_values = self._cache.get_many(missing_keys)
+            self._fill_missing_values(values, keys, missing_keys, fetched_values, caster, generation)
+        return values
+
+    def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        self._cache.set_many(values, ttl)
+        for key in values:
+            self._invalidate_local(key)
+
+    def delete_many(self, keys: list[str]) -> None:
+        self._cache.delete_many(keys)
+        for key in keys:
+            self._invalidate_local(key)
+
+    @overload
+    async def aget(self, key: str) -> Any | None: ...
+    @overload
+    async def aget(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
+    async def aget(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
+        if not self._is_local_key(key):
+            return await self._cache.aget(key, caster)
+
+        local = self._get_local()
+        is_hit, value = local.get(key)
+        if is_hit:
+            return self._cast(value, caster)
+
+        generation = local.generation
+        value = await self._cache.aget(key)
+        if value is None:
+            return None
+
+        local.put(key, value, generation)
+        return self._cast(value, caster)
+
+    async def aset(self, key: str, value: Any, ttl: int = 0) -> None:
+        await self._cache.aset(key, value, ttl)
+        await self._ainvalidate_local(key)
+
+    async def adelete(self, key: str) -> None:
+        await self._cache.adelete(key)
+        await self._ainvalidate_local(key)
+
+    async def amget(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        values, missing_keys, generation = self._get_many_from_local(keys, caster)
+        if missing_keys:
+            fetched_values = await self._cache.amget(missing_keys)
+            self._fill_missing_values(values, keys, missing_keys, fetched_values, caster, generation)
+        return values
+
+    async def amset(self, values: dict[str, Any], ttl: int = 0) -> None:
+        await self._cache.amset(values, ttl)
+        for key in values:
+            await self._ainvalidate_local(key)
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        await self._cache.adelete_many(keys)
+        for key in keys:
+            await self._ainvalidate_local(key)
+
+    def hincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        return self._cache.hincr(key, field, amount, ttl)
+
+    def hgetall(self, key: str) -> dict[str, int]:
+        return self._cache.hgetall(key)
+
+    async def ahincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        return await self._cache.ahincr(key, field, amount, ttl)
+
+    async def ahgetall(self, key: str) -> dict[str, int]:
+        return await self._cache.ahgetall(key)
+
+    def publish_invalidation(self, key: str | None) -> None:
+        self._cache.publish_invalidation(key)
+
+    async def apublish_invalidation(self, key: str | None) -> None:
+        await self._cache.apublish_invalidation(key)
+
+    def listen_invalidation(self, callback: Callable[[str | None], None]) -> None:
+        self._cache.listen_invalidation(callback)
+
+    def register_local_prefix(self, prefix: str) -> None:
+        """Keeps the decoded values of keys starting with the prefix in the process-local cache
+
+        Every process reading or writing those keys must register the prefix, so writers publish invalidations to
+        the other workers.
+
+        Values returned for those keys are shared between callers, so they must be cast with a caster that creates a
+        new object (e.g. ``Model.model_validate``) if the caller mutates them.
+
+        :param prefix: Key prefix to cache locally
+        """
+        if prefix not in self._local_prefixes:
+            self._local_prefixes = (*self._local_prefixes, prefix)
+
+    def local_stats(self) -> dict[str, int | float]:
+        """Returns the hit, miss and eviction counters and the hit rate of the process-local cache"""
+        if not self._local:
+            return {}
+        stats: dict[str, int | float] = {**self._local.stats()}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _is_local_key(self, key: str) -> bool:
+        return self._local is not None and key.startswith(self._local_prefixes)
+
+    def _get_local(self) -> LocalCache:
+        local: LocalCache = self._local  # type: ignore
+        pid = getpid()
+        if self._listening_pid == pid:
+            return local
+
+        with self._listening_lock:
+            if self._listening_pid != pid:
+                # A forked worker must not trust values cached by its parent before it starts listening.
+                local.invalidate()
+                self._cache.listen_invalidation(local.invalidate)
+                self._listening_pid = pid
+        return local
+
+    def _get_many_from_local(
+        self, keys: list[str], caster: Callable[[Any], Any] | None
+    ) -> tuple[list[Any | None], list[str], int]:
+        values: list[Any | None] = [None] * len(keys)
+        if self._local is None or not self._local_prefixes:
+            return values, list(keys), 0
+
+        local = self._get_local()
+        generation = local.generation
+        missing_keys: list[str] = []
+        for i, key in enumerate(keys):
+            is_hit = False
+            if self._is_local_key(key):
+                is_hit, value = local.get(key)
+                if is_hit:
+                    values[i] = self._cast(value, caster)
+            if not is_hit:
+                missing_keys.append(key)
+        return values, missing_keys, generation
+
+    def _fill_missing_values(
+        self,
+        values: list[Any | None],
+        keys: list[str],
+        missing_keys: list[str],
+        fetched_values: list[Any | None],
+        caster: Callable[[Any], Any] | None,
+        generation: int,
+    ) -> None:
+        fetched_by_key = dict(zip(missing_keys, fetched_values))
+        for i, key in enumerate(keys):
+            if key not in fetched_by_key or fetched_by_key[key] is None:
+                continue
+            value = fetched_by_key[key]
+            if self._is_local_key(key):
+                self._get_local().put(key, value, generation)
+            values[i] = self._cast(value, caster)
+
+    def _invalidate_local(self, key: str) -> None:
+        if not self._is_local_key(key):
+            return
+        self._get_local().invalidate(key)
+        self._cache.publish_invalidation(key)
+
+    async def _ainvalidate_local(self, key: str) -> None:
+        if not self._is_local_key(key):
+            return
+        self._get_local().invalidate(key)
+        await self._cache.apublish_invalidation(key)
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from json import dumps as json_dumps
+from typing import Any
+import orjson
+from pydantic import BaseModel
+from ..utils.Converter import json_default
+from ..utils.decorators import staticclass
+
+
+class BaseCacheSerializer(ABC):
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        """Serializes a value to be stored in cache
+
+        :param value: Value to serialize
+        """
+
+    @abstractmethod
+    def loads(self, raw_value: str) -> Any:
+        """Deserializes a value stored in cache
+
+        It must also accept plain JSON, so entries written before the serializer was registered can still be read.
+
+        :param raw_value: Raw value stored in cache
+        """
+
+
+class JsonCacheSerializer(BaseCacheSerializer):
+    """Serializes values to JSON text with orjson, so non-Python consumers (e.g. the socket server) can read them."""
+
+    def dumps(self, value: Any) -> str:
+        if isinstance(value, BaseModel):
+            return value.model_dump_json()
+
+        try:
+            return orjson.dumps(
+                value,
+                default=json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers over 64 bits and some key types that the standard library accepts.
+            return json_dumps(value, default=json_default)
+
+    def loads(self, raw_value: str) -> Any:
+        return orjson.loads(raw_value)
+
+
+@staticclass
+class CacheSerializer:
+    DEFAULT: BaseCacheSerializer = JsonCacheSerializer()
+    __serializers: list[tuple[str, BaseCacheSerializer]] = []
+
+    @staticmethod
+    def register(prefix: str, serializer: BaseCacheSerializer) -> None:
+        """Uses the serializer for keys starting with the prefix
+
+        The longest matching prefix wins.
+
+        :param prefix: Key prefix
+        :param serializer: Serializer to use
+        """
+        serializers = [item for item in CacheSerializer.__serializers if item[0] != prefix]
+        serializers.append((prefix, serializer))
+        serializers.sort(key=lambda item: len(item[0]), reverse=True)
+        CacheSerializer.__serializers[:] = serializers
+
+    @staticmethod
+    def get(key: str) -> BaseCacheSerializer:
+        for prefix, serializer in CacheSerializer.__serializers:
+            if key.startswith(prefix):
+                return serializer
+        return CacheSerializer.DEFAULT
@@ -1,5 +1,8 @@
 from datetime import timedelta
+from os import getpid
 from sqlite3 import Connection
+from threading import Lock, Thread
+from time import monotonic, sleep
 from typing import Any, Callable, TypeVar, overload
 from ...Env import Env
 from ..types import SafeDateTime
@@ -7,68 +10,213 @@ from .BaseCache import BaseCache
 
 
 _TCastReturn = TypeVar("_TCastReturn")
+_NEVER_EXPIRES = 2**62
 
 
 class InMemoryCache(BaseCache):
+    SWEEP_INTERVAL = 30
+    SWEEP_BATCH_SIZE = 500
+    INVALIDATION_POLL_INTERVAL = 0.5
+    INVALIDATION_RETENTION = 60
+
+    def __init__(self):
+        super().__init__()
+        self._lock = Lock()
+        self._conn: Connection | None = None
+        self._conn_pid: int | None = None
+        self._last_swept_at = 0.0
+
     @overload
     def get(self, key: str) -> Any | None: ...
     @overload
     def get(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
     def get(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
-        self._expire()
-        with self._get_cache_db() as conn:
-            cursor = conn.execute(
-                "SELECT value, expiry FROM cache WHERE key = ? AND expiry > ?",
-                (key, int(SafeDateTime.now().timestamp())),
+        with self._lock:
+            self._sweep_if_due()
+            cursor = self._get_cache_db().execute(
+                "SELECT value FROM cache WHERE key = ? AND expiry > ?", (key, self._now())
             )
-            raw_value, ttl = cursor.fetchone() or (None, None)
-            if raw_value is None or ttl is None:
-                return None
+            row = cursor.fetchone()
 
-            value = self._cast_get(raw_value, caster)
-        return value
+        if row is None:
+            return None
+
+        return self._cast_get(row[0], caster, key)
 
     def has(self, key: str) -> bool:
-        self._expire()
-        result = False
-        with self._get_cache_db() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM cache WHERE key = ? AND expiry > ?", (key, int(SafeDateTime.now().timestamp()))
+        with self._lock:
+            self._sweep_if_due()
+            cursor = self._get_cache_db().execute(
+                "SELECT 1 FROM cache WHERE key = ? AND expiry > ?", (key, self._now())
             )
-            result = cursor.fetchone() is not None
-        return result
+            return cursor.fetchone() is not None
 
     def set(self, key: str, value: Any, ttl: int = 0) -> None:
-        self._expire()
-        with self._get_cache_db() as conn:
-            casted_value = self._cast_set(value)
-            expiry = int((SafeDateTime.now() + timedelta(seconds=ttl)).timestamp())
+        casted_value = self._cast_set(value, key)
+        expiry = int((SafeDateTime.now() + timedelta(seconds=ttl)).timestamp())
+        with self._lock:
+            self._sweep_if_due()
+            conn = self._get_cache_db()
             conn.execute("REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)", (key, casted_value, expiry))
             conn.commit()
 
     def delete(self, key: str) -> None:
-        self._expire()
-        with self._get_cache_db() as conn:
+        with self._lock:
+            self._sweep_if_due()
+            conn = self._get_cache_db()
             conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            conn.execute("DELETE FROM cache_hash WHERE key = ?", (key,))
             conn.commit()
 
     def clear(self) -> None:
-        with self._get_cache_db() as conn:
+        with self._lock:
+            conn = self._get_cache_db()
             conn.execute("DELETE FROM cache")
+            conn.execute("DELETE FROM cache_hash")
+            conn.commit()
+
+    def get_many(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        if not keys:
+            return []
+
+        placeholders = ", ".join("?" for _ in keys)
+        with self._lock:
+            self._sweep_if_due()
+            cursor = self._get_cache_db().execute(
+                f"SELECT key, value FROM cache WHERE key IN ({placeholders}) AND expiry > ?", (*keys, self._now())
+            )
+            raw_values = dict(cursor.fetchall())
+
+        return [self._cast_get(raw_values[key], caster, key) if key in raw_values else None for key in keys]
+
+    def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        expiry = int((SafeDateTime.now() + timedelta(seconds=ttl)).timestamp())
+        rows = [(key, self._cast_set(value, key), expiry) for key, value in values.items()]
+        with self._lock:
+            self._sweep_if_due()
+            conn = self._get_cache_db()
+            conn.executemany("REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)", rows)
+            conn.commit()
+
+    def delete_many(self, keys: list[str]) -> None:
+        with self._lock:
+            self._sweep_if_due()
+            conn = self._get_cache_db()
+            conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in keys])
+            conn.executemany("DELETE FROM cache_hash WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+
+    def hincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        now = self._now()
+        expiry = now + ttl if ttl > 0 else None
+        with self._lock:
+            self._sweep_if_due()
+            conn = self._get_cache_db()
+            # The upsert and the removal run in one transaction, so other processes never see a zero counter.
+            conn.execute("DELETE FROM cache_hash WHERE key = ? AND field = ? AND expiry <= ?", (key, field, now))
+            cursor = conn.execute(
+                """
+                INSERT INTO cache_hash (key, field, value, expiry) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key, field) DO UPDATE SET value = value + excluded.value
+                RETURNING value
+                """,
+                (key, field, amount, expiry or _NEVER_EXPIRES),
+            )
+            value: int = cursor.fetchone()[0]
+            if value <= 0:
+                conn.execute("DELETE FROM cache_hash WHERE key = ? AND field = ?", (key, field))
+                value = 0
+            if expiry:
+                conn.execute("UPDATE cache_hash SET expiry = ? WHERE key = ?", (expiry, key))
+            conn.commit()
+        return value
+
+    def hgetall(self, key: str) -> dict[str, int]:
+        with self._lock:
+            self._sweep_if_due()
+            cursor = self._get_cache_db().execute(
+                "SELECT field, value FROM cache_hash WHERE key = ? AND expiry > ?", (key, self._now())
+            )
+            return dict(cursor.fetchall())
+
+    def publish_invalidation(self, key: str | None) -> None:
+        with self._lock:
+            conn = self._get_cache_db()
+            conn.execute("INSERT INTO cache_invalidation (key, created_at) VALUES (?, ?)", (key, self._now()))
             conn.commit()
 
-    def _expire(self) -> None:
-        with self._get_cache_db() as conn:
-            conn.execute("DELETE FROM cache WHERE expiry <= ?", (int(SafeDateTime.now().timestamp()),))
+    def listen_invalidation(self, callback: Callable[[str | None], None]) -> None:
+        with self._lock:
+            cursor = self._get_cache_db().execute("SELECT COALESCE(MAX(id), 0) FROM cache_invalidation")
+            last_id: int = cursor.fetchone()[0]
+
+        def poll() -> None:
+            nonlocal last_id
+            while True:
+                sleep(InMemoryCache.INVALIDATION_POLL_INTERVAL)
+                try:
+                    with self._lock:
+                        cursor = self._get_cache_db().execute(
+                            "SELECT id, key FROM cache_invalidation WHERE id > ? ORDER BY id", (last_id,)
+                        )
+                        rows = cursor.fetchall()
+                except Exception:
+                    continue
+
+                for invalidation_id, key in rows:
+                    last_id = invalidation_id
+                    callback(key)
+
+        Thread(target=poll, daemon=True).start()
+
+    def _sweep_if_due(self) -> None:
+        """Deletes expired rows in bounded batches at most once per :attr:`SWEEP_INTERVAL` seconds.
+
+        Reads already filter out expired rows, so the sweep only reclaims space and never affects correctness.
+
+        Must be called while holding :attr:`_lock`.
+        """
+        now = monotonic()
+        if now - self._last_swept_at < InMemoryCache.SWEEP_INTERVAL:
+            return
+        self._last_swept_at = now
+
+        conn = self._get_cache_db()
+        expiry = self._now()
+        while True:
+            cursor = conn.execute(
+                "DELETE FROM cache WHERE rowid IN (SELECT rowid FROM cache WHERE expiry <= ? LIMIT ?)",
+                (expiry, InMemoryCache.SWEEP_BATCH_SIZE),
+            )
             conn.commit()
+            if cursor.rowcount < InMemoryCache.SWEEP_BATCH_SIZE:
+                break
+
+        conn.execute("DELETE FROM cache_hash WHERE expiry <= ?", (expiry,))
+        conn.execute(
+            "DELETE FROM cache_invalidation WHERE created_at <= ?", (expiry - InMemoryCache.INVALIDATION_RETENTION,)
+        )
+        conn.commit()
 
     def _get_cache_db(self) -> Connection:
+        """Returns the long-lived connection of the current process.
+
+        The connection is reopened after a fork so worker processes never share a SQLite handle with their parent.
+
+        Must be called while holding :attr:`_lock`.
+        """
+        pid = getpid()
+        if self._conn is not None and self._conn_pid == pid:
+            return self._conn
+
         if Env.CACHE_DIR is None:
             raise ValueError("Cache directory is not set")
 
         Env.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         db_path = Env.CACHE_DIR / "cache.db"
-        conn = Connection(db_path)
+        conn = Connection(db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
@@ -76,4 +224,30 @@ class InMemoryCache(BaseCache):
                 expiry INTEGER NOT NULL
             )
         """)
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expiry_idx ON cache (expiry)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_hash (
+                key TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value INTEGER NOT NULL,
+                expiry INTEGER NOT NULL,
+                PRIMARY KEY (key, field)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_hash_expiry_idx ON cache_hash (expiry)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_invalidation (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT,
+                created_at INTEGER NOT NULL
+            )
+        """)
+        conn.commit()
+
+        self._conn = conn
+        self._conn_pid = pid
+        self._last_swept_at = 0.0
         return conn
+
+    def _now(self) -> int:
+        return int(SafeDateTime.now().timestamp())
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+
+class LocalCache:
+    """Bounded, TTL-aware LRU cache living in the current process.
+
+    It holds values that were already decoded from the remote cache, so a hit skips both the network round trip and
+    the JSON parsing.
+
+    Every invalidation bumps :attr:`generation`. Callers must read the generation before fetching from the remote cache
+    and pass it to :meth:`put`, so a value fetched before a concurrent invalidation is never stored.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return False, None
+
+            expires_at, value = item
+            if expires_at <= monotonic():
+                del self._items[key]
+                self.misses += 1
+                return False, None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: str, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+
+            self._items[key] = (monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Removes a key from the cache. If key is None, removes every key.
+
+        :param key: Key to remove
+        """
+        with self._lock:
+            self.generation += 1
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
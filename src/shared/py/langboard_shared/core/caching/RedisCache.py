@@ -1,18 +1,39 @@
 import asyncio
+from asyncio import AbstractEventLoop
 from inspect import iscoroutinefunction
-from typing import Any, Callable, TypeVar, overload
+from threading import Lock
+from typing import Any, AsyncGenerator, Callable, TypeVar, overload
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from ...Env import Env
 from .BaseCache import BaseCache
 
 
 _TCastReturn = TypeVar("_TCastReturn")
+_HINCR_SCRIPT = """
+local value = redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+if value <= 0 then
+    redis.call("HDEL", KEYS[1], ARGV[1])
+    value = 0
+end
+if tonumber(ARGV[3]) > 0 and redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call("EXPIRE", KEYS[1], ARGV[3])
+end
+return value
+"""
 
 
 class RedisCache(BaseCache):
+    INVALIDATION_CHANNEL = "cache-invalidation"
+    INVALIDATE_ALL = "*"
+
     def __init__(self):
         super().__init__()
         self._cache = Redis.from_url(Env.CACHE_URL, decode_responses=True)
+        # redis.asyncio connections are bound to the event loop that opened them, so each loop gets its own pool.
+        self._async_caches: dict[AbstractEventLoop, AsyncRedis] = {}
+        self._async_cache_closers: dict[AbstractEventLoop, AsyncGenerator[None, None]] = {}
+        self._async_caches_lock = Lock()
 
     @overload
     def get(self, key: str) -> Any | None: ...
@@ -23,23 +44,150 @@ class RedisCache(BaseCache):
         if raw_value is None:
             return None
 
-        value = self._cast_get(raw_value, caster)
+        value = self._cast_get(raw_value, caster, key)
         return value
 
     def has(self, key: str) -> bool:
         return self.__run_redis_method("exists", key)
 
     def set(self, key: str, value: Any, ttl: int = 0) -> None:
-        casted_value = self._cast_set(value)
+        casted_value = self._cast_set(value, key)
         self.__run_redis_method("set", key, casted_value, ex=ttl if ttl > 0 else None)
 
     def delete(self, key: str) -> None:
-        if self.__run_redis_method("exists", key):
-            self.__run_redis_method("delete", key)
+        self.__run_redis_method("delete", key)
 
     def clear(self) -> None:
         self.__run_redis_method("flushdb")
 
+    def get_many(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        if not keys:
+            return []
+        raw_values = self.__run_redis_method("mget", keys)
+        return [
+            self._cast_get(raw_value, caster, key) if raw_value is not None else None
+            for key, raw_value in zip(keys, raw_values)
+        ]
+
+    def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        if not values:
+            return
+        pipeline = self._cache.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.set(key, self._cast_set(value, key), ex=ttl if ttl > 0 else None)
+        pipeline.execute()
+
+    def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        self.__run_redis_method("delete", *keys)
+
+    def hincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        return int(self.__run_redis_method("eval", _HINCR_SCRIPT, 1, key, field, amount, ttl))
+
+    def hgetall(self, key: str) -> dict[str, int]:
+        raw_values: dict[str, str] = self.__run_redis_method("hgetall", key)
+        return {field: int(value) for field, value in raw_values.items()}
+
+    async def aget(self, key: str, caster: Callable[[Any], Any] | None = None) -> Any | None:
+        raw_value = await self._get_async_cache().get(key)
+        if raw_value is None:
+            return None
+        return self._cast_get(raw_value, caster, key)
+
+    async def aset(self, key: str, value: Any, ttl: int = 0) -> None:
+        await self._get_async_cache().set(key, self._cast_set(value, key), ex=ttl if ttl > 0 else None)
+
+    async def adelete(self, key: str) -> None:
+        await self._get_async_cache().delete(key)
+
+    async def amget(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> list[Any | None]:
+        if not keys:
+            return []
+        raw_values = await self._get_async_cache().mget(keys)
+        return [
+            self._cast_get(raw_value, caster, key) if raw_value is not None else None
+            for key, raw_value in zip(keys, raw_values)
+        ]
+
+    async def amset(self, values: dict[str, Any], ttl: int = 0) -> None:
+        if not values:
+            return
+        async with self._get_async_cache().pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, self._cast_set(value, key), ex=ttl if ttl > 0 else None)
+            await pipeline.execute()
+
+    async def adelete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        await self._get_async_cache().delete(*keys)
+
+    async def ahincr(self, key: str, field: str, amount: int = 1, ttl: int = 0) -> int:
+        return int(await self._get_async_cache().eval(_HINCR_SCRIPT, 1, key, field, amount, ttl))  # type: ignore
+
+    async def ahgetall(self, key: str) -> dict[str, int]:
+        raw_values: dict[str, str] = await self._get_async_cache().hgetall(key)  # type: ignore
+        return {field: int(value) for field, value in raw_values.items()}
+
+    def publish_invalidation(self, key: str | None) -> None:
+        self.__run_redis_method("publish", RedisCache.INVALIDATION_CHANNEL, key or RedisCache.INVALIDATE_ALL)
+
+    async def apublish_invalidation(self, key: str | None) -> None:
+        await self._get_async_cache().publish(RedisCache.INVALIDATION_CHANNEL, key or RedisCache.INVALIDATE_ALL)
+
+    def listen_invalidation(self, callback: Callable[[str | None], None]) -> None:
+        def handle_message(message: dict[str, Any]) -> None:
+            key = message.get("data")
+            callback(None if key == RedisCache.INVALIDATE_ALL else key)
+
+        pubsub = self._cache.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{RedisCache.INVALIDATION_CHANNEL: handle_message})
+        pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    def _get_async_cache(self) -> AsyncRedis:
+        loop = asyncio.get_running_loop()
+        cache = self._async_caches.get(loop)
+        if cache is not None:
+            return cache
+
+        with self._async_caches_lock:
+            cache = self._async_caches.get(loop)
+            if cache is None:
+                # Loops closed without shutting down their async generators cannot close their clients anymore.
+                for closed_loop in [other_loop for other_loop in self._async_caches if other_loop.is_closed()]:
+                    self._async_caches.pop(closed_loop, None)
+                    self._async_cache_closers.pop(closed_loop, None)
+
+                cache = AsyncRedis.from_url(Env.CACHE_URL, decode_responses=True)
+                self._async_caches[loop] = cache
+                self._async_cache_closers[loop] = self.__start_async_cache_closer(loop, cache)
+        return cache
+
+    def __start_async_cache_closer(self, loop: AbstractEventLoop, cache: AsyncRedis) -> AsyncGenerator[None, None]:
+        """Closes the client when its loop shuts down.
+
+        :func:`asyncio.run` and uvicorn call :meth:`AbstractEventLoop.shutdown_asyncgens` before closing the loop, which
+        closes every async generator the loop is tracking. The generator is started here, so the loop tracks it and
+        runs its ``finally`` block while it can still await the client.
+        """
+
+        async def close_on_shutdown():
+            try:
+                yield
+            finally:
+                with self._async_caches_lock:
+                    self._async_caches.pop(loop, None)
+                    self._async_cache_closers.pop(loop, None)
+                await cache.aclose(close_connection_pool=True)
+
+        closer = close_on_shutdown()
+        try:
+            closer.__anext__().send(None)
+        except StopIteration:
+            pass
+        return closer
+
     def __run_redis_method(self, command: str, *args: Any, **kwargs) -> Any:
         method = getattr(self._cache, command)
         if iscoroutinefunction(method):
@@ -1,6 +1,10 @@
 from .Cache import Cache
+from .CacheSerializer import BaseCacheSerializer, CacheSerializer, JsonCacheSerializer
 
 
 __all__ = [
+    "BaseCacheSerializer",
     "Cache",
+    "CacheSerializer",
+    "JsonCacheSerializer",
 ]
@@ -1,7 +1,18 @@
 import json
+from datetime import datetime
 from enum import Enum
 from types import UnionType
-from typing import Any, Callable, ClassVar, Literal, Union, _UnionGenericAlias, get_args, get_origin  # type: ignore
+from typing import (  # type: ignore
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Literal,
+    Union,
+    _UnionGenericAlias,
+    get_args,
+    get_origin,
+)
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 from ..types import SafeDateTime, SnowflakeID
@@ -9,10 +20,35 @@ from ..utils.String import generate_random_string
 
 
 _TConditions = dict[str, tuple[Literal["both", "schema", "api"], Any]]
+# Values of these exact types are returned as they are by the default converter.
+_PLAIN_VALUE_TYPES = frozenset({str, int, float, bool, type(None), dict, datetime, SafeDateTime})
+
+
+class ApiFieldPlan:
+    """The API fields of a model class, resolved once so converting an instance only reads its values."""
+
+    def __init__(self, fields: list[tuple[str, "ApiField"]]):
+        self.fields = [
+            (field_name, api_field.get_api_name(field_name), api_field, api_field.has_converter())
+            for field_name, api_field in fields
+        ]
+        self.has_conditions = any(api_field.has_api_conditions() for _, api_field in fields)
+
+    def convert(self, model: BaseModel, **kwargs: Any) -> dict[str, Any]:
+        api_result: dict[str, Any] = {}
+        for field_name, api_name, api_field, has_converter in self.fields:
+            if self.has_conditions and not api_field.is_api_included(**kwargs):
+                continue
+            value = getattr(model, field_name, None)
+            if has_converter or type(value) not in _PLAIN_VALUE_TYPES:
+                value = api_field.convert_value(model, value)
+            api_result[api_name] = value
+        return api_result
 
 
 class ApiField:
     __fields__: ClassVar[dict[str, "ApiField"]] = {}
+    __plans__: ClassVar[dict[type[BaseModel], ApiFieldPlan]] = {}
 
     def __init__(
         self,
@@ -39,13 +75,33 @@ class ApiField:
 
     @staticmethod
     def convert(model: BaseModel, **kwargs: Any) -> dict[str, Any]:
-        api_result: dict[str, Any] = {}
-        for field_name, api_field, _ in ApiField.__iter_api_fields(model):
-            value = getattr(model, field_name, None)
+        return ApiField.get_plan(model.__class__).convert(model, **kwargs)
 
-            field_result = api_field.field_convert(model, field_name, value, **kwargs)
-            api_result.update(field_result)
-        return api_result
+    @staticmethod
+    def convert_many(models: Iterable[BaseModel], **kwargs: Any) -> list[dict[str, Any]]:
+        """Converts the models like :meth:`convert`, resolving the plan once per model class.
+
+        :param models: Models to convert
+        """
+        plans: dict[type[BaseModel], ApiFieldPlan] = {}
+        results = []
+        for model in models:
+            model_class = model.__class__
+            plan = plans.get(model_class)
+            if plan is None:
+                plan = plans[model_class] = ApiField.get_plan(model_class)
+            results.append(plan.convert(model, **kwargs))
+        return results
+
+    @staticmethod
+    def get_plan(model: type[BaseModel]) -> ApiFieldPlan:
+        plan = ApiField.__plans__.get(model)
+        if plan is None:
+            plan = ApiFieldPlan(
+                [(field_name, api_field) for field_name, api_field, _ in ApiField.__iter_api_fields(model)]
+            )
+            ApiField.__plans__[model] = plan
+        return plan
 
     @staticmethod
     def create_schema(model: type[BaseModel], **kwargs: Any) -> dict[str, Any]:
@@ -160,6 +216,8 @@ class ApiField:
 
     @staticmethod
     def __get_default_converter(value: Any, field_base_model: str | None = None) -> Any:
+        if type(value) in _PLAIN_VALUE_TYPES:
+            return value
         if isinstance(value, list):
             return [ApiField.__get_default_converter(v, field_base_model) for v in value]
         if isinstance(value, SnowflakeID):
@@ -200,20 +258,30 @@ class ApiField:
         return token
 
     def field_convert(self, model: BaseModel, field_name: str, value: Any, **kwargs: Any) -> dict[str, Any]:
-        if not ApiField.__check_conditions(self.__by_conditions, ("both", "api"), **kwargs):
+        if not self.is_api_included(**kwargs):
             return {}
 
-        api_name = self.__name if self.__name else field_name
-        converted_value = value
-        converter: Callable[[], Any] | None = None
-        if self.__converter:
-            converter = getattr(model, self.__converter, None)
-            if not converter or not callable(converter):
-                raise ValueError(
-                    f"Converter method '{self.__converter}' not found in model '{model.__class__.__name__}'"
-                )
-            converted_value = converter()
-        else:
-            converted_value = ApiField.__get_default_converter(value, self.__field_base_model)
-
-        return {api_name: converted_value}
+        return {self.get_api_name(field_name): self.convert_value(model, value)}
+
+    def get_api_name(self, field_name: str) -> str:
+        return self.__name if self.__name else field_name
+
+    def has_converter(self) -> bool:
+        return bool(self.__converter)
+
+    def has_api_conditions(self) -> bool:
+        return bool(self.__by_conditions) and any(
+            range in ("both", "api") for range, _ in self.__by_conditions.values()
+        )
+
+    def is_api_included(self, **kwargs: Any) -> bool:
+        return ApiField.__check_conditions(self.__by_conditions, ("both", "api"), **kwargs)
+
+    def convert_value(self, model: BaseModel, value: Any) -> Any:
+        if not self.__converter:
+            return ApiField.__get_default_converter(value, self.__field_base_model)
+
+        converter: Callable[[], Any] | None = getattr(model, self.__converter, None)
+        if not converter or not callable(converter):
+            raise ValueError(f"Converter method '{self.__converter}' not found in model '{model.__class__.__name__}'")
+        return converter()
@@ -2,6 +2,7 @@ from typing import Any, Literal
 from sqlalchemy import NullPool, StaticPool
 from ...Env import Env
 from ..utils.decorators import staticclass
+from .DbPool import MeteredQueuePool
 
 
 @staticclass
@@ -20,16 +21,48 @@ class DbConfigHelper:
             }
 
         if driver_type == "postgresql":
+            connect_args: dict[str, Any] = {
+                "conninfo": f"application_name={Env.PROJECT_NAME}_{Env.WORKER}&timeout={Env.DB_TIMEOUT}&statement_cache_size=0&tcp_user_timeout={Env.DB_TCP_USER_TIMEOUT}",
+            }
+
+            pool_mode = Env.DB_POOL_MODE
+            if pool_mode == "null":
+                return {
+                    "connect_args": connect_args,
+                    "poolclass": NullPool,
+                    "pool_pre_ping": True,
+                }
+
+            if pool_mode == "pgbouncer":
+                # PgBouncer in transaction mode hands each transaction to any server connection,
+                # so server-side prepared statements must never be created.
+                connect_args["prepare_threshold"] = None
+
             return {
-                "connect_args": {
-                    "conninfo": f"application_name={Env.PROJECT_NAME}_{Env.WORKER}&timeout={Env.DB_TIMEOUT}&statement_cache_size=0&tcp_user_timeout={Env.DB_TCP_USER_TIMEOUT}",
-                },
-                "poolclass": NullPool,
-                "pool_pre_ping": True,
+                "connect_args": connect_args,
+                "poolclass": MeteredQueuePool,
+                "pool_size": DbConfigHelper.get_worker_pool_setting("DB_POOL_SIZE", Env.DB_POOL_SIZE),
+                "max_overflow": DbConfigHelper.get_worker_pool_setting(
+                    "DB_POOL_MAX_OVERFLOW", Env.DB_POOL_MAX_OVERFLOW
+                ),
+                "pool_recycle": Env.DB_POOL_RECYCLE,
+                "pool_timeout": Env.DB_POOL_TIMEOUT,
+                # Pooled connections are recycled instead of pinged on every checkout.
+                "pool_pre_ping": False,
+                "pool_use_lifo": True,
             }
 
         return {}
 
+    @staticmethod
+    def get_worker_pool_setting(name: str, default: int) -> int:
+        """Gets a pool setting for the current worker (e.g. `DB_POOL_SIZE_MAIN`), falling back to the shared one
+
+        :param name: Setting name
+        :param default: Shared setting value
+        """
+        return int(Env.get_from_env(f"{name}_{Env.WORKER.upper()}", default))
+
     @staticmethod
     def get_sanitized_driver(url: str) -> str:
         split_url = url.split("://", maxsplit=1)
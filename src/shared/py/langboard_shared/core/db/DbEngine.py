@@ -1,8 +1,9 @@
-from typing import Optional
-from sqlalchemy import Engine, create_engine
+from typing import Any, Optional
+from sqlalchemy import Engine, create_engine, event
 from ...Env import Env
 from ..utils.decorators import class_instance, thread_safe_singleton
 from .DbConfigHelper import DbConfigHelper
+from .DbPool import MeteredQueuePool
 
 
 @class_instance()
@@ -16,10 +17,7 @@ class DbEngine:
             return self.__main_engine
 
         url = DbConfigHelper.get_sanitized_driver(Env.MAIN_DATABASE_URL)
-        self.__main_engine = create_engine(
-            url,
-            **DbConfigHelper.create_config(url),
-        )
+        self.__main_engine = self.__create_engine(url)
         return self.__main_engine
 
     def get_readonly_engine(self) -> Engine:
@@ -27,8 +25,38 @@ class DbEngine:
             return self.__readonly_engine
 
         url = DbConfigHelper.get_sanitized_driver(Env.READONLY_DATABASE_URL)
-        self.__readonly_engine = create_engine(
-            url,
-            **DbConfigHelper.create_config(url),
-        )
+        self.__readonly_engine = self.__create_engine(url)
         return self.__readonly_engine
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Gets the checkout and saturation metrics of the engines created in this process
+
+        Engines that are not pooled (:attr:`Env.DB_POOL_MODE` is `null` or SQLite) only report their pool class.
+        """
+        stats = {}
+        for name, engine in (("main", self.__main_engine), ("readonly", self.__readonly_engine)):
+            if not engine:
+                continue
+            pool = engine.pool
+            if isinstance(pool, MeteredQueuePool):
+                stats[name] = {"pool": pool.__class__.__name__, **pool.stats()}
+            else:
+                stats[name] = {"pool": pool.__class__.__name__}
+        return stats
+
+    def __create_engine(self, url: str) -> Engine:
+        engine = create_engine(url, **DbConfigHelper.create_config(url))
+        if DbConfigHelper.get_driver_type(url) == "sqlite":
+            # pysqlite begins transactions lazily, so a SAVEPOINT would start (and its RELEASE commit) the transaction.
+            # Transactions are begun explicitly instead, so the unit of work's savepoints nest in them. The connection
+            # is shared by every session (StaticPool), so one that is already in a transaction is joined.
+            @event.listens_for(engine, "connect")
+            def disable_implicit_begin(dbapi_connection, _):
+                dbapi_connection.isolation_level = None
+
+            @event.listens_for(engine, "begin")
+            def begin(connection):
+                if not connection.connection.dbapi_connection.in_transaction:
+                    connection.exec_driver_sql("BEGIN")
+
+        return engine
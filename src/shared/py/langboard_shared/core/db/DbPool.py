@@ -0,0 +1,63 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any
+from sqlalchemy import QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a connection.
+
+    Waiting checkouts mean the pool is saturated, so :meth:`stats` reports the wait times together with the pool usage.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = Lock()
+        self._checkouts = 0
+        self._checkout_timeouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+
+    def _do_get(self):
+        started_at = perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self._record_checkout(perf_counter() - started_at, is_timeout=True)
+            raise
+        self._record_checkout(perf_counter() - started_at, is_timeout=False)
+        return connection
+
+    def stats(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            checkouts = self._checkouts
+            timeouts = self._checkout_timeouts
+            wait_total = self._checkout_wait_total
+            wait_max = self._checkout_wait_max
+
+        size = self.size()
+        max_connections = size + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            "size": size,
+            "max_overflow": self._max_overflow,
+            "checked_in": self.checkedin(),
+            "checked_out": checked_out,
+            "overflow": self.overflow(),
+            "saturation": round(checked_out / max_connections, 4) if max_connections > 0 else 0,
+            "checkouts": checkouts,
+            "checkout_timeouts": timeouts,
+            "checkout_wait_avg_ms": round(wait_total / checkouts * 1000, 3) if checkouts else 0,
+            "checkout_wait_max_ms": round(wait_max * 1000, 3),
+        }
+
+    def _record_checkout(self, wait: float, is_timeout: bool) -> None:
+        with self._metrics_lock:
+            if is_timeout:
+                self._checkout_timeouts += 1
+            else:
+                self._checkouts += 1
+                self._checkout_wait_total += wait
+            if wait > self._checkout_wait_max:
+                self._checkout_wait_max = wait
@@ -1,15 +1,34 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import RLock
 from time import sleep
-from typing import Any, Dict, Generic, Iterable, Mapping, Optional, Sequence, TypeVar, Union, cast, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 import psycopg.errors
 from sqlalchemy import CompoundSelect, CursorResult, Delete, Insert, IteratorResult, Update
 from sqlalchemy import Sequence as SqlSequence
 from sqlalchemy.engine.result import ScalarResult, TupleResult
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine.row import Row
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.util import EMPTY_DICT
 from sqlmodel import Session, update
 from sqlmodel.sql.base import Executable
 from sqlmodel.sql.expression import Select, SelectOfScalar
+from ...Env import Env
 from ..logger import Logger
 from ..types import SafeDateTime, SnowflakeID
 from .DbEngine import DbEngine
@@ -19,9 +38,26 @@ from .Models import BaseSqlModel, SoftDeleteModel
 _TSelectParam = TypeVar("_TSelectParam", bound=Any)
 
 
+TResultDetachMode = Literal["expunge", "copy"]
+
+
 class Result(Generic[_TSelectParam]):
-    def __init__(self, records: Sequence[Any]):
-        self.__records = [self.__copy_record(record) for record in records]
+    """Detaches the selected models from the session, so changing them never writes to the database.
+
+    - `expunge`: Removes the loaded models from the session and returns them as they are. A model appearing in more
+      than one row is copied for the later rows, so each row still gets its own instance.
+    - `copy`: Returns a validated copy of each model.
+
+    Models in multi-column rows (:class:`Row`) are always expunged and shared between the rows, as rows cannot be
+    rebuilt.
+    """
+
+    def __init__(self, records: Sequence[Any], session: Session | None = None, detach: TResultDetachMode = "copy"):
+        self.__session = session
+        self.__detach = detach
+        self.__detached_ids: set[int] = set()
+        self.__records = [self.__detach_record(record) for record in records]
+        self.__session = None
 
     def all(self) -> list[_TSelectParam]:
         return self.__records
@@ -29,15 +65,32 @@ class Result(Generic[_TSelectParam]):
     def first(self) -> Optional[_TSelectParam]:
         return self.__records[0] if self.__records else None
 
-    def __copy_record(self, record: Any):
+    def __detach_record(self, record: Any):
         if isinstance(record, BaseSqlModel):
-            record = self.__copy_model(record)
+            record = self.__detach_model(record)
         elif isinstance(record, tuple):
             record = self.__convert_tuple_record(record)
+        elif isinstance(record, Row):
+            for item in record:
+                if isinstance(item, BaseSqlModel) and id(item) not in self.__detached_ids:
+                    self.__detached_ids.add(id(item))
+                    self.__expunge_model(item)
         return record
 
     def __convert_tuple_record(self, record: tuple) -> tuple:
-        return tuple(self.__copy_model(item) if isinstance(item, BaseSqlModel) else item for item in record)
+        return tuple(self.__detach_model(item) if isinstance(item, BaseSqlModel) else item for item in record)
+
+    def __detach_model(self, record: BaseSqlModel) -> BaseSqlModel:
+        if self.__detach == "copy" or id(record) in self.__detached_ids:
+            return self.__copy_model(record)
+
+        self.__detached_ids.add(id(record))
+        self.__expunge_model(record)
+        return record
+
+    def __expunge_model(self, record: BaseSqlModel) -> None:
+        if self.__session is not None and record in self.__session:
+            self.__session.expunge(record)
 
     def __copy_model(self, record: BaseSqlModel) -> BaseSqlModel:
         return record.__class__.model_validate(record.model_dump())
@@ -46,6 +99,122 @@ class Result(Generic[_TSelectParam]):
 _logger = Logger.use("db")
 
 
+class DbUnitOfWork:
+    """Shares one readonly and one read-write session between the :meth:`DbSession.use` calls of a context.
+
+    Each `DbSession.use(readonly=False)` block runs in a savepoint, released (and flushed) when the block exits, and
+    the writes are committed once by :meth:`commit`. If an exception escapes a read-write block, only that block's
+    writes and :meth:`on_commit` callbacks are rolled back, so a caller catching it keeps the earlier writes. Once the
+    read-write session is open, readonly blocks also use it, so they see the pending writes.
+
+    The sessions are used by one thread at a time. Blocks opened from another thread while the sessions are in use
+    get their own session, as they do outside a unit of work.
+    """
+
+    def __init__(self):
+        self.is_closed = False
+        self._lock = RLock()
+        self._sessions: dict[bool, Session] = {}
+        self._on_commit_callbacks: list[Callable[[], Any]] = []
+        # Without a replica, one session serves both reads and writes.
+        self._is_shared_session = Env.READONLY_DATABASE_URL == Env.MAIN_DATABASE_URL
+
+    def acquire(self) -> bool:
+        """Acquires the sessions for the current thread without waiting.
+
+        Returns `False` if the unit is closed or another thread is using it; :meth:`release` must not be called then.
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        if self.is_closed:
+            self._lock.release()
+            return False
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    @contextmanager
+    def use(self, readonly: bool) -> Iterator["DbSession"]:
+        if readonly and not self._is_shared_session and False not in self._sessions:
+            session = self._get_session(readonly=True)
+        else:
+            session = self._get_session(readonly=False)
+
+        savepoint = session.begin_nested() if not readonly else None
+        callback_count = len(self._on_commit_callbacks)
+        db = DbSession(session, readonly=readonly)
+        try:
+            yield db
+            if savepoint is not None and savepoint.is_active:
+                savepoint.commit()
+        except Exception as e:
+            if savepoint is not None:
+                if savepoint.is_active:
+                    savepoint.rollback()
+                del self._on_commit_callbacks[callback_count:]
+            elif isinstance(e, SQLAlchemyError):
+                # A failed statement aborts the whole transaction, so the pending writes cannot be kept.
+                if session is self._sessions.get(False):
+                    _logger.warning("Rolling back the pending writes of the unit of work: %s", e)
+                    self._on_commit_callbacks.clear()
+                session.rollback()
+            raise
+        finally:
+            db.close()
+
+    def on_commit(self, callback: Callable[[], Any]) -> None:
+        with self._lock:
+            if not self.is_closed:
+                self._on_commit_callbacks.append(callback)
+                return
+        callback()
+
+    def commit(self) -> None:
+        """Commits the pending writes, closes the sessions and runs the callbacks registered by :meth:`on_commit`.
+
+        Later :meth:`DbSession.use` calls of the context open their own sessions.
+        """
+        sessions, callbacks = self._close()
+        try:
+            write_session = sessions.get(False)
+            if write_session is not None:
+                write_session.commit()
+        finally:
+            for session in sessions.values():
+                session.close()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                _logger.exception(e)
+
+    def rollback(self) -> None:
+        """Rolls back the pending writes and closes the sessions. Callbacks registered by :meth:`on_commit` are dropped."""
+        sessions, _ = self._close()
+        for session in sessions.values():
+            session.close()
+
+    def _get_session(self, readonly: bool) -> Session:
+        if readonly not in self._sessions:
+            engine = DbEngine.get_readonly_engine() if readonly else DbEngine.get_main_engine()
+            self._sessions[readonly] = Session(engine, expire_on_commit=False)
+        return self._sessions[readonly]
+
+    def _close(self) -> tuple[dict[bool, Session], list[Callable[[], Any]]]:
+        with self._lock:
+            self.is_closed = True
+            sessions = self._sessions.copy()
+            callbacks = self._on_commit_callbacks.copy()
+            self._sessions.clear()
+            self._on_commit_callbacks.clear()
+        return sessions, callbacks
+
+
+_unit_of_work: ContextVar[DbUnitOfWork | None] = ContextVar("db_unit_of_work", default=None)
+
+
 class DbSession:
     """Manages the database sessions.
 
@@ -59,6 +228,15 @@ class DbSession:
     @staticmethod
     @contextmanager
     def use(readonly: bool):
+        unit = _unit_of_work.get()
+        if unit is not None and unit.acquire():
+            try:
+                with unit.use(readonly) as db:
+                    yield db
+            finally:
+                unit.release()
+            return
+
         MAX_TRIALS = 10
         for trial in range(MAX_TRIALS):
             session = None
@@ -102,6 +280,54 @@ class DbSession:
                     session.close()
                     session = None
 
+    @staticmethod
+    @contextmanager
+    def unit_of_work(isolated: bool = False) -> Iterator[DbUnitOfWork]:
+        """Shares the sessions of every :meth:`use` call in the current context and commits the writes once on exit.
+
+        Nested calls join the outermost unit of work. If an exception escapes, the writes are rolled back.
+        Call :meth:`DbUnitOfWork.commit` to commit earlier (e.g. before a response is sent).
+
+        :param isolated: If `True`, starts a new unit of work even inside another one (e.g. for each sub-request of a
+            batch request); the enclosing unit is used again after it exits.
+
+        E.g.::
+
+            with DbSession.unit_of_work():
+                project = project_repository.get_by_id_like(project_uid)
+                project_repository.update(project)
+        """
+        unit = _unit_of_work.get()
+        if not isolated and unit is not None and not unit.is_closed:
+            yield unit
+            return
+
+        unit = DbUnitOfWork()
+        token = _unit_of_work.set(unit)
+        try:
+            yield unit
+        except BaseException:
+            unit.rollback()
+            raise
+        else:
+            unit.commit()
+        finally:
+            _unit_of_work.reset(token)
+
+    @staticmethod
+    def on_commit(callback: Callable[[], Any]) -> None:
+        """Runs the callback after the current unit of work commits, or immediately outside a unit of work.
+
+        Use it for side effects that read the written rows from elsewhere (e.g. dispatching tasks).
+
+        :param callback: Callback to run
+        """
+        unit = _unit_of_work.get()
+        if unit is None:
+            callback()
+            return
+        unit.on_commit(callback)
+
     def close(self):
         self.__session = cast(Session, None)
         self.__readonly = True
@@ -148,11 +374,11 @@ class DbSession:
             return
 
         obj.clear_changes()
-        obj = obj.model_validate(obj.model_dump())
         try:
-            obj = self.__session.merge(obj)
+            # merge copies the values to the session's instance, so the given object stays detached.
+            self.__session.merge(obj)
         except Exception:
-            self.__session.add(obj)
+            self.__session.add(obj.model_validate(obj.model_dump()))
 
     @overload
     def delete(self, obj: BaseSqlModel): ...
@@ -173,12 +399,11 @@ class DbSession:
             return
 
         obj.clear_changes()
-        obj = obj.model_validate(obj.model_dump())
 
         try:
             obj = self.__session.merge(obj)
         except Exception:
-            pass
+            obj = obj.model_validate(obj.model_dump())
 
         try:
             if purge or not isinstance(obj, SoftDeleteModel):
@@ -201,6 +426,7 @@ class DbSession:
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        detach: TResultDetachMode = "expunge",
     ) -> Result[_TSelectParam]: ...
     @overload
     def exec(
@@ -212,6 +438,7 @@ class DbSession:
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        detach: TResultDetachMode = "expunge",
     ) -> Result[_TSelectParam]: ...
     @overload
     def exec(
@@ -223,6 +450,7 @@ class DbSession:
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        detach: TResultDetachMode = "expunge",
     ) -> Result[_TSelectParam]: ...
     @overload
     def exec(
@@ -272,6 +500,7 @@ class DbSession:
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
         purge: bool = False,
+        detach: TResultDetachMode = "expunge",
     ) -> Union[Result[_TSelectParam], Result[_TSelectParam]] | int:
         """Executes a statement on the database.
 
@@ -286,6 +515,7 @@ class DbSession:
         :param bind_arguments: The bind arguments to be passed to the statement.
         :param _parent_execute_state: The parent execute state to be passed to the statement.
         :param _add_event: The event to be added to the statement.
+        :param detach: How the selected models are detached from the session; See :class:`Result`.
         """
         if (
             isinstance(statement, Delete)
@@ -322,7 +552,7 @@ class DbSession:
 
         if isinstance(result, (ScalarResult, TupleResult, IteratorResult, CursorResult)):
             raw_records = result.all()
-            result = Result(raw_records)
+            result = Result(raw_records, self.__session, detach)
             return result
 
         _logger.warning(f"Unexpected result type: {type(result)}")
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, ClassVar, Literal, TypeVar, overload
+from typing import Any, Iterable, Literal, TypeVar, overload
 from pydantic import BaseModel, SecretStr, model_serializer
 from sqlalchemy import MetaData
 from sqlalchemy.orm import declared_attr, registry
@@ -30,7 +30,6 @@ default_registry = registry()
 class BaseSqlModel(ABC, SQLModel, registry=default_registry):
     """Bases for all SQL models in the application inherited from :class:`SQLModel`."""
 
-    __changes__: ClassVar[dict[str, dict[str, Any]]] = {}
     __pydantic_post_init__ = "model_post_init"
 
     id: SnowflakeID = SnowflakeIDField(primary_key=True, api_field=ApiField(name="uid"))
@@ -39,13 +38,10 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
         default=SafeDateTime.now, nullable=False, onupdate=True, api_field=ApiField()
     )
 
-    @property
-    def __change_key(self) -> str:
-        return f"{self.__tablename__}:{self.id}"
-
     @property
     def __changes(self) -> dict[str, Any]:
-        return self.__changes__[self.__change_key] if self.__change_key in self.__changes__ else {}
+        # Stored in the instance dict (like `_initiated`), so the changes are freed with the instance.
+        return self.__dict__.get("_changes") or {}
 
     @property
     def changes(self) -> dict[str, Any]:
@@ -100,15 +96,18 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
             super().__setattr__(name, value)
             return
 
-        if not self.is_new() and name in self.model_fields.keys():
+        # Changes are tracked once the object has an ID (`0` while new, unset while being constructed).
+        if name != "id" and name in self.__class__.model_fields and self.__dict__.get("id"):
             old_value = getattr(self, name)
-            if self.__change_key not in self.__changes__:
-                self.__changes__[self.__change_key] = {}
             if old_value != value:
-                if name not in self.__changes:
-                    self.__changes[name] = old_value
-                elif self.__changes[name] == value:
-                    del self.__changes[name]
+                changes = self.__dict__.get("_changes")
+                if changes is None:
+                    changes = {}
+                    object.__setattr__(self, "_changes", changes)
+                if name not in changes:
+                    changes[name] = old_value
+                elif changes[name] == value:
+                    del changes[name]
         super().__setattr__(name, value)
 
     @classmethod
@@ -177,7 +176,7 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
         """Clear the changes made to the object."""
         if not isinstance(self, BaseSqlModel) or not self.__changes:
             return
-        self.__changes__.pop(self.__change_key)
+        self.__dict__["_changes"].clear()
 
     @model_serializer
     def serialize(self) -> dict[str, Any]:
@@ -203,6 +202,22 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
     def api_response(self, **kwargs) -> dict[str, Any]:
         return ApiField.convert(self, **kwargs)
 
+    @staticmethod
+    def api_response_many(models: Iterable["BaseSqlModel"], **kwargs) -> list[dict[str, Any]]:
+        """Get the API responses of the models, same as calling :meth:`api_response` on each of them.
+
+        Models that do not override :meth:`api_response` are converted with their class's compiled API field plan.
+
+        :param models: The models to convert.
+        """
+        api_responses = []
+        for model in models:
+            if model.__class__.api_response is BaseSqlModel.api_response:
+                api_responses.append(ApiField.get_plan(model.__class__).convert(model, **kwargs))
+            else:
+                api_responses.append(model.api_response(**kwargs))
+        return api_responses
+
     @abstractmethod
     def notification_data(self) -> dict[str, Any]: ...
 
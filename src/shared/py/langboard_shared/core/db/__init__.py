@@ -11,7 +11,7 @@ from .ColumnTypes import (
     SnowflakeIDField,
     SnowflakeIDType,
 )
-from .DbSession import DbSession
+from .DbSession import DbSession, DbUnitOfWork
 from .Field import Field
 from .Models import BaseSqlModel, ChatContentModel, EditorContentModel, SoftDeleteModel
 from .SqlBuilder import SqlBuilder
@@ -20,6 +20,7 @@ from .SqlBuilder import SqlBuilder
 __all__ = [
     "BaseSeed",
     "DbSession",
+    "DbUnitOfWork",
     "DateTimeField",
     "Field",
     "ApiField",
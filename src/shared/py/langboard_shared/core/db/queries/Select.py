@@ -1,11 +1,14 @@
 from typing import Any, Literal, Mapping, Optional, Sequence, TypeGuard, TypeVar, cast, overload
-from sqlalchemy import Column, func
+from sqlalchemy import JSON, Column, func
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql._typing import _DMLTableArgument
+from sqlalchemy.sql.functions import Function
 from sqlmodel import select
 from sqlmodel.sql._expression_select_gen import _TCCA
 from sqlmodel.sql.expression import Select, SelectOfScalar
+from ....Env import Env
 from ...types import SafeDateTime, SnowflakeID
+from ..DbConfigHelper import DbConfigHelper
 from ..Models import SoftDeleteModel
 
 
@@ -312,6 +315,17 @@ class SelectQuery:
 
         return select(func.count(column))  # type: ignore
 
+    def json_array(self, column: _DMLTableArgument) -> Function[Any]:
+        """Aggregates the column into a JSON array that is loaded as a Python list.
+
+        Uses `json_agg` on PostgreSQL and `json_group_array` on SQLite. PostgreSQL returns `None` for no rows.
+
+        :param column: Column to aggregate
+        """
+        if DbConfigHelper.get_driver_type(Env.READONLY_DATABASE_URL) == "postgresql":
+            return func.json_agg(column, type_=JSON)
+        return func.json_group_array(column, type_=JSON)
+
     @overload
     def _is_soft_delete_model(
         self, entity: Any, is_column: Literal[True]
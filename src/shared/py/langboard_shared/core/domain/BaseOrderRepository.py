@@ -1,9 +1,12 @@
 from contextlib import contextmanager
-from typing import Any, Generic, TypeVar, overload
+from typing import Any, Generic, Literal, Sequence, TypeVar, overload
 from sqlalchemy import func
+from ...Env import Env
 from ...helpers import InfraHelper
+from ...tasks.orders import OrderTask
 from ..db import BaseSqlModel, DbSession, SoftDeleteModel, SqlBuilder
 from ..types.ParamTypes import TBaseParam
+from ..utils.OrderKey import OrderKey
 from .BaseRepository import BaseRepository
 
 
@@ -41,6 +44,36 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
             ).all()
             yield db
 
+    def insert(self, model: _TModel | _TModelParam | list[_TModel | _TModelParam]):
+        """Inserts the models; In `key` mode, new rows are appended after the last key of their parent.
+
+        In `index` mode, the keys are left empty and generated from `order` once `key` mode is enabled.
+        """
+        models = model if isinstance(model, list) else [model]
+        last_keys: dict[tuple[type[BaseSqlModel], Any], str | None] = {}
+        long_key_parent_ids: dict[type[BaseSqlModel], set[int]] = {}
+        for target in models:
+            model_class = target.__class__
+            if not InfraHelper.is_order_key_enabled(model_class) or getattr(target, "order_key", None) is not None:
+                continue
+            parent_foreign_key_name = self._get_parent_foreign_key_name()
+            parent_id = getattr(target, parent_foreign_key_name, None)
+            if parent_id is None:
+                continue
+            cache_key = (model_class, parent_id)
+            if cache_key not in last_keys:
+                last_keys[cache_key] = self._get_last_order_key(model_class, parent_foreign_key_name, parent_id)
+            setattr(target, "order_key", OrderKey.between(last_keys[cache_key], None))
+            last_keys[cache_key] = getattr(target, "order_key")
+            if len(getattr(target, "order_key")) > Env.ORDER_KEY_MAX_LENGTH:
+                long_key_parent_ids.setdefault(model_class, set()).add(int(parent_id))
+        super().insert(model)
+
+        # Appending makes the keys longer, so they are regenerated once they get too long.
+        parent_foreign_key_name = self._get_parent_foreign_key_name() if long_key_parent_ids else ""
+        for model_class, parent_ids in long_key_parent_ids.items():
+            OrderTask.rebalance_order(model_class.__tablename__, parent_foreign_key_name, list(parent_ids))
+
     def update_column_order(
         self,
         model: _TModel | TBaseParam,
@@ -56,6 +89,10 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
         model_class = self._get_model_cls(model_cls)
         parent_foreign_key_name = self._get_parent_foreign_key_name(parent_model_cls)
 
+        if InfraHelper.is_order_key_enabled(model_class):
+            self._move_by_order_key(model, model_class, parent_foreign_key_name, parent_id, new_order)
+            return
+
         with DbSession.use(readonly=False) as db:
             update_query = SqlBuilder.update.table(model_class).where(
                 model_class.column(parent_foreign_key_name) == parent_id
@@ -66,7 +103,7 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
             db.exec(
                 SqlBuilder.update.table(model_class)
                 .where(model_class.column("id") == model_id)
-                .values({model_class.column("order"): new_order})
+                .values(self._get_index_order_values(model, model_class, new_order))
             )
 
     def update_row_order(
@@ -86,6 +123,12 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
         model_class = self._get_model_cls(model_cls)
         parent_foreign_key_name = self._get_parent_foreign_key_name(parent_model_cls)
 
+        if InfraHelper.is_order_key_enabled(model_class):
+            self._move_by_order_key(
+                model, model_class, parent_foreign_key_name, new_parent_id or old_parent_id, new_order, old_parent_id
+            )
+            return
+
         with DbSession.use(readonly=False) as db:
             shared_update_query = SqlBuilder.update.table(model_class)
 
@@ -111,7 +154,7 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
             db.exec(
                 SqlBuilder.update.table(model_class)
                 .where(model_class.column("id") == model_id)
-                .values({model_class.column("order"): new_order})
+                .values(self._get_index_order_values(model, model_class, new_order))
             )
 
     def get_next_order(
@@ -126,6 +169,19 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
         model_class = self._get_model_cls(model_cls)
         parent_foreign_key_name = self._get_parent_foreign_key_name(parent_model_cls)
 
+        if InfraHelper.is_order_key_enabled(model_class):
+            # Moves only update the moved row, so the stored order of the siblings may be stale and the next order
+            # is their count.
+            count_query = SqlBuilder.select.count(model_class, model_class.column("id")).where(
+                model_class.column(parent_foreign_key_name) == parent_id
+            )
+            if issubclass(model_class, SoftDeleteModel):
+                count_query = count_query.where(model_class.column("deleted_at") == None)  # noqa
+            if where_clauses:
+                count_query = InfraHelper.where_recursive(count_query, model_class, **where_clauses)
+            with DbSession.use(readonly=True) as db:
+                return db.exec(count_query).first() or 0
+
         query = (
             SqlBuilder.select.columns(
                 func.sum(model_class.column("order")),
@@ -198,6 +254,143 @@ class BaseOrderRepository(Generic[_TModel, _TParentModel], BaseRepository[_TMode
                 )
             )
 
+    def rebalance_order(
+        self,
+        parent_model: _TParentModel | TBaseParam,
+        by: Literal["order", "order_key"] = "order_key",
+        *,
+        model_cls: type[_TModelParam] | None = None,
+        parent_model_cls: type[_TParentModelParam] | None = None,
+    ) -> int:
+        """Renumbers the rows of the parent; See :meth:`InfraHelper.rebalance_order`."""
+        model_class = self._get_model_cls(model_cls)
+        parent_foreign_key_name = self._get_parent_foreign_key_name(parent_model_cls)
+        return InfraHelper.rebalance_order(
+            model_class, parent_foreign_key_name, InfraHelper.convert_id(parent_model), by
+        )
+
+    def _set_order_by_position(
+        self,
+        models: Sequence[BaseSqlModel],
+        *,
+        model_cls: type[_TModelParam] | None = None,
+        parent_model_cls: type[_TParentModelParam] | None = None,
+    ):
+        """Sets the `order` of the sorted models to their position in `key` mode; See
+        :meth:`InfraHelper.set_order_by_position`.
+        """
+        if InfraHelper.is_order_key_enabled(self._get_model_cls(model_cls)):
+            InfraHelper.set_order_by_position(models, self._get_parent_foreign_key_name(parent_model_cls))
+
+    def _move_by_order_key(
+        self,
+        model: BaseSqlModel | TBaseParam,
+        model_class: type[BaseSqlModel],
+        parent_foreign_key_name: str,
+        parent_id: Any,
+        new_order: int,
+        old_parent_id: Any | None = None,
+    ):
+        """Moves the row by giving it a key between its new neighbors, so only the moved row is updated.
+
+        The siblings keep their stored `order` (readers sort by :meth:`InfraHelper.get_order_columns`). The parent is
+        only rebalanced when a neighbor has no usable key, or in background once the new key gets too long.
+        """
+        model_id = InfraHelper.convert_id(model)
+        order_key = self._get_order_key_at(model_class, parent_foreign_key_name, parent_id, model_id, new_order)
+        if order_key is None:
+            # A sibling has no key or concurrent moves gave two siblings the same key.
+            InfraHelper.rebalance_order(model_class, parent_foreign_key_name, parent_id)
+            order_key = self._get_order_key_at(model_class, parent_foreign_key_name, parent_id, model_id, new_order)
+
+        if isinstance(model, BaseSqlModel):
+            setattr(model, "order_key", order_key)
+
+        with DbSession.use(readonly=False) as db:
+            db.exec(
+                SqlBuilder.update.table(model_class)
+                .where(model_class.column("id") == model_id)
+                .values(
+                    {
+                        model_class.column(parent_foreign_key_name): parent_id,
+                        model_class.column("order"): new_order,
+                        model_class.column("order_key"): order_key,
+                    }
+                )
+            )
+
+        # Keys between close neighbors get longer, so they are regenerated once they get too long.
+        if order_key is not None and len(order_key) > Env.ORDER_KEY_MAX_LENGTH:
+            OrderTask.rebalance_order(model_class.__tablename__, parent_foreign_key_name, [int(parent_id)])
+
+    def _get_index_order_values(
+        self, model: BaseSqlModel | TBaseParam, model_class: type[BaseSqlModel], new_order: int
+    ) -> dict[Any, Any]:
+        """Gets the values of a row moved in `index` mode.
+
+        Its key no longer matches its position, so it is cleared and regenerated from `order` once `key` mode is
+        enabled.
+        """
+        values: dict[Any, Any] = {model_class.column("order"): new_order}
+        if InfraHelper.has_order_key(model_class):
+            values[model_class.column("order_key")] = None
+            if isinstance(model, BaseSqlModel):
+                setattr(model, "order_key", None)
+        return values
+
+    def _get_order_key_at(
+        self,
+        model_class: type[BaseSqlModel],
+        parent_foreign_key_name: str,
+        parent_id: Any,
+        model_id: Any,
+        order: int,
+    ) -> str | None:
+        """Generates a key for the row placed at the order among its siblings.
+
+        :return: `None` if a neighbor has no key or the neighbors have the same key
+        """
+        query = (
+            SqlBuilder.select.column(model_class.column("order_key"))
+            .where((model_class.column(parent_foreign_key_name) == parent_id) & (model_class.column("id") != model_id))
+            .order_by(*InfraHelper.get_order_columns(model_class), model_class.column("id"))
+        )
+        with DbSession.use(readonly=True) as db:
+            if order <= 0:
+                keys = list(db.exec(query.limit(1)).all())
+                before, after = None, keys[0] if keys else None
+            else:
+                keys = list(db.exec(query.offset(order - 1).limit(2)).all())
+                if not keys:
+                    keys = list(
+                        db.exec(
+                            query.order_by(None)
+                            .order_by(
+                                *[column.desc() for column in InfraHelper.get_order_columns(model_class)],
+                                model_class.column("id").desc(),
+                            )
+                            .limit(1)
+                        ).all()
+                    )
+                before, after = keys[0] if keys else None, keys[1] if len(keys) > 1 else None
+
+        if any(key is None for key in keys):
+            return None
+        try:
+            return OrderKey.between(before, after)
+        except ValueError:
+            return None
+
+    def _get_last_order_key(
+        self, model_class: type[BaseSqlModel], parent_foreign_key_name: str, parent_id: Any
+    ) -> str | None:
+        with DbSession.use(readonly=True) as db:
+            return db.exec(
+                SqlBuilder.select.column(func.max(model_class.column("order_key"))).where(
+                    model_class.column(parent_foreign_key_name) == parent_id
+                )
+            ).first()
+
     def _get_parent_foreign_key_name(
         self, parent_model_cls: type[_TParentModel] | type[_TParentModelParam] | None = None
     ) -> str:
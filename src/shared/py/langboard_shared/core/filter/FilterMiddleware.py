@@ -1,8 +1,9 @@
 from typing import Literal, overload
-from starlette.routing import BaseRoute, Match
+from starlette.routing import BaseRoute
 from starlette.types import ASGIApp, Scope
 from ..routing import AppExceptionHandlingRoute
 from ..routing.BaseMiddleware import BaseMiddleware
+from ..routing.RouteMatcher import RouteMatcher
 from .BaseFilter import BaseFilter
 
 
@@ -17,6 +18,7 @@ class FilterMiddleware(BaseMiddleware):
     ):
         super().__init__(app)
         self._routes = routes
+        self._route_matcher = RouteMatcher(routes)
         self._filter = filter
 
     @overload
@@ -24,15 +26,11 @@ class FilterMiddleware(BaseMiddleware):
     @overload
     def should_filter(self, scope: Scope) -> tuple[Literal[False], None]: ...
     def should_filter(self, scope: Scope) -> tuple[bool, Scope | None]:
-        should_filter = False
-        child_scope = None
-        for route in self._routes:
-            if not isinstance(route, AppExceptionHandlingRoute):
-                continue
+        result = self._route_matcher.match(scope)
+        if result is None:
+            return False, None
 
-            matches, child_scope = route.matches(scope)
-            if matches == Match.FULL:
-                if self._filter.exists(child_scope["endpoint"]):
-                    should_filter = True
-                break
-        return should_filter, child_scope
+        route, child_scope = result
+        if not isinstance(route, AppExceptionHandlingRoute):
+            return False, None
+        return self._filter.exists(child_scope["endpoint"]), child_scope
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any
+from threading import Lock
+from typing import Any, Iterator
 from pydantic import BaseModel
 from ..broadcast import DispatcherModel, DispatcherQueue
 from ..utils.decorators import staticclass
@@ -18,6 +21,86 @@ class SocketPublishQueueModel(BaseModel):
     publish_models: list[SocketPublishModel] | SocketPublishModel
 
 
+class SocketPublishBuffer:
+    """Collects socket publishes and merges repeated state updates.
+
+    Each publish is resolved to the payload the socket server would send (the selected data keys plus custom data).
+    Publishes of mergeable events (see :attr:`MERGEABLE_EVENT_SUFFIXES`) sharing (topic, topic_id, event) are merged,
+    later payloads overwriting earlier keys, and keep the position of their first occurrence. Every other publish
+    (e.g. created, deleted or order changes) is kept as is and in order.
+    """
+
+    MERGEABLE_EVENT_SUFFIXES = (":updated", ":details:changed")
+
+    def __init__(self):
+        self.is_closed = False
+        self._lock = Lock()
+        self._publish_models: list[SocketPublishModel] = []
+        self._mergeable_models: dict[tuple[str, str, str], SocketPublishModel] = {}
+
+    @staticmethod
+    def is_mergeable(event: str) -> bool:
+        # Events usually end with the uid of their target, e.g. "board:card:details:changed:{card_uid}"
+        suffixes = SocketPublishBuffer.MERGEABLE_EVENT_SUFFIXES
+        return event.endswith(suffixes) or event.rsplit(":", 1)[0].endswith(suffixes)
+
+    def add(self, data: dict[str, Any], publish_models: list[SocketPublishModel] | SocketPublishModel) -> bool:
+        with self._lock:
+            if self.is_closed:
+                return False
+
+            if not isinstance(publish_models, list):
+                publish_models = [publish_models]
+
+            for publish_model in publish_models:
+                topic = publish_model.topic.value if isinstance(publish_model.topic, Enum) else publish_model.topic
+                key = (topic, publish_model.topic_id, publish_model.event)
+                payload = self._resolve_payload(data, publish_model)
+                is_mergeable = self.is_mergeable(publish_model.event)
+                if is_mergeable and key in self._mergeable_models:
+                    custom_data: dict[str, Any] = self._mergeable_models[key].custom_data  # type: ignore
+                    custom_data.update(payload)
+                    continue
+
+                resolved_model = SocketPublishModel(
+                    topic=publish_model.topic,
+                    topic_id=publish_model.topic_id,
+                    event=publish_model.event,
+                    custom_data=payload,
+                )
+                self._publish_models.append(resolved_model)
+                if is_mergeable:
+                    self._mergeable_models[key] = resolved_model
+            return True
+
+    def flush(self) -> None:
+        """Dispatches the merged publishes as one batch and sends later publishes directly."""
+        with self._lock:
+            self.is_closed = True
+            publish_models = self._publish_models
+            self._publish_models = []
+            self._mergeable_models.clear()
+
+        if publish_models:
+            BaseSocketPublisher.put_dispather({}, publish_models)
+
+    def _resolve_payload(self, data: dict[str, Any], publish_model: SocketPublishModel) -> dict[str, Any]:
+        payload = {}
+        if publish_model.data_keys:
+            data_keys = (
+                publish_model.data_keys if isinstance(publish_model.data_keys, list) else [publish_model.data_keys]
+            )
+            for key in data_keys:
+                if key in data:
+                    payload[key] = data[key]
+        if publish_model.custom_data:
+            payload.update(publish_model.custom_data)
+        return payload
+
+
+_publish_buffer: ContextVar[SocketPublishBuffer | None] = ContextVar("socket_publish_buffer", default=None)
+
+
 @staticclass
 class BaseSocketPublisher:
     @staticmethod
@@ -25,6 +108,38 @@ class BaseSocketPublisher:
         data: dict[str, Any],
         publish_models: list[SocketPublishModel] | SocketPublishModel,
     ):
+        buffer = _publish_buffer.get()
+        if buffer is not None and buffer.add(data, publish_models):
+            return
+
         model = SocketPublishQueueModel(data=data, publish_models=publish_models)
         dispatacher_model = DispatcherModel(event="socket_publish", data=model.model_dump())
         DispatcherQueue.put(dispatacher_model)
+
+    @staticmethod
+    @contextmanager
+    def batch() -> Iterator[SocketPublishBuffer]:
+        """Buffers every publish in the current context and dispatches them as one merged batch on exit.
+
+        Nested calls join the enclosing buffer, so their publishes are dispatched with the outermost batch. Call
+        :meth:`SocketPublishBuffer.flush` to dispatch earlier (e.g. when a streaming response starts); publishes after a
+        flush are dispatched directly, unless they are made in a new nested batch, which gets its own buffer.
+
+        E.g.::
+
+            with BaseSocketPublisher.batch():
+                for card in cards:
+                    CardPublisher.updated(project, card, None, {"title": card.title})
+        """
+        buffer = _publish_buffer.get()
+        if buffer is not None and not buffer.is_closed:
+            yield buffer
+            return
+
+        buffer = SocketPublishBuffer()
+        token = _publish_buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            _publish_buffer.reset(token)
+            buffer.flush()
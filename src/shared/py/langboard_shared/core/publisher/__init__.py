@@ -1,9 +1,10 @@
-from .BaseSocketPublisher import BaseSocketPublisher, SocketPublishModel, SocketPublishQueueModel
+from .BaseSocketPublisher import BaseSocketPublisher, SocketPublishBuffer, SocketPublishModel, SocketPublishQueueModel
 from .NotificationPublisher import NotificationPublisher, NotificationPublishModel
 
 
 __all__ = [
     "BaseSocketPublisher",
+    "SocketPublishBuffer",
     "SocketPublishModel",
     "SocketPublishQueueModel",
     "NotificationPublisher",
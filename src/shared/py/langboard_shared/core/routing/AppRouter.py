@@ -32,9 +32,11 @@ class AppRouter:
     api_routes: TApiRouteMap = {}
     api: APIRouter
     __app: FastAPI
+    __route_paths: dict[str, str]
 
     def __init__(self):
         self.api = APIRouter(route_class=AppExceptionHandlingRoute)
+        self.__route_paths = {}
 
     def schema(
         self,
@@ -126,6 +128,11 @@ class AppRouter:
         self.__app = app
         self.__app.title = Env.PROJECT_NAME.capitalize()
         self.__app.version = Env.PROJECT_VERSION
+        self.__route_paths = {
+            route.name: route.path
+            for route in cast(list[AppExceptionHandlingRoute], app.routes)
+            if getattr(route, "name", None) and getattr(route, "path", None)
+        }
 
     def create_schema_files(self, schema_dir: str | Path):
         schema_dir = Path(schema_dir)
@@ -154,3 +161,10 @@ class AppRouter:
         if not self.__app:
             raise ValueError("AppRouter has not been initialized with a FastAPI instance.")
         return self.__app
+
+    def get_path_by_name(self, name: str) -> str | None:
+        """Gets the path of the route by its name (the name of the endpoint function by default).
+
+        The routes are indexed by :meth:`set_app`.
+        """
+        return self.__route_paths.get(name)
@@ -0,0 +1,126 @@
+from typing import Any
+from starlette.convertors import PathConvertor
+from starlette.routing import BaseRoute, Match, Route, Router, get_route_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+ROUTE_MATCH_SCOPE_KEY = "route_match"
+
+
+class _RouteNode:
+    __slots__ = ("literals", "param", "route_indexes")
+
+    def __init__(self):
+        self.literals: dict[str, _RouteNode] = {}
+        self.param: _RouteNode | None = None
+        self.route_indexes: list[int] = []
+
+
+class RouteMatcher:
+    """Finds the route of a request by walking a path segment tree instead of trying every route.
+
+    The tree only narrows down the candidates, :meth:`starlette.routing.BaseRoute.matches` still decides the match,
+    so the first matching route wins as in :class:`starlette.routing.Router`.
+
+    The match is stored in the scope, so the middlewares and the router sharing the same routes match only once per request.
+    """
+
+    def __init__(self, routes: list[BaseRoute]):
+        self._routes = routes
+        self._root = _RouteNode()
+        self._fallback_indexes: list[int] = []
+        self._indexed_count = -1
+
+    def match(self, scope: Scope) -> tuple[BaseRoute, Scope] | None:
+        """Returns the first route that fully matches the request.
+
+        :param scope: Request scope
+        :return: The route and its child scope, or ``None`` if no route fully matches
+        """
+        route_path = get_route_path(scope)
+        method = scope.get("method")
+        cached = scope.get(ROUTE_MATCH_SCOPE_KEY)
+        if cached is not None and cached[0] is self._routes and cached[1] == method and cached[2] == route_path:
+            return cached[3]
+
+        if self._indexed_count != len(self._routes):
+            self._build()
+
+        result = None
+        for index in self._find_candidate_indexes(route_path):
+            route = self._routes[index]
+            matches, child_scope = route.matches(scope)
+            if matches == Match.FULL:
+                result = route, child_scope
+                break
+
+        scope[ROUTE_MATCH_SCOPE_KEY] = (self._routes, method, route_path, result)
+        return result
+
+    def bind_router(self, router: Router) -> None:
+        """Makes the router handle the request with the route already matched by :meth:`match`.
+
+        Requests without a full match (404, 405, redirects) are still handled by the router itself.
+
+        :param router: Router that owns the same routes
+        """
+        router_app: ASGIApp = router.middleware_stack
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            result = self.match(scope) if scope["type"] == "http" else None
+            if result is None:
+                await router_app(scope, receive, send)
+                return
+
+            route, child_scope = result
+            if "router" not in scope:
+                scope["router"] = router
+            scope.update(child_scope)
+            await route.handle(scope, receive, send)
+
+        router.middleware_stack = app
+
+    def _build(self) -> None:
+        self._root = _RouteNode()
+        self._fallback_indexes = []
+        for index, route in enumerate(self._routes):
+            path_format: Any = getattr(route, "path_format", None)
+            # Mounts and ``{param:path}`` can span several segments, so they are always tried.
+            if (
+                not isinstance(route, Route)
+                or not isinstance(path_format, str)
+                or any(isinstance(convertor, PathConvertor) for convertor in route.param_convertors.values())
+            ):
+                self._fallback_indexes.append(index)
+                continue
+
+            node = self._root
+            for segment in path_format.split("/"):
+                if "{" in segment:
+                    if node.param is None:
+                        node.param = _RouteNode()
+                    node = node.param
+                else:
+                    node = node.literals.setdefault(segment, _RouteNode())
+            node.route_indexes.append(index)
+        self._indexed_count = len(self._routes)
+
+    def _find_candidate_indexes(self, route_path: str) -> list[int]:
+        segments = route_path.split("/")
+        indexes = list(self._fallback_indexes)
+        nodes = [self._root]
+        for segment in segments:
+            next_nodes: list[_RouteNode] = []
+            for node in nodes:
+                literal_node = node.literals.get(segment)
+                if literal_node is not None:
+                    next_nodes.append(literal_node)
+                if node.param is not None and segment:
+                    next_nodes.append(node.param)
+            if not next_nodes:
+                return sorted(indexes)
+            nodes = next_nodes
+
+        for node in nodes:
+            indexes.extend(node.route_indexes)
+        return sorted(indexes)
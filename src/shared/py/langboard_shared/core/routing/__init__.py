@@ -6,6 +6,7 @@ from .AppRouter import AppRouter, TApiRouteMap
 from .BaseMiddleware import BaseMiddleware
 from .Form import BaseFormModel, form_model
 from .JsonResponse import JsonResponse
+from .RouteMatcher import ROUTE_MATCH_SCOPE_KEY, RouteMatcher
 from .SocketTopic import GLOBAL_TOPIC_ID, NONE_TOPIC_ID, SettingSocketTopicID, SocketTopic
 
 
@@ -21,6 +22,8 @@ __all__ = [
     "BaseFormModel",
     "BaseMiddleware",
     "form_model",
+    "RouteMatcher",
+    "ROUTE_MATCH_SCOPE_KEY",
     "JsonResponse",
     "GLOBAL_TOPIC_ID",
     "NONE_TOPIC_ID",
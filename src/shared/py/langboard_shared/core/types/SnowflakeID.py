@@ -1,10 +1,18 @@
+from functools import lru_cache
 from random import getrandbits
 from threading import Lock
 from time import time
-from typing import Any
+from typing import Any, Iterable
 from ..utils.String import BASE62_ALPHABET
 
 
+SHORT_CODE_CACHE_SIZE = 65536
+# Two base62 digits per entry, so encoding needs half the divisions.
+_BASE62_PAIRS = [a + b for a in BASE62_ALPHABET for b in BASE62_ALPHABET]
+_BASE62_PAIR_BASE = len(_BASE62_PAIRS)
+_BASE62_INDEXES = {c: i for i, c in enumerate(BASE62_ALPHABET)}
+
+
 class SnowflakeID(int):
     FIXED_SHORT_CODE_LENGTH = 11
     EPOCH = 1704067200000  # 2024-01-01 00:00:00 UTC
@@ -43,9 +51,38 @@ class SnowflakeID(int):
     def from_short_code(short_code: str) -> "SnowflakeID":
         if not short_code or len(short_code) != SnowflakeID.FIXED_SHORT_CODE_LENGTH:
             return SnowflakeID(0)
-        decoded_int = SnowflakeID.__base62_decode(short_code)
-        original_value = SnowflakeID.__feistel_unshuffle(decoded_int)
-        return SnowflakeID(original_value)
+        return SnowflakeID(_decode_short_code(short_code))
+
+    @staticmethod
+    def from_short_codes(short_codes: Iterable[str]) -> list["SnowflakeID"]:
+        """Decodes the short codes like :meth:`from_short_code`, decoding each distinct short code once.
+
+        :param short_codes: Short codes to decode
+        """
+        decoded: dict[str, SnowflakeID] = {}
+        ids = []
+        for short_code in short_codes:
+            snowflake_id = decoded.get(short_code)
+            if snowflake_id is None:
+                snowflake_id = decoded[short_code] = SnowflakeID.from_short_code(short_code)
+            ids.append(snowflake_id)
+        return ids
+
+    @staticmethod
+    def to_short_codes(ids: Iterable[int]) -> list[str]:
+        """Encodes the IDs like :meth:`to_short_code`, encoding each distinct ID once.
+
+        :param ids: IDs to encode
+        """
+        encoded: dict[int, str] = {}
+        short_codes = []
+        for snowflake_id in ids:
+            snowflake_id = int(snowflake_id)
+            short_code = encoded.get(snowflake_id)
+            if short_code is None:
+                short_code = encoded[snowflake_id] = _encode_short_code(snowflake_id)
+            short_codes.append(short_code)
+        return short_codes
 
     @classmethod
     def _current_millis(cls):
@@ -86,39 +123,7 @@ class SnowflakeID(int):
         return f"SnowflakeID({int(self)})"
 
     def to_short_code(self) -> str:
-        mixed_value = SnowflakeID.__feistel_shuffle(int(self))
-        return SnowflakeID.__base62_encode(mixed_value)
-
-    @staticmethod
-    def __base62_encode(n: int) -> str:
-        s = []
-        while n > 0:
-            n, r = divmod(n, 62)
-            s.append(BASE62_ALPHABET[r])
-        return "".join(reversed(s)).rjust(SnowflakeID.FIXED_SHORT_CODE_LENGTH, BASE62_ALPHABET[0])
-
-    @staticmethod
-    def __base62_decode(s: str) -> int:
-        n = 0
-        for c in s:
-            n = n * 62 + BASE62_ALPHABET.index(c)
-        return n
-
-    @staticmethod
-    def __feistel_shuffle(x: int, rounds: int = 4) -> int:
-        left = x >> 32
-        right = x & 0xFFFFFFFF
-        for i in range(rounds):
-            left, right = right, left ^ ((right * SnowflakeID.EPOCH + i) & 0xFFFFFFFF)
-        return (left << 32) | right
-
-    @staticmethod
-    def __feistel_unshuffle(x: int, rounds: int = 4) -> int:
-        left = x >> 32
-        right = x & 0xFFFFFFFF
-        for i in reversed(range(rounds)):
-            left, right = right ^ ((left * SnowflakeID.EPOCH + i) & 0xFFFFFFFF), left
-        return (left << 32) | right
+        return _encode_short_code(int(self))
 
     @staticmethod
     def __get_machine_id() -> int:
@@ -133,3 +138,48 @@ class SnowflakeID(int):
         digest = sha256(raw.encode()).digest()
         int_val = int.from_bytes(digest, "little")
         return int_val % modulo
+
+
+def _base62_encode(n: int) -> str:
+    s = []
+    while n > 0:
+        n, r = divmod(n, _BASE62_PAIR_BASE)
+        s.append(_BASE62_PAIRS[r])
+    encoded = "".join(reversed(s)).lstrip(BASE62_ALPHABET[0])
+    return encoded.rjust(SnowflakeID.FIXED_SHORT_CODE_LENGTH, BASE62_ALPHABET[0])
+
+
+def _base62_decode(s: str) -> int:
+    n = 0
+    try:
+        for c in s:
+            n = n * 62 + _BASE62_INDEXES[c]
+    except KeyError:
+        raise ValueError(f"Invalid base62 character in '{s}'") from None
+    return n
+
+
+def _feistel_shuffle(x: int, rounds: int = 4) -> int:
+    left = x >> 32
+    right = x & 0xFFFFFFFF
+    for i in range(rounds):
+        left, right = right, left ^ ((right * SnowflakeID.EPOCH + i) & 0xFFFFFFFF)
+    return (left << 32) | right
+
+
+def _feistel_unshuffle(x: int, rounds: int = 4) -> int:
+    left = x >> 32
+    right = x & 0xFFFFFFFF
+    for i in reversed(range(rounds)):
+        left, right = right ^ ((left * SnowflakeID.EPOCH + i) & 0xFFFFFFFF), left
+    return (left << 32) | right
+
+
+@lru_cache(maxsize=SHORT_CODE_CACHE_SIZE)
+def _encode_short_code(value: int) -> str:
+    return _base62_encode(_feistel_shuffle(value))
+
+
+@lru_cache(maxsize=SHORT_CODE_CACHE_SIZE)
+def _decode_short_code(short_code: str) -> int:
+    return _feistel_unshuffle(_base62_decode(short_code))
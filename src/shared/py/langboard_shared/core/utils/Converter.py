@@ -37,3 +37,17 @@ def convert_python_data(data: Any, recursive: bool = False) -> Any:
     elif isinstance(data, dict):
         return {key: convert_python_data(value, recursive=True) for key, value in data.items()}
     return data
+
+
+def convert_to_compact_records(records: list[dict[str, Any]]) -> dict[str, list]:
+    """Converts records sharing the same keys into a key list and value rows, so the keys are sent only once.
+
+    E.g. `[{"uid": "a", "name": "A"}]` becomes `{"keys": ["uid", "name"], "rows": [["a", "A"]]}`.
+
+    :param records: Records to convert; missing keys become `None`
+    """
+    if not records:
+        return {"keys": [], "rows": []}
+
+    keys = list(records[0])
+    return {"keys": keys, "rows": [[record.get(key) for key in keys] for record in records]}
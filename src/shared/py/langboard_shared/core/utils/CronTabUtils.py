@@ -1,12 +1,8 @@
-from os import environ
-from pathlib import Path
-from subprocess import run as subprocess_run
+from datetime import timedelta
 from typing import Callable
 from zoneinfo import ZoneInfo
 import crontab
-from crontab import SPECIALS, CronItem, CronTab, OrderedVariableList
-from psutil import process_iter
-from ...Env import Env
+from crontab import SPECIALS, CronItem, CronSlice
 from ..types import SafeDateTime
 
 
@@ -14,23 +10,6 @@ crontab.SPECIALS_CONVERSION = False
 
 
 class CronTabUtils:
-    def __init__(self, file_path: str | Path | None = None):
-        self.file_path = Path(file_path) if file_path else Env.CRON_TAB_FILE
-
-    def reload_cron(self):
-        if Env.ENVIRONMENT == "development":
-            return
-        try:
-            for process in process_iter(["pid", "name"]):
-                if process.name() != "cron":
-                    continue
-                process.kill()
-            subprocess_run(["crontab", "-r"])
-            subprocess_run(["crontab", str(self.file_path)])
-            subprocess_run(["cron"])
-        except Exception:
-            pass
-
     def convert_valid_interval_str(self, interval_str: str) -> str:
         """Convert a string to a valid cron interval string.
 
@@ -47,46 +26,61 @@ class CronTabUtils:
         except Exception:
             return ""
 
-    def get_cron(self):
-        if not self.file_path.exists():
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            self.file_path.touch()
-        cron = CronTab(user=False, tabfile=str(self.file_path))
-        if Env.ENVIRONMENT != "development":
-            if cron.env is None:
-                cron.env = OrderedVariableList()
-            cron.env.update(environ)
-
-        if Env.ENVIRONMENT == "development":
-            cron.env = OrderedVariableList()
-
-        return cron
-
-    def create_job(self, cron: CronTab, interval_str: str, command: str, filterable_comment: str) -> bool:
-        has_job = False
-        for job in cron.find_comment(filterable_comment):
-            has_job = True
-            break
-
-        if has_job:
-            return False
-
-        job = cron.new(
-            command=command,
-            comment=filterable_comment,
-            user="/bin/bash",
-        )
-        job.setall(interval_str)
-        return True
-
-    def remove_job(self, cron: CronTab, filterable_comment: str):
-        cron.remove_all(comment=filterable_comment)
-
-    def save_cron(self, cron: CronTab):
-        if Env.ENVIRONMENT == "development":
-            return
-        cron.write()
-        self.reload_cron()
+    def get_next_run_at(self, interval_str: str, after: SafeDateTime) -> SafeDateTime | None:
+        """Get the first minute after the given time that matches the cron interval string.
+
+        If the string is not valid or never matches (e.g. ``@reboot``), return None.
+        """
+        try:
+            job = CronItem()
+            job.setall(interval_str)
+            if job.slices.special == "@reboot":
+                return None
+            minute_slice, hour_slice, day_slice, month_slice, weekday_slice = job.slices
+        except Exception:
+            return None
+
+        minutes = self.__get_slice_values(minute_slice)
+        hours = self.__get_slice_values(hour_slice)
+        days = set(self.__get_slice_values(day_slice))
+        months = set(self.__get_slice_values(month_slice))
+        weekdays = set(self.__get_slice_values(weekday_slice))
+        is_any_day = str(day_slice) == "*"
+        is_any_weekday = str(weekday_slice) == "*"
+
+        current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Four years, so Feb 29 schedules are found as well.
+        limit = current + timedelta(days=366 * 4)
+        while current < limit:
+            if current.month not in months:
+                current = (current.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+
+            is_day_matched = current.day in days
+            # Cron counts weekdays from Sunday.
+            is_weekday_matched = (current.weekday() + 1) % 7 in weekdays
+            if is_any_day or is_any_weekday:
+                is_matched = is_day_matched and is_weekday_matched
+            else:
+                is_matched = is_day_matched or is_weekday_matched
+            if not is_matched:
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            hour = next((hour for hour in hours if hour >= current.hour), None)
+            if hour is None:
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if hour != current.hour:
+                current = current.replace(hour=hour, minute=0)
+
+            minute = next((minute for minute in minutes if minute >= current.minute), None)
+            if minute is None:
+                current = current.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return current.replace(minute=minute)
+        return None
 
     def adjust_interval_for_utc(self, interval_str: str, tz: str | float) -> str:
         if isinstance(tz, str):
@@ -163,6 +157,18 @@ class CronTabUtils:
                 new_chunks.append(str(new_value))
         return ",".join(new_chunks)
 
+    def __get_slice_values(self, cron_slice: CronSlice) -> list[int]:
+        if not cron_slice.parts:
+            return list(range(cron_slice.min, cron_slice.max + 1))
+
+        values: set[int] = set()
+        for part in cron_slice.parts:
+            if hasattr(part, "range"):
+                values.update(int(value) for value in part.range())
+            else:
+                values.add(int(part))
+        return sorted(values)
+
     def __ensure_valid_minute(self, minute: int) -> int:
         return ((minute % 60) + 60) % 60
 
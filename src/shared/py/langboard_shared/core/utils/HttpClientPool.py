@@ -0,0 +1,58 @@
+from asyncio import AbstractEventLoop, get_running_loop, new_event_loop, run_coroutine_threadsafe, wrap_future
+from os import getpid
+from threading import Lock, Thread
+from typing import Any, Callable, Coroutine, TypeVar
+from httpx import AsyncClient, Limits, Timeout
+
+
+_TReturn = TypeVar("_TReturn")
+
+
+class HttpClientPool:
+    """Keeps one :class:`httpx.AsyncClient` per process on a background event loop.
+
+    Async tasks run on short-lived event loops (see :meth:`Broker.wrap_async_task_decorator`), so a client created in a
+    task could not keep its connections between tasks. The requests are run on the pool's own loop instead, which lives
+    as long as the process.
+
+    E.g.::
+
+        pool = HttpClientPool(max_connections=20, timeout=10)
+        response = await pool.run(lambda client: client.post(url, json=data))
+    """
+
+    def __init__(self, max_connections: int, timeout: float):
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._lock = Lock()
+        self._pid: int | None = None
+        self._loop: AbstractEventLoop | None = None
+        self._client: AsyncClient | None = None
+
+    async def run(self, func: Callable[[AsyncClient], Coroutine[Any, Any, _TReturn]]) -> _TReturn:
+        """Runs the coroutine created by the function on the pool's loop and waits for it.
+
+        :param func: Function creating the coroutine with the shared client
+        """
+        loop, client = self._get_loop_and_client()
+        if get_running_loop() is loop:
+            return await func(client)
+        return await wrap_future(run_coroutine_threadsafe(func(client), loop))
+
+    def _get_loop_and_client(self) -> tuple[AbstractEventLoop, AsyncClient]:
+        pid = getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    # A forked worker cannot use the loop thread of its parent, so it starts its own.
+                    loop = new_event_loop()
+                    Thread(target=loop.run_forever, daemon=True).start()
+                    self._client = AsyncClient(
+                        limits=Limits(
+                            max_connections=self._max_connections, max_keepalive_connections=self._max_connections
+                        ),
+                        timeout=Timeout(self._timeout),
+                    )
+                    self._loop = loop
+                    self._pid = pid
+        return self._loop, self._client  # type: ignore
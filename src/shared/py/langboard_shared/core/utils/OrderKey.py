@@ -0,0 +1,87 @@
+from string import ascii_lowercase, digits
+from .decorators import staticclass
+
+
+# Digits and lowercase letters sort the same way under binary and locale-aware collations.
+ORDER_KEY_DIGITS = f"{digits}{ascii_lowercase}"
+_ORDER_KEY_BASE = len(ORDER_KEY_DIGITS)
+_ORDER_KEY_INDEXES = {digit: index for index, digit in enumerate(ORDER_KEY_DIGITS)}
+
+
+@staticclass
+class OrderKey:
+    """Generates fractional order keys that sort as strings.
+
+    A key is the fraction digits of a number between 0 and 1 (e.g. `"i"` is 0.5), and it never ends with the zero
+    digit, so there is always another key between two keys. Moving a row only needs a new key between its new
+    neighbors, so the other rows are never renumbered.
+    """
+
+    @staticmethod
+    def between(before: str | None, after: str | None) -> str:
+        """Generates a key between the given keys.
+
+        :param before: Key of the previous row (`None` if it is the first row)
+        :param after: Key of the next row (`None` if it is the last row)
+        """
+        if before is not None and after is not None and before >= after:
+            raise ValueError(f"Order key {before!r} must be less than {after!r}")
+
+        if after == "":
+            raise ValueError("Order key must not be empty")
+
+        if before and after is None:
+            # Rows are usually appended, so step the first digit that can grow instead of halving the rest of the
+            # space; halving would add a digit every few appends.
+            for index, digit in enumerate(before):
+                if digit != ORDER_KEY_DIGITS[-1]:
+                    return f"{before[:index]}{ORDER_KEY_DIGITS[_ORDER_KEY_INDEXES[digit] + 1]}"
+
+        return OrderKey._midpoint(before or "", after)
+
+    @staticmethod
+    def spread(count: int) -> list[str]:
+        """Generates evenly spaced keys of the same length, e.g. to rebalance or migrate rows.
+
+        :param count: Number of keys
+        """
+        if count <= 0:
+            return []
+
+        length = 1
+        while _ORDER_KEY_BASE**length <= count:
+            length += 1
+
+        space = _ORDER_KEY_BASE**length
+        keys = []
+        for index in range(count):
+            value = (index + 1) * space // (count + 1)
+            key = []
+            for _ in range(length):
+                value, digit = divmod(value, _ORDER_KEY_BASE)
+                key.append(ORDER_KEY_DIGITS[digit])
+            keys.append("".join(reversed(key)).rstrip(ORDER_KEY_DIGITS[0]))
+        return keys
+
+    @staticmethod
+    def _midpoint(before: str, after: str | None) -> str:
+        if after is not None:
+            # Keep the shared prefix and find the midpoint of the remaining digits.
+            index = 0
+            while (
+                index < len(after) and (before[index] if index < len(before) else ORDER_KEY_DIGITS[0]) == after[index]
+            ):
+                index += 1
+            if index > 0:
+                return f"{after[:index]}{OrderKey._midpoint(before[index:], after[index:])}"
+
+        before_digit = _ORDER_KEY_INDEXES[before[0]] if before else 0
+        after_digit = _ORDER_KEY_INDEXES[after[0]] if after is not None else _ORDER_KEY_BASE
+        if after_digit - before_digit > 1:
+            return ORDER_KEY_DIGITS[(before_digit + after_digit + 1) // 2]
+
+        # The first digits are adjacent, so the key is the shorter one of the next key's first digit (if it has more
+        # digits) or the previous key's first digit followed by any key after the rest of the previous key.
+        if after is not None and len(after) > 1:
+            return after[0]
+        return f"{ORDER_KEY_DIGITS[before_digit]}{OrderKey._midpoint(before[1:], None)}"
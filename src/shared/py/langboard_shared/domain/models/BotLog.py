@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Any
 from pydantic import BaseModel
-from ...core.db import ApiField, BaseSqlModel, EnumLikeType, Field, ModelColumnListType, SnowflakeIDField
+from ...core.db import ApiField, BaseSqlModel, EnumLikeType, Field, SnowflakeIDField
 from ...core.types import SafeDateTime, SnowflakeID
 from .Bot import Bot
 
@@ -27,9 +27,21 @@ class BotLog(BaseSqlModel, table=True):
     log_type: BotLogType = Field(
         default=BotLogType.Info, nullable=False, sa_type=EnumLikeType(BotLogType), api_field=ApiField()
     )
-    message_stack: list[BotLogMessage] = Field(
-        default=[], nullable=False, sa_type=ModelColumnListType(BotLogMessage), api_field=ApiField()
-    )
+
+    @classmethod
+    def api_schema(cls, schema: dict | None = None, **kwargs) -> dict[str, Any]:
+        """Messages are stored as :class:`BotLogStack` rows, so responses only add the latest one and the count.
+
+        The whole stack is served by the log's ``stacks`` endpoint.
+        """
+        return super().api_schema(
+            {
+                "latest_message": BotLogMessage.api_schema(),
+                "message_count": "integer",
+                **(schema or {}),
+            },
+            **kwargs,
+        )
 
     def notification_data(self) -> dict[str, Any]:
         return {}
@@ -0,0 +1,28 @@
+from typing import Any
+from sqlalchemy import TEXT, Index
+from ...core.db import ApiField, BaseSqlModel, DateTimeField, EnumLikeType, Field, SnowflakeIDField
+from ...core.types import SafeDateTime, SnowflakeID
+from .BotLog import BotLog, BotLogMessage, BotLogType
+
+
+class BotLogStack(BaseSqlModel, table=True):
+    """A message of a :class:`BotLog`.
+
+    Messages are only appended, so adding one never rewrites the messages before it.
+    """
+
+    __table_args__ = (Index("ix_bot_log_stack_bot_log_id_log_date", "bot_log_id", "log_date"),)
+
+    bot_log_id: SnowflakeID = SnowflakeIDField(foreign_key=BotLog, nullable=False)
+    message: str = Field(nullable=False, sa_type=TEXT, api_field=ApiField())
+    log_type: BotLogType = Field(nullable=False, sa_type=EnumLikeType(BotLogType), api_field=ApiField())
+    log_date: SafeDateTime = DateTimeField(default=SafeDateTime.now, nullable=False, api_field=ApiField())
+
+    def to_message(self) -> BotLogMessage:
+        return BotLogMessage(message=self.message, log_type=self.log_type, log_date=self.log_date)
+
+    def notification_data(self) -> dict[str, Any]:
+        return {}
+
+    def _get_repr_keys(self) -> list[str | tuple[str, str]]:
+        return ["bot_log_id", "log_type"]
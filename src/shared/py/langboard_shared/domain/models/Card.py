@@ -1,5 +1,5 @@
 from typing import Any
-from sqlalchemy import TEXT
+from sqlalchemy import TEXT, Index
 from ...core.db import (
     ApiField,
     DateTimeField,
@@ -15,6 +15,8 @@ from .ProjectColumn import ProjectColumn
 
 
 class Card(SoftDeleteModel, table=True):
+    __table_args__ = (Index("ix_card_project_column_id_order_key", "project_column_id", "order_key"),)
+
     project_id: SnowflakeID = SnowflakeIDField(
         foreign_key=Project, nullable=False, index=True, api_field=ApiField(name="project_uid")
     )
@@ -28,6 +30,7 @@ class Card(SoftDeleteModel, table=True):
     ai_description: str | None = Field(default=None, sa_type=TEXT, api_field=ApiField())
     deadline_at: SafeDateTime | None = DateTimeField(default=None, nullable=True, api_field=ApiField())
     order: int = Field(default=0, nullable=False, api_field=ApiField())
+    order_key: str | None = Field(default=None, nullable=True)
     archived_at: SafeDateTime | None = DateTimeField(default=None, nullable=True, api_field=ApiField())
 
     def board_api_response(
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Any
+from sqlalchemy import Index
 from ...core.db import ApiField, Field, SnowflakeIDField, SoftDeleteModel
 from ...core.types import SnowflakeID
 from .Card import Card
@@ -14,6 +15,8 @@ class CheckitemStatus(Enum):
 
 
 class Checkitem(SoftDeleteModel, table=True):
+    __table_args__ = (Index("ix_checkitem_checklist_id_order_key", "checklist_id", "order_key"),)
+
     checklist_id: SnowflakeID = SnowflakeIDField(
         foreign_key=Checklist, nullable=False, index=True, api_field=ApiField(name="checklist_uid")
     )
@@ -22,6 +25,7 @@ class Checkitem(SoftDeleteModel, table=True):
     title: str = Field(nullable=False, api_field=ApiField())
     status: CheckitemStatus = Field(default=CheckitemStatus.Stopped, nullable=False, api_field=ApiField())
     order: int = Field(default=0, nullable=False, api_field=ApiField())
+    order_key: str | None = Field(default=None, nullable=True)
     accumulated_seconds: int = Field(default=0, nullable=False, api_field=ApiField())
     is_checked: bool = Field(default=False, nullable=False, api_field=ApiField())
 
@@ -1,15 +1,19 @@
 from typing import Any
+from sqlalchemy import Index
 from ...core.db import ApiField, Field, SnowflakeIDField, SoftDeleteModel
 from ...core.types import SnowflakeID
 from .Card import Card
 
 
 class Checklist(SoftDeleteModel, table=True):
+    __table_args__ = (Index("ix_checklist_card_id_order_key", "card_id", "order_key"),)
+
     card_id: SnowflakeID = SnowflakeIDField(
         foreign_key=Card, nullable=False, index=True, api_field=ApiField(name="card_uid")
     )
     title: str = Field(nullable=False, api_field=ApiField())
     order: int = Field(default=0, nullable=False, api_field=ApiField())
+    order_key: str | None = Field(default=None, nullable=True)
     is_checked: bool = Field(default=False, nullable=False, api_field=ApiField())
 
     def notification_data(self) -> dict[str, Any]:
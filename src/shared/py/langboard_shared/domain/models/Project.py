@@ -14,6 +14,7 @@ class Project(SoftDeleteModel, table=True):
     ai_description: str | None = Field(default=None, sa_type=TEXT, api_field=ApiField())
     project_type: str = Field(default="Other", nullable=False, api_field=ApiField())
     archive_visible_days: int = Field(default=3, nullable=False, api_field=ApiField())
+    change_seq: int = Field(default=0, nullable=False)
 
     def notification_data(self) -> dict[str, Any]:
         return {
@@ -0,0 +1,37 @@
+from enum import Enum
+from typing import Any
+from sqlalchemy import Index, UniqueConstraint
+from ...core.db import BaseSqlModel, EnumLikeType, Field, SnowflakeIDField
+from ...core.types import SnowflakeID
+from .Project import Project
+
+
+class ProjectChangeTarget(Enum):
+    Board = "board"
+    Card = "card"
+    ProjectColumn = "project_column"
+    ProjectLabel = "project_label"
+
+
+class ProjectChange(BaseSqlModel, table=True):
+    """The last change of a board row, stamped with the change sequence of its project.
+
+    There is one row per changed target, so the table grows with the board rows instead of the events.
+    """
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "target", "target_id", name="uq_project_change_project_target"),
+        Index("ix_project_change_project_id_seq", "project_id", "seq"),
+    )
+
+    project_id: SnowflakeID = SnowflakeIDField(foreign_key=Project, nullable=False)
+    target: ProjectChangeTarget = Field(nullable=False, sa_type=EnumLikeType(ProjectChangeTarget))
+    target_id: SnowflakeID = SnowflakeIDField(nullable=False)
+    seq: int = Field(nullable=False)
+    is_deleted: bool = Field(default=False, nullable=False)
+
+    def notification_data(self) -> dict[str, Any]:
+        return {}
+
+    def _get_repr_keys(self) -> list[str | tuple[str, str]]:
+        return ["project_id", "target", "target_id", "seq", "is_deleted"]
@@ -1,16 +1,20 @@
 from typing import Any, ClassVar
+from sqlalchemy import Index
 from ...core.db import ApiField, Field, SnowflakeIDField, SoftDeleteModel
 from ...core.types import SnowflakeID
 from .Project import Project
 
 
 class ProjectColumn(SoftDeleteModel, table=True):
+    __table_args__ = (Index("ix_project_column_project_id_order_key", "project_id", "order_key"),)
+
     DEFAULT_ARCHIVE_COLUMN_NAME: ClassVar[str] = "Archive"
     project_id: SnowflakeID = SnowflakeIDField(
         foreign_key=Project, nullable=False, index=True, api_field=ApiField(name="project_uid")
     )
     name: str = Field(nullable=False, api_field=ApiField())
     order: int = Field(default=0, nullable=False, api_field=ApiField())
+    order_key: str | None = Field(default=None, nullable=True)
     is_archive: bool = Field(default=False, nullable=False, api_field=ApiField())
 
     def notification_data(self) -> dict[str, Any]:
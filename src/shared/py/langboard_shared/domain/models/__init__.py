@@ -4,6 +4,7 @@ from .ApiKeyUsage import ApiKeyUsage
 from .Bot import Bot
 from .BotDefaultScopeBranch import BotDefaultScopeBranch
 from .BotLog import BotLog
+from .BotLogStack import BotLogStack
 from .BotSchedule import BotSchedule
 from .Card import Card
 from .CardAssignedProjectLabel import CardAssignedProjectLabel
@@ -36,6 +37,7 @@ from .ProjectBotDefaultScope import ProjectBotDefaultScope
 from .ProjectBotLog import ProjectBotLog
 from .ProjectBotSchedule import ProjectBotSchedule
 from .ProjectBotScope import ProjectBotScope
+from .ProjectChange import ProjectChange, ProjectChangeTarget
 from .ProjectChatSession import ProjectChatSession
 from .ProjectColumn import ProjectColumn
 from .ProjectColumnBotDefaultScope import ProjectColumnBotDefaultScope
@@ -73,6 +75,7 @@ __all__ = [
     "Bot",
     "BotDefaultScopeBranch",
     "BotLog",
+    "BotLogStack",
     "CardBotDefaultScope",
     "ProjectBotDefaultScope",
     "ProjectColumnBotDefaultScope",
@@ -106,6 +109,8 @@ __all__ = [
     "ProjectBotLog",
     "ProjectBotSchedule",
     "ProjectBotScope",
+    "ProjectChange",
+    "ProjectChangeTarget",
     "ProjectChatSession",
     "ProjectColumn",
     "ProjectColumnBotLog",
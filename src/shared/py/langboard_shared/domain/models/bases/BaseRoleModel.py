@@ -26,19 +26,29 @@ class BaseRoleModel(BaseSqlModel):
         return [field for field in cls.model_fields if field not in BaseRoleModel.model_fields]
 
     def is_all_granted(self) -> bool:
-        if ALL_GRANTED in self.actions or self.actions == [action.value for action in self.get_all_actions()]:
+        return self.is_all_granted_actions(self.actions)
+
+    def is_granted(self, actions: Enum | str | list[Enum | str] | list[Enum] | list[str]):
+        return self.is_granted_actions(self.actions, actions)
+
+    @classmethod
+    def is_all_granted_actions(cls, granted_actions: list[str]) -> bool:
+        if ALL_GRANTED in granted_actions or granted_actions == [action.value for action in cls.get_all_actions()]:
             return True
         return False
 
-    def is_granted(self, actions: Enum | str | list[Enum | str] | list[Enum] | list[str]):
-        if self.is_all_granted():
+    @classmethod
+    def is_granted_actions(
+        cls, granted_actions: list[str], actions: Enum | str | list[Enum | str] | list[Enum] | list[str]
+    ) -> bool:
+        if cls.is_all_granted_actions(granted_actions):
             return True
         if not isinstance(actions, list):
             actions = [actions]
         actions = [action.value if isinstance(action, Enum) else action for action in actions]
 
         for action in actions:
-            if action not in self.actions:
+            if action not in granted_actions:
                 return False
         return True
 
@@ -5,6 +5,7 @@ from ....core.types.ParamTypes import TGlobalCardRelationshipTypeParam
 from ....core.utils.Converter import convert_python_data
 from ....helpers import InfraHelper
 from ....publishers import AppSettingPublisher
+from ....tasks.webhooks.utils import WebhookDispatcher
 from ...models import GlobalCardRelationshipType, WebhookSetting
 
 
@@ -119,6 +120,7 @@ class AppSettingService(BaseDomainService):
         )
 
         self.repo.webhook_setting.insert(webhook_setting)
+        WebhookDispatcher.reset_settings()
 
         AppSettingPublisher.webhook_setting_created(webhook_setting)
 
@@ -142,6 +144,7 @@ class AppSettingService(BaseDomainService):
             return True
 
         self.repo.webhook_setting.update(setting)
+        WebhookDispatcher.reset_settings()
 
         AppSettingPublisher.webhook_setting_updated(setting.get_uid(), model)
 
@@ -153,6 +156,7 @@ class AppSettingService(BaseDomainService):
             return False
 
         self.repo.webhook_setting.delete(setting)
+        WebhookDispatcher.reset_settings()
 
         AppSettingPublisher.webhook_setting_deleted(setting.get_uid())
 
@@ -160,6 +164,7 @@ class AppSettingService(BaseDomainService):
 
     def delete_selected_webhook_settings(self, webhook_setting_uids: Sequence[str]) -> bool:
         self.repo.webhook_setting.delete(webhook_setting_uids)
+        WebhookDispatcher.reset_settings()
 
         if isinstance(webhook_setting_uids, str):
             webhook_setting_uids = [webhook_setting_uids]
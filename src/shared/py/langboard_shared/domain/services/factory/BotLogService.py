@@ -2,6 +2,7 @@ from typing import Any, TypeVar
 from ....core.db import BaseSqlModel
 from ....core.domain import BaseDomainService
 from ....core.schema import TimeBasedPagination
+from ....core.types.ParamTypes import TBaseParam
 from ...models import Bot
 from ...models.bases import BaseBotLogModel
 
@@ -29,9 +30,32 @@ class BotLogService(BaseDomainService):
             pagination,
         )
 
+        latest_by_log = self.repo.bot_log.get_latest_stacks_by_logs([log for _, log in logs])
+
         api_logs = []
         for log_model, log in logs:
-            api_log = {**log.api_response(), **log_model.api_response()}
+            latest_stack, message_count = latest_by_log[log.id]
+            api_log = {
+                **log.api_response(),
+                **log_model.api_response(),
+                "latest_message": latest_stack.to_message().model_dump() if latest_stack else None,
+                "message_count": message_count,
+            }
             api_logs.append(api_log)
 
         return api_logs
+
+    def get_api_stack_list_by_scope(
+        self,
+        log_model_class: type[_TBotLogModel],
+        bot: Bot,
+        scope_model: BaseSqlModel,
+        bot_log: TBaseParam,
+        pagination: TimeBasedPagination | None = None,
+    ) -> list[dict[str, Any]] | None:
+        log = self.repo.bot_log.get_by_scope(log_model_class, bot, scope_model, bot_log)
+        if not log:
+            return None
+
+        stacks = self.repo.bot_log.get_stacks(log, pagination)
+        return [stack.to_message().model_dump() for stack in stacks]
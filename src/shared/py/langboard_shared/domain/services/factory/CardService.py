@@ -1,12 +1,12 @@
 from typing import Any, Literal, Sequence, cast, overload
 from ....ai import BotScheduleHelper, BotScopeHelper
-from ....core.db import EditorContentModel
+from ....core.db import BaseSqlModel, EditorContentModel
 from ....core.domain import BaseDomainService
 from ....core.domain.BaseDomainService import TMutableValidatorMap
 from ....core.schema import TimeBasedPagination
 from ....core.types import SafeDateTime, SnowflakeID
 from ....core.types.ParamTypes import TCardParam, TColumnParam, TProjectLabelParam, TProjectParam, TUserOrBot
-from ....core.utils.Converter import convert_python_data
+from ....core.utils.Converter import convert_python_data, convert_to_compact_records
 from ....helpers import InfraHelper
 from ....publishers import CardPublisher
 from ....tasks.activities import CardActivityTask
@@ -19,6 +19,7 @@ from ...models import (
     CardBotScope,
     Checkitem,
     Project,
+    ProjectChangeTarget,
     ProjectColumn,
     User,
 )
@@ -30,6 +31,10 @@ from .ProjectLabelService import ProjectLabelService
 from .ProjectService import ProjectService
 
 
+# Beyond this, sending the whole board is about as small as sending the changes.
+MAX_BOARD_CHANGES = 500
+
+
 class CardService(BaseDomainService):
     @staticmethod
     def name() -> str:
@@ -80,25 +85,27 @@ class CardService(BaseDomainService):
             members[card_assigned_user.card_id].append(user.get_uid())
 
         raw_relationships = self.repo.card_relationship.get_all_by_project(project)
+        api_relationships = BaseSqlModel.api_response_many(relationship for relationship, _ in raw_relationships)
         relationships: dict[int, list[dict[str, Any]]] = {}
-        for relationship, _ in raw_relationships:
+        for (relationship, _), api_relationship in zip(raw_relationships, api_relationships):
             if relationship.card_id_parent not in relationships:
                 relationships[relationship.card_id_parent] = []
             if relationship.card_id_child not in relationships:
                 relationships[relationship.card_id_child] = []
-            relationships[relationship.card_id_parent].append(relationship.api_response())
-            relationships[relationship.card_id_child].append(relationship.api_response())
+            relationships[relationship.card_id_parent].append(api_relationship)
+            relationships[relationship.card_id_child].append({**api_relationship})
 
         raw_labels = self.repo.project_label.get_all_card_labels_by_project(project)
+        api_labels = BaseSqlModel.api_response_many(label for label, _ in raw_labels)
         labels: dict[int, list[dict[str, Any]]] = {}
-        for label, card_label in raw_labels:
+        for (_, card_label), api_label in zip(raw_labels, api_labels):
             if card_label.card_id not in labels:
                 labels[card_label.card_id] = []
-            labels[card_label.card_id].append(label.api_response())
+            labels[card_label.card_id].append(api_label)
 
+        api_cards = BaseSqlModel.api_response_many(card for card, _ in raw_cards)
         cards = []
-        for card, count_comment in raw_cards:
-            api_card = card.api_response()
+        for (card, count_comment), api_card in zip(raw_cards, api_cards):
             api_card["count_comment"] = count_comment
             api_card["member_uids"] = members.get(card.id, [])
             api_card["relationships"] = relationships.get(card.id, [])
@@ -107,6 +114,148 @@ class CardService(BaseDomainService):
 
         return cards
 
+    def get_board_snapshot(self, project: TProjectParam | None, compact: bool = False) -> dict[str, Any] | None:
+        """Gets the whole board (columns, labels, and cards with their members, labels, relationships, and comment
+        counts) in one call.
+
+        The cards are aggregated by :meth:`CardRepository.get_board_snapshot` and the relationships are read by a
+        second query.
+
+        With `compact`, each list is sent as `{"keys": [...], "rows": [[...]]}` (see
+        :func:`convert_to_compact_records`), the card labels are sent as label UIDs, and the relationships are sent
+        once at the top level instead of under both cards.
+
+        The change sequence of the board is sent as `seq` to get the later changes by :meth:`get_board_changes`.
+
+        :param project: Project to get
+        :param compact: Whether to use the compact format
+        """
+        project = InfraHelper.get_by_id_like(Project, project)
+        if not project:
+            return None
+
+        return {"seq": project.change_seq, **self._get_board(project, compact)}
+
+    def get_board_changes(
+        self, project: TProjectParam | None, since: int, compact: bool = False
+    ) -> dict[str, Any] | None:
+        """Gets the board rows changed after the change sequence `since` (see :class:`ProjectChange`).
+
+        The changed columns, labels, and cards are sent in the format of :meth:`get_board_snapshot`, and the deleted
+        ones are sent as UIDs. The relationships of a changed card replace every relationship of the card. The UIDs of
+        all columns and labels, and the card UIDs of the columns whose cards changed, are sent in order, so the
+        orders of the unchanged rows can be fixed.
+
+        If there are too many changes, the whole board must be reloaded, or `since` is unknown, the snapshot is sent
+        with `"full": true` instead.
+
+        :param project: Project to get
+        :param since: The last change sequence the client has
+        :param compact: Whether to use the compact format
+        """
+        project = InfraHelper.get_by_id_like(Project, project)
+        if not project:
+            return None
+
+        seq = project.change_seq
+        changes = None
+        if 0 <= since <= seq:
+            changes = self.repo.project_change.get_all_since(project, since, seq, MAX_BOARD_CHANGES)
+
+        if changes is None or any(change.target == ProjectChangeTarget.Board for change in changes):
+            return {"seq": seq, "full": True, **self._get_board(project, compact)}
+
+        changed: dict[ProjectChangeTarget, set[int]] = {target: set() for target in ProjectChangeTarget}
+        deleted: dict[ProjectChangeTarget, list[str]] = {target: [] for target in ProjectChangeTarget}
+        for change in changes:
+            if change.is_deleted:
+                deleted[change.target].append(change.target_id.to_short_code())
+            else:
+                changed[change.target].add(change.target_id)
+
+        board = self._get_board(project, compact, changed)
+        board["deleted"] = {
+            "columns": deleted[ProjectChangeTarget.ProjectColumn],
+            "labels": deleted[ProjectChangeTarget.ProjectLabel],
+            "cards": deleted[ProjectChangeTarget.Card],
+        }
+        return {"seq": seq, "full": False, **board}
+
+    def _get_board(
+        self, project: Project, compact: bool, changed: dict[ProjectChangeTarget, set[int]] | None = None
+    ) -> dict[str, Any]:
+        raw_columns = self.repo.project_column.get_all_by_project(project)
+        column_names = {column.get_uid(): column.name for column, _ in raw_columns}
+        columns = [
+            {**column.api_response(), "count": count}
+            for column, count in raw_columns
+            if changed is None or column.id in changed[ProjectChangeTarget.ProjectColumn]
+        ]
+
+        raw_labels = self.repo.project_label.get_all_by_project(project)
+        api_labels = BaseSqlModel.api_response_many(raw_labels)
+        labels = {label.id: api_label for label, api_label in zip(raw_labels, api_labels)}
+
+        changed_card_ids = list(changed[ProjectChangeTarget.Card]) if changed is not None else None
+        raw_cards = self.repo.card.get_board_snapshot(project, changed_card_ids) if changed_card_ids != [] else []
+        api_cards = BaseSqlModel.api_response_many(card for card, *_ in raw_cards)
+        for (_, count_comment, member_ids, label_ids), api_card in zip(raw_cards, api_cards):
+            api_card["project_column_name"] = column_names.get(api_card["project_column_uid"], "")
+            api_card["count_comment"] = count_comment
+            api_card["member_uids"] = SnowflakeID.to_short_codes(member_ids or [])
+            card_labels = [labels[label_id] for label_id in label_ids or [] if label_id in labels]
+            if compact:
+                api_card["label_uids"] = [label["uid"] for label in card_labels]
+            else:
+                api_card["labels"] = card_labels
+
+        raw_relationships = (
+            self.repo.card_relationship.get_all_by_project(project, changed_card_ids) if changed_card_ids != [] else []
+        )
+        # The query returns a relationship once for each of its cards in the project.
+        raw_relationships = list(
+            {raw_relationship[0].id: raw_relationship for raw_relationship in raw_relationships}.values()
+        )
+        api_relationships = BaseSqlModel.api_response_many(relationship for relationship, _ in raw_relationships)
+
+        board: dict[str, Any] = {}
+        if changed is not None:
+            api_labels = [
+                api_label
+                for label, api_label in zip(raw_labels, api_labels)
+                if label.id in changed[ProjectChangeTarget.ProjectLabel]
+            ]
+
+            card_orders: dict[str, list[str]] = {}
+            order_column_ids = {card.project_column_id for card, *_ in raw_cards}
+            order_column_ids.update(changed[ProjectChangeTarget.ProjectColumn])
+            if order_column_ids:
+                for card_id, column_id in self.repo.card.get_ordered_ids_by_columns(project, list(order_column_ids)):
+                    card_orders.setdefault(column_id.to_short_code(), []).append(card_id.to_short_code())
+
+            board["column_uids"] = [column.get_uid() for column, _ in raw_columns]
+            board["label_uids"] = [label.get_uid() for label in raw_labels]
+            board["card_orders"] = card_orders
+
+        if compact:
+            return {
+                "columns": convert_to_compact_records(columns),
+                "labels": convert_to_compact_records(api_labels),
+                "cards": convert_to_compact_records(api_cards),
+                "relationships": convert_to_compact_records(api_relationships),
+                **board,
+            }
+
+        relationships: dict[int, list[dict[str, Any]]] = {}
+        for (relationship, _), api_relationship in zip(raw_relationships, api_relationships):
+            relationships.setdefault(relationship.card_id_parent, []).append(api_relationship)
+            relationships.setdefault(relationship.card_id_child, []).append({**api_relationship})
+
+        for (card, *_), api_card in zip(raw_cards, api_cards):
+            api_card["relationships"] = relationships.get(card.id, [])
+
+        return {"columns": columns, "labels": api_labels, "cards": api_cards, **board}
+
     def get_dashboard_list(
         self, user: User, pagination: TimeBasedPagination
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
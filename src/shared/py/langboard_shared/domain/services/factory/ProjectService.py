@@ -7,6 +7,7 @@ from ....core.types.ParamTypes import TInternalBotParam, TProjectParam, TUserOrB
 from ....core.utils.Converter import convert_python_data
 from ....helpers import InfraHelper
 from ....publishers import ProjectPublisher
+from ....security import RoleCache
 from ....tasks.activities import ProjectActivityTask
 from ....tasks.bots import ProjectBotTask
 from ...models import (
@@ -437,6 +438,9 @@ class ProjectService(BaseDomainService):
 
         self.repo.project.delete(project)
 
+        roles = self.repo.role.project.get_list(project_id=project.id)
+        RoleCache.invalidate(ProjectRole, [role.user_id for role in roles], {"project_id": project.id})
+
         ProjectPublisher.deleted(project)
         ProjectActivityTask.project_deleted(user, project)
         ProjectBotTask.project_deleted(user, project)
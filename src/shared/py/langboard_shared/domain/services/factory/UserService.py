@@ -15,7 +15,7 @@ from ....core.utils.String import concat, generate_random_string
 from ....Env import UI_QUERY_NAMES, Env
 from ....helpers import InfraHelper
 from ....publishers import AppSettingPublisher, UserPublisher
-from ....security import Auth
+from ....security import Auth, RoleSecurity
 from ...models import SettingRole, User, UserEmail, UserProfile, UserSignInHistory
 from ...models.SettingRole import SettingRoleAction, SettingRoleCategory
 from ...models.UserSignInHistory import SignInErrorCode
@@ -386,3 +386,6 @@ class UserService(BaseDomainService):
             user_id=user.id, is_success=is_success, ip_address=ip_address, error_code=error_code
         )
         self.repo.user_sign_in_history.insert(login_history)
+
+        if is_success:
+            RoleSecurity.preload(user.id)
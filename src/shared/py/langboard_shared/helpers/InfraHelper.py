@@ -1,10 +1,12 @@
 from typing import Any, Literal, Sequence, TypeVar, cast, overload
-from sqlalchemy import Delete, Update, func
+from sqlalchemy import Delete, Update, bindparam, func, update
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlmodel.sql.expression import Select, SelectOfScalar
 from ..core.db import BaseSqlModel, DbSession, SoftDeleteModel, SqlBuilder
 from ..core.types import SnowflakeID
 from ..core.utils.decorators import staticclass
+from ..core.utils.OrderKey import OrderKey
+from ..Env import Env
 from .ModelHelper import ModelHelper
 
 
@@ -206,6 +208,96 @@ class InfraHelper:
 
         return count_all
 
+    @staticmethod
+    def has_order_key(model_class: type[BaseSqlModel]) -> bool:
+        """Checks if the model has an `order_key` column that sorts the same way as `order`."""
+        return "order_key" in model_class.model_fields
+
+    @staticmethod
+    def is_order_key_enabled(model_class: type[BaseSqlModel]) -> bool:
+        """Checks if the model is moved by its `order_key` instead of renumbering the siblings (`ORDER_MODE=key`)."""
+        return Env.ORDER_MODE == "key" and InfraHelper.has_order_key(model_class)
+
+    @staticmethod
+    def get_order_columns(model_class: type[BaseSqlModel]) -> list[InstrumentedAttribute]:
+        """Gets the columns to sort the siblings by.
+
+        In `key` mode, moves do not renumber the siblings, so `order_key` comes first and `order` only breaks ties.
+        """
+        if InfraHelper.is_order_key_enabled(model_class):
+            return [model_class.column("order_key"), model_class.column("order")]
+        return [model_class.column("order")]
+
+    @staticmethod
+    def set_order_by_position(models: Sequence[BaseSqlModel], parent_foreign_key_name: str) -> None:
+        """Sets the `order` of the models, sorted by :meth:`get_order_columns`, to their position among their siblings.
+
+        Only needed in `key` mode, where the stored `order` of the siblings of a moved row is stale until they are
+        rebalanced. The models must contain every sibling of their parents.
+        """
+        positions: dict[Any, int] = {}
+        for model in models:
+            parent_id = getattr(model, parent_foreign_key_name)
+            position = positions.get(parent_id, 0)
+            if getattr(model, "order") != position:
+                setattr(model, "order", position)
+            positions[parent_id] = position + 1
+
+    @staticmethod
+    def rebalance_order(
+        model_class: type[_TBaseModel],
+        column: str,
+        value: Any,
+        by: Literal["order", "order_key"] = "order_key",
+    ) -> int:
+        """Renumbers `order` from 0 and regenerates `order_key` if a key is missing, duplicated, or longer than
+        `ORDER_KEY_MAX_LENGTH`. Only the changed rows are updated.
+
+        :param model_class: Model class with `order` and `order_key` columns
+        :param column: Parent foreign key column name
+        :param value: Parent ID
+        :param by: Column that has the current order; `order` always regenerates the keys. If a key is missing (e.g.
+            the row was moved while `ORDER_MODE` was `index`), `order` is used too.
+        :return: Number of the updated rows
+        """
+        query = SqlBuilder.select.columns(
+            model_class.column("id"), model_class.column("order"), model_class.column("order_key")
+        ).where(model_class.column(column) == value)
+        rows = []
+        with DbSession.use(readonly=False) as db:
+            rows = list(db.exec(query).all())
+
+        if by == "order_key" and any(row[2] is None for row in rows):
+            by = "order"
+
+        if by == "order_key":
+            rows.sort(key=lambda row: (row[2], row[1], row[0]))
+        else:
+            rows.sort(key=lambda row: (row[1], row[0]))
+
+        keys: list[str | None] = [row[2] for row in rows]
+        should_regenerate = by == "order" or any(len(cast(str, key)) > Env.ORDER_KEY_MAX_LENGTH for key in keys)
+        if not should_regenerate:
+            should_regenerate = any(keys[i - 1] == keys[i] for i in range(1, len(keys)))
+        if should_regenerate:
+            keys = cast(list[str | None], OrderKey.spread(len(rows)))
+
+        params = [
+            {"row_id": row[0], "row_order": order, "row_order_key": keys[order]}
+            for order, row in enumerate(rows)
+            if row[1] != order or row[2] != keys[order]
+        ]
+        if params:
+            table = model_class.__table__  # type: ignore
+            with DbSession.use(readonly=False) as db:
+                db.exec(
+                    update(table)
+                    .where(table.c.id == bindparam("row_id"))
+                    .values({"order": bindparam("row_order"), "order_key": bindparam("row_order_key")}),
+                    params=params,
+                )
+        return len(params)
+
     @staticmethod
     def get_by(
         model_class: type[_TBaseModel],
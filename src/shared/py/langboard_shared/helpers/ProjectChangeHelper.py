@@ -0,0 +1,85 @@
+from typing import Sequence
+from ..core.db import BaseSqlModel, DbSession, SqlBuilder
+from ..core.types.ParamTypes import TBaseParam, TProjectParam
+from ..core.utils.decorators import staticclass
+from ..domain.models import Project, ProjectChange, ProjectChangeTarget
+from .InfraHelper import InfraHelper
+
+
+@staticclass
+class ProjectChangeHelper:
+    @staticmethod
+    def record(
+        project: TProjectParam,
+        target: ProjectChangeTarget,
+        models: BaseSqlModel | TBaseParam | Sequence[BaseSqlModel | TBaseParam],
+        is_deleted: bool = False,
+    ) -> None:
+        """Stamps the changed board rows with the next change sequence of the project once the unit of work commits.
+
+        The sequence is taken in a short transaction of its own after the commit (see :meth:`DbSession.on_commit`),
+        so the project row is not locked for the whole request. Outside a unit of work, it is taken immediately.
+
+        :param project: Project of the rows
+        :param target: Type of the rows (:attr:`ProjectChangeTarget.Board` means the whole board must be reloaded)
+        :param models: Changed rows
+        :param is_deleted: Whether the rows are deleted
+        """
+        if not isinstance(models, Sequence) or isinstance(models, str):
+            models = [models]
+        project_id = InfraHelper.convert_id(project)
+        target_ids = list(dict.fromkeys(InfraHelper.convert_id(model) for model in models))
+
+        DbSession.on_commit(lambda: ProjectChangeHelper._record(project_id, target, target_ids, is_deleted))
+
+    @staticmethod
+    def _record(project_id: int, target: ProjectChangeTarget, target_ids: list[int], is_deleted: bool) -> int:
+        with DbSession.use(readonly=False) as db:
+            # The project row stays locked until the transaction commits, so the sequences are committed in order.
+            db.exec(
+                SqlBuilder.update.table(Project, with_deleted=True)
+                .where(Project.column("id") == project_id)
+                .values(
+                    {
+                        Project.column("change_seq"): Project.column("change_seq") + 1,
+                        Project.column("updated_at"): Project.column("updated_at"),
+                    }
+                )
+            )
+            seq = db.exec(
+                SqlBuilder.select.column(Project.column("change_seq"), with_deleted=True).where(
+                    Project.column("id") == project_id
+                )
+            ).first()
+            if seq is None:
+                return 0
+
+            existing_target_ids = set(
+                db.exec(
+                    SqlBuilder.select.column(ProjectChange.column("target_id")).where(
+                        (ProjectChange.column("project_id") == project_id)
+                        & (ProjectChange.column("target") == target)
+                        & (ProjectChange.column("target_id").in_(target_ids))
+                    )
+                ).all()
+            )
+            if existing_target_ids:
+                db.exec(
+                    SqlBuilder.update.table(ProjectChange)
+                    .where(
+                        (ProjectChange.column("project_id") == project_id)
+                        & (ProjectChange.column("target") == target)
+                        & (ProjectChange.column("target_id").in_(existing_target_ids))
+                    )
+                    .values({ProjectChange.column("seq"): seq, ProjectChange.column("is_deleted"): is_deleted})
+                )
+
+            new_changes = [
+                ProjectChange(project_id=project_id, target=target, target_id=target_id, seq=seq, is_deleted=is_deleted)
+                for target_id in target_ids
+                if target_id not in existing_target_ids
+            ]
+            if new_changes:
+                db.insert_all(new_changes)
+
+        return seq
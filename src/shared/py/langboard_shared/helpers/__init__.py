@@ -2,6 +2,7 @@ from .BotHelper import BotHelper
 from .InfraHelper import InfraHelper
 from .MiddlewareHelper import MiddlewareHelper
 from .ModelHelper import ModelHelper, ensure_models_imported
+from .ProjectChangeHelper import ProjectChangeHelper
 
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "ModelHelper",
     "InfraHelper",
     "MiddlewareHelper",
+    "ProjectChangeHelper",
     "ensure_models_imported",
 ]
@@ -111,6 +111,10 @@ class Repository(Factory):
     def project_invitation(self):
         return self._create_or_get_product(factory.ProjectInvitationRepository)
 
+    @property
+    def project_change(self):
+        return self._create_or_get_product(factory.ProjectChangeRepository)
+
     @property
     def reaction(self):
         return self._create_or_get_product(factory.ReactionRepository)
@@ -1,9 +1,11 @@
 from typing import TypeVar
+from sqlalchemy import func
 from ....core.db import BaseSqlModel, DbSession, SqlBuilder
 from ....core.domain import BaseRepository
 from ....core.schema import TimeBasedPagination
-from ....core.types.ParamTypes import TBotParam
-from ....domain.models import BotLog
+from ....core.types import SnowflakeID
+from ....core.types.ParamTypes import TBaseParam, TBotParam
+from ....domain.models import BotLog, BotLogStack
 from ....domain.models.bases import BaseBotLogModel
 from ....helpers import InfraHelper
 
@@ -48,3 +50,86 @@ class BotLogRepository(BaseRepository[BotLog]):
             logs = result.all()
 
         return logs
+
+    def get_by_scope(
+        self,
+        log_model_class: type[_TBotLogModel],
+        bot: TBotParam,
+        scope_model: BaseSqlModel,
+        bot_log: TBaseParam,
+    ) -> BotLog | None:
+        query = (
+            SqlBuilder.select.table(BotLog)
+            .join(log_model_class, BotLog.column("id") == log_model_class.column("bot_log_id"))
+            .where(
+                (BotLog.column("id") == InfraHelper.convert_id(bot_log))
+                & (BotLog.column("bot_id") == InfraHelper.convert_id(bot))
+                & (log_model_class.column(f"{scope_model.__tablename__}_id") == scope_model.id)
+            )
+            .limit(1)
+        )
+
+        log = None
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(query)
+            log = result.first()
+
+        return log
+
+    def get_stacks(
+        self, bot_log: BotLog | TBaseParam, pagination: TimeBasedPagination | None = None
+    ) -> list[BotLogStack]:
+        query = (
+            SqlBuilder.select.table(BotLogStack)
+            .where(BotLogStack.column("bot_log_id") == InfraHelper.convert_id(bot_log))
+            .order_by(BotLogStack.column("log_date").asc(), BotLogStack.column("id").asc())
+        )
+
+        if pagination:
+            query = query.where(BotLogStack.column("log_date") <= pagination.refer_time)
+            query = query.limit(pagination.limit).offset((pagination.page - 1) * pagination.limit)
+
+        stacks = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(query)
+            stacks = result.all()
+
+        return stacks
+
+    def get_latest_stacks_by_logs(self, bot_logs: list[BotLog]) -> dict[SnowflakeID, tuple[BotLogStack | None, int]]:
+        """Gets the latest message and the message count of the logs in one query.
+
+        :param bot_logs: Logs to get the latest messages of
+        """
+        latest_by_log: dict[SnowflakeID, tuple[BotLogStack | None, int]] = {
+            bot_log.id: (None, 0) for bot_log in bot_logs
+        }
+        if not latest_by_log:
+            return latest_by_log
+
+        ranked_cte = (
+            SqlBuilder.select.columns(
+                BotLogStack.column("id"),
+                func.row_number()
+                .over(
+                    partition_by=BotLogStack.column("bot_log_id"),
+                    order_by=(BotLogStack.column("log_date").desc(), BotLogStack.column("id").desc()),
+                )
+                .label("rank"),
+                func.count().over(partition_by=BotLogStack.column("bot_log_id")).label("count"),
+            )
+            .where(BotLogStack.column("bot_log_id").in_(list(latest_by_log)))
+            .cte("ranked_cte")
+        )
+        query = (
+            SqlBuilder.select.tables(BotLogStack, ranked_cte.c.count)
+            .join(ranked_cte, BotLogStack.column("id") == ranked_cte.c.id)
+            .where(ranked_cte.c.rank == 1)
+        )
+
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(query)
+            for stack, count in result.all():
+                latest_by_log[stack.bot_log_id] = (stack, count)
+
+        return latest_by_log
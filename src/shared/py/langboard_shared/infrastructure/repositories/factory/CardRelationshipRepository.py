@@ -39,25 +39,32 @@ class CardRelationshipRepository(BaseRepository[CardRelationship]):
             relationships = result.all()
         return relationships
 
-    def get_all_by_project(self, project: TProjectParam) -> list[tuple[CardRelationship, GlobalCardRelationshipType]]:
+    def get_all_by_project(
+        self, project: TProjectParam, where_cards_in: Sequence[TCardParam] | None = None
+    ) -> list[tuple[CardRelationship, GlobalCardRelationshipType]]:
         project_id = InfraHelper.convert_id(project)
 
+        query = (
+            SqlBuilder.select.tables(CardRelationship, GlobalCardRelationshipType)
+            .join(
+                GlobalCardRelationshipType,
+                CardRelationship.column("relationship_type_id") == GlobalCardRelationshipType.column("id"),
+            )
+            .join(
+                Card,
+                (CardRelationship.column("card_id_parent") == Card.column("id"))
+                | (CardRelationship.column("card_id_child") == Card.column("id")),
+            )
+            .join(Project, (Card.column("project_id") == Project.column("id")))
+            .where(Project.column("id") == project_id)
+        )
+        if where_cards_in is not None:
+            card_ids = [InfraHelper.convert_id(card) for card in where_cards_in]
+            query = query.where(Card.column("id").in_(card_ids))
+
         relationships = []
         with DbSession.use(readonly=True) as db:
-            result = db.exec(
-                SqlBuilder.select.tables(CardRelationship, GlobalCardRelationshipType)
-                .join(
-                    GlobalCardRelationshipType,
-                    CardRelationship.column("relationship_type_id") == GlobalCardRelationshipType.column("id"),
-                )
-                .join(
-                    Card,
-                    (CardRelationship.column("card_id_parent") == Card.column("id"))
-                    | (CardRelationship.column("card_id_child") == Card.column("id")),
-                )
-                .join(Project, (Card.column("project_id") == Project.column("id")))
-                .where(Project.column("id") == project_id)
-            )
+            result = db.exec(query)
             relationships = result.all()
         return relationships
 
@@ -1,10 +1,21 @@
+from typing import Sequence
 from sqlalchemy import func
 from ....core.db import DbSession, SqlBuilder
 from ....core.domain import BaseOrderRepository
 from ....core.schema import TimeBasedPagination
-from ....core.types import SafeDateTime
-from ....core.types.ParamTypes import TColumnParam, TProjectParam, TUserParam
-from ....domain.models import Card, CardAssignedUser, CardComment, Checkitem, Project, ProjectColumn, ProjectRole
+from ....core.types import SafeDateTime, SnowflakeID
+from ....core.types.ParamTypes import TCardParam, TColumnParam, TProjectParam, TUserParam
+from ....domain.models import (
+    Card,
+    CardAssignedProjectLabel,
+    CardAssignedUser,
+    CardComment,
+    Checkitem,
+    Project,
+    ProjectColumn,
+    ProjectRole,
+    User,
+)
 from ....helpers import InfraHelper
 
 
@@ -37,13 +48,90 @@ class CardRepository(BaseOrderRepository[Card, ProjectColumn]):
                     (Card.column("id") == CardComment.column("card_id")) & (CardComment.column("deleted_at") == None),  # noqa
                 )
                 .where(Project.column("id") == project_id)
-                .order_by(Card.column("order").asc())
-                .group_by(Card.column("id"), Card.column("order"))
+                .order_by(*InfraHelper.get_order_columns(Card))
+                .group_by(Card.column("id"), *InfraHelper.get_order_columns(Card))
             )
             cards = result.all()
 
+        self._set_order_by_position([card for card, _ in cards])
         return cards
 
+    def get_board_snapshot(
+        self, project: TProjectParam, where_in: Sequence[TCardParam] | None = None
+    ) -> list[tuple[Card, int, list[int] | None, list[int] | None]]:
+        """Gets the project cards with their comment counts, assigned user IDs, and label IDs in a single query.
+
+        The IDs are aggregated into JSON arrays by correlated subqueries, so a card without any is `None` or `[]`
+        depending on the database.
+        """
+        project_id = InfraHelper.convert_id(project)
+
+        count_comment = (
+            SqlBuilder.select.count(CardComment, CardComment.column("id"))
+            .where(
+                (CardComment.column("card_id") == Card.column("id")) & (CardComment.column("deleted_at") == None)  # noqa
+            )
+            .scalar_subquery()
+        )
+        member_ids = (
+            SqlBuilder.select.column(SqlBuilder.select.json_array(CardAssignedUser.column("user_id")))
+            .select_from(CardAssignedUser)
+            .join(User, CardAssignedUser.column("user_id") == User.column("id"))
+            .where(
+                (CardAssignedUser.column("card_id") == Card.column("id")) & (User.column("deleted_at") == None)  # noqa
+            )
+            .scalar_subquery()
+        )
+        label_ids = (
+            SqlBuilder.select.column(SqlBuilder.select.json_array(CardAssignedProjectLabel.column("project_label_id")))
+            .where(CardAssignedProjectLabel.column("card_id") == Card.column("id"))
+            .scalar_subquery()
+        )
+
+        query = (
+            SqlBuilder.select.tables(
+                Card,
+                count_comment.label("count_comment"),
+                member_ids.label("member_ids"),
+                label_ids.label("label_ids"),
+            )
+            .where(Card.column("project_id") == project_id)
+            .order_by(*InfraHelper.get_order_columns(Card))
+        )
+        if where_in is not None:
+            card_ids = [InfraHelper.convert_id(card) for card in where_in]
+            query = query.where(Card.column("id").in_(card_ids))
+
+        cards = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(query)
+            cards = result.all()
+
+        if where_in is None:
+            self._set_order_by_position([card for card, *_ in cards])
+        return cards
+
+    def get_ordered_ids_by_columns(
+        self, project: TProjectParam, columns: Sequence[TColumnParam]
+    ) -> list[tuple[SnowflakeID, SnowflakeID]]:
+        """Gets the IDs of the cards in the columns ordered by their order.
+
+        :return: List of (card ID, column ID)
+        """
+        project_id = InfraHelper.convert_id(project)
+        column_ids = [InfraHelper.convert_id(column) for column in columns]
+
+        records = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(
+                SqlBuilder.select.columns(Card.column("id"), Card.column("project_column_id"))
+                .where((Card.column("project_id") == project_id) & (Card.column("project_column_id").in_(column_ids)))
+                .order_by(*InfraHelper.get_order_columns(Card))
+            )
+            records = result.all()
+
+        return records
+
     def get_dashboard_list_scroller(self, user: TUserParam, pagination: TimeBasedPagination):
         user_id = InfraHelper.convert_id(user)
         query = (
@@ -101,9 +189,11 @@ class CardRepository(BaseOrderRepository[Card, ProjectColumn]):
                     Card.column("project_column_id") == ProjectColumn.column("id"),
                 )
                 .where(Card.column("project_id") == project_id)
-                .order_by(Card.column("order").asc())
+                .order_by(*InfraHelper.get_order_columns(Card))
             )
             records = result.all()
+
+        self._set_order_by_position([card for card, _ in records])
         return records
 
     def get_all_by_column(self, column: TColumnParam):
@@ -114,9 +204,11 @@ class CardRepository(BaseOrderRepository[Card, ProjectColumn]):
             result = db.exec(
                 SqlBuilder.select.table(Card)
                 .where(Card.column("project_column_id") == column_id)
-                .order_by(Card.column("order").asc())
+                .order_by(*InfraHelper.get_order_columns(Card))
             )
             records = result.all()
+
+        self._set_order_by_position(records)
         return records
 
     def move_all_by_column(
@@ -129,6 +221,11 @@ class CardRepository(BaseOrderRepository[Card, ProjectColumn]):
         source_column_id = InfraHelper.convert_id(source_column)
         dest_column_id = InfraHelper.convert_id(dest_column)
         current_time = SafeDateTime.now()
+        is_order_key_enabled = InfraHelper.is_order_key_enabled(Card)
+        if is_order_key_enabled:
+            # The moves below use the order, so it must be up to date with the keys.
+            self.rebalance_order(source_column_id)
+            self.rebalance_order(dest_column_id)
 
         with DbSession.use(readonly=False) as db:
             db.exec(
@@ -152,8 +249,13 @@ class CardRepository(BaseOrderRepository[Card, ProjectColumn]):
                 .values(
                     {
                         Card.column("order"): ordered_cards_cte.c.new_order,
+                        Card.column("order_key"): None,
                         Card.column("project_column_id"): dest_column_id,
                         Card.column("archived_at"): current_time if is_archive else None,
                     }
                 )
             )
+
+        if is_order_key_enabled:
+            # The moved cards have no keys and must come before the ones already in the destination column.
+            self.rebalance_order(dest_column_id, by="order")
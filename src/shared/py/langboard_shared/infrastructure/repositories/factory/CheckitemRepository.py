@@ -30,8 +30,11 @@ class CheckitemRepository(BaseOrderRepository[Checkitem, Checklist]):
                 .outerjoin(Card, Card.column("id") == Checkitem.column("cardified_id"))
                 .outerjoin(User, User.column("id") == Checkitem.column("user_id"))
                 .where(Checkitem.column("checklist_id") == checklist_id)
+                .order_by(*InfraHelper.get_order_columns(Checkitem))
             )
             records = result.all()
+
+        self._set_order_by_position([checkitem for checkitem, _, _ in records])
         return list(records)
 
     def get_all_by_card(self, card: TCardParam) -> list[tuple[Checkitem, Card | None, User | None]]:
@@ -48,8 +51,11 @@ class CheckitemRepository(BaseOrderRepository[Checkitem, Checklist]):
                 .outerjoin(Card, Card.column("id") == Checkitem.column("cardified_id"))
                 .outerjoin(User, User.column("id") == Checkitem.column("user_id"))
                 .where(Checklist.column("card_id") == card_id)
+                .order_by(*InfraHelper.get_order_columns(Checkitem))
             )
             records = result.all()
+
+        self._set_order_by_position([checkitem for checkitem, _, _ in records])
         return list(records)
 
     def get_all_tracking_scroller(self, user: TUserParam, pagination: TimeBasedPagination):
@@ -21,7 +21,16 @@ class ChecklistRepository(BaseOrderRepository[Checklist, Card]):
     def get_all_by_card(self, card: TCardParam) -> list[Checklist]:
         card_id = InfraHelper.convert_id(card)
 
-        checklists = InfraHelper.get_all_by(Checklist, "card_id", card_id)
+        checklists = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(
+                SqlBuilder.select.table(Checklist)
+                .where(Checklist.column("card_id") == card_id)
+                .order_by(*InfraHelper.get_order_columns(Checklist))
+            )
+            checklists = result.all()
+
+        self._set_order_by_position(checklists)
         return checklists
 
     def get_all_by_project(self, project: TProjectParam) -> list[Checklist]:
@@ -33,7 +42,9 @@ class ChecklistRepository(BaseOrderRepository[Checklist, Card]):
                 SqlBuilder.select.table(Checklist)
                 .join(Card, Checklist.column("card_id") == Card.column("id"))
                 .where(Card.column("project_id") == project_id)
+                .order_by(*InfraHelper.get_order_columns(Checklist))
             )
             checklists = result.all()
 
+        self._set_order_by_position(checklists)
         return checklists
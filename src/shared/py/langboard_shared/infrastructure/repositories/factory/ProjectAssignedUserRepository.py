@@ -5,6 +5,7 @@ from ....core.types import SafeDateTime
 from ....core.types.ParamTypes import TProjectParam, TUserParam
 from ....domain.models import Project, ProjectAssignedUser, ProjectRole, User
 from ....helpers import InfraHelper
+from ....security.RoleCache import RoleCache
 
 
 class ProjectAssignedUserRepository(BaseRepository[ProjectAssignedUser]):
@@ -134,6 +135,7 @@ class ProjectAssignedUserRepository(BaseRepository[ProjectAssignedUser]):
                     (ProjectRole.column("project_id") == project_id) & (ProjectRole.column("user_id").in_(user_ids))
                 )
             )
+        RoleCache.invalidate(ProjectRole, user_ids, {"project_id": project_id})
 
         with DbSession.use(readonly=False) as db:
             db.exec(
@@ -0,0 +1,39 @@
+from ....core.db import DbSession, SqlBuilder
+from ....core.domain import BaseRepository
+from ....core.types.ParamTypes import TProjectParam
+from ....domain.models import ProjectChange
+from ....helpers import InfraHelper
+
+
+class ProjectChangeRepository(BaseRepository[ProjectChange]):
+    @staticmethod
+    def model_cls():
+        return ProjectChange
+
+    @staticmethod
+    def name() -> str:
+        return "project_change"
+
+    def get_all_since(self, project: TProjectParam, since: int, until: int, limit: int) -> list[ProjectChange] | None:
+        """Gets the changes of the project stamped after `since` and up to `until`.
+
+        :return: `None` if there are more changes than `limit`
+        """
+        project_id = InfraHelper.convert_id(project)
+        changes = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(
+                SqlBuilder.select.table(ProjectChange)
+                .where(
+                    (ProjectChange.column("project_id") == project_id)
+                    & (ProjectChange.column("seq") > since)
+                    & (ProjectChange.column("seq") <= until)
+                )
+                .order_by(ProjectChange.column("seq").asc())
+                .limit(limit + 1)
+            )
+            changes = result.all()
+
+        if len(changes) > limit:
+            return None
+        return list(changes)
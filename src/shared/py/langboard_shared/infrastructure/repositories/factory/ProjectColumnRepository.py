@@ -31,8 +31,8 @@ class ProjectColumnRepository(BaseOrderRepository[ProjectColumn, Project]):
 
         query = (
             query.where(ProjectColumn.column("project_id").in_(project_ids))
-            .order_by(ProjectColumn.column("order").asc())
-            .group_by(ProjectColumn.column("id"), ProjectColumn.column("order"))
+            .order_by(*InfraHelper.get_order_columns(ProjectColumn))
+            .group_by(ProjectColumn.column("id"), *InfraHelper.get_order_columns(ProjectColumn))
         )
 
         raw_columns = []
@@ -40,6 +40,8 @@ class ProjectColumnRepository(BaseOrderRepository[ProjectColumn, Project]):
             result = db.exec(query)
             raw_columns = result.all()
 
+        self._set_order_by_position([column for column, _ in raw_columns])
+
         has_archive_column = {}
         for raw_column in raw_columns:
             column, _ = raw_column
@@ -76,8 +78,7 @@ class ProjectColumnRepository(BaseOrderRepository[ProjectColumn, Project]):
             is_archive=True,
         )
 
-        with DbSession.use(readonly=False) as db:
-            db.insert(column)
+        self.insert(column)
 
         return column
 
@@ -27,6 +27,7 @@ from .ProjectAssignedInternalBotRepository import ProjectAssignedInternalBotRepo
 from .ProjectAssignedUserRepository import ProjectAssignedUserRepository
 from .ProjectBotDefaultScopeRepository import ProjectBotDefaultScopeRepository
 from .ProjectBotScopeRepository import ProjectBotScopeRepository
+from .ProjectChangeRepository import ProjectChangeRepository
 from .ProjectColumnBotDefaultScopeRepository import ProjectColumnBotDefaultScopeRepository
 from .ProjectColumnBotScopeRepository import ProjectColumnBotScopeRepository
 from .ProjectColumnRepository import ProjectColumnRepository
@@ -80,6 +81,7 @@ __all__ = [
     "ProjectAssignedUserRepository",
     "ProjectBotDefaultScopeRepository",
     "ProjectBotScopeRepository",
+    "ProjectChangeRepository",
     "ProjectColumnBotDefaultScopeRepository",
     "ProjectColumnBotScopeRepository",
     "ProjectColumnRepository",
@@ -2,6 +2,7 @@ from typing import Generic, TypeVar
 from .....core.db import DbSession, SqlBuilder
 from .....core.domain import BaseRepository
 from .....domain.models.bases import BaseRoleModel
+from .....security.RoleCache import RoleCache
 
 
 _TRoleModel = TypeVar("_TRoleModel", bound=BaseRoleModel)
@@ -68,6 +69,8 @@ class BaseRoleRepository(Generic[_TRoleModel], BaseRepository[_TRoleModel]):
             else:
                 db.update(role)
 
+        RoleCache.invalidate_role(role)
+
         return role
 
     def grant_all(self, **kwargs) -> _TRoleModel:
@@ -86,6 +89,8 @@ class BaseRoleRepository(Generic[_TRoleModel], BaseRepository[_TRoleModel]):
             else:
                 db.update(role)
 
+        RoleCache.invalidate_role(role)
+
         return role
 
     def grant_default(self, **kwargs) -> _TRoleModel:
@@ -104,6 +109,8 @@ class BaseRoleRepository(Generic[_TRoleModel], BaseRepository[_TRoleModel]):
             else:
                 db.update(role)
 
+        RoleCache.invalidate_role(role)
+
         return role
 
     def withdraw(self, **kwargs) -> _TRoleModel | None:
@@ -120,6 +127,8 @@ class BaseRoleRepository(Generic[_TRoleModel], BaseRepository[_TRoleModel]):
         with DbSession.use(readonly=False) as db:
             db.delete(role)
 
+        RoleCache.invalidate_role(role)
+
         return role
 
     def _get_or_create_role(self, **kwargs) -> _TRoleModel:
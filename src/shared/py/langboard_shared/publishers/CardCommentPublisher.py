@@ -1,7 +1,8 @@
 from ..core.publisher import BaseSocketPublisher, SocketPublishModel
 from ..core.routing import SocketTopic
 from ..core.utils.decorators import staticclass
-from ..domain.models import Bot, Card, CardComment, Project, User
+from ..domain.models import Bot, Card, CardComment, Project, ProjectChangeTarget, User
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -21,6 +22,8 @@ class CardCommentPublisher(BaseSocketPublisher):
             data_keys=list(model.keys()),
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardCommentPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -50,6 +53,8 @@ class CardCommentPublisher(BaseSocketPublisher):
             data_keys=list(model.keys()),
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardCommentPublisher.put_dispather(model, publish_model)
 
     @staticmethod
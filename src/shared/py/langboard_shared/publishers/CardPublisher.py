@@ -2,7 +2,8 @@ from typing import Any, Literal
 from ..core.publisher import BaseSocketPublisher, SocketPublishModel
 from ..core.routing import SocketTopic
 from ..core.utils.decorators import staticclass
-from ..domain.models import Card, Checkitem, Project, ProjectColumn, ProjectLabel, User
+from ..domain.models import Card, Checkitem, Project, ProjectChangeTarget, ProjectColumn, ProjectLabel, User
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -25,6 +26,9 @@ class CardPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, model["card"]["uid"])
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, column)
+
         CardPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -71,6 +75,8 @@ class CardPublisher(BaseSocketPublisher):
                 ]
             )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -150,6 +156,10 @@ class CardPublisher(BaseSocketPublisher):
                 )
             )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+        if new_column:
+            ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, [old_column, new_column])
+
         CardPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -162,6 +172,8 @@ class CardPublisher(BaseSocketPublisher):
             data_keys="member_uids",
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -174,6 +186,8 @@ class CardPublisher(BaseSocketPublisher):
             data_keys="labels",
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -198,6 +212,9 @@ class CardPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card, is_deleted=True)
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, card.project_column_id)
+
         CardPublisher.put_dispather({}, publish_models)
 
     @staticmethod
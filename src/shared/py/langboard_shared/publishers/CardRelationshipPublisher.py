@@ -2,7 +2,8 @@ from typing import Any
 from ..core.publisher import BaseSocketPublisher, SocketPublishModel
 from ..core.routing import SocketTopic
 from ..core.utils.decorators import staticclass
-from ..domain.models import Card, Project
+from ..domain.models import Card, Project, ProjectChangeTarget
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -20,4 +21,6 @@ class CardRelationshipPublisher(BaseSocketPublisher):
             data_keys=list(model.keys()),
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, card)
+
         CardRelationshipPublisher.put_dispather(model, publish_model)
@@ -8,10 +8,12 @@ from ..domain.models import (
     CheckitemTimerRecord,
     Checklist,
     Project,
+    ProjectChangeTarget,
     ProjectColumn,
     User,
 )
 from ..domain.models.Checkitem import CheckitemStatus
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -81,6 +83,9 @@ class CheckitemPublisher(BaseSocketPublisher):
                 ]
             )
 
+        if cardified_card:
+            ProjectChangeHelper.record(project, ProjectChangeTarget.Card, cardified_card)
+
         CheckitemPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -221,6 +226,9 @@ class CheckitemPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(card.project_id, ProjectChangeTarget.Card, api_card["uid"])
+        ProjectChangeHelper.record(card.project_id, ProjectChangeTarget.ProjectColumn, target_column)
+
         CheckitemPublisher.put_dispather(model, publish_models)
 
     @staticmethod
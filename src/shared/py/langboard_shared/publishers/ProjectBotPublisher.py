@@ -109,9 +109,16 @@ class ProjectBotPublisher(BaseSocketPublisher):
         ProjectBotPublisher.put_dispather(model, publish_model)
 
     @staticmethod
-    def log_created(project: Project, bot_log: tuple[BotLog, BaseBotLogModel]):
+    def log_created(project: Project, bot_log: tuple[BotLog, BaseBotLogModel], stacks: list[BotLogMessage]):
         topic_id = project.get_uid()
-        model = {"log": {**bot_log[0].api_response(), **bot_log[1].api_response()}}
+        model = {
+            "log": {
+                **bot_log[0].api_response(),
+                **bot_log[1].api_response(),
+                "latest_message": stacks[-1].model_dump() if stacks else None,
+                "message_count": len(stacks),
+            }
+        }
         publish_model = SocketPublishModel(
             topic=SocketTopic.BoardSettings,
             topic_id=topic_id,
@@ -3,7 +3,8 @@ from ..core.publisher import BaseSocketPublisher, SocketPublishModel
 from ..core.routing import SocketTopic
 from ..core.types import SafeDateTime
 from ..core.utils.decorators import staticclass
-from ..domain.models import Project, ProjectColumn
+from ..domain.models import Project, ProjectChangeTarget, ProjectColumn
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -33,6 +34,8 @@ class ProjectColumnPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, column)
+
         ProjectColumnPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -58,6 +61,8 @@ class ProjectColumnPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, column)
+
         ProjectColumnPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -83,6 +88,8 @@ class ProjectColumnPublisher(BaseSocketPublisher):
             ),
         ]
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, column)
+
         ProjectColumnPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -118,6 +125,9 @@ class ProjectColumnPublisher(BaseSocketPublisher):
             ),
         ]
 
+        # The cards of the column are moved to the archive column, so the whole board is reloaded.
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Board, project)
+
         ProjectColumnPublisher.put_dispather(model, publish_models)
 
     @staticmethod
@@ -2,7 +2,8 @@ from typing import Any
 from ..core.publisher import BaseSocketPublisher, SocketPublishModel
 from ..core.routing import SocketTopic
 from ..core.utils.decorators import staticclass
-from ..domain.models import Project, ProjectLabel
+from ..domain.models import Project, ProjectChangeTarget, ProjectLabel
+from ..helpers import ProjectChangeHelper
 
 
 @staticclass
@@ -17,6 +18,8 @@ class ProjectLabelPublisher(BaseSocketPublisher):
             data_keys="label",
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectLabel, label)
+
         ProjectLabelPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -29,6 +32,8 @@ class ProjectLabelPublisher(BaseSocketPublisher):
             data_keys=list(model.keys()),
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectLabel, label)
+
         ProjectLabelPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -42,6 +47,8 @@ class ProjectLabelPublisher(BaseSocketPublisher):
             data_keys=["uid", "order"],
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectLabel, label)
+
         ProjectLabelPublisher.put_dispather(model, publish_model)
 
     @staticmethod
@@ -55,4 +62,6 @@ class ProjectLabelPublisher(BaseSocketPublisher):
             data_keys="uid",
         )
 
+        ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectLabel, label, is_deleted=True)
+
         ProjectLabelPublisher.put_dispather(model, publish_model)
@@ -14,6 +14,12 @@ from ..domain.models.BaseBotModel import BaseBotModel, BotPlatform
 from ..Env import Env
 
 
+_USER_CACHE_PREFIX = "auth-user-"
+_BOT_CACHE_PREFIX = "auth-bot-"
+Cache.register_local_prefix(_USER_CACHE_PREFIX)
+Cache.register_local_prefix(_BOT_CACHE_PREFIX)
+
+
 @staticclass
 class Auth:
     @overload
@@ -78,7 +84,7 @@ class Auth:
         :return User: The user if the user exists.
         :return None: If the user does not exist.
         """
-        cache_key = f"auth-user-{user_id}"
+        cache_key = f"{_USER_CACHE_PREFIX}{user_id}"
         try:
             cached_user = Cache.get(cache_key, User.model_validate)
             if cached_user:
@@ -113,7 +119,7 @@ class Auth:
         :return Bot: The bot if the bot exists.
         :return None: If the bot does not exist.
         """
-        cache_key = f"auth-bot-{api_token}"
+        cache_key = f"{_BOT_CACHE_PREFIX}{api_token}"
         try:
             cached_bot = Cache.get(cache_key, Bot.model_validate)
             if cached_bot:
@@ -144,7 +150,7 @@ class Auth:
         if user.is_new():
             return
 
-        cache_key = f"auth-user-{user.id}"
+        cache_key = f"{_USER_CACHE_PREFIX}{user.id}"
         Cache.delete(cache_key)
 
         Cache.set(cache_key, user, 60 * 5)
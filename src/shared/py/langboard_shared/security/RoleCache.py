@@ -0,0 +1,133 @@
+from typing import Any, Callable, Sequence, TypeVar
+from ..core.caching import Cache
+from ..core.db import DbSession
+from ..core.types import SnowflakeID
+from ..core.utils.decorators import staticclass
+from ..domain.models.bases import BaseRoleModel
+
+
+_TRoleFinder = TypeVar("_TRoleFinder", bound=Callable)
+
+
+_ROLE_CACHE_PREFIX = "role-"
+_ROLE_CACHE_TTL = 60 * 5
+Cache.register_local_prefix(_ROLE_CACHE_PREFIX)
+
+_finder_scope_params: dict[Callable, dict[str, str]] = {}
+
+
+@staticclass
+class RoleCache:
+    """Caches the granted actions of a user's role, keyed by the role model, user ID and role columns (e.g. project ID).
+
+    An empty action list means the user has no role, so denied requests are cached as well.
+    """
+
+    @staticmethod
+    def scope(**scope_params: str) -> Callable[[_TRoleFinder], _TRoleFinder]:
+        """Marks a role finder as cacheable.
+
+        This will return a decorator.
+
+        :param scope_params: Role columns mapped to the path parameters holding their short codes
+        """
+
+        def _scope(role_finder: _TRoleFinder) -> _TRoleFinder:
+            _finder_scope_params[role_finder] = scope_params
+            return role_finder
+
+        return _scope
+
+    @staticmethod
+    def get_scope(role_finder: Callable, path_params: dict[str, Any]) -> dict[str, int] | None:
+        """Gets the role columns of a request from its path parameters.
+
+        :param role_finder: Role finder of the endpoint
+        :param path_params: Path parameters of the request
+        :return: The role columns, or ``None`` if the role finder is not cacheable
+        """
+        scope_params = _finder_scope_params.get(role_finder)
+        if scope_params is None:
+            return None
+
+        scope: dict[str, int] = {}
+        for column, path_param in scope_params.items():
+            short_code = path_params.get(path_param)
+            if not short_code or not isinstance(short_code, str):
+                return None
+            scope_id = SnowflakeID.from_short_code(short_code)
+            if not scope_id:
+                return None
+            scope[column] = scope_id
+        return scope
+
+    @staticmethod
+    def get(model_class: type[BaseRoleModel], user_id: int, scope: dict[str, int]) -> list[str] | None:
+        """Gets the cached actions of a role.
+
+        :return: The actions, or ``None`` if they are not cached
+        """
+        key = RoleCache._key(model_class, user_id, scope)
+        if key is None:
+            return None
+
+        try:
+            return Cache.get(key)
+        except Exception:
+            return None
+
+    @staticmethod
+    def set(model_class: type[BaseRoleModel], user_id: int, scope: dict[str, int], actions: list[str]) -> None:
+        key = RoleCache._key(model_class, user_id, scope)
+        if key is not None:
+            Cache.set(key, actions, _ROLE_CACHE_TTL)
+
+    @staticmethod
+    def set_roles(roles: Sequence[BaseRoleModel]) -> None:
+        """Caches the actions of the given roles in one round trip.
+
+        :param roles: Roles to cache
+        """
+        values: dict[str, list[str]] = {}
+        for role in roles:
+            key = RoleCache._key(type(role), role.user_id, RoleCache._get_role_scope(role))
+            if key is not None:
+                values[key] = role.actions
+        if values:
+            Cache.set_many(values, _ROLE_CACHE_TTL)
+
+    @staticmethod
+    def invalidate(model_class: type[BaseRoleModel], user_ids: Sequence[int], scope: dict[str, int]) -> None:
+        """Removes the cached roles of the users.
+
+        The roles are removed again once the current unit of work commits, so a request reading the role before the
+        commit cannot keep the old actions cached.
+
+        :param model_class: Role model class
+        :param user_ids: User IDs
+        :param scope: Role columns
+        """
+        keys = [RoleCache._key(model_class, user_id, scope) for user_id in user_ids]
+        keys = [key for key in keys if key is not None]
+        if not keys:
+            return
+
+        Cache.delete_many(keys)
+        DbSession.on_commit(lambda: Cache.delete_many(keys))
+
+    @staticmethod
+    def invalidate_role(role: BaseRoleModel) -> None:
+        RoleCache.invalidate(type(role), [role.user_id], RoleCache._get_role_scope(role))
+
+    @staticmethod
+    def _get_role_scope(role: BaseRoleModel) -> dict[str, int]:
+        return {column: getattr(role, column) for column in role.get_filterable_columns()}
+
+    @staticmethod
+    def _key(model_class: type[BaseRoleModel], user_id: int, scope: dict[str, int]) -> str | None:
+        key = f"{_ROLE_CACHE_PREFIX}{model_class.__tablename__}-{int(user_id)}"
+        for column in model_class.get_filterable_columns():
+            if column not in scope:
+                return None
+            key = f"{key}-{int(scope[column])}"
+        return key
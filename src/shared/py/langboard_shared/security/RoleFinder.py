@@ -2,8 +2,10 @@ from typing import Any
 from sqlmodel.sql.expression import SelectOfScalar
 from ..core.types import SnowflakeID
 from ..domain.models import ApiKeyRole, McpRole, Project, ProjectRole, SettingRole
+from .RoleCache import RoleCache
 
 
+@RoleCache.scope(project_id="project_uid")
 def project(
     query: SelectOfScalar[ProjectRole], path_params: dict[str, Any], user_id: int
 ) -> SelectOfScalar[ProjectRole]:
@@ -22,6 +24,7 @@ def project(
     return query
 
 
+@RoleCache.scope()
 def setting(
     query: SelectOfScalar[SettingRole], path_params: dict[str, Any], user_id: int
 ) -> SelectOfScalar[SettingRole]:
@@ -29,11 +32,13 @@ def setting(
     return query
 
 
+@RoleCache.scope()
 def api_key(query: SelectOfScalar[ApiKeyRole], path_params: dict[str, Any], user_id: int) -> SelectOfScalar[ApiKeyRole]:
     """RoleFinder for ApiKeyRole - no additional filtering needed."""
     return query
 
 
+@RoleCache.scope()
 def mcp(query: SelectOfScalar[McpRole], path_params: dict[str, Any], user_id: int) -> SelectOfScalar[McpRole]:
     """RoleFinder for McpRole - no additional filtering needed."""
     return query
@@ -1,8 +1,10 @@
 from typing import Any, TypeVar, cast
 from sqlmodel.sql.expression import SelectOfScalar
 from ..core.db import DbSession, SqlBuilder
+from ..domain.models import ApiKeyRole, McpRole, Project, ProjectRole, SettingRole
 from ..domain.models.bases import BaseRoleModel
 from ..filter.RoleFilter import _RoleFinderFunc
+from .RoleCache import RoleCache
 
 
 _TRoleModel = TypeVar("_TRoleModel", bound=BaseRoleModel)
@@ -19,15 +21,49 @@ class RoleSecurity:
         actions: list[str],
         role_finder: _RoleFinderFunc[_TRoleModel],
     ) -> bool:
-        query = SqlBuilder.select.table(self._model_class).where(self._model_class.column("user_id") == user_id)
+        scope = RoleCache.get_scope(role_finder, path_params)
+        granted_actions = RoleCache.get(self._model_class, user_id, scope) if scope is not None else None
+        if granted_actions is None:
+            query = SqlBuilder.select.table(self._model_class).where(self._model_class.column("user_id") == user_id)
 
-        query = role_finder(cast(SelectOfScalar[_TRoleModel], query), path_params, user_id)
+            query = role_finder(cast(SelectOfScalar[_TRoleModel], query), path_params, user_id)
 
-        role = None
-        with DbSession.use(readonly=True) as db:
-            result = db.exec(query.limit(1))
-            role = result.first()
+            role = None
+            with DbSession.use(readonly=True) as db:
+                result = db.exec(query.limit(1))
+                role = result.first()
+
+            granted_actions = role.actions if role and role.actions else []
+            if scope is not None:
+                RoleCache.set(self._model_class, user_id, scope, granted_actions)
 
-        if not role or not role.actions:
+        if not granted_actions:
             return False
-        return role.is_granted(actions)
+        return self._model_class.is_granted_actions(granted_actions, actions)
+
+    @staticmethod
+    def preload(user_id: int) -> None:
+        """Caches every role of the user, so the following requests are authorized without the database.
+
+        :param user_id: User ID
+        """
+        roles: list[BaseRoleModel] = []
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(
+                SqlBuilder.select.table(ProjectRole)
+                .join(
+                    Project,
+                    (Project.column("id") == ProjectRole.column("project_id")) & (Project.column("deleted_at") == None),  # noqa
+                )
+                .where(ProjectRole.column("user_id") == user_id)
+            )
+            roles.extend(result.all())
+
+            for model_class in (SettingRole, ApiKeyRole, McpRole):
+                result = db.exec(
+                    SqlBuilder.select.table(model_class).where(model_class.column("user_id") == user_id).limit(1)
+                )
+                role = result.first()
+                roles.append(role or model_class(user_id=user_id, actions=[]))
+
+        RoleCache.set_roles(roles)
@@ -1,10 +1,12 @@
 from . import RoleFinder
 from .Auth import Auth
+from .RoleCache import RoleCache
 from .RoleSecurity import RoleSecurity
 
 
 __all__ = [
     "Auth",
+    "RoleCache",
     "RoleFinder",
     "RoleSecurity",
 ]
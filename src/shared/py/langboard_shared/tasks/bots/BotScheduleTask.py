@@ -1,14 +1,13 @@
 from ...ai import BotDefaultTrigger, BotScheduleHelper
 from ...core.broker import Broker
 from ...core.db import BaseSqlModel, DbSession, SqlBuilder
-from ...core.types import SafeDateTime
+from ...core.types import SafeDateTime, SnowflakeID
 from ...domain.models import Bot, Card, Project, ProjectColumn
 from ...domain.models.bases import BaseBotScheduleModel
 from ...domain.models.BotSchedule import BotSchedule, BotScheduleRunningType, BotScheduleStatus
 from ...helpers import BotHelper, ModelHelper
 from ...publishers import ProjectBotPublisher
 from .utils import BotTaskHelper, BotTaskSchemaHelper
-from .utils.BotTaskHelper import logger
 
 
 @BotTaskSchemaHelper.schema(
@@ -25,16 +24,14 @@ async def bot_cron_scheduled(bot: Bot, bot_schedule: BotSchedule, schedule_model
     await _run_scheduler(bot, bot_schedule, schedule_model)
 
 
-async def run_scheduled_bots_cron(interval_str: str):
-    if interval_str.startswith("scheduled "):
-        await _check_bot_schedule_runnable(interval_str.removeprefix("scheduled "))
-        return
+def run_due_bot_schedules(bot_schedule_ids: list[SnowflakeID]):
+    """Sends the due schedules to the broker, so their bots run concurrently on the workers.
 
-    interval_str = BotScheduleHelper.utils.convert_valid_interval_str(interval_str)
-    if not interval_str:
-        logger.error(f"Invalid interval string: {interval_str}")
-        return
+    Pending schedules are started first.
 
+    :param bot_schedule_ids: IDs of the due schedules from :class:`BotScheduler`
+    """
+    current_time = SafeDateTime.now()
     model_classes = ModelHelper.get_models_by_base_class(BaseBotScheduleModel)
     records: list[tuple[BaseBotScheduleModel, BotSchedule, Bot]] = []
     with DbSession.use(readonly=True) as db:
@@ -46,82 +43,58 @@ async def run_scheduled_bots_cron(interval_str: str):
                     model_class.column("bot_schedule_id") == BotSchedule.column("id"),
                 )
                 .join(Bot, BotSchedule.column("bot_id") == Bot.column("id"))
-                .where(
-                    (BotSchedule.column("interval_str") == interval_str)
-                    & (BotSchedule.column("status") == BotScheduleStatus.Started)
-                    & (BotSchedule.column("running_type") != BotScheduleRunningType.Onetime)
-                )
+                .where(BotSchedule.column("id").in_(bot_schedule_ids))
             )
             records.extend(result.all())
 
     for schedule_model, bot_schedule, bot in records:
-        await _run_scheduler(bot, bot_schedule, schedule_model)
+        if bot_schedule.status == BotScheduleStatus.Pending:
+            if not _start_bot_schedule(schedule_model, bot_schedule, current_time):
+                continue
+        elif (
+            bot_schedule.status != BotScheduleStatus.Started
+            or bot_schedule.running_type == BotScheduleRunningType.Onetime
+        ):
+            continue
 
+        bot_cron_scheduled(bot, bot_schedule, schedule_model)
 
-async def _check_bot_schedule_runnable(interval_str: str):
-    current_time = SafeDateTime.now()
-    model_classes = ModelHelper.get_models_by_base_class(BaseBotScheduleModel)
-    records: list[tuple[BaseBotScheduleModel, BotSchedule, Bot]] = []
-    with DbSession.use(readonly=True) as db:
-        for model_class in model_classes:
-            result = db.exec(
-                SqlBuilder.select.tables(model_class, BotSchedule, Bot)
-                .join(
-                    BotSchedule,
-                    model_class.column("bot_schedule_id") == BotSchedule.column("id"),
-                )
-                .join(Bot, BotSchedule.column("bot_id") == Bot.column("id"))
-                .where(
-                    (BotSchedule.column("status") == BotScheduleStatus.Pending)
-                    & (BotSchedule.column("start_at") <= current_time)
-                    & (BotSchedule.column("interval_str") == interval_str)
-                )
-            )
-            records.extend(result.all())
 
-    with DbSession.use(readonly=False) as db:
-        db.exec(
-            SqlBuilder.update.table(BotSchedule)
-            .values({"status": BotScheduleStatus.Started})
-            .where(
-                (BotSchedule.column("status") == BotScheduleStatus.Pending)
-                & (BotSchedule.column("start_at") <= current_time)
-                & (BotSchedule.column("interval_str") == interval_str)
-                & (BotSchedule.column("running_type") == BotScheduleRunningType.Onetime)
-            )
-        )
+def _start_bot_schedule(
+    schedule_model: BaseBotScheduleModel, bot_schedule: BotSchedule, current_time: SafeDateTime
+) -> bool:
+    if not bot_schedule.start_at or bot_schedule.start_at > current_time:
+        return False
 
-    for schedule_model, bot_schedule, bot in records:
-        if bot_schedule.running_type == BotScheduleRunningType.Duration:
-            if (
-                not bot_schedule.start_at
-                or not bot_schedule.end_at
-                or bot_schedule.start_at >= bot_schedule.end_at
-                or bot_schedule.end_at < current_time
-            ):
-                continue
+    if bot_schedule.running_type == BotScheduleRunningType.Duration:
+        if (
+            not bot_schedule.end_at
+            or bot_schedule.start_at >= bot_schedule.end_at
+            or bot_schedule.end_at < current_time
+        ):
+            return False
 
-        BotScheduleHelper.change_status(
-            schedule_model.__class__,
-            schedule_model,
-            BotScheduleStatus.Started,
-            bot_schedule=bot_schedule,
-        )
+    BotScheduleHelper.change_status(
+        schedule_model.__class__,
+        schedule_model,
+        BotScheduleStatus.Started,
+        bot_schedule=bot_schedule,
+    )
 
-        model = BotHelper.get_target_model_by_bot_model("schedule", schedule_model)
-        if not model:
-            continue
+    model = BotHelper.get_target_model_by_bot_model("schedule", schedule_model)
+    if not model:
+        return False
 
-        project = None
-        if isinstance(model, ProjectColumn) or isinstance(model, Card):
-            with DbSession.use(readonly=True) as db:
-                result = db.exec(SqlBuilder.select.table(Project).where(Project.column("id") == model.project_id))
-                project = result.first()
+    project = None
+    if isinstance(model, ProjectColumn) or isinstance(model, Card):
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(SqlBuilder.select.table(Project).where(Project.column("id") == model.project_id))
+            project = result.first()
 
-        if project:
-            ProjectBotPublisher.rescheduled(project, schedule_model, {"status": bot_schedule.status.value})
+    if project:
+        ProjectBotPublisher.rescheduled(project, schedule_model, {"status": bot_schedule.status.value})
 
-        await _run_scheduler(bot, bot_schedule, schedule_model, model)
+    return True
 
 
 async def _run_scheduler(
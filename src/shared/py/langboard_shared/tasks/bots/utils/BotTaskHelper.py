@@ -1,3 +1,4 @@
+from asyncio import Semaphore, gather
 from typing import Any, overload
 from ....ai import BotDefaultTrigger
 from ....core.db import BaseSqlModel, DbSession, SqlBuilder
@@ -6,10 +7,12 @@ from ....core.types.BotRelatedTypes import AVAILABLE_BOT_TARGET_TABLES
 from ....core.utils.decorators import staticclass
 from ....domain.models import Bot, Project
 from ....domain.models.bases import BotTriggerCondition
+from ....Env import Env
 from ....helpers import BotHelper
 from ....helpers import BotHelper as BotHelperClass
 from ...webhooks import WebhookTask
 from ...webhooks.utils import WebhookModel
+from .requests.BaseBotRequest import BaseBotRequest
 from .requests.Utils import create_request
 
 
@@ -121,10 +124,22 @@ class BotTaskHelper:
 
         WebhookTask.webhook_task(WebhookModel(event=event.value, data=data))
 
+        requests: list[BaseBotRequest] = []
         for bot in bots:
             if isinstance(bot, tuple):
                 bot, scope_model = bot
             request = create_request(bot, event.value, data, project, scope_model)
-            if not request:
-                continue
-            await request.execute()
+            if request:
+                requests.append(request)
+
+        # The bots of an event are requested concurrently, a few at a time.
+        semaphore = Semaphore(max(Env.AI_REQUEST_MAX_CONCURRENCY, 1))
+
+        async def execute(request: BaseBotRequest) -> None:
+            async with semaphore:
+                try:
+                    await request.execute()
+                except Exception:
+                    logger.exception("Failed to run bot task: %s", event.value)
+
+        await gather(*[execute(request) for request in requests])
@@ -1,19 +1,31 @@
 from abc import ABC, abstractmethod
+from asyncio import sleep
+from random import uniform
 from typing import Any, TypedDict
-from httpx import TimeoutException, post
+from httpx import HTTPStatusError, Response, TimeoutException, TransportError
 from .....core.db import BaseSqlModel, DbSession
 from .....core.logger import Logger
 from .....core.utils.Converter import convert_python_data
-from .....domain.models import Bot, BotLog, Project
+from .....core.utils.HttpClientPool import HttpClientPool
+from .....domain.models import Bot, BotLog, BotLogStack, Project
 from .....domain.models.BaseBotModel import BotPlatform, BotPlatformRunningType
 from .....domain.models.bases import BaseBotLogModel
-from .....domain.models.BotLog import BotLogMessage, BotLogType
+from .....domain.models.BotLog import BotLogType
 from .....Env import Env
 from .....helpers import BotHelper
 from .....publishers import ProjectBotPublisher
+from .BotCircuitBreaker import BotCircuitBreaker
 
 
 logger = Logger.use("bot-task")
+_RETRY_BACKOFF_SECONDS = 1
+_RETRY_MAX_BACKOFF_SECONDS = 30
+_RETRY_STATUS_CODES = {429, 502, 503, 504}
+# Each platform has its own connections, so a slow platform cannot hold the connections of the others.
+_POOLS = {
+    platform: HttpClientPool(max_connections=Env.AI_REQUEST_MAX_CONNECTIONS, timeout=Env.AI_REQUEST_TIMEOUT)
+    for platform in BotPlatform
+}
 
 
 class RequestData(TypedDict, total=True):
@@ -41,6 +53,11 @@ class BaseBotRequest(ABC):
     async def execute(self) -> None:
         bot_log = await self._create_log(BotLogType.Info, f"'{self._event}' task started")
 
+        if BotCircuitBreaker.is_open(self._bot.id):
+            logger.warning("Skipped failing bot: %s(@%s)", self._bot.name, self._bot.bot_uname)
+            await self._update_log(bot_log, BotLogType.Error, "Skipped because the bot has failed repeatedly")
+            return
+
         request_data = self.create_request_data(bot_log)
         if not request_data:
             await self._update_log(bot_log, BotLogType.Error, "Invalid request data")
@@ -58,42 +75,53 @@ class BaseBotRequest(ABC):
         request_data: RequestData,
         headers: dict[str, Any],
         bot_log: tuple[BotLog, BaseBotLogModel | None],
-        retried: int = 0,
     ) -> None:
-        res = None
         request_data["data"] = convert_python_data(request_data["data"], recursive=True)
-
-        try:
-            res = post(
-                url=request_data["url"],
-                headers=headers,
-                json=request_data["data"],
-                timeout=Env.AI_REQUEST_TIMEOUT,
-            )
-            res.raise_for_status()
-            text = res.text
-            logger.info("Successfully requested bot: %s(@%s)", self._bot.name, self._bot.bot_uname)
-            log_type = self._get_start_request_log_type()
-            message = "Request successfully executed"
-            await self._update_log(bot_log, log_type, text if text else message)
-        except TimeoutException as e:
-            if retried < Env.AI_REQUEST_TRIALS:
-                return await self.request(request_data, headers, bot_log, retried + 1)
-            logger.error("Timeout while requesting bot: %s", e)
-            await self._update_log(bot_log, BotLogType.Error, str(e))
-        except Exception as e:
-            if res:
+        pool = _POOLS[self._bot.platform]
+
+        error = ""
+        for trial in range(max(Env.AI_REQUEST_TRIALS, 0) + 1):
+            if trial:
+                backoff = min(_RETRY_BACKOFF_SECONDS * 2 ** (trial - 1), _RETRY_MAX_BACKOFF_SECONDS)
+                await sleep(backoff * uniform(0.8, 1.2))
+
+            res: Response | None = None
+            try:
+                res = await pool.run(
+                    lambda client: client.post(url=request_data["url"], headers=headers, json=request_data["data"])
+                )
+                res.raise_for_status()
+            except HTTPStatusError:
                 logger.error(
                     "Failed to request bot: %s(@%s) %s: %s",
                     self._bot.name,
                     self._bot.bot_uname,
-                    str(res.status_code),
-                    res.text,
+                    str(res.status_code) if res else "",
+                    res.text if res else "",
                 )
-                await self._update_log(bot_log, BotLogType.Error, f"{res.status_code}: {res.text}")
-            else:
+                error = f"{res.status_code}: {res.text}" if res else "Unknown status"
+                if res and res.status_code in _RETRY_STATUS_CODES:
+                    continue
+                break
+            except (TimeoutException, TransportError) as e:
+                logger.error("Timeout or connection error while requesting bot: %s", e)
+                error = str(e) or type(e).__name__
+                continue
+            except Exception as e:
                 logger.error("Failed to request bot: %s(@%s)", self._bot.name, self._bot.bot_uname)
-                await self._update_log(bot_log, BotLogType.Error, str(e))
+                error = str(e)
+                break
+
+            BotCircuitBreaker.record_success(self._bot.id)
+            text = res.text
+            logger.info("Successfully requested bot: %s(@%s)", self._bot.name, self._bot.bot_uname)
+            log_type = self._get_start_request_log_type()
+            message = "Request successfully executed"
+            await self._update_log(bot_log, log_type, text if text else message)
+            return
+
+        BotCircuitBreaker.record_failure(self._bot.id)
+        await self._update_log(bot_log, BotLogType.Error, error)
 
     def _get_bot_request_headers(self) -> dict[str, Any]:
         headers = {
@@ -111,14 +139,12 @@ class BaseBotRequest(ABC):
         return headers
 
     async def _create_log(self, log_type: BotLogType, message: str):
-        bot_log = BotLog(
-            bot_id=self._bot.id,
-            log_type=log_type,
-            message_stack=[BotLogMessage(message=message, log_type=log_type)],
-        )
+        bot_log = BotLog(bot_id=self._bot.id, log_type=log_type)
 
         with DbSession.use(readonly=False) as db:
             db.insert(bot_log)
+            log_stack = BotLogStack(bot_log_id=bot_log.id, message=message, log_type=log_type)
+            db.insert(log_stack)
 
         if not self._scope_model:
             return bot_log, None
@@ -137,7 +163,7 @@ class BaseBotRequest(ABC):
             db.insert(scope_log)
 
         if self._project:
-            ProjectBotPublisher.log_created(self._project, (bot_log, scope_log))
+            ProjectBotPublisher.log_created(self._project, (bot_log, scope_log), [log_stack.to_message()])
         return bot_log, scope_log
 
     async def _update_log(
@@ -148,16 +174,14 @@ class BaseBotRequest(ABC):
     ) -> None:
         log, scope_log = bot_log
         log.log_type = log_type
-        log_stack = BotLogMessage(message=stack, log_type=log_type)
-        message_stack = log.message_stack
-        message_stack.append(log_stack)
-        log.message_stack = message_stack
+        log_stack = BotLogStack(bot_log_id=log.id, message=stack, log_type=log_type)
 
         with DbSession.use(readonly=False) as db:
             db.update(log)
+            db.insert(log_stack)
 
         if self._project and scope_log:
-            ProjectBotPublisher.log_stack_added(self._project, log, log_stack)
+            ProjectBotPublisher.log_stack_added(self._project, log, log_stack.to_message())
 
     def _get_start_request_log_type(self) -> BotLogType:
         if self._bot.platform == BotPlatform.Default:
@@ -0,0 +1,44 @@
+from threading import Lock
+from time import monotonic
+from .....core.utils.decorators import class_instance, thread_safe_singleton
+from .....Env import Env
+
+
+@class_instance()
+@thread_safe_singleton
+class BotCircuitBreaker:
+    """Skips the requests to a bot for :attr:`Env.AI_REQUEST_CIRCUIT_COOLDOWN` seconds once it has failed
+    :attr:`Env.AI_REQUEST_CIRCUIT_FAILURES` times in a row.
+
+    After the cooldown, one request is let through; the circuit closes again if it succeeds.
+    The failures are counted per process.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._failures: dict[int, int] = {}
+        self._opened_until: dict[int, float] = {}
+
+    def is_open(self, bot_id: int) -> bool:
+        with self._lock:
+            opened_until = self._opened_until.get(bot_id)
+            if opened_until is None:
+                return False
+            if monotonic() < opened_until:
+                return True
+
+            # Half-open: let one request through and keep the others out until it finishes.
+            self._opened_until[bot_id] = monotonic() + Env.AI_REQUEST_CIRCUIT_COOLDOWN
+            return False
+
+    def record_success(self, bot_id: int) -> None:
+        with self._lock:
+            self._failures.pop(bot_id, None)
+            self._opened_until.pop(bot_id, None)
+
+    def record_failure(self, bot_id: int) -> None:
+        with self._lock:
+            failures = self._failures.get(bot_id, 0) + 1
+            self._failures[bot_id] = failures
+            if failures >= max(Env.AI_REQUEST_CIRCUIT_FAILURES, 1):
+                self._opened_until[bot_id] = monotonic() + Env.AI_REQUEST_CIRCUIT_COOLDOWN
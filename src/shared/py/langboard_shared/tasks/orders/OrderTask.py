@@ -0,0 +1,12 @@
+from typing import Sequence
+from ...core.broker import Broker
+from ...helpers import InfraHelper, ModelHelper
+
+
+@Broker.wrap_async_task_decorator
+async def rebalance_order(table_name: str, column: str, parent_ids: Sequence[int]):
+    model_class = ModelHelper.get_model_by_table_name(table_name)
+    if not model_class:
+        return
+    for parent_id in parent_ids:
+        InfraHelper.rebalance_order(model_class, column, parent_id)
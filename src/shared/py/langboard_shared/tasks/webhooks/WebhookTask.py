@@ -1,11 +1,11 @@
 from typing import Any
-from httpx import post
 from ...core.broker import Broker
 from ...core.db import DbSession, SqlBuilder
 from ...core.types import SafeDateTime
 from ...domain.models import WebhookSetting
+from ...helpers import InfraHelper
 from ...publishers import AppSettingPublisher
-from .utils import WebhookModel
+from .utils import WebhookDispatcher, WebhookModel
 
 
 @Broker.wrap_async_task_decorator
@@ -14,48 +14,40 @@ async def webhook_task(model: WebhookModel):
 
 
 async def run_webhook(event: str, data: dict[str, Any]):
-    settings = _get_webhook_settings()
+    settings = WebhookDispatcher.get_settings()
     if not settings:
         return
 
-    for setting in settings:
-        res = None
-        try:
-            res = post(
-                setting.url,
-                json={"event": event, "data": data},
-            )
-            res.raise_for_status()
-
-            res = True
-        except Exception:
-            if res:
-                Broker.logger.error("Failed to request webhook: \nURL: %s\nResponse: %s", setting.url, res.text)
-            else:
-                Broker.logger.error("Failed to request webhook: \nURL: %s", setting.url)
-
-        if res:
-            setting.last_used_at = SafeDateTime.now()
-            setting.total_used_count += 1
-            with DbSession.use(readonly=False) as db:
-                db.update(setting)
-            AppSettingPublisher.webhook_setting_updated(
-                setting.get_uid(),
-                {
-                    "last_used_at": setting.last_used_at,
-                    "total_used_count": setting.total_used_count,
-                },
-            )
-
+    sent_ids = await WebhookDispatcher.dispatch(settings, event, data)
+    if sent_ids:
+        _increase_used_counts(sent_ids)
 
-def _get_webhook_settings() -> list[WebhookSetting]:
-    urls = None
-    with DbSession.use(readonly=True) as db:
-        result = db.exec(SqlBuilder.select.table(WebhookSetting))
-        urls = result.all()
-    if not urls:
-        return []
-    if not isinstance(urls, list):
-        return []
 
-    return urls
+def _increase_used_counts(setting_ids: list[int]) -> None:
+    last_used_at = SafeDateTime.now()
+    with DbSession.use(readonly=False) as db:
+        db.exec(
+            SqlBuilder.update.table(WebhookSetting)
+            .where(WebhookSetting.column("id").in_(setting_ids))
+            .values(
+                {
+                    WebhookSetting.column("last_used_at"): last_used_at,
+                    WebhookSetting.column("total_used_count"): WebhookSetting.column("total_used_count") + 1,
+                }
+            )
+        )
+        result = db.exec(
+            SqlBuilder.select.columns(WebhookSetting.column("id"), WebhookSetting.column("total_used_count")).where(
+                WebhookSetting.column("id").in_(setting_ids)
+            )
+        )
+        used_counts = result.all()
+
+    for setting_id, total_used_count in used_counts:
+        AppSettingPublisher.webhook_setting_updated(
+            InfraHelper.convert_uid(setting_id),
+            {
+                "last_used_at": last_used_at,
+                "total_used_count": total_used_count,
+            },
+        )
@@ -0,0 +1,180 @@
+from asyncio import gather, sleep
+from json import dumps as json_dumps
+from json import loads as json_loads
+from pathlib import Path
+from random import uniform
+from threading import Lock
+from typing import Any
+from httpx import AsyncClient, HTTPStatusError, Response
+from ....core.broker import Broker
+from ....core.caching import Cache
+from ....core.db import DbSession, SqlBuilder
+from ....core.types import SafeDateTime
+from ....core.utils.Converter import json_default
+from ....core.utils.decorators import class_instance, thread_safe_singleton
+from ....core.utils.HttpClientPool import HttpClientPool
+from ....domain.models import WebhookSetting
+from ....Env import Env
+
+
+_SETTINGS_CACHE_KEY = "webhook-settings"
+_SETTINGS_CACHE_TTL = 60 * 5
+_RETRY_BACKOFF_SECONDS = 0.5
+_RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+Cache.register_local_prefix(_SETTINGS_CACHE_KEY)
+
+
+@class_instance()
+@thread_safe_singleton
+class WebhookDispatcher:
+    """Sends an event to every webhook concurrently on a shared connection pool.
+
+    Each webhook is retried with exponential backoff on timeouts, connection errors and temporary error statuses.
+    Events that still fail are appended to :attr:`Env.WEBHOOK_DEAD_LETTER_FILE`, which is rotated by size and drained by
+    :meth:`replay_dead_letters` (``webhook:replay`` command).
+    """
+
+    def __init__(self):
+        self._pool = HttpClientPool(max_connections=Env.WEBHOOK_MAX_CONNECTIONS, timeout=Env.WEBHOOK_TIMEOUT)
+        self._dead_letter_lock = Lock()
+
+    def get_settings(self) -> list[dict[str, Any]]:
+        """Gets the ID and URL of every webhook, cached until a webhook setting changes."""
+        settings = Cache.get(_SETTINGS_CACHE_KEY)
+        if settings is not None:
+            return settings
+
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(SqlBuilder.select.columns(WebhookSetting.column("id"), WebhookSetting.column("url")))
+            settings = [{"id": setting_id, "url": url} for setting_id, url in result.all()]
+
+        Cache.set(_SETTINGS_CACHE_KEY, settings, _SETTINGS_CACHE_TTL)
+        return settings
+
+    def reset_settings(self) -> None:
+        """Drops the cached webhook settings once the current unit of work commits."""
+        DbSession.on_commit(lambda: Cache.delete(_SETTINGS_CACHE_KEY))
+
+    async def dispatch(self, settings: list[dict[str, Any]], event: str, data: dict[str, Any]) -> list[int]:
+        """Sends the event to the webhooks.
+
+        :param settings: Webhooks from :meth:`get_settings`
+        :param event: Event name
+        :param data: Event data
+        :return: IDs of the webhooks that received the event
+        """
+        content = json_dumps({"event": event, "data": data}, default=json_default).encode()
+
+        async def send_all(client: AsyncClient) -> list[bool]:
+            return await gather(*[self._send(client, setting, event, content) for setting in settings])
+
+        results = await self._pool.run(send_all)
+        return [setting["id"] for setting, is_sent in zip(settings, results) if is_sent]
+
+    async def _send(self, client: AsyncClient, setting: dict[str, Any], event: str, content: bytes) -> bool:
+        error = ""
+        for trial in range(max(Env.WEBHOOK_TRIALS, 1)):
+            if trial:
+                await sleep(_RETRY_BACKOFF_SECONDS * 2 ** (trial - 1) * uniform(0.8, 1.2))
+
+            res: Response | None = None
+            try:
+                res = await client.post(setting["url"], content=content, headers={"Content-Type": "application/json"})
+                res.raise_for_status()
+                return True
+            except HTTPStatusError:
+                error = f"{res.status_code}: {res.text}" if res else "Unknown status"
+                if res and res.status_code not in _RETRY_STATUS_CODES:
+                    break
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+        Broker.logger.error("Failed to request webhook: \nURL: %s\nResponse: %s", setting["url"], error)
+        self._dead_letter(setting, event, content, error)
+        return False
+
+    def _dead_letter(self, setting: dict[str, Any], event: str, content: bytes, error: str) -> None:
+        letter = {
+            "webhook_setting_id": setting["id"],
+            "url": setting["url"],
+            "event": event,
+            "payload": content.decode(),
+            "error": error,
+            "failed_at": SafeDateTime.now().isoformat(),
+        }
+        try:
+            with self._dead_letter_lock:
+                self._rotate_dead_letters()
+                with open(Env.WEBHOOK_DEAD_LETTER_FILE, "a", encoding="utf-8") as f:
+                    f.write(json_dumps(letter) + "\n")
+        except Exception:
+            Broker.logger.exception("Failed to write webhook dead letter: \nURL: %s", setting["url"])
+
+    async def replay_dead_letters(self) -> dict[str, int]:
+        """Resends the dead letters, oldest first, and removes them.
+
+        Letters of deleted webhooks are dropped and letters that fail again are dead-lettered again.
+
+        :return: Counts of the sent, failed and dropped letters
+        """
+        counts = {"sent": 0, "failed": 0, "dropped": 0}
+        claimed_files = self._claim_dead_letters()
+        if not claimed_files:
+            return counts
+
+        urls = {setting["id"]: setting["url"] for setting in self.get_settings()}
+        for claimed_file in claimed_files:
+            letters: list[tuple[dict[str, Any], str, bytes]] = []
+            with open(claimed_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    letter = json_loads(line)
+                    setting_id = letter["webhook_setting_id"]
+                    if setting_id not in urls:
+                        counts["dropped"] += 1
+                        continue
+                    setting = {"id": setting_id, "url": urls[setting_id]}
+                    letters.append((setting, letter["event"], letter["payload"].encode()))
+
+            async def send_all(client: AsyncClient) -> list[bool]:
+                return await gather(*[self._send(client, *letter) for letter in letters])
+
+            results = await self._pool.run(send_all) if letters else []
+            counts["sent"] += results.count(True)
+            counts["failed"] += results.count(False)
+            claimed_file.unlink(missing_ok=True)
+
+        return counts
+
+    def _get_dead_letter_files(self) -> list[Path]:
+        """Gets the dead letter file and its backups, newest first."""
+        dead_letter_file = Env.WEBHOOK_DEAD_LETTER_FILE
+        return [dead_letter_file] + [
+            dead_letter_file.with_name(f"{dead_letter_file.name}.{i}")
+            for i in range(1, max(Env.WEBHOOK_DEAD_LETTER_BACKUP_COUNT, 0) + 1)
+        ]
+
+    def _rotate_dead_letters(self) -> None:
+        dead_letter_file = Env.WEBHOOK_DEAD_LETTER_FILE
+        if not dead_letter_file.exists() or dead_letter_file.stat().st_size < Env.WEBHOOK_DEAD_LETTER_MAX_BYTES:
+            return
+
+        files = self._get_dead_letter_files()
+        files[-1].unlink(missing_ok=True)
+        for older_file, newer_file in zip(reversed(files), list(reversed(files))[1:]):
+            if newer_file.exists():
+                newer_file.replace(older_file)
+
+    def _claim_dead_letters(self) -> list[Path]:
+        """Moves the dead letter files aside, oldest first, so new failures are written to a fresh file meanwhile."""
+        claimed_at = SafeDateTime.now().strftime("%Y%m%d%H%M%S%f")
+        claimed_files: list[Path] = []
+        with self._dead_letter_lock:
+            for dead_letter_file in reversed(self._get_dead_letter_files()):
+                if not dead_letter_file.exists():
+                    continue
+                claimed_file = dead_letter_file.with_name(f"{dead_letter_file.name}.replay-{claimed_at}")
+                dead_letter_file.replace(claimed_file)
+                claimed_files.append(claimed_file)
+        return claimed_files
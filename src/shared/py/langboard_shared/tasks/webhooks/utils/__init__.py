@@ -1,8 +1,10 @@
 from .WebhookDataHelper import WebhookDataHelper
+from .WebhookDispatcher import WebhookDispatcher
 from .WebhookModel import WebhookModel
 
 
 __all__ = [
     "WebhookDataHelper",
+    "WebhookDispatcher",
     "WebhookModel",
 ]
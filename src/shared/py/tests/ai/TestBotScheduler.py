@@ -0,0 +1,122 @@
+from datetime import timedelta
+import pytest
+from sqlmodel import delete
+from langboard_shared.ai import BotScheduler
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import BotSchedule
+from langboard_shared.domain.models.BotSchedule import BotScheduleRunningType, BotScheduleStatus
+
+
+@pytest.fixture(autouse=True)
+def bot_schedule_table():
+    engine = DbEngine.get_main_engine()
+    BotSchedule.metadata.create_all(engine, tables=[BotSchedule.__table__])  # type: ignore
+    yield
+    with DbSession.use(readonly=False) as db:
+        db.exec(delete(BotSchedule), purge=True)
+
+
+@pytest.fixture
+def published_keys(monkeypatch: pytest.MonkeyPatch) -> list[str | None]:
+    keys: list[str | None] = []
+    monkeypatch.setattr(Cache, "publish_invalidation", keys.append)
+    return keys
+
+
+def _schedule(
+    running_type: BotScheduleRunningType,
+    status: BotScheduleStatus,
+    interval_str: str = "* * * * *",
+    start_at: SafeDateTime | None = None,
+) -> BotSchedule:
+    bot_schedule = BotSchedule(
+        bot_id=SnowflakeID(1), running_type=running_type, status=status, interval_str=interval_str, start_at=start_at
+    )
+    with DbSession.use(readonly=False) as db:
+        db.insert(bot_schedule)
+    return bot_schedule
+
+
+def test_loads_only_the_schedules_that_can_run():
+    start_at = SafeDateTime.now() + timedelta(days=1)
+    started = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+    reserved = _schedule(BotScheduleRunningType.Reserved, BotScheduleStatus.Pending, "*/5 * * * *", start_at)
+    _schedule(BotScheduleRunningType.Onetime, BotScheduleStatus.Started)
+    _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Stopped)
+    _schedule(BotScheduleRunningType.Reserved, BotScheduleStatus.Pending)
+
+    scheduler = BotScheduler(lambda _: None)
+    scheduler._reload()
+
+    assert set(scheduler._schedules) == {started.id, reserved.id}
+    first_run_at = scheduler._schedules[reserved.id][2]
+    assert start_at <= first_run_at < start_at + timedelta(minutes=5)
+    assert first_run_at.minute % 5 == 0
+
+
+def test_pops_the_due_schedules_and_queues_their_next_run():
+    now = SafeDateTime.now()
+    started = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+    onetime = _schedule(BotScheduleRunningType.Onetime, BotScheduleStatus.Pending, start_at=now)
+    later = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started, "0 0 1 1 *")
+
+    scheduler = BotScheduler(lambda _: None)
+    scheduler._reload()
+
+    assert scheduler._pop_due_ids(now) == []
+    due_at = now + timedelta(minutes=1)
+    assert sorted(scheduler._pop_due_ids(due_at)) == sorted([started.id, onetime.id])
+    assert scheduler._pop_due_ids(due_at) == []
+    assert set(scheduler._schedules) == {started.id, later.id}
+    assert scheduler._schedules[started.id][2] > due_at
+    assert scheduler._pop_due_ids(due_at + timedelta(minutes=1)) == [started.id]
+
+
+def test_notify_publishes_after_the_unit_of_work_commits(published_keys):
+    with DbSession.unit_of_work():
+        BotScheduler.notify([SnowflakeID(1), SnowflakeID(2)])
+        assert published_keys == []
+
+    assert len(published_keys) == 2
+
+
+def test_reloads_only_the_notified_schedules(published_keys):
+    first = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+    second = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+    scheduler = BotScheduler(lambda _: None)
+    scheduler._reload()
+
+    with DbSession.use(readonly=False) as db:
+        first.status = BotScheduleStatus.Stopped
+        db.update(first)
+        second.interval_str = "0 0 1 1 *"
+        db.update(second)
+    added = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+
+    BotScheduler.notify([first.id, added.id])
+    for key in published_keys:
+        scheduler._on_invalidated(key)
+    assert scheduler._wakeup.is_set()
+    scheduler._reload()
+
+    assert set(scheduler._schedules) == {second.id, added.id}
+    # The second schedule was not notified, so it keeps the interval it was loaded with.
+    assert scheduler._schedules[second.id][0] == "* * * * *"
+    assert sorted(scheduler._pop_due_ids(SafeDateTime.now() + timedelta(minutes=1))) == sorted([second.id, added.id])
+
+
+def test_reloads_every_schedule_after_a_full_invalidation():
+    scheduler = BotScheduler(lambda _: None)
+    scheduler._reload()
+    assert scheduler._schedules == {}
+
+    bot_schedule = _schedule(BotScheduleRunningType.Infinite, BotScheduleStatus.Started)
+    scheduler._reload()
+    assert scheduler._schedules == {}
+
+    scheduler._on_invalidated(None)
+    scheduler._reload()
+    assert set(scheduler._schedules) == {bot_schedule.id}
@@ -0,0 +1,48 @@
+from os import environ
+from pathlib import Path
+from tempfile import mkdtemp
+import pytest
+
+
+_TEST_DATA_DIR = Path(mkdtemp(prefix="langboard-tests-"))
+
+environ.setdefault("PROJECT_NAME", "langboard")
+environ.setdefault("MAIN_DATABASE_URL", f"sqlite:///{_TEST_DATA_DIR / 'main.db'}")
+environ.setdefault("CACHE_TYPE", "in-memory")
+
+from langboard_shared.Env import Env  # noqa: E402
+
+
+# Modules create their directories on import, so the data directory is moved before any of them are imported.
+setattr(type(Env), "DATA_DIR", property(lambda _: _TEST_DATA_DIR))
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Gives each test its own SQLite cache file."""
+    monkeypatch.setattr(type(Env), "CACHE_DIR", property(lambda _: tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def redis_cache(monkeypatch: pytest.MonkeyPatch):
+    """Creates a :class:`RedisCache` whose sync and async clients share one in-process fake Redis server."""
+    from importlib import import_module
+    from fakeredis import FakeAsyncRedis, FakeRedis, FakeServer
+
+    redis_cache_module = import_module("langboard_shared.core.caching.RedisCache")
+    server = FakeServer()
+
+    class FakeRedisFactory:
+        @staticmethod
+        def from_url(_: str, **kwargs):
+            return FakeRedis(server=server, **kwargs)
+
+    class FakeAsyncRedisFactory:
+        @staticmethod
+        def from_url(_: str, **kwargs):
+            return FakeAsyncRedis(server=server, **kwargs)
+
+    monkeypatch.setattr(redis_cache_module, "Redis", FakeRedisFactory)
+    monkeypatch.setattr(redis_cache_module, "AsyncRedis", FakeAsyncRedisFactory)
+    return redis_cache_module.RedisCache()
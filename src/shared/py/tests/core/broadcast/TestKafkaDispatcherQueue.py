@@ -0,0 +1,86 @@
+from importlib import import_module
+from json import loads as json_loads
+import pytest
+from langboard_shared.core.broadcast.DispatcherModel import DispatcherModel
+from langboard_shared.core.broadcast.kafka.KafkaDispatcherQueue import KafkaDispatcherQueue
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.caching.InMemoryCache import InMemoryCache
+from langboard_shared.Env import Env
+
+
+@pytest.fixture
+def producers(monkeypatch: pytest.MonkeyPatch) -> list:
+    created = []
+
+    class Future:
+        def __init__(self):
+            self.errbacks = []
+
+        def add_errback(self, func, *args):
+            self.errbacks.append((func, args))
+
+    class KafkaProducer:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            self.sent: list[tuple[str, bytes, Future]] = []
+            created.append(self)
+
+        def send(self, topic: str, value: bytes) -> Future:
+            future = Future()
+            self.sent.append((topic, value, future))
+            return future
+
+    monkeypatch.setattr(
+        import_module("langboard_shared.core.broadcast.kafka.KafkaDispatcherQueue"), "KafkaProducer", KafkaProducer
+    )
+    return created
+
+
+@pytest.fixture
+def cached_broadcasts(cache_dir, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(type(Env), "CACHE_TYPE", property(lambda _: "redis"))
+    monkeypatch.setattr(Cache, "_cache", InMemoryCache())
+    monkeypatch.setattr(Cache, "_local", None)
+
+
+def _set_inline_max_bytes(monkeypatch: pytest.MonkeyPatch, max_bytes: int) -> None:
+    monkeypatch.setattr(type(Env), "BROADCAST_INLINE_MAX_BYTES", property(lambda _: max_bytes))
+
+
+def test_sends_small_payloads_inline_on_one_batching_producer(producers):
+    queue = KafkaDispatcherQueue()
+
+    queue.put("socket", {"event": "a"})
+    queue.put(DispatcherModel(event="socket", data={"event": "b"}))
+
+    assert len(producers) == 1
+    assert producers[0].kwargs["compression_type"] == "gzip"
+    assert producers[0].kwargs["linger_ms"] == Env.BROADCAST_LINGER_MS
+    assert producers[0].kwargs["batch_size"] == Env.BROADCAST_BATCH_SIZE
+    assert [(topic, json_loads(value)) for topic, value, _ in producers[0].sent] == [
+        ("socket", {"data": {"event": "a"}}),
+        ("socket", {"data": {"event": "b"}}),
+    ]
+    assert all(future.errbacks for _, _, future in producers[0].sent)
+
+
+def test_sends_the_cache_key_of_payloads_over_the_limit(producers, cached_broadcasts, monkeypatch):
+    _set_inline_max_bytes(monkeypatch, 64)
+    queue = KafkaDispatcherQueue()
+
+    queue.put("socket", {"event": "small"})
+    queue.put("socket", {"event": "large", "content": "x" * 64})
+
+    small, large = [json_loads(value) for _, value, _ in producers[0].sent]
+    assert small == {"data": {"event": "small"}}
+    assert Cache.get(large["cache_key"]) == {"event": "large", "content": "x" * 64}
+
+
+def test_always_sends_the_cache_key_when_inlining_is_disabled(producers, cached_broadcasts, monkeypatch):
+    _set_inline_max_bytes(monkeypatch, 0)
+
+    KafkaDispatcherQueue().put("socket", {"event": "small"})
+
+    message = json_loads(producers[0].sent[0][1])
+    assert list(message) == ["cache_key"]
+    assert Cache.get(message["cache_key"]) == {"event": "small"}
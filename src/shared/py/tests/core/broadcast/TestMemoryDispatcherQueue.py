@@ -0,0 +1,99 @@
+import socket
+from importlib import import_module
+from json import loads as json_loads
+from pathlib import Path
+import pytest
+from langboard_shared.core.broadcast.memory.MemoryDispatcherQueue import MemoryDispatcherQueue
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    socket_path = tmp_path / "broadcast.sock"
+    monkeypatch.setattr(
+        import_module("langboard_shared.core.broadcast.memory.MemoryDispatcherQueue"),
+        "_BROADCAST_SOCKET_PATH",
+        socket_path,
+    )
+    return socket_path
+
+
+@pytest.fixture
+def recorded_files(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    recorded = []
+
+    def record_model(_, model, data=None, file_only=False):
+        recorded.append((model.data["event"], file_only))
+        return ""
+
+    monkeypatch.setattr(MemoryDispatcherQueue, "_record_model", record_model)
+    return recorded
+
+
+def _listen(socket_path: Path) -> socket.socket:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    server.settimeout(1)
+    return server
+
+
+def _read_events(connection: socket.socket, count: int) -> list[str]:
+    buffer = b""
+    while buffer.count(b"\n") < count:
+        buffer += connection.recv(65536)
+    return [json_loads(line)["data"]["event"] for line in buffer.splitlines()]
+
+
+def test_streams_events_as_lines_over_one_connection(socket_path, recorded_files):
+    server = _listen(socket_path)
+    queue = MemoryDispatcherQueue()
+
+    queue.put("socket", {"event": "a"})
+    queue.put("socket", {"event": "b"})
+
+    connection, _ = server.accept()
+    assert _read_events(connection, 2) == ["a", "b"]
+    with pytest.raises(TimeoutError):
+        server.accept()
+    assert recorded_files == []
+
+    connection.close()
+    server.close()
+
+
+def test_falls_back_to_files_until_the_socket_server_is_reachable(socket_path, recorded_files):
+    queue = MemoryDispatcherQueue()
+
+    queue.put("socket", {"event": "a"})
+    server = _listen(socket_path)
+    queue.put("socket", {"event": "b"})
+
+    assert recorded_files == [("a", True), ("b", True)]
+
+    # The connection is retried once the retry interval has passed.
+    queue._next_connect_at = 0
+    queue.put("socket", {"event": "c"})
+
+    connection, _ = server.accept()
+    assert _read_events(connection, 1) == ["c"]
+
+    connection.close()
+    server.close()
+
+
+def test_reconnects_in_a_forked_process(socket_path, recorded_files):
+    server = _listen(socket_path)
+    queue = MemoryDispatcherQueue()
+    queue.put("socket", {"event": "parent"})
+    parent_connection, _ = server.accept()
+
+    queue._socket_pid = -1
+    queue.put("socket", {"event": "child"})
+
+    child_connection, _ = server.accept()
+    assert _read_events(parent_connection, 1) == ["parent"]
+    assert _read_events(child_connection, 1) == ["child"]
+
+    parent_connection.close()
+    child_connection.close()
+    server.close()
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from json import dumps as json_dumps
+from langboard_shared.core.caching.CacheSerializer import BaseCacheSerializer, CacheSerializer, JsonCacheSerializer
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.core.utils.Converter import json_default
+from langboard_shared.domain.models.BotLog import BotLogMessage, BotLogType
+
+
+def _payload() -> dict:
+    return {
+        "id": SnowflakeID(1234567890123456789),
+        "created_at": datetime(2026, 1, 2, 3, 4, 5),
+        "updated_at": SafeDateTime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "log_type": BotLogType.Error,
+        "nested": {"ids": [SnowflakeID(1), SnowflakeID(2)], 3: "non-str key"},
+    }
+
+
+def test_round_trips_datetimes_snowflake_ids_and_enums():
+    serializer = JsonCacheSerializer()
+
+    assert serializer.loads(serializer.dumps(_payload())) == {
+        "id": 1234567890123456789,
+        "created_at": "2026-01-02T03:04:05+00:00",
+        "updated_at": "2026-01-02T03:04:05+00:00",
+        "log_type": "error",
+        "nested": {"ids": [1, 2], "3": "non-str key"},
+    }
+
+
+def test_matches_the_standard_library_encoding():
+    serializer = JsonCacheSerializer()
+
+    assert serializer.loads(serializer.dumps(_payload())) == serializer.loads(
+        json_dumps(_payload(), default=json_default)
+    )
+
+
+def test_falls_back_to_the_standard_library_for_integers_over_64_bits():
+    serializer = JsonCacheSerializer()
+
+    assert serializer.loads(serializer.dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_serializes_pydantic_models_as_json():
+    serializer = JsonCacheSerializer()
+    message = BotLogMessage(
+        message="done", log_type=BotLogType.Success, log_date=SafeDateTime(2026, 1, 2, tzinfo=timezone.utc)
+    )
+
+    assert BotLogMessage.model_validate(serializer.loads(serializer.dumps(message))) == message
+
+
+def test_uses_the_longest_registered_prefix(monkeypatch):
+    monkeypatch.setattr(CacheSerializer, "_CacheSerializer__serializers", [])
+
+    class PrefixSerializer(BaseCacheSerializer):
+        def __init__(self, name: str):
+            self.name = name
+
+        def dumps(self, value):
+            return self.name
+
+        def loads(self, raw_value):
+            return raw_value
+
+    short, long = PrefixSerializer("short"), PrefixSerializer("long")
+    CacheSerializer.register("test:", short)
+    CacheSerializer.register("test:long:", long)
+
+    assert CacheSerializer.get("test:long:key") is long
+    assert CacheSerializer.get("test:key") is short
+    assert CacheSerializer.get("other:key") is CacheSerializer.DEFAULT
@@ -0,0 +1,70 @@
+from time import monotonic
+from langboard_shared.core.caching.InMemoryCache import InMemoryCache
+
+
+def test_set_get_and_delete(cache_dir):
+    cache = InMemoryCache()
+
+    cache.set("key", {"value": 1}, ttl=60)
+    cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+    assert cache.get("key") == {"value": 1}
+    assert cache.get_many(["a", "missing", "b"]) == [1, None, 2]
+
+    cache.delete("key")
+    cache.delete_many(["a"])
+
+    assert cache.get("key") is None
+    assert cache.get_many(["a", "b"]) == [None, 2]
+
+
+def test_reuses_one_wal_connection_per_process(cache_dir):
+    cache = InMemoryCache()
+
+    with cache._lock:
+        conn = cache._get_cache_db()
+        assert cache._get_cache_db() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        # A forked worker must open its own connection.
+        cache._conn_pid = -1
+        assert cache._get_cache_db() is not conn
+
+
+def test_sweeps_expired_rows_in_batches(cache_dir, monkeypatch):
+    monkeypatch.setattr(InMemoryCache, "SWEEP_BATCH_SIZE", 3)
+    cache = InMemoryCache()
+    cache.set("alive", 1, ttl=60)
+    with cache._lock:
+        conn = cache._get_cache_db()
+        conn.executemany(
+            "INSERT INTO cache (key, value, expiry) VALUES (?, ?, ?)", [(f"expired-{i}", "1", 0) for i in range(10)]
+        )
+        conn.commit()
+
+    # Sweeps run at most once per interval.
+    cache._last_swept_at = monotonic()
+    cache.has("alive")
+    with cache._lock:
+        assert cache._get_cache_db().execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 11
+
+    cache._last_swept_at = 0
+    assert cache.has("alive")
+    with cache._lock:
+        assert cache._get_cache_db().execute("SELECT key FROM cache").fetchall() == [("alive",)]
+
+
+def test_hincr_keeps_only_positive_counters_and_never_returns_below_zero(cache_dir):
+    cache = InMemoryCache()
+
+    assert cache.hincr("running", "a", ttl=60) == 1
+    assert cache.hincr("running", "a", ttl=60) == 2
+    assert cache.hincr("running", "b", ttl=60) == 1
+
+    assert cache.hincr("running", "a", -2) == 0
+    assert cache.hincr("running", "a", -1) == 0
+    assert cache.hgetall("running") == {"b": 1}
+
+    assert cache.hincr("running", "b", -5) == 0
+    assert cache.hgetall("running") == {}
+    assert cache.hincr("running", "a") == 1
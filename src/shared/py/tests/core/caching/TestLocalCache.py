@@ -0,0 +1,70 @@
+from importlib import import_module
+from time import monotonic, sleep
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.caching.InMemoryCache import InMemoryCache
+from langboard_shared.core.caching.LocalCache import LocalCache
+
+
+def test_evicts_the_least_recently_used_key():
+    local = LocalCache(max_size=2, ttl=60)
+    local.put("a", 1, local.generation)
+    local.put("b", 2, local.generation)
+
+    assert local.get("a") == (True, 1)
+    local.put("c", 3, local.generation)
+
+    assert local.get("b") == (False, None)
+    assert local.get("a") == (True, 1) and local.get("c") == (True, 3)
+    assert local.stats() == {"size": 2, "max_size": 2, "hits": 3, "misses": 1, "evictions": 1}
+
+
+def test_expires_values_after_the_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(import_module("langboard_shared.core.caching.LocalCache"), "monotonic", lambda: now[0])
+    local = LocalCache(max_size=2, ttl=60)
+    local.put("a", 1, local.generation)
+
+    now[0] += 59
+    assert local.get("a") == (True, 1)
+
+    now[0] += 1
+    assert local.get("a") == (False, None)
+    assert local.stats()["size"] == 0
+
+
+def test_does_not_store_values_fetched_before_an_invalidation():
+    local = LocalCache(max_size=2, ttl=60)
+    generation = local.generation
+
+    local.invalidate("a")
+    local.put("a", "stale", generation)
+
+    assert local.get("a") == (False, None)
+
+
+def test_serves_local_prefixes_from_the_process_until_another_worker_invalidates(cache_dir, monkeypatch):
+    monkeypatch.setattr(InMemoryCache, "INVALIDATION_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(Cache, "_cache", InMemoryCache())
+    monkeypatch.setattr(Cache, "_local", LocalCache(16, 60))
+    monkeypatch.setattr(Cache, "_local_prefixes", ("local:",))
+    monkeypatch.setattr(Cache, "_listening_pid", None)
+    other_worker = InMemoryCache()
+
+    other_worker.set("local:a", {"value": 1}, 60)
+    other_worker.set("remote:b", {"value": 1}, 60)
+    assert Cache.get("local:a") == {"value": 1}
+    assert Cache.get_many(["local:a", "remote:b"]) == [{"value": 1}, {"value": 1}]
+    assert Cache.local_stats()["hits"] == 1
+    assert Cache.local_stats()["hit_rate"] == 0.5
+
+    other_worker.set("local:a", {"value": 2}, 60)
+    other_worker.set("remote:b", {"value": 2}, 60)
+    assert Cache.get("local:a") == {"value": 1}
+    assert Cache.get("remote:b") == {"value": 2}
+
+    other_worker.publish_invalidation("local:a")
+    deadline = monotonic() + 5
+    while Cache.get("local:a") != {"value": 2} and monotonic() < deadline:
+        sleep(0.01)
+
+    assert Cache.get("local:a") == {"value": 2}
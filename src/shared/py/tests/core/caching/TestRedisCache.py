@@ -0,0 +1,75 @@
+import asyncio
+from os import getpid
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.caching.LocalCache import LocalCache
+from langboard_shared.core.caching.RedisCache import RedisCache
+
+
+async def test_async_operations(redis_cache):
+    await redis_cache.aset("a", {"value": 1}, ttl=60)
+    await redis_cache.amset({"b": 2, "c": 3})
+
+    assert await redis_cache.aget("a") == {"value": 1}
+    assert await redis_cache.amget(["a", "missing", "c"]) == [{"value": 1}, None, 3]
+
+    await redis_cache.adelete_many(["a", "b"])
+
+    assert redis_cache.get_many(["a", "b", "c"]) == [None, None, 3]
+
+
+async def test_async_writes_publish_invalidations_on_the_async_client(redis_cache, monkeypatch):
+    def publish_blocking(*_):
+        raise AssertionError("Async writes must not publish with the blocking client.")
+
+    monkeypatch.setattr(RedisCache, "publish_invalidation", publish_blocking)
+    monkeypatch.setattr(Cache, "_cache", redis_cache)
+    monkeypatch.setattr(Cache, "_local", LocalCache(16, 60))
+    monkeypatch.setattr(Cache, "_local_prefixes", ("local:",))
+    monkeypatch.setattr(Cache, "_listening_pid", getpid())
+
+    pubsub = redis_cache._get_async_cache().pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(RedisCache.INVALIDATION_CHANNEL)
+
+    await Cache.aset("local:a", 1)
+    await Cache.amset({"local:b": 2, "remote:c": 3})
+    await Cache.adelete("local:a")
+
+    keys = []
+    for _ in range(5):
+        message = await pubsub.get_message(timeout=0.1)
+        if message:
+            keys.append(message["data"])
+    await pubsub.aclose()
+
+    assert keys == ["local:a", "local:b", "local:a"]
+
+
+def test_closes_async_clients_when_their_loop_shuts_down(redis_cache):
+    connections = []
+
+    async def use_cache():
+        await redis_cache.aset("a", 1)
+        connections.extend(redis_cache._get_async_cache().connection_pool._available_connections)
+
+    asyncio.run(use_cache())
+
+    assert connections
+    assert all(not connection.is_connected for connection in connections)
+    assert not redis_cache._async_caches
+    assert not redis_cache._async_cache_closers
+
+
+async def test_hincr_keeps_only_positive_counters_and_never_returns_below_zero(redis_cache):
+    assert await redis_cache.ahincr("running", "a", ttl=60) == 1
+    assert await redis_cache.ahincr("running", "a", ttl=60) == 2
+    assert redis_cache.hincr("running", "b", ttl=60) == 1
+    assert 0 < redis_cache._cache.ttl("running") <= 60
+
+    assert await redis_cache.ahincr("running", "a", -1) == 1
+    assert await redis_cache.ahincr("running", "a", -1) == 0
+    assert await redis_cache.ahincr("running", "a", -1) == 0
+    assert redis_cache.hgetall("running") == {"b": 1}
+
+    assert redis_cache.hincr("running", "b", -5) == 0
+    assert redis_cache.hgetall("running") == {}
+    assert await redis_cache.ahincr("running", "a") == 1
@@ -0,0 +1,90 @@
+from typing import Any
+from langboard_shared.core.db import ApiField, BaseSqlModel, EditorContentModel
+from langboard_shared.core.storage import FileModel
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import Bot, Card, User
+
+
+def _field_convert(model: BaseSqlModel, **kwargs: Any) -> dict[str, Any]:
+    """Converts the model field by field, as before the plan was compiled."""
+    api_result: dict[str, Any] = {}
+    for field_name, api_field, _ in ApiField._ApiField__iter_api_fields(model.__class__):  # type: ignore
+        api_result.update(api_field.field_convert(model, field_name, getattr(model, field_name, None), **kwargs))
+    return api_result
+
+
+def _card() -> Card:
+    return Card(
+        id=SnowflakeID(),
+        project_id=SnowflakeID(),
+        project_column_id=SnowflakeID(),
+        title="Card",
+        description=EditorContentModel(content="content"),
+        deadline_at=SafeDateTime.now(),
+        order=3,
+    )
+
+
+def _bot() -> Bot:
+    return Bot(
+        id=SnowflakeID(),
+        name="Bot",
+        bot_uname="bot",
+        avatar=FileModel(
+            storage_type="local",
+            storage_name="bot",
+            original_filename="avatar.png",
+            filename="avatar.png",
+            path="avatar.png",
+        ),
+        api_url="http://localhost",
+        app_api_token="0123456789abcdef",
+        ip_whitelist=["127.0.0.1"],
+    )
+
+
+def test_plan_matches_the_field_by_field_conversion():
+    card, bot = _card(), _bot()
+
+    assert ApiField.convert(card) == _field_convert(card)
+    assert ApiField.convert(bot) == _field_convert(bot)
+    assert ApiField.convert(bot, is_setting=True) == _field_convert(bot, is_setting=True)
+
+
+def test_plan_applies_conditions_and_converters():
+    bot = _bot()
+
+    assert "api_url" not in ApiField.convert(bot)
+    setting = ApiField.convert(bot, is_setting=True)
+    assert setting["api_url"] == "http://localhost"
+    assert setting["app_api_token"] == "01234567********"
+    assert setting["avatar"] == "avatar.png"
+    assert setting["uid"] == bot.get_uid()
+
+
+def test_plan_is_built_once_per_model_class():
+    assert ApiField.get_plan(Card) is ApiField.get_plan(Card)
+    assert ApiField.get_plan(Card) is not ApiField.get_plan(Bot)
+
+
+def test_convert_many_matches_convert():
+    models = [_card(), _bot(), _card()]
+
+    assert ApiField.convert_many(models, is_setting=True) == [
+        ApiField.convert(model, is_setting=True) for model in models
+    ]
+
+
+def test_api_response_many_keeps_overridden_api_responses():
+    user = User(
+        id=SnowflakeID(),
+        firstname="First",
+        lastname="Last",
+        email="user@langboard.test",
+        username="user",
+        password="password",
+    )
+    card = _card()
+
+    assert BaseSqlModel.api_response_many([user, card]) == [user.api_response(), card.api_response()]
+    assert BaseSqlModel.api_response_many([user])[0]["type"] == User.USER_TYPE
@@ -0,0 +1,77 @@
+from gc import collect
+from sys import getrefcount
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import Card
+
+
+def _card(card_id: int = 1, title: str = "a") -> Card:
+    # Constructing a model with an ID tracks the constructor values, so start clean like a loaded model.
+    card = Card(id=SnowflakeID(card_id), project_id=1, project_column_id=1, title=title)
+    card.clear_changes()
+    return card
+
+
+def test_tracks_the_first_old_value_of_each_changed_field():
+    card = _card()
+    assert not card.has_changes()
+
+    card.title = "b"
+    card.title = "c"
+    card.order = 3
+
+    assert card.changes == {"title": "a", "order": 0}
+
+
+def test_setting_the_old_value_back_drops_the_change():
+    card = _card()
+
+    card.title = "b"
+    card.title = "a"
+
+    assert not card.has_changes()
+    assert card.changes == {}
+
+
+def test_does_not_track_new_objects_or_the_id():
+    card = Card(project_id=1, project_column_id=1, title="a")
+    card.title = "b"
+    assert not card.has_changes()
+
+    card.id = SnowflakeID(1)
+    assert not card.has_changes()
+    card.title = "c"
+    assert card.changes == {"title": "b"}
+
+
+def test_clear_changes():
+    card = _card()
+    card.title = "b"
+
+    card.clear_changes()
+
+    assert not card.has_changes()
+    card.title = "c"
+    assert card.changes == {"title": "b"}
+
+
+def test_instances_with_the_same_id_keep_their_own_changes():
+    first, second = _card(), _card()
+
+    first.title = "b"
+
+    assert first.changes == {"title": "a"}
+    assert not second.has_changes()
+    second.clear_changes()
+    assert first.changes == {"title": "a"}
+
+
+def test_changes_are_freed_with_the_instance():
+    card = _card()
+    card.title = "b"
+    changes = card.__dict__["_changes"]
+
+    del card
+    collect()
+
+    # Only `changes` and the argument of getrefcount are left.
+    assert getrefcount(changes) == 2
@@ -0,0 +1,170 @@
+import pytest
+from sqlalchemy import inspect, true
+from sqlalchemy.orm import aliased
+from sqlmodel import delete, select
+from langboard_shared.core.db import BaseSqlModel, DbSession, Field
+from langboard_shared.core.db.DbEngine import DbEngine
+
+
+class UnitOfWorkItem(BaseSqlModel, table=True):
+    name: str = Field(nullable=False)
+
+    def notification_data(self) -> dict:
+        return {}
+
+    def _get_repr_keys(self) -> list[str | tuple[str, str]]:
+        return ["name"]
+
+
+@pytest.fixture(autouse=True)
+def items_table():
+    engine = DbEngine.get_main_engine()
+    UnitOfWorkItem.metadata.create_all(engine, tables=[UnitOfWorkItem.__table__])  # type: ignore
+    yield
+    with DbSession.use(readonly=False) as db:
+        db.exec(delete(UnitOfWorkItem))
+
+
+def _insert(name: str) -> None:
+    with DbSession.use(readonly=False) as db:
+        db.insert(UnitOfWorkItem(name=name))
+
+
+def _names() -> list[str]:
+    with DbSession.use(readonly=True) as db:
+        return sorted(item.name for item in db.exec(select(UnitOfWorkItem)).all())
+
+
+def test_commits_the_writes_once_on_exit():
+    committed = []
+    with DbSession.unit_of_work() as unit:
+        _insert("a")
+        _insert("b")
+        DbSession.on_commit(lambda: committed.append(_names()))
+        assert _names() == ["a", "b"]
+        assert not unit.is_closed
+
+    assert committed == [["a", "b"]]
+    assert _names() == ["a", "b"]
+
+
+def test_rolls_back_every_write_when_an_exception_escapes():
+    committed = []
+    with pytest.raises(RuntimeError):
+        with DbSession.unit_of_work():
+            _insert("a")
+            DbSession.on_commit(lambda: committed.append(True))
+            raise RuntimeError()
+
+    assert committed == []
+    assert _names() == []
+
+
+def test_caught_exception_rolls_back_only_its_own_block():
+    committed = []
+    with DbSession.unit_of_work():
+        _insert("a")
+        DbSession.on_commit(lambda: committed.append("a"))
+
+        try:
+            with DbSession.use(readonly=False) as db:
+                db.insert(UnitOfWorkItem(name="b"))
+                DbSession.on_commit(lambda: committed.append("b"))
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        with DbSession.use(readonly=False) as db:
+            db.insert(UnitOfWorkItem(name="c"))
+            try:
+                _insert("d")
+                with DbSession.use(readonly=False) as nested_db:
+                    nested_db.insert(UnitOfWorkItem(name="e"))
+                    raise RuntimeError()
+            except RuntimeError:
+                pass
+
+    assert committed == ["a"]
+    assert _names() == ["a", "c", "d"]
+
+
+def test_isolated_unit_of_work_does_not_join_the_enclosing_one():
+    with DbSession.unit_of_work() as outer:
+        with DbSession.unit_of_work() as joined:
+            assert joined is outer
+
+        with DbSession.unit_of_work(isolated=True) as inner:
+            assert inner is not outer
+            _insert("a")
+
+        assert inner.is_closed
+        assert not outer.is_closed
+        with DbSession.unit_of_work() as joined:
+            assert joined is outer
+
+    assert _names() == ["a"]
+
+
+def test_expunge_detaches_the_selected_models():
+    _insert("a")
+
+    with DbSession.use(readonly=False) as db:
+        item = db.exec(select(UnitOfWorkItem)).first()
+        assert item is not None
+        item.name = "changed"
+        assert inspect(item).detached
+
+    assert _names() == ["a"]
+
+
+def test_expunge_copies_a_model_repeated_in_later_rows():
+    _insert("a")
+    _insert("b")
+    other = aliased(UnitOfWorkItem)
+
+    with DbSession.use(readonly=True) as db:
+        items = db.exec(
+            select(UnitOfWorkItem).join(other, true()).order_by(UnitOfWorkItem.column("name"), other.column("name"))
+        ).all()
+
+    assert [item.name for item in items] == ["a", "a", "b", "b"]
+    assert len({id(item) for item in items}) == 4
+    assert inspect(items[0]).detached and inspect(items[2]).detached
+    assert inspect(items[1]).transient and inspect(items[3]).transient
+
+
+def test_expunge_shares_the_models_of_multi_column_rows():
+    _insert("a")
+
+    with DbSession.use(readonly=True) as db:
+        rows = db.exec(select(UnitOfWorkItem, UnitOfWorkItem.column("name"))).all()
+
+    item, name = rows[0]
+    assert name == "a"
+    assert inspect(item).detached
+
+
+def test_copy_returns_validated_copies():
+    _insert("a")
+
+    with DbSession.use(readonly=False) as db:
+        item = db.exec(select(UnitOfWorkItem), detach="copy").first()
+        assert item is not None
+        assert inspect(item).transient
+        item.name = "changed"
+
+    assert _names() == ["a"]
+
+
+def test_update_merges_and_keeps_the_given_model_detached():
+    _insert("a")
+    with DbSession.use(readonly=True) as db:
+        item = db.exec(select(UnitOfWorkItem)).first()
+    assert item is not None
+
+    item.name = "b"
+    with DbSession.use(readonly=False) as db:
+        db.update(item)
+        assert inspect(item).detached
+
+    assert _names() == ["b"]
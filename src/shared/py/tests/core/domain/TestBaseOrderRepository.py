@@ -0,0 +1,114 @@
+from importlib import import_module
+import pytest
+from sqlmodel import delete, select
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.domain.models import Card
+from langboard_shared.Env import Env
+from langboard_shared.helpers import InfraHelper
+from langboard_shared.infrastructure.repositories.factory.CardRepository import CardRepository
+
+
+PROJECT_ID = 1
+COLUMN_ID = 10
+
+
+@pytest.fixture(autouse=True)
+def cards_table():
+    Card.metadata.create_all(DbEngine.get_main_engine(), tables=[Card.__table__])  # type: ignore
+    yield
+    with DbSession.use(readonly=False) as db:
+        db.exec(delete(Card), purge=True)
+
+
+@pytest.fixture
+def queued_rebalances(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, list[int]]]:
+    queued = []
+
+    class OrderTask:
+        @staticmethod
+        def rebalance_order(table_name: str, column: str, parent_ids: list[int]):
+            queued.append((table_name, column, parent_ids))
+
+    monkeypatch.setattr(import_module("langboard_shared.core.domain.BaseOrderRepository"), "OrderTask", OrderTask)
+    return queued
+
+
+def _set_order_mode(monkeypatch: pytest.MonkeyPatch, order_mode: str) -> None:
+    monkeypatch.setattr(type(Env), "ORDER_MODE", property(lambda _: order_mode))
+
+
+def _create_cards(repository: CardRepository, titles: list[str]) -> list[Card]:
+    cards = [
+        Card(project_id=PROJECT_ID, project_column_id=COLUMN_ID, title=title, order=order)
+        for order, title in enumerate(titles)
+    ]
+    repository.insert(cards)
+    with DbSession.use(readonly=True) as db:
+        return list(db.exec(select(Card).order_by(Card.column("order"))).all())
+
+
+def _stored_cards() -> dict[str, tuple[int, str | None]]:
+    with DbSession.use(readonly=True) as db:
+        return {card.title: (card.order, card.order_key) for card in db.exec(select(Card)).all()}
+
+
+def _key(order_key: str | None) -> str:
+    assert order_key is not None
+    return order_key
+
+
+def test_key_mode_moves_only_the_moved_row(monkeypatch, queued_rebalances):
+    _set_order_mode(monkeypatch, "key")
+    repository = CardRepository(lambda _: None, lambda _: None)
+    a, b, c = _create_cards(repository, ["a", "b", "c"])
+    assert a.order_key and b.order_key and c.order_key
+    assert a.order_key < b.order_key < c.order_key
+    before = _stored_cards()
+
+    repository.update_row_order(a, COLUMN_ID, 0, 2)
+
+    after = _stored_cards()
+    assert after["b"] == before["b"] and after["c"] == before["c"]
+    assert after["a"][0] == 2
+    assert _key(after["a"][1]) > _key(before["c"][1])
+    assert queued_rebalances == []
+    assert [(card.title, card.order) for card in repository.get_all_by_column(COLUMN_ID)] == [
+        ("b", 0),
+        ("c", 1),
+        ("a", 2),
+    ]
+
+
+def test_key_mode_rebalances_once_a_key_gets_too_long(monkeypatch, queued_rebalances):
+    _set_order_mode(monkeypatch, "key")
+    repository = CardRepository(lambda _: None, lambda _: None)
+    _create_cards(repository, ["a", "b", "c"])
+
+    # Moving the last card between the first two keeps narrowing the gap, so the new keys get longer.
+    moves = 0
+    while not queued_rebalances and moves < 200:
+        last_card = repository.get_all_by_column(COLUMN_ID)[-1]
+        repository.update_row_order(last_card, COLUMN_ID, 2, 1)
+        moves += 1
+
+    assert queued_rebalances == [("card", "project_column_id", [COLUMN_ID])]
+    assert max(len(_key(order_key)) for _, order_key in _stored_cards().values()) > Env.ORDER_KEY_MAX_LENGTH
+    assert moves > 1
+
+
+def test_index_mode_leaves_keys_empty_and_key_mode_rebuilds_them_from_order(monkeypatch, queued_rebalances):
+    _set_order_mode(monkeypatch, "index")
+    repository = CardRepository(lambda _: None, lambda _: None)
+    a, _, _ = _create_cards(repository, ["a", "b", "c"])
+    assert set(_stored_cards().values()) == {(0, None), (1, None), (2, None)}
+
+    repository.update_row_order(a, COLUMN_ID, 0, 2)
+    assert [title for title, _ in sorted(_stored_cards().items(), key=lambda item: item[1][0])] == ["b", "c", "a"]
+
+    _set_order_mode(monkeypatch, "key")
+    InfraHelper.rebalance_order(Card, "project_column_id", COLUMN_ID)
+
+    stored = _stored_cards()
+    assert [title for title, _ in sorted(stored.items(), key=lambda item: _key(item[1][1]))] == ["b", "c", "a"]
+    assert queued_rebalances == []
@@ -0,0 +1,85 @@
+from importlib import import_module
+import pytest
+from langboard_shared.core.publisher import BaseSocketPublisher, SocketPublishBuffer, SocketPublishModel
+
+
+@pytest.fixture
+def dispatched(monkeypatch: pytest.MonkeyPatch) -> list[list[dict]]:
+    """Collects the publish models of every dispatched socket publish."""
+    publisher_module = import_module("langboard_shared.core.publisher.BaseSocketPublisher")
+    dispatched: list[list[dict]] = []
+
+    class DispatcherQueue:
+        @staticmethod
+        def put(model):
+            publish_models = model.data["publish_models"]
+            dispatched.append(publish_models if isinstance(publish_models, list) else [publish_models])
+
+    monkeypatch.setattr(publisher_module, "DispatcherQueue", DispatcherQueue)
+    return dispatched
+
+
+def _publish(event: str, **custom_data):
+    BaseSocketPublisher.put_dispather(
+        {}, SocketPublishModel(topic="board", topic_id="project", event=event, custom_data=custom_data)
+    )
+
+
+def _events(publish_models: list[dict]) -> list[tuple[str, dict]]:
+    return [(model["event"], model["custom_data"]) for model in publish_models]
+
+
+def test_merges_only_mergeable_events(dispatched):
+    with BaseSocketPublisher.batch():
+        _publish("board:card:created:column", uid="a")
+        _publish("board:card:details:changed:a", title="first")
+        _publish("board:card:created:column", uid="b")
+        _publish("board:card:details:changed:a", title="second", description="text")
+        _publish("board:card:deleted:column", uid="a")
+
+    assert len(dispatched) == 1
+    assert _events(dispatched[0]) == [
+        ("board:card:created:column", {"uid": "a"}),
+        ("board:card:details:changed:a", {"title": "second", "description": "text"}),
+        ("board:card:created:column", {"uid": "b"}),
+        ("board:card:deleted:column", {"uid": "a"}),
+    ]
+
+
+def test_nested_batches_dispatch_with_the_outermost_batch(dispatched):
+    with BaseSocketPublisher.batch() as outer:
+        _publish("board:card:created:column", uid="a")
+        with BaseSocketPublisher.batch() as inner:
+            assert inner is outer
+            _publish("board:card:created:column", uid="b")
+        assert dispatched == []
+
+    assert _events(dispatched[0]) == [
+        ("board:card:created:column", {"uid": "a"}),
+        ("board:card:created:column", {"uid": "b"}),
+    ]
+
+
+def test_nested_batch_after_a_flush_gets_its_own_buffer(dispatched):
+    with BaseSocketPublisher.batch() as outer:
+        _publish("board:card:created:column", uid="a")
+        outer.flush()
+        _publish("board:card:created:column", uid="b")
+        with BaseSocketPublisher.batch() as inner:
+            assert inner is not outer
+            _publish("board:card:created:column", uid="c")
+            _publish("board:card:created:column", uid="d")
+
+    assert [_events(publish_models) for publish_models in dispatched] == [
+        [("board:card:created:column", {"uid": "a"})],
+        [("board:card:created:column", {"uid": "b"})],
+        [("board:card:created:column", {"uid": "c"}), ("board:card:created:column", {"uid": "d"})],
+    ]
+
+
+def test_is_mergeable():
+    assert SocketPublishBuffer.is_mergeable("bot:updated:uid")
+    assert SocketPublishBuffer.is_mergeable("board:wiki:details:changed:uid")
+    assert SocketPublishBuffer.is_mergeable("project:updated")
+    assert not SocketPublishBuffer.is_mergeable("board:card:created:uid")
+    assert not SocketPublishBuffer.is_mergeable("board:card:order:changed:uid")
@@ -0,0 +1,102 @@
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import BaseRoute, Match, Mount, Route
+from starlette.testclient import TestClient
+from langboard_shared.core.routing.RouteMatcher import ROUTE_MATCH_SCOPE_KEY, RouteMatcher
+
+
+def _route(path: str, name: str, methods: list[str] | None = None) -> Route:
+    async def endpoint(request):
+        return PlainTextResponse(name)
+
+    return Route(path, endpoint, name=name, methods=methods or ["GET"])
+
+
+def _routes() -> list[BaseRoute]:
+    return [
+        _route("/board/{project_uid}", "project"),
+        _route("/board/{project_uid}/cards", "cards"),
+        _route("/board/{project_uid}/card/{card_uid}", "card"),
+        _route("/board/{project_uid}/card/{card_uid}", "update_card", ["PUT"]),
+        _route("/board/archive/cards", "archive_cards"),
+        _route("/board/{project_uid}/{card_uid}", "short_card"),
+        _route("/files/{file_path:path}", "file"),
+        Mount("/static", routes=[_route("/{name}", "static")]),
+        _route("/", "root"),
+    ]
+
+
+def _scope(method: str, path: str) -> dict:
+    return {"type": "http", "method": method, "path": path, "root_path": ""}
+
+
+def _linear_match(routes: list[BaseRoute], scope: dict) -> BaseRoute | None:
+    for route in routes:
+        matches, _ = route.matches(scope)
+        if matches == Match.FULL:
+            return route
+    return None
+
+
+def test_matches_the_same_route_as_the_linear_scan():
+    routes = _routes()
+    matcher = RouteMatcher(routes)
+    paths = [
+        "/",
+        "/board/p1",
+        "/board/p1/cards",
+        "/board/archive/cards",
+        "/board/p1/card/c1",
+        "/board/p1/c1",
+        "/board/p1/card",
+        "/board/p1/card/c1/extra",
+        "/board/",
+        "/files/a/b/c.png",
+        "/static/app.js",
+        "/missing",
+        "",
+    ]
+
+    for method in ("GET", "PUT", "POST"):
+        for path in paths:
+            result = matcher.match(_scope(method, path))
+            assert (result[0] if result else None) is _linear_match(routes, _scope(method, path)), (method, path)
+
+
+def test_keeps_the_match_in_the_scope():
+    routes = _routes()
+    matcher = RouteMatcher(routes)
+    scope = _scope("GET", "/board/p1/cards")
+
+    result = matcher.match(scope)
+    assert result is not None and result[0] is routes[1]
+    assert scope[ROUTE_MATCH_SCOPE_KEY][3] is result
+
+    # A second matcher over the same routes reuses the match.
+    assert RouteMatcher(routes).match(scope) is result
+    scope["path"] = "/board/p1"
+    assert RouteMatcher(routes).match(scope)[0] is routes[0]  # type: ignore
+
+
+def test_indexes_routes_added_later():
+    routes = _routes()
+    matcher = RouteMatcher(routes)
+    assert matcher.match(_scope("GET", "/later")) is None
+
+    routes.append(_route("/later", "later"))
+
+    result = matcher.match(_scope("GET", "/later"))
+    assert result is not None and result[0] is routes[-1]
+
+
+def test_bound_router_handles_matched_and_unmatched_requests():
+    app = Starlette(routes=_routes())
+    RouteMatcher(app.router.routes).bind_router(app.router)
+    client = TestClient(app)
+
+    assert client.get("/board/p1/card/c1").text == "card"
+    assert client.put("/board/p1/card/c1").text == "update_card"
+    assert client.get("/static/app.js").text == "static"
+    assert client.get("/files/a/b/c.png").text == "file"
+    assert client.get("/missing").status_code == 404
+    assert client.post("/board/p1/cards").status_code == 405
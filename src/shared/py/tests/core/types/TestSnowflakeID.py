@@ -0,0 +1,61 @@
+from random import Random
+import pytest
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.core.types.SnowflakeID import _decode_short_code, _encode_short_code
+from langboard_shared.core.utils.String import BASE62_ALPHABET
+
+
+def _previous_to_short_code(value: int) -> str:
+    left, right = value >> 32, value & 0xFFFFFFFF
+    for i in range(4):
+        left, right = right, left ^ ((right * SnowflakeID.EPOCH + i) & 0xFFFFFFFF)
+    n = (left << 32) | right
+    s = []
+    while n > 0:
+        n, r = divmod(n, 62)
+        s.append(BASE62_ALPHABET[r])
+    return "".join(reversed(s)).rjust(SnowflakeID.FIXED_SHORT_CODE_LENGTH, BASE62_ALPHABET[0])
+
+
+def _ids() -> list[int]:
+    random = Random(0)
+    return [0, 1, 61, 62, 2**32, 2**63 - 1, *(SnowflakeID() for _ in range(100))] + [
+        random.getrandbits(64) for _ in range(500)
+    ]
+
+
+def test_short_codes_match_the_previous_encoding_and_round_trip():
+    for value in _ids():
+        short_code = SnowflakeID(value).to_short_code()
+        assert short_code == _previous_to_short_code(value)
+        assert SnowflakeID.from_short_code(short_code) == value
+
+
+def test_invalid_short_codes():
+    assert SnowflakeID.from_short_code("") == 0
+    assert SnowflakeID.from_short_code("short") == 0
+    with pytest.raises(ValueError):
+        SnowflakeID.from_short_code("!" * SnowflakeID.FIXED_SHORT_CODE_LENGTH)
+
+
+def test_repeated_conversions_are_cached():
+    snowflake_id = SnowflakeID()
+    short_code = snowflake_id.to_short_code()
+    encode_hits, decode_hits = _encode_short_code.cache_info().hits, _decode_short_code.cache_info().hits
+
+    assert snowflake_id.to_short_code() == short_code
+    assert SnowflakeID.from_short_code(short_code) == snowflake_id
+    assert SnowflakeID.from_short_code(short_code) == snowflake_id
+
+    assert _encode_short_code.cache_info().hits == encode_hits + 1
+    assert _decode_short_code.cache_info().hits == decode_hits + 1
+
+
+def test_batch_conversions_match_single_conversions():
+    ids = [SnowflakeID() for _ in range(5)]
+    ids = [*ids, *ids, 0]
+    short_codes = SnowflakeID.to_short_codes(ids)
+
+    assert short_codes == [SnowflakeID(snowflake_id).to_short_code() for snowflake_id in ids]
+    assert SnowflakeID.from_short_codes([*short_codes, ""]) == [*ids, 0]
+    assert all(isinstance(snowflake_id, SnowflakeID) for snowflake_id in SnowflakeID.from_short_codes(short_codes))
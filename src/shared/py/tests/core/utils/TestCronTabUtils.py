@@ -0,0 +1,47 @@
+import pytest
+from langboard_shared.core.types import SafeDateTime
+from langboard_shared.core.utils.CronTabUtils import CronTabUtils
+
+
+# 2026-01-05 is a Monday.
+_AFTER = SafeDateTime(2026, 1, 5, 9, 7, 30)
+
+
+@pytest.mark.parametrize(
+    "interval_str, expected",
+    [
+        ("* * * * *", SafeDateTime(2026, 1, 5, 9, 8)),
+        ("*/15 * * * *", SafeDateTime(2026, 1, 5, 9, 15)),
+        ("7 9 * * *", SafeDateTime(2026, 1, 6, 9, 7)),
+        ("0 9 * * 1", SafeDateTime(2026, 1, 12, 9, 0)),
+        ("30 8-10 * * 1-5", SafeDateTime(2026, 1, 5, 9, 30)),
+        ("0 0 1 */3 *", SafeDateTime(2026, 4, 1, 0, 0)),
+        ("@daily", SafeDateTime(2026, 1, 6, 0, 0)),
+        ("@hourly", SafeDateTime(2026, 1, 5, 10, 0)),
+        ("0 0 29 2 *", SafeDateTime(2028, 2, 29, 0, 0)),
+    ],
+)
+def test_get_next_run_at(interval_str: str, expected: SafeDateTime):
+    assert CronTabUtils().get_next_run_at(interval_str, _AFTER) == expected
+
+
+def test_get_next_run_at_matches_the_day_of_month_or_the_day_of_week():
+    utils = CronTabUtils()
+
+    # The 13th, or any Friday (2026-01-09).
+    assert utils.get_next_run_at("0 0 13 * 5", _AFTER) == SafeDateTime(2026, 1, 9, 0, 0)
+    # When either field is "*", only the other one restricts the day.
+    assert utils.get_next_run_at("0 0 13 * *", _AFTER) == SafeDateTime(2026, 1, 13, 0, 0)
+    assert utils.get_next_run_at("0 0 * * 5", _AFTER) == SafeDateTime(2026, 1, 9, 0, 0)
+
+
+def test_get_next_run_at_is_strictly_after_the_given_minute():
+    utils = CronTabUtils()
+    run_at = SafeDateTime(2026, 1, 5, 9, 15)
+
+    assert utils.get_next_run_at("*/15 * * * *", run_at) == SafeDateTime(2026, 1, 5, 9, 30)
+
+
+@pytest.mark.parametrize("interval_str", ["@reboot", "invalid", "61 * * * *", "0 0 31 2 *"])
+def test_get_next_run_at_without_a_match(interval_str: str):
+    assert CronTabUtils().get_next_run_at(interval_str, _AFTER) is None
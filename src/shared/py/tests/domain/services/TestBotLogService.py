@@ -0,0 +1,59 @@
+from datetime import timedelta
+import pytest
+from sqlmodel import delete
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import Bot, BotLog, BotLogStack, Card, CardBotLog
+from langboard_shared.domain.models.BotLog import BotLogType
+from langboard_shared.domain.services import DomainService
+
+
+TABLES = [BotLog, BotLogStack, CardBotLog]
+
+
+@pytest.fixture(autouse=True)
+def bot_log_tables():
+    engine = DbEngine.get_main_engine()
+    BotLog.metadata.create_all(engine, tables=[table.__table__ for table in TABLES])  # type: ignore
+    yield
+    with DbSession.use(readonly=False) as db:
+        for table in reversed(TABLES):
+            db.exec(delete(table), purge=True)
+
+
+def _create_log(bot: Bot, card: Card, messages: list[str]) -> BotLog:
+    log = BotLog(bot_id=bot.id)
+    log_date = SafeDateTime.now()
+    with DbSession.use(readonly=False) as db:
+        db.insert(log)
+        db.insert(CardBotLog(card_id=card.id, bot_log_id=log.id))
+        for i, message in enumerate(messages):
+            db.insert(
+                BotLogStack(
+                    bot_log_id=log.id,
+                    message=message,
+                    log_type=BotLogType.Info,
+                    log_date=log_date + timedelta(seconds=i),
+                )
+            )
+    return log
+
+
+def test_lists_only_the_latest_message_and_the_count():
+    bot, card = Bot(id=SnowflakeID()), Card(id=SnowflakeID())
+    service = DomainService()
+    long_log = _create_log(bot, card, [f"message-{i}" for i in range(5)])
+    _create_log(bot, card, [])
+
+    api_logs = sorted(
+        service.bot_log.get_api_list_by_scope(CardBotLog, bot, card), key=lambda api_log: api_log["message_count"]
+    )
+
+    assert (api_logs[0]["latest_message"], api_logs[0]["message_count"]) == (None, 0)
+    assert api_logs[1]["latest_message"]["message"] == "message-4"
+    assert api_logs[1]["message_count"] == 5
+    assert all("message_stack" not in api_log for api_log in api_logs)
+
+    stacks = service.bot_log.get_api_stack_list_by_scope(CardBotLog, bot, card, long_log.get_uid())
+    assert [stack["message"] for stack in stacks or []] == [f"message-{i}" for i in range(5)]
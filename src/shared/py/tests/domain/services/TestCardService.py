@@ -0,0 +1,177 @@
+import pytest
+from sqlmodel import delete
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SafeDateTime, SnowflakeID
+from langboard_shared.domain.models import (
+    Card,
+    CardAssignedProjectLabel,
+    CardAssignedUser,
+    CardComment,
+    CardRelationship,
+    GlobalCardRelationshipType,
+    Project,
+    ProjectChange,
+    ProjectChangeTarget,
+    ProjectColumn,
+    ProjectLabel,
+    User,
+)
+from langboard_shared.domain.services import DomainService
+from langboard_shared.helpers import ProjectChangeHelper
+
+
+TABLES = [
+    User,
+    Project,
+    ProjectColumn,
+    ProjectLabel,
+    Card,
+    CardAssignedUser,
+    CardComment,
+    CardAssignedProjectLabel,
+    GlobalCardRelationshipType,
+    CardRelationship,
+    ProjectChange,
+]
+
+
+@pytest.fixture(autouse=True)
+def board_tables():
+    engine = DbEngine.get_main_engine()
+    Card.metadata.create_all(engine, tables=[table.__table__ for table in TABLES])  # type: ignore
+    yield
+    with DbSession.use(readonly=False) as db:
+        for table in reversed(TABLES):
+            db.exec(delete(table), purge=True)
+
+
+@pytest.fixture
+def project() -> Project:
+    user = User(firstname="First", lastname="Last", email="user@langboard.test", password="password")
+    deleted_user = User(firstname="Deleted", lastname="User", email="deleted@langboard.test", password="password")
+    with DbSession.use(readonly=False) as db:
+        db.insert_all([user, deleted_user])
+        project = Project(owner_id=user.id, title="Project")
+        db.insert(project)
+        column = ProjectColumn(project_id=project.id, name="Todo")
+        db.insert(column)
+        first_label, second_label = (
+            ProjectLabel(project_id=project.id, name=name, color="#000000", description="", order=order)
+            for order, name in enumerate(["first", "second"])
+        )
+        db.insert_all([first_label, second_label])
+        first, second, third = (
+            Card(project_id=project.id, project_column_id=column.id, title=title, order=order)
+            for order, title in enumerate(["first", "second", "third"])
+        )
+        db.insert_all([first, second, third])
+        db.insert_all(
+            [
+                CardAssignedUser(project_assigned_id=SnowflakeID(1), card_id=first.id, user_id=user.id),
+                CardAssignedUser(project_assigned_id=SnowflakeID(1), card_id=first.id, user_id=deleted_user.id),
+                CardComment(card_id=first.id, user_id=user.id),
+                CardComment(card_id=first.id, user_id=user.id, deleted_at=SafeDateTime.now()),
+                CardComment(card_id=second.id, user_id=user.id),
+                CardAssignedProjectLabel(card_id=first.id, project_label_id=second_label.id),
+                CardAssignedProjectLabel(card_id=first.id, project_label_id=first_label.id),
+            ]
+        )
+        relationship_type = GlobalCardRelationshipType(parent_name="Parent", child_name="Child")
+        db.insert(relationship_type)
+        db.insert(
+            CardRelationship(
+                relationship_type_id=relationship_type.id, card_id_parent=first.id, card_id_child=second.id
+            )
+        )
+
+    with DbSession.use(readonly=False) as db:
+        deleted_user.deleted_at = SafeDateTime.now()
+        db.update(deleted_user)
+
+    return project
+
+
+def _unique_sorted(records: list[dict]) -> list[dict]:
+    return sorted({record["uid"]: record for record in records}.values(), key=lambda record: record["uid"])
+
+
+def test_snapshot_cards_match_the_board_list(project: Project):
+    service = DomainService()
+
+    board_cards = service.card.get_board_list(project)
+    snapshot = service.card.get_board_snapshot(project)
+
+    assert snapshot is not None
+    assert snapshot["seq"] == project.change_seq
+    assert [column["name"] for column in snapshot["columns"]][0] == "Todo"
+    assert [label["name"] for label in snapshot["labels"]] == ["first", "second"]
+    assert len(snapshot["cards"]) == len(board_cards) == 3
+    for snapshot_card, board_card in zip(snapshot["cards"], board_cards):
+        assert snapshot_card["project_column_name"] == "Todo"
+        # The board list repeats a relationship once for each of its cards.
+        for key in ("labels", "relationships"):
+            snapshot_card[key] = _unique_sorted(snapshot_card[key])
+            board_card[key] = _unique_sorted(board_card[key])
+        assert {key: snapshot_card[key] for key in board_card} == board_card
+
+
+def test_snapshot_aggregates_members_labels_and_comments(project: Project):
+    snapshot = DomainService().card.get_board_snapshot(project)
+    assert snapshot is not None
+
+    first, second, third = snapshot["cards"]
+    assert (first["count_comment"], second["count_comment"], third["count_comment"]) == (1, 1, 0)
+    assert len(first["member_uids"]) == 1 and second["member_uids"] == third["member_uids"] == []
+    assert sorted(label["name"] for label in first["labels"]) == ["first", "second"]
+    assert second["labels"] == third["labels"] == []
+    assert first["relationships"] == second["relationships"]
+    assert len(first["relationships"]) == 1 and third["relationships"] == []
+
+
+def test_compact_snapshot_sends_keys_once_and_relationships_at_the_top_level(project: Project):
+    service = DomainService()
+    snapshot = service.card.get_board_snapshot(project)
+    compact = service.card.get_board_snapshot(project, compact=True)
+    assert snapshot is not None and compact is not None
+
+    cards = [dict(zip(compact["cards"]["keys"], row)) for row in compact["cards"]["rows"]]
+    assert "labels" not in compact["cards"]["keys"] and "relationships" not in compact["cards"]["keys"]
+    assert sorted(cards[0]["label_uids"]) == sorted(label["uid"] for label in snapshot["cards"][0]["labels"])
+    assert len(compact["relationships"]["rows"]) == 1
+    assert dict(zip(compact["labels"]["keys"], compact["labels"]["rows"][0])) == snapshot["labels"][0]
+
+
+def test_board_changes_send_only_the_changed_rows(project: Project):
+    service = DomainService()
+    first, second, third = service.card.get_board_list(project)
+    deleted_card_id = SnowflakeID()
+    ProjectChangeHelper.record(project, ProjectChangeTarget.Card, SnowflakeID.from_short_code(second["uid"]))
+    ProjectChangeHelper.record(project, ProjectChangeTarget.Card, deleted_card_id, is_deleted=True)
+
+    changes = service.card.get_board_changes(project.id, since=0)
+
+    assert changes is not None
+    assert (changes["seq"], changes["full"]) == (2, False)
+    assert [card["uid"] for card in changes["cards"]] == [second["uid"]]
+    assert changes["columns"] == changes["labels"] == []
+    assert changes["deleted"] == {"columns": [], "labels": [], "cards": [deleted_card_id.to_short_code()]}
+    assert changes["card_orders"] == {second["project_column_uid"]: [first["uid"], second["uid"], third["uid"]]}
+
+    assert service.card.get_board_changes(project.id, since=2) == {
+        **changes,
+        "cards": [],
+        "deleted": {"columns": [], "labels": [], "cards": []},
+        "card_orders": {},
+    }
+
+
+def test_board_changes_fall_back_to_the_snapshot(project: Project):
+    service = DomainService()
+
+    unknown = service.card.get_board_changes(project.id, since=1)
+    assert unknown is not None and unknown["full"] and len(unknown["cards"]) == 3
+
+    ProjectChangeHelper.record(project, ProjectChangeTarget.Board, project)
+    reload = service.card.get_board_changes(project.id, since=0)
+    assert reload is not None and reload["full"] and reload["seq"] == 1
@@ -0,0 +1,54 @@
+import pytest
+from sqlmodel import delete, select
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.domain.models import Project, ProjectChange, ProjectChangeTarget
+from langboard_shared.helpers import ProjectChangeHelper
+
+
+@pytest.fixture
+def project():
+    Project.metadata.create_all(
+        DbEngine.get_main_engine(),
+        tables=[Project.__table__, ProjectChange.__table__],  # type: ignore
+    )
+    project = Project(owner_id=1, title="project")
+    with DbSession.use(readonly=False) as db:
+        db.insert(project)
+    yield project
+    with DbSession.use(readonly=False) as db:
+        db.exec(delete(ProjectChange))
+        db.exec(delete(Project), purge=True)
+
+
+def _get_state(project: Project) -> tuple[int, list[tuple[int, int, bool]]]:
+    with DbSession.use(readonly=True) as db:
+        seq = db.exec(select(Project.change_seq).where(Project.id == project.id)).first()
+        changes = db.exec(select(ProjectChange).order_by(ProjectChange.column("target_id"))).all()
+        return seq or 0, [(change.target_id, change.seq, change.is_deleted) for change in changes]
+
+
+def test_records_the_change_after_the_unit_of_work_commits(project):
+    with DbSession.unit_of_work():
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, [11, 12])
+        ProjectChangeHelper.record(project, ProjectChangeTarget.Card, 11, is_deleted=True)
+
+        # Nothing is written (or locked) in the request's transaction.
+        assert _get_state(project) == (0, [])
+
+    assert _get_state(project) == (2, [(11, 2, True), (12, 1, False)])
+
+
+def test_drops_the_change_when_the_unit_of_work_rolls_back(project):
+    with pytest.raises(RuntimeError):
+        with DbSession.unit_of_work():
+            ProjectChangeHelper.record(project, ProjectChangeTarget.Card, 11)
+            raise RuntimeError()
+
+    assert _get_state(project) == (0, [])
+
+
+def test_records_immediately_outside_a_unit_of_work(project):
+    ProjectChangeHelper.record(project, ProjectChangeTarget.ProjectColumn, 21)
+
+    assert _get_state(project) == (1, [(21, 1, False)])
@@ -0,0 +1,129 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import delete
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import ApiKeyRole, McpRole, Project, ProjectRole, SettingRole, User
+from langboard_shared.domain.models.McpRole import McpRoleAction
+from langboard_shared.domain.models.ProjectRole import ProjectRoleAction
+from langboard_shared.domain.models.SettingRole import SettingRoleAction
+from langboard_shared.infrastructure.repositories import Repository
+from langboard_shared.security import RoleCache, RoleFinder
+from langboard_shared.security.RoleSecurity import RoleSecurity
+
+
+TABLES = [User, Project, ProjectRole, SettingRole, ApiKeyRole, McpRole]
+
+
+@pytest.fixture(autouse=True)
+def role_tables():
+    engine = DbEngine.get_main_engine()
+    User.metadata.create_all(engine, tables=[table.__table__ for table in TABLES])  # type: ignore
+    Cache.clear()
+    yield
+    Cache.clear()
+    with DbSession.use(readonly=False) as db:
+        for table in reversed(TABLES):
+            db.exec(delete(table), purge=True)
+
+
+@pytest.fixture
+def queries():
+    """Collects the statements sent to any database engine."""
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+def project() -> Project:
+    user = User(firstname="First", lastname="Last", email="user@langboard.test", password="password")
+    with DbSession.use(readonly=False) as db:
+        db.insert(user)
+        project = Project(owner_id=user.id, title="Project")
+        db.insert(project)
+    return project
+
+
+def _is_authorized(user_id: int, project: Project, actions: list[ProjectRoleAction]) -> bool:
+    return RoleSecurity(ProjectRole).is_authorized(
+        user_id, {"project_uid": project.get_uid()}, [action.value for action in actions], RoleFinder.project
+    )
+
+
+def test_caches_granted_actions_and_denials(project: Project, queries: list[str]):
+    Repository().role.project.grant_default(user_id=project.owner_id, project_id=project.id)
+    other_user_id = SnowflakeID()
+
+    assert _is_authorized(project.owner_id, project, [ProjectRoleAction.Read])
+    assert not _is_authorized(other_user_id, project, [ProjectRoleAction.Read])
+    queries.clear()
+
+    assert _is_authorized(project.owner_id, project, [ProjectRoleAction.Read])
+    assert not _is_authorized(project.owner_id, project, [ProjectRoleAction.Update])
+    assert not _is_authorized(other_user_id, project, [ProjectRoleAction.Read])
+    assert queries == []
+    assert RoleCache.get(ProjectRole, other_user_id, {"project_id": project.id}) == []
+
+
+def test_grant_and_withdraw_invalidate_the_cached_role(project: Project):
+    roles = Repository().role.project
+    roles.grant_default(user_id=project.owner_id, project_id=project.id)
+    assert not _is_authorized(project.owner_id, project, [ProjectRoleAction.CardWrite])
+
+    roles.grant_all(user_id=project.owner_id, project_id=project.id)
+    assert _is_authorized(project.owner_id, project, [ProjectRoleAction.CardWrite])
+
+    roles.withdraw(user_id=project.owner_id, project_id=project.id)
+    assert not _is_authorized(project.owner_id, project, [ProjectRoleAction.Read])
+
+
+def test_invalidation_runs_again_when_the_unit_of_work_commits(project: Project):
+    scope = {"project_id": project.id}
+
+    with DbSession.unit_of_work():
+        Repository().role.project.grant_all(user_id=project.owner_id, project_id=project.id)
+        assert RoleCache.get(ProjectRole, project.owner_id, scope) is None
+
+        # Another request reads the committed role before this unit of work commits.
+        RoleCache.set(ProjectRole, project.owner_id, scope, [])
+        assert RoleCache.get(ProjectRole, project.owner_id, scope) == []
+
+    assert RoleCache.get(ProjectRole, project.owner_id, scope) is None
+    assert _is_authorized(project.owner_id, project, [ProjectRoleAction.CardWrite])
+
+
+def test_get_scope_reads_the_role_columns_from_the_path_params():
+    project_id = SnowflakeID()
+
+    assert RoleCache.get_scope(RoleFinder.project, {"project_uid": project_id.to_short_code()}) == {
+        "project_id": project_id
+    }
+    assert RoleCache.get_scope(RoleFinder.setting, {}) == {}
+    assert RoleCache.get_scope(RoleFinder.project, {}) is None
+    assert RoleCache.get_scope(RoleFinder.project, {"project_uid": [project_id.to_short_code()]}) is None
+    assert RoleCache.get_scope(RoleFinder.project, {"project_uid": "!"}) is None
+    assert RoleCache.get_scope(lambda query, path_params, user_id: query, {}) is None
+
+
+def test_preload_caches_every_role_of_the_user(project: Project, queries: list[str]):
+    Repository().role.project.grant_all(user_id=project.owner_id, project_id=project.id)
+    Repository().role.setting.grant_all(user_id=project.owner_id)
+
+    RoleSecurity.preload(project.owner_id)
+    queries.clear()
+
+    assert _is_authorized(project.owner_id, project, [ProjectRoleAction.CardDelete])
+    assert RoleSecurity(SettingRole).is_authorized(
+        project.owner_id, {}, [SettingRoleAction.UserRead.value], RoleFinder.setting
+    )
+    assert not RoleSecurity(McpRole).is_authorized(project.owner_id, {}, [McpRoleAction.Read.value], RoleFinder.mcp)
+    assert queries == []
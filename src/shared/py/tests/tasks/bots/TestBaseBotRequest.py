@@ -0,0 +1,110 @@
+from asyncio import run
+from importlib import import_module
+import pytest
+from httpx import AsyncClient, ConnectError, MockTransport, Request, Response
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.domain.models import Bot
+from langboard_shared.domain.models.BaseBotModel import BotPlatform, BotPlatformRunningType
+from langboard_shared.domain.models.BotLog import BotLogType
+from langboard_shared.Env import Env
+from langboard_shared.tasks.bots.utils.requests.BaseBotRequest import BaseBotRequest, RequestData
+from langboard_shared.tasks.bots.utils.requests.BotCircuitBreaker import BotCircuitBreaker
+
+
+class StubRequest(BaseBotRequest):
+    """Posts to the bot's API URL and keeps the log messages instead of writing them."""
+
+    def __init__(self, bot: Bot):
+        super().__init__(bot, bot.api_url, "card_created", {"title": "Card"}, None, None)
+        self.logs: list[tuple[BotLogType, str]] = []
+
+    def create_request_data(self, bot_log) -> RequestData:
+        return {"url": self._base_url, "data": self._data}
+
+    async def _create_log(self, log_type: BotLogType, message: str):
+        self.logs.append((log_type, message))
+        return None, None
+
+    async def _update_log(self, bot_log, log_type: BotLogType, stack: str) -> None:
+        self.logs.append((log_type, stack))
+
+
+# Statuses returned by each URL in turn, the last one repeated; 0 refuses the connection.
+_responses: dict[str, list[int]] = {}
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[Request]:
+    """Answers the bot requests with the statuses in :data:`_responses` instead of the network and collects them."""
+    sent: list[Request] = []
+
+    async def handle(request: Request) -> Response:
+        sent.append(request)
+        statuses = _responses[str(request.url)]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if status == 0:
+            raise ConnectError("Connection refused", request=request)
+        return Response(status, text=f"response {status}")
+
+    class MockPool:
+        async def run(self, func):
+            async with AsyncClient(transport=MockTransport(handle)) as client:
+                return await func(client)
+
+    module = import_module(BaseBotRequest.__module__)
+    _responses.clear()
+    monkeypatch.setattr(module, "_POOLS", {platform: MockPool() for platform in BotPlatform})
+    monkeypatch.setattr(module, "_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(type(Env), "AI_REQUEST_TRIALS", property(lambda _: 2))
+    monkeypatch.setattr(type(Env), "AI_REQUEST_CIRCUIT_FAILURES", property(lambda _: 2))
+    monkeypatch.setattr(BotCircuitBreaker, "_failures", {})
+    monkeypatch.setattr(BotCircuitBreaker, "_opened_until", {})
+    return sent
+
+
+def _bot(url: str) -> Bot:
+    return Bot(
+        id=SnowflakeID(),
+        name="Bot",
+        bot_uname=f"bot-{url.rsplit('/', 1)[-1]}",
+        api_url=url,
+        app_api_token="token",
+        platform=BotPlatform.N8N,
+        platform_running_type=BotPlatformRunningType.Default,
+    )
+
+
+def test_retries_temporary_failures(requests):
+    _responses["http://bot/flaky"] = [503, 0, 200]
+    request = StubRequest(_bot("http://bot/flaky"))
+
+    run(request.execute())
+
+    assert len(requests) == 3
+    assert requests[0].content == b'{"title":"Card"}'
+    assert request.logs[-1] == (BotLogType.Success, "response 200")
+
+
+def test_does_not_retry_other_error_statuses(requests):
+    _responses["http://bot/invalid"] = [400]
+    request = StubRequest(_bot("http://bot/invalid"))
+
+    run(request.execute())
+
+    assert len(requests) == 1
+    assert request.logs[-1] == (BotLogType.Error, "400: response 400")
+
+
+def test_skips_a_bot_that_keeps_failing(requests):
+    _responses["http://bot/down"] = [0]
+    bot = _bot("http://bot/down")
+
+    for _ in range(2):
+        run(StubRequest(bot).execute())
+    assert len(requests) == 6
+
+    skipped = StubRequest(bot)
+    run(skipped.execute())
+
+    assert len(requests) == 6
+    assert skipped.logs[-1] == (BotLogType.Error, "Skipped because the bot has failed repeatedly")
@@ -0,0 +1,58 @@
+from importlib import import_module
+import pytest
+from langboard_shared.Env import Env
+from langboard_shared.tasks.bots.utils.requests.BotCircuitBreaker import BotCircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replaces the monotonic clock of the circuit breaker with a value the test can move."""
+    now = [1000.0]
+    monkeypatch.setattr(import_module(BotCircuitBreaker.__module__), "monotonic", lambda: now[0])
+    monkeypatch.setattr(type(Env), "AI_REQUEST_CIRCUIT_FAILURES", property(lambda _: 3))
+    monkeypatch.setattr(type(Env), "AI_REQUEST_CIRCUIT_COOLDOWN", property(lambda _: 60))
+    monkeypatch.setattr(BotCircuitBreaker, "_failures", {})
+    monkeypatch.setattr(BotCircuitBreaker, "_opened_until", {})
+    return now
+
+
+def test_opens_after_consecutive_failures(clock):
+    for _ in range(2):
+        BotCircuitBreaker.record_failure(1)
+    assert not BotCircuitBreaker.is_open(1)
+
+    BotCircuitBreaker.record_failure(1)
+
+    assert BotCircuitBreaker.is_open(1)
+    assert not BotCircuitBreaker.is_open(2)
+
+
+def test_a_success_resets_the_failures(clock):
+    for _ in range(2):
+        BotCircuitBreaker.record_failure(1)
+    BotCircuitBreaker.record_success(1)
+    BotCircuitBreaker.record_failure(1)
+
+    assert not BotCircuitBreaker.is_open(1)
+
+
+def test_lets_one_request_through_after_the_cooldown(clock):
+    for _ in range(3):
+        BotCircuitBreaker.record_failure(1)
+
+    clock[0] += 59
+    assert BotCircuitBreaker.is_open(1)
+
+    clock[0] += 1
+    assert not BotCircuitBreaker.is_open(1)
+    assert BotCircuitBreaker.is_open(1)
+
+    # The trial request fails, so the circuit stays open for another cooldown.
+    BotCircuitBreaker.record_failure(1)
+    clock[0] += 59
+    assert BotCircuitBreaker.is_open(1)
+
+    clock[0] += 1
+    assert not BotCircuitBreaker.is_open(1)
+    BotCircuitBreaker.record_success(1)
+    assert not BotCircuitBreaker.is_open(1)
@@ -0,0 +1,53 @@
+from asyncio import run, sleep
+from importlib import import_module
+import pytest
+from langboard_shared.ai import BotDefaultTrigger
+from langboard_shared.core.types import SnowflakeID
+from langboard_shared.Env import Env
+from langboard_shared.tasks.bots.utils.BotTaskHelper import BotTaskHelper
+
+
+class StubRequest:
+    running = 0
+    max_running = 0
+    executed: list[int] = []
+
+    def __init__(self, bot_id: int, should_fail: bool = False):
+        self._bot_id = bot_id
+        self._should_fail = should_fail
+
+    async def execute(self) -> None:
+        StubRequest.running += 1
+        StubRequest.max_running = max(StubRequest.max_running, StubRequest.running)
+        try:
+            await sleep(0.05)
+            if self._should_fail:
+                raise RuntimeError("Failed")
+            StubRequest.executed.append(self._bot_id)
+        finally:
+            StubRequest.running -= 1
+
+
+@pytest.fixture(autouse=True)
+def stub_requests(monkeypatch: pytest.MonkeyPatch):
+    module = import_module(BotTaskHelper.__module__)
+    monkeypatch.setattr(module.WebhookTask, "webhook_task", lambda *_: None)
+    monkeypatch.setattr(module, "create_request", lambda bot_id, *_: StubRequest(bot_id, should_fail=bot_id == 1))
+    monkeypatch.setattr(type(Env), "AI_REQUEST_MAX_CONCURRENCY", property(lambda _: 3))
+    StubRequest.running = StubRequest.max_running = 0
+    StubRequest.executed = []
+
+
+def test_requests_the_bots_concurrently_a_few_at_a_time():
+    bot_ids = [SnowflakeID(i) for i in range(2, 10)]
+
+    run(BotTaskHelper.run(bot_ids, BotDefaultTrigger.BotMentioned, {}))  # type: ignore
+
+    assert sorted(StubRequest.executed) == bot_ids
+    assert StubRequest.max_running == 3
+
+
+def test_a_failing_bot_does_not_stop_the_others():
+    run(BotTaskHelper.run([1, 2, 3], BotDefaultTrigger.BotMentioned, {}))  # type: ignore
+
+    assert sorted(StubRequest.executed) == [2, 3]
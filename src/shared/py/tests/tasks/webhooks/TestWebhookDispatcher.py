@@ -0,0 +1,173 @@
+from asyncio import run, sleep
+from importlib import import_module
+from json import loads as json_loads
+from pathlib import Path
+from time import perf_counter
+import pytest
+from httpx import AsyncClient, ConnectError, MockTransport, Request, Response
+from sqlmodel import delete
+from langboard_shared.core.caching import Cache
+from langboard_shared.core.db import DbSession
+from langboard_shared.core.db.DbEngine import DbEngine
+from langboard_shared.domain.models import WebhookSetting
+from langboard_shared.Env import Env
+from langboard_shared.tasks.webhooks.utils import WebhookDispatcher
+
+
+@pytest.fixture
+def dead_letter_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    dead_letter_file = tmp_path / "webhook-dead-letters.jsonl"
+    monkeypatch.setattr(type(Env), "WEBHOOK_DEAD_LETTER_FILE", property(lambda _: dead_letter_file))
+    monkeypatch.setattr(type(Env), "WEBHOOK_DEAD_LETTER_MAX_BYTES", property(lambda _: 300))
+    monkeypatch.setattr(type(Env), "WEBHOOK_DEAD_LETTER_BACKUP_COUNT", property(lambda _: 2))
+    return dead_letter_file
+
+
+# Statuses returned by each URL in turn, the last one repeated; 0 refuses the connection.
+_responses: dict[str, list[int]] = {}
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[Request]:
+    """Answers the webhook requests with the statuses in :data:`_responses` instead of the network and collects them."""
+    sent: list[Request] = []
+
+    async def handle(request: Request) -> Response:
+        sent.append(request)
+        await sleep(0.05)
+        statuses = _responses.get(str(request.url), [200])
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if status == 0:
+            raise ConnectError("Connection refused", request=request)
+        return Response(status, text="response")
+
+    class MockPool:
+        async def run(self, func):
+            async with AsyncClient(transport=MockTransport(handle)) as client:
+                return await func(client)
+
+    _responses.clear()
+    monkeypatch.setattr(WebhookDispatcher, "_pool", MockPool())
+    monkeypatch.setattr(import_module(WebhookDispatcher.__module__), "_RETRY_BACKOFF_SECONDS", 0)
+    return sent
+
+
+def _dead_letter(setting_id: int, event: str) -> None:
+    WebhookDispatcher._dead_letter(
+        {"id": setting_id, "url": f"http://old-{setting_id}"}, event, f'{{"event": "{event}"}}'.encode(), "500"
+    )
+
+
+def _events(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return [json_loads(line)["event"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_rotates_the_dead_letter_file_by_size(dead_letter_file):
+    for i in range(12):
+        _dead_letter(1, f"event-{i}")
+
+    backups = [dead_letter_file.with_name(f"{dead_letter_file.name}.{i}") for i in range(1, 4)]
+    assert backups[0].stat().st_size >= 300 and backups[1].stat().st_size >= 300
+    assert not backups[2].exists()
+
+    kept = _events(backups[1]) + _events(backups[0]) + _events(dead_letter_file)
+    assert kept == [f"event-{i}" for i in range(12 - len(kept), 12)]
+
+
+def test_replays_the_dead_letters_oldest_first_and_drains_them(dead_letter_file, monkeypatch):
+    monkeypatch.setattr(type(Env), "WEBHOOK_DEAD_LETTER_BACKUP_COUNT", property(lambda _: 10))
+    for i in range(8):
+        _dead_letter(1 if i % 2 else 2, f"event-{i}")
+    _dead_letter(3, "deleted-webhook")
+    assert dead_letter_file.with_name(f"{dead_letter_file.name}.2").exists()
+
+    sent = []
+
+    async def send(_, setting, event, content):
+        sent.append((setting["url"], event, content))
+        if event == "event-7":
+            WebhookDispatcher._dead_letter(setting, event, content, "500")
+            return False
+        return True
+
+    monkeypatch.setattr(
+        WebhookDispatcher, "get_settings", lambda: [{"id": 1, "url": "http://1"}, {"id": 2, "url": "http://2"}]
+    )
+    monkeypatch.setattr(WebhookDispatcher, "_send", send)
+
+    counts = run(WebhookDispatcher.replay_dead_letters())
+
+    assert counts == {"sent": 7, "failed": 1, "dropped": 1}
+    assert [event for _, event, _ in sent] == [f"event-{i}" for i in range(8)]
+    assert sent[0] == ("http://2", "event-0", b'{"event": "event-0"}')
+    assert _events(dead_letter_file) == ["event-7"]
+    assert sorted(path.name for path in dead_letter_file.parent.iterdir()) == [dead_letter_file.name]
+
+
+def test_replay_without_dead_letters_sends_nothing(dead_letter_file):
+    assert run(WebhookDispatcher.replay_dead_letters()) == {"sent": 0, "failed": 0, "dropped": 0}
+
+
+def test_dispatch_sends_the_same_payload_to_every_webhook_concurrently(requests, dead_letter_file):
+    settings = [{"id": i, "url": f"http://webhook-{i}"} for i in range(10)]
+
+    async def dispatch():
+        started_at = perf_counter()
+        sent_ids = await WebhookDispatcher.dispatch(settings, "card:created", {"title": "Card"})
+        return sent_ids, perf_counter() - started_at
+
+    sent_ids, elapsed = run(dispatch())
+
+    assert sent_ids == list(range(10))
+    # Each request takes 50 ms, so sending them one by one would take 500 ms.
+    assert elapsed < 0.3
+    assert {request.content for request in requests} == {b'{"event": "card:created", "data": {"title": "Card"}}'}
+    assert not dead_letter_file.exists()
+
+
+def test_dispatch_retries_temporary_failures(requests, dead_letter_file, monkeypatch):
+    monkeypatch.setattr(type(Env), "WEBHOOK_TRIALS", property(lambda _: 3))
+    _responses.update({"http://flaky": [503, 0, 200], "http://down": [0]})
+    settings = [{"id": 1, "url": "http://flaky"}, {"id": 2, "url": "http://down"}]
+
+    assert run(WebhookDispatcher.dispatch(settings, "event", {})) == [1]
+
+    assert [str(request.url) for request in requests].count("http://flaky") == 3
+    assert [str(request.url) for request in requests].count("http://down") == 3
+    letter = json_loads(dead_letter_file.read_text(encoding="utf-8"))
+    assert (letter["webhook_setting_id"], letter["event"]) == (2, "event")
+    assert letter["error"].startswith("ConnectError")
+
+
+def test_dispatch_does_not_retry_other_error_statuses(requests, dead_letter_file, monkeypatch):
+    monkeypatch.setattr(type(Env), "WEBHOOK_TRIALS", property(lambda _: 3))
+    _responses["http://missing"] = [404]
+
+    assert run(WebhookDispatcher.dispatch([{"id": 1, "url": "http://missing"}], "event", {})) == []
+
+    assert len(requests) == 1
+    assert json_loads(dead_letter_file.read_text(encoding="utf-8"))["error"] == "404: response"
+
+
+def test_settings_are_cached_until_a_webhook_setting_changes():
+    engine = DbEngine.get_main_engine()
+    WebhookSetting.metadata.create_all(engine, tables=[WebhookSetting.__table__])  # type: ignore
+    Cache.clear()
+    try:
+        with DbSession.use(readonly=False) as db:
+            db.insert(WebhookSetting(name="first", url="http://first"))
+        assert [setting["url"] for setting in WebhookDispatcher.get_settings()] == ["http://first"]
+
+        with DbSession.unit_of_work():
+            with DbSession.use(readonly=False) as db:
+                db.insert(WebhookSetting(name="second", url="http://second"))
+            WebhookDispatcher.reset_settings()
+            assert [setting["url"] for setting in WebhookDispatcher.get_settings()] == ["http://first"]
+
+        assert [setting["url"] for setting in WebhookDispatcher.get_settings()] == ["http://first", "http://second"]
+    finally:
+        Cache.clear()
+        with DbSession.use(readonly=False) as db:
+            db.exec(delete(WebhookSetting), purge=True)
@@ -191,6 +191,9 @@ const API = {
             GET_ALL_BY_PROJECT: "/bot/{bot_uid}/project/{project_uid}/logs",
             GET_ALL_BY_CARD: "/bot/{bot_uid}/card/{card_uid}/logs",
             GET_ALL_BY_COLUMN: "/bot/{bot_uid}/column/{project_column_uid}/logs",
+            GET_STACKS_BY_PROJECT: "/bot/{bot_uid}/project/{project_uid}/log/{log_uid}/stacks",
+            GET_STACKS_BY_CARD: "/bot/{bot_uid}/card/{card_uid}/log/{log_uid}/stacks",
+            GET_STACKS_BY_COLUMN: "/bot/{bot_uid}/column/{project_column_uid}/log/{log_uid}/stacks",
         },
     },
     METADATA: {
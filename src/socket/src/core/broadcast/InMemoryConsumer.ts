@@ -2,6 +2,7 @@ import { DATA_DIR } from "@/Constants";
 import BaseConsumer from "@/core/broadcast/BaseConsumer";
 import { Utils } from "@langboard/core/utils";
 import * as fs from "fs";
+import * as net from "net";
 import * as path from "path";
 
 class InMemoryConsumer extends BaseConsumer {
@@ -10,9 +11,14 @@ class InMemoryConsumer extends BaseConsumer {
         fs.mkdirSync(dir, { recursive: true });
         return dir;
     }
+    public static get BROADCAST_SOCKET_PATH() {
+        return path.join(DATA_DIR, "broadcast.sock");
+    }
     #watcher!: fs.FSWatcher;
+    #server?: net.Server;
 
     public async start() {
+        this.#startSocketServer();
         this.#runExistingFiles();
 
         this.#watcher = fs.watch(InMemoryConsumer.BROADCAST_DIR, {}, async (event, filename) => {
@@ -45,6 +51,59 @@ class InMemoryConsumer extends BaseConsumer {
     public async stop() {
         this.#watcher?.close();
         this.#watcher = undefined!;
+        this.#server?.close();
+        this.#server = undefined;
+    }
+
+    /**
+     * Producers on the same host stream newline-delimited JSON models through this socket.
+     * Files in the broadcast directory are still consumed as a fallback when a producer cannot connect.
+     */
+    #startSocketServer() {
+        if (process.platform === "win32") {
+            return;
+        }
+
+        const socketPath = InMemoryConsumer.BROADCAST_SOCKET_PATH;
+        try {
+            fs.rmSync(socketPath, { force: true });
+        } catch {
+            // Ignore stale socket removal errors, listen will fail and files will be used instead
+        }
+
+        this.#server = net.createServer((connection) => {
+            let buffer = "";
+            connection.setEncoding("utf-8");
+            connection.on("data", async (chunk: string) => {
+                buffer += chunk;
+                const lines = buffer.split("\n");
+                buffer = lines.pop() ?? "";
+
+                for (let i = 0; i < lines.length; ++i) {
+                    const line = lines[i];
+                    if (!line) {
+                        continue;
+                    }
+
+                    try {
+                        const model: { event: string; data: unknown } = Utils.Json.Parse(line);
+                        if (model && model.event) {
+                            await this.emit(model.event, model.data);
+                        }
+                    } catch {
+                        // Ignore invalid JSON lines
+                    }
+                }
+            });
+            connection.on("error", () => {
+                // A producer disconnected in the middle of a message, the partial line is dropped
+            });
+        });
+        this.#server.on("error", () => {
+            this.#server?.close();
+            this.#server = undefined;
+        });
+        this.#server.listen(socketPath);
     }
 
     #runExistingFiles() {
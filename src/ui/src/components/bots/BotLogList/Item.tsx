@@ -4,9 +4,12 @@ import Button from "@/components/base/Button";
 import Collapsible from "@/components/base/Collapsible";
 import Flex from "@/components/base/Flex";
 import IconComponent from "@/components/base/IconComponent";
+import Loading from "@/components/base/Loading";
+import { useBotLogList } from "@/components/bots/BotLogList/Provider";
 import DateDistance from "@/components/DateDistance";
+import useGetBotLogStacks from "@/controllers/api/shared/botLogs/useGetBotLogStacks";
 import { BotLogModel } from "@/core/models";
-import { useMemo } from "react";
+import { useCallback, useMemo } from "react";
 import { useTranslation } from "react-i18next";
 
 export interface IBotLogListItemProps {
@@ -15,21 +18,34 @@ export interface IBotLogListItemProps {
 
 function BotLogListItem({ log }: IBotLogListItemProps) {
     const [t] = useTranslation();
+    const { bot, params, target } = useBotLogList();
     const logType = log.useField("log_type");
+    const latestMessage = log.useField("latest_message");
     const logStack = log.useField("message_stack");
     const updatedAt = log.useField("updated_at");
     const badgeVariant = useMemo(() => log.getBadgeVariant(), [logType]);
+    const { mutate: getBotLogStacks, isPending } = useGetBotLogStacks(bot.uid, { ...params, target_uid: target.uid, log_uid: log.uid });
+    const loadStacks = useCallback(
+        (opened: bool) => {
+            if (!opened || logStack || isPending) {
+                return;
+            }
+
+            getBotLogStacks({});
+        },
+        [logStack, isPending, getBotLogStacks]
+    );
 
     return (
-        <Collapsible.Root className="border-b">
+        <Collapsible.Root className="border-b" onOpenChange={loadStacks}>
             <Collapsible.Trigger asChild>
                 <Button
                     size="sm"
                     variant="ghost"
                     className="w-full justify-between truncate rounded-none [&[data-state=open]>:last-child]:rotate-180"
                 >
-                    {logStack.length > 0 ? (
-                        <BotLogListItemStack log={log} stack={logStack.at(-1)!} />
+                    {latestMessage ? (
+                        <BotLogListItemStack log={log} stack={latestMessage} />
                     ) : (
                         <Flex items="center" gap="2">
                             <Badge variant="outline">
@@ -44,11 +60,17 @@ function BotLogListItem({ log }: IBotLogListItemProps) {
             <Collapsible.Content
                 className={"overflow-hidden p-2 pl-6 data-[state=closed]:animate-collapse-up data-[state=open]:animate-collapse-down"}
             >
-                <Flex direction="col" gap="2">
-                    {logStack.map((stack, i) => (
-                        <BotLogListItemStack log={log} stack={stack} key={`log-stack-${log.uid}-${i}`} />
-                    ))}
-                </Flex>
+                {logStack ? (
+                    <Flex direction="col" gap="2">
+                        {logStack.map((stack, i) => (
+                            <BotLogListItemStack log={log} stack={stack} key={`log-stack-${log.uid}-${i}`} />
+                        ))}
+                    </Flex>
+                ) : (
+                    <Flex justify="center">
+                        <Loading size="3" variant="secondary" />
+                    </Flex>
+                )}
             </Collapsible.Content>
         </Collapsible.Root>
     );
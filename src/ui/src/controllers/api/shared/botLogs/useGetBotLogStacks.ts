@@ -0,0 +1,80 @@
+import { TBotLogRelatedParams } from "@/controllers/api/shared/botLogs/types";
+import { Routing } from "@langboard/core/constants";
+import { api } from "@/core/helpers/Api";
+import { TMutationOptions, useQueryMutation } from "@/core/helpers/QueryMutation";
+import { BotLogModel } from "@/core/models";
+import { Utils } from "@langboard/core/utils";
+
+export type TUseGetBotLogStacksForm = TBotLogRelatedParams & {
+    target_uid: string;
+    log_uid: string;
+};
+
+const useGetBotLogStacks = (botUID: string, params: TUseGetBotLogStacksForm, limit: number = 50, options?: TMutationOptions) => {
+    const { mutate } = useQueryMutation();
+
+    let url;
+    switch (params.target_table) {
+        case "project":
+            url = Utils.String.format(Routing.API.BOT.LOG.GET_STACKS_BY_PROJECT, {
+                bot_uid: botUID,
+                project_uid: params.target_uid,
+                log_uid: params.log_uid,
+            });
+            break;
+        case "project_column":
+            url = Utils.String.format(Routing.API.BOT.LOG.GET_STACKS_BY_COLUMN, {
+                bot_uid: botUID,
+                project_column_uid: params.target_uid,
+                log_uid: params.log_uid,
+            });
+            break;
+        case "card":
+            url = Utils.String.format(Routing.API.BOT.LOG.GET_STACKS_BY_CARD, {
+                bot_uid: botUID,
+                card_uid: params.target_uid,
+                log_uid: params.log_uid,
+            });
+            break;
+        default:
+            throw new Error("Invalid target_table");
+    }
+
+    const getBotLogStacks = async () => {
+        const referTime = new Date();
+        const stacks: BotLogModel.ILogMessageStack[] = [];
+        for (let page = 1; ; ++page) {
+            const res = await api.get(url, {
+                params: {
+                    refer_time: referTime,
+                    page,
+                    limit,
+                },
+                env: {
+                    interceptToast: options?.interceptToast,
+                } as never,
+            });
+
+            stacks.push(...res.data.stacks.map(BotLogModel.convertLogMessageStack));
+            if (res.data.stacks.length < limit) {
+                break;
+            }
+        }
+
+        const log = BotLogModel.Model.getModel(params.log_uid);
+        if (log) {
+            log.message_stack = stacks;
+        }
+
+        return {};
+    };
+
+    const result = mutate(["get-bot-log-stacks"], getBotLogStacks, {
+        ...options,
+        retry: 0,
+    });
+
+    return result;
+};
+
+export default useGetBotLogStacks;
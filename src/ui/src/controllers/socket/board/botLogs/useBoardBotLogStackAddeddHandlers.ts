@@ -24,8 +24,13 @@ const useBoardBotLogStackAddedHandlers = ({ callback, projectUID }: IUseBoardBot
             responseConverter: (data) => {
                 const botLog = BotLogModel.Model.getModel(data.uid);
                 if (botLog) {
+                    const stack = BotLogModel.convertLogMessageStack(data.stack);
                     botLog.updated_at = data.updated_at;
-                    botLog.message_stack = [...botLog.message_stack, data.stack];
+                    botLog.latest_message = stack;
+                    botLog.message_count = botLog.message_count + 1;
+                    if (botLog.message_stack) {
+                        botLog.message_stack = [...botLog.message_stack, stack];
+                    }
                 }
 
                 return {};
@@ -18,11 +18,22 @@ export interface ILogMessageStack {
 export interface Interface extends IBaseModel {
     bot_uid: string;
     log_type: EBotLogType;
-    message_stack: ILogMessageStack[];
+    latest_message?: ILogMessageStack;
+    message_count: number;
+    // Loaded when the log is expanded, the log list only has the latest message
+    message_stack?: ILogMessageStack[];
     filterable_table?: TBotRelatedTargetTable;
     filterable_uid?: string;
 }
 
+export const convertLogMessageStack = (stack: ILogMessageStack): ILogMessageStack => {
+    stack.log_type = Utils.String.convertSafeEnum(EBotLogType, stack.log_type);
+    if (Utils.Type.isString(stack.log_date)) {
+        stack.log_date = new Date(stack.log_date);
+    }
+    return stack;
+};
+
 class BotLogModel extends BaseModel<Interface> {
     public static get MODEL_NAME() {
         return "BotLogModel" as const;
@@ -33,14 +44,12 @@ class BotLogModel extends BaseModel<Interface> {
             model.log_type = Utils.String.convertSafeEnum(EBotLogType, model.log_type);
         }
 
+        if (model.latest_message) {
+            model.latest_message = convertLogMessageStack(model.latest_message);
+        }
+
         if (Utils.Type.isArray(model.message_stack)) {
-            model.message_stack = model.message_stack.map((stack) => {
-                stack.log_type = Utils.String.convertSafeEnum(EBotLogType, stack.log_type);
-                if (Utils.Type.isString(stack.log_date)) {
-                    stack.log_date = new Date(stack.log_date);
-                }
-                return stack;
-            });
+            model.message_stack = model.message_stack.map(convertLogMessageStack);
         }
 
         return model;
@@ -60,6 +69,20 @@ class BotLogModel extends BaseModel<Interface> {
         this.update({ log_type: value });
     }
 
+    public get latest_message() {
+        return this.getValue("latest_message");
+    }
+    public set latest_message(value) {
+        this.update({ latest_message: value });
+    }
+
+    public get message_count() {
+        return this.getValue("message_count");
+    }
+    public set message_count(value) {
+        this.update({ message_count: value });
+    }
+
     public get message_stack() {
         return this.getValue("message_stack");
     }